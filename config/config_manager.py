@@ -99,6 +99,66 @@ class ConfigManager:
         """获取浏览器配置"""
         return self.get('browser', {})
     
+    @property
+    def browser_profiles_config(self) -> Dict[str, Any]:
+        """获取浏览器配置档"""
+        return self.get('browser_profiles', {})
+    
+    @property
+    def page_load_metrics_config(self) -> Dict[str, Any]:
+        """获取页面加载耗时统计配置"""
+        return self.get('page_load_metrics', {})
+    
+    @property
+    def driver_pool_config(self) -> Dict[str, Any]:
+        """获取WebDriver会话池配置"""
+        return self.get('driver_pool', {})
+    
+    @property
+    def trace_config(self) -> Dict[str, Any]:
+        """获取页面操作耗时追踪配置"""
+        return self.get('trace', {})
+    
+    @property
+    def session_cache_config(self) -> Dict[str, Any]:
+        """获取登录会话缓存配置"""
+        return self.get('session_cache', {})
+    
+    @property
+    def employee_cache_config(self) -> Dict[str, Any]:
+        """获取员工姓名缓存配置"""
+        return self.get('employee_cache', {})
+    
+    @property
+    def click_strategy_cache_config(self) -> Dict[str, Any]:
+        """获取点击策略学习缓存配置"""
+        return self.get('click_strategy_cache', {})
+    
+    @property
+    def api_client_config(self) -> Dict[str, Any]:
+        """获取API客户端配置"""
+        return self.get('api_client', {})
+    
+    @property
+    def retry_config(self) -> Dict[str, Any]:
+        """获取重试策略配置"""
+        return self.get('retry', {})
+    
+    @property
+    def claim_verification_config(self) -> Dict[str, Any]:
+        """获取Claim记录验证配置"""
+        return self.get('claim_verification', {})
+    
+    @property
+    def exceptions_page_config(self) -> Dict[str, Any]:
+        """获取异常测试页面运行模式配置"""
+        return self.get('exceptions_page', {})
+    
+    @property
+    def bdd_steps_config(self) -> Dict[str, Any]:
+        """获取BDD步骤截图策略配置"""
+        return self.get('bdd_steps', {})
+    
     @property
     def urls(self) -> Dict[str, str]:
         """获取URL配置"""
@@ -11,8 +11,14 @@ from loguru import logger
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from utils.driver_manager import DriverManager
+from utils.driver_manager import DriverManager, driver_pool_enabled, get_driver_pool, shutdown_driver_pools
 from utils.screenshot_utils import screenshot_utils
+from utils.step_tracer import step_tracer
+from utils.api_client import close_api_clients
+from utils.screenshot_writer import flush_screenshots
+from utils.step_registry import PageRegistry
+from utils.page_load_metrics import page_load_metrics
+from utils.click_strategy_cache import click_strategy_cache
 
 
 def before_all(context):
@@ -26,19 +32,30 @@ def before_all(context):
     # 设置浏览器
     context.browser_name = os.environ.get('BROWSER', 'chrome')
     logger.info(f"使用浏览器: {context.browser_name}")
+    
+    # 步骤共享的页面对象（按驱动缓存，场景更换驱动时自动重建）
+    context.pages = PageRegistry(context)
 
 
 def before_scenario(context, scenario):
     """每个场景开始前的设置"""
     logger.info(f"=== 开始场景: {scenario.name} ===")
     
-    # 创建WebDriver实例
-    context.driver_manager = DriverManager()
-    context.driver = context.driver_manager.create_driver(context.browser_name)
+    # 创建WebDriver实例（启用会话池时复用已启动的浏览器）
+    if driver_pool_enabled():
+        context.driver_pool = get_driver_pool(context.browser_name)
+        context.driver = context.driver_pool.acquire()
+    else:
+        context.driver_manager = DriverManager()
+        context.driver = context.driver_manager.create_driver(context.browser_name)
     
     # 设置截图工具
     context.screenshot_utils = screenshot_utils
     
+    # 记录页面操作耗时，每个场景输出一个trace文件
+    if step_tracer.enabled():
+        step_tracer.start(scenario.name)
+    
     logger.info("WebDriver已创建")
 
 
@@ -65,8 +82,13 @@ def after_scenario(context, scenario):
     else:
         logger.info(f"场景成功: {scenario.name}")
     
-    # 关闭WebDriver
-    if hasattr(context, 'driver_manager'):
+    step_tracer.stop()
+    
+    # 关闭WebDriver（会话池模式下归还驱动，失败场景的驱动直接回收）
+    if hasattr(context, 'driver_pool'):
+        context.driver_pool.release(context.driver, discard=scenario.status == "failed")
+        logger.info("WebDriver已归还会话池")
+    elif hasattr(context, 'driver_manager'):
         context.driver_manager.quit_driver()
         logger.info("WebDriver已关闭")
 
@@ -75,5 +97,19 @@ def after_all(context):
     """测试套件结束后的清理"""
     logger.info("=== BDD测试套件完成 ===")
     
+    # 等待异步截图全部写入磁盘
+    flush_screenshots()
+    
+    # 关闭WebDriver会话池和API客户端连接池
+    shutdown_driver_pools()
+    close_api_clients()
+    
+    # 写回本次会话学习到的点击策略和页面加载耗时
+    click_strategy_cache.flush()
+    page_load_metrics.flush()
+    
+    # 输出页面加载耗时及浏览器配置档节省的时间
+    page_load_metrics.log_summary()
+    
     # 清理旧截图
     screenshot_utils.cleanup_old_screenshots(days=7)
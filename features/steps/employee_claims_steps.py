@@ -6,91 +6,81 @@ from selenium.webdriver.common.by import By
 from pages.orangehrm_login_page import OrangeHRMLoginPage
 from pages.orangehrm_dashboard_page import OrangeHRMDashboardPage
 from pages.orangehrm_claims_page import OrangeHRMClaimsPage
+from utils.step_registry import step_registry, ALWAYS, ON_FAILURE, SAMPLED
 from loguru import logger
 import time
 
+# 按名称分派的页面操作
+step_registry.register_action("tab", "Employee Claims", OrangeHRMClaimsPage, "click_employee_claims")
+step_registry.register_action("tab", "Assign Claim", OrangeHRMClaimsPage, "click_assign_claim")
+step_registry.register_action("button", "Create", OrangeHRMClaimsPage, "click_create_button")
+step_registry.register_action("button", "Submit", OrangeHRMClaimsPage, "submit_expense")
+step_registry.register_action("button", "Back", OrangeHRMClaimsPage, "click_back_button")
+
 
 @given('I am on the OrangeHRM login page')
+@step_registry.screenshot("打开OrangeHRM登录页面", SAMPLED)
 def step_open_orangehrm_login_page(context):
     """打开OrangeHRM登录页面"""
-    context.login_page = OrangeHRMLoginPage(context.driver)
+    context.login_page = context.pages.get(OrangeHRMLoginPage)
     context.login_page.open_page()
     
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, "打开OrangeHRM登录页面", context.browser_name)
-    
     assert context.login_page.is_on_login_page(), "未能正确打开OrangeHRM登录页面"
 
 
 @when('I login with valid credentials')
+@step_registry.screenshot("执行登录操作", ON_FAILURE)
 def step_login_with_valid_credentials(context):
     """使用有效凭据登录"""
     context.login_page.login_with_default_credentials()
-    
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, "执行登录操作", context.browser_name)
 
 
 @then('I should be on the dashboard page')
+@step_registry.screenshot("登录成功_仪表板页面", ALWAYS)
 def step_verify_dashboard_page(context):
     """验证是否在仪表板页面"""
-    context.dashboard_page = OrangeHRMDashboardPage(context.driver)
+    context.dashboard_page = context.pages.get(OrangeHRMDashboardPage)
     context.dashboard_page.wait_for_dashboard_load()
     
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, "登录成功_仪表板页面", context.browser_name)
-    
     assert context.dashboard_page.is_on_dashboard_page(), "登录后未能到达仪表板页面"
 
 
 @given('I am on the OrangeHRM dashboard')
 def step_verify_on_dashboard(context):
     """验证当前在仪表板页面"""
-    if not hasattr(context, 'dashboard_page'):
-        context.dashboard_page = OrangeHRMDashboardPage(context.driver)
+    context.dashboard_page = context.pages.get(OrangeHRMDashboardPage)
     assert context.dashboard_page.is_on_dashboard_page(), "当前不在仪表板页面"
 
 
 @when('I click on "{menu_item}" in the left sidebar')
+@step_registry.screenshot("点击左侧菜单_{menu_item}", ON_FAILURE)
 def step_click_sidebar_menu(context, menu_item):
     """点击左侧菜单项"""
     context.dashboard_page.click_sidebar_menu_item(menu_item)
-    
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, f"点击左侧菜单_{menu_item}", context.browser_name)
 
 
 @then('I should be on the Claims page')
+@step_registry.screenshot("进入Claims页面", ALWAYS)
 def step_verify_claims_page(context):
     """验证是否在Claims页面"""
-    context.claims_page = OrangeHRMClaimsPage(context.driver)
-    
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, "进入Claims页面", context.browser_name)
+    context.claims_page = context.pages.get(OrangeHRMClaimsPage)
     
     assert context.claims_page.is_on_claims_page(), "未能正确进入Claims页面"
 
 
 @when('I click on "{button_text}"')
+@step_registry.screenshot("点击_{button_text}", ON_FAILURE)
 def step_click_button_or_tab(context, button_text):
     """点击按钮或标签"""
-    if button_text == "Employee Claims":
-        context.claims_page.click_employee_claims()
-    elif button_text == "Assign Claim":
-        context.claims_page.click_assign_claim()
-    
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, f"点击_{button_text}", context.browser_name)
+    step_registry.perform(context, "tab", button_text)
 
 
 @then('I should be on the Employee Claims page')
+@step_registry.screenshot("Employee_Claims页面", SAMPLED)
 def step_verify_employee_claims_page(context):
     """验证是否在Employee Claims页面"""
     # 验证页面元素存在
     assert context.claims_page.is_on_claims_page(), "未能正确进入Employee Claims页面"
-    
-    # 截图
-    context.screenshot_utils.take_screenshot(context.driver, "Employee_Claims页面", context.browser_name)
 
 
 # 删除重复的Step定义 - 使用通用的点击Step
@@ -100,8 +90,9 @@ def step_verify_employee_claims_page(context):
 
 
 @when('I fill in the claim request with following details:')
+@step_registry.screenshot("填写完成的Claim表单", ON_FAILURE, failure_name="填写表单失败")
 def step_fill_claim_request(context):
-    """填写Claim Request表单"""
+    """填写Claim Request表单（表格中的所有字段一次批量填写）"""
     logger.info("开始填写Claim Request表单...")
 
     # 从表格中获取数据
@@ -109,28 +100,17 @@ def step_fill_claim_request(context):
     for row in context.table:
         data[row['Field']] = row['Value']
 
-    employee_name = data.get('Employee Name')
-    event = data.get('Event')
-    currency = data.get('Currency')
-
-    logger.info(f"填写数据: 员工={employee_name}, 事件={event}, 货币={currency}")
-
-    # 等待表单完全加载
-    time.sleep(3)
+    logger.info(f"填写数据: {data}")
 
     try:
-        context.claims_page.fill_claim_request(employee_name, event, currency)
+        context.claims_page.fill_claim_request_fields(data)
         logger.info("Claim Request表单填写完成")
 
         # 保存数据供后续验证使用
         context.claim_data = data
 
-        # 截图填写完成的表单
-        context.screenshot_utils.take_screenshot(context.driver, "填写完成的Claim表单", context.browser_name)
-
     except Exception as e:
         logger.error(f"填写Claim Request表单失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "填写表单失败", context.browser_name)
         raise
 
 
@@ -142,28 +122,17 @@ def step_screenshot_filled_form(context):
 
 
 @when('I click "{button_text}" button')
+@step_registry.screenshot("点击{button_text}按钮", SAMPLED)
 def step_click_action_button(context, button_text):
     """点击操作按钮"""
     logger.info(f"点击 {button_text} 按钮...")
 
     try:
-        if button_text == "Create":
-            context.claims_page.click_create_button()
-        elif button_text == "Submit":
-            context.claims_page.submit_expense()
-        elif button_text == "Back":
-            context.claims_page.click_back_button()
-        else:
-            logger.warning(f"未知的按钮类型: {button_text}")
-
-        logger.info(f"{button_text} 按钮点击成功")
-
-        # 截图操作
-        context.screenshot_utils.take_screenshot(context.driver, f"点击{button_text}按钮", context.browser_name)
+        if step_registry.perform(context, "button", button_text):
+            logger.info(f"{button_text} 按钮点击成功")
 
     except Exception as e:
         logger.error(f"点击 {button_text} 按钮失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, f"点击{button_text}按钮失败", context.browser_name)
         raise
 
 
@@ -212,6 +181,7 @@ def step_screenshot_claim_details(context):
 
 
 @when('I add expenses with the following details:')
+@step_registry.screenshot("费用添加完成", ALWAYS, failure_name="添加费用失败")
 def step_add_expenses(context):
     """添加费用"""
     logger.info("开始添加费用...")
@@ -237,15 +207,12 @@ def step_add_expenses(context):
 
         logger.info("✅ 所有费用添加完成")
 
-        # 截图费用添加完成
-        context.screenshot_utils.take_screenshot(context.driver, "费用添加完成", context.browser_name)
-
     except Exception as e:
         logger.error(f"添加费用失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "添加费用失败", context.browser_name)
         raise
 
 @when('I click "Submit" for expenses')
+@step_registry.screenshot("提交费用", SAMPLED)
 def step_click_submit_expenses(context):
     """点击提交费用"""
     logger.info("点击提交费用...")
@@ -253,15 +220,12 @@ def step_click_submit_expenses(context):
         context.claims_page.submit_expense()
         logger.info("✅ 费用提交成功")
 
-        # 截图提交操作
-        context.screenshot_utils.take_screenshot(context.driver, "提交费用", context.browser_name)
-
     except Exception as e:
         logger.error(f"提交费用失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "提交费用失败", context.browser_name)
         raise
 
 @then('I should see success message for expense submission')
+@step_registry.screenshot("验证费用提交", ON_FAILURE)
 def step_verify_expense_submission_success(context):
     """验证费用提交成功消息"""
     logger.info("验证费用提交成功消息...")
@@ -294,10 +258,10 @@ def step_verify_expense_submission_success(context):
 
     except Exception as e:
         logger.error(f"验证费用提交成功消息失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "验证费用提交失败", context.browser_name)
         raise
 
 @when('I verify the expense data matches the input')
+@step_registry.screenshot("费用数据验证", ON_FAILURE, failure_name="验证费用数据失败")
 def step_verify_expense_data(context):
     """验证费用数据匹配"""
     logger.info("验证费用数据匹配...")
@@ -344,12 +308,10 @@ def step_verify_expense_data(context):
         else:
             error_msg = f"费用数据验证失败: {', '.join(validation_errors)}"
             logger.error(f"❌ {error_msg}")
-            context.screenshot_utils.take_screenshot(context.driver, "费用数据验证失败", context.browser_name)
             raise AssertionError(error_msg)
 
     except Exception as e:
         logger.error(f"验证费用数据失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "验证费用数据失败", context.browser_name)
         raise
 
 
@@ -408,22 +370,20 @@ def step_screenshot_final_verification(context):
 # 添加缺失的Step定义
 
 @when('I click on "Assign Claim" button')
+@step_registry.screenshot("点击Assign_Claim按钮", ON_FAILURE)
 def step_click_assign_claim_button(context):
     """点击Assign Claim按钮"""
     logger.info("点击Assign Claim按钮...")
     try:
-        context.claims_page.click_assign_claim()
+        step_registry.perform(context, "tab", "Assign Claim")
         logger.info("✅ Assign Claim按钮点击成功")
 
-        # 截图操作
-        context.screenshot_utils.take_screenshot(context.driver, "点击Assign_Claim按钮", context.browser_name)
-
     except Exception as e:
         logger.error(f"点击Assign Claim按钮失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "点击Assign_Claim按钮失败", context.browser_name)
         raise
 
 @then('I should see the Create Claim Request form')
+@step_registry.screenshot("Create_Claim_Request表单", ALWAYS, failure_name="验证表单失败")
 def step_see_create_claim_form(context):
     """验证看到Create Claim Request表单"""
     logger.info("验证Create Claim Request表单...")
@@ -454,17 +414,14 @@ def step_see_create_claim_form(context):
         if not form_found:
             logger.warning("未找到明确的表单指示器，假设表单已加载")
 
-        # 截图表单
-        context.screenshot_utils.take_screenshot(context.driver, "Create_Claim_Request表单", context.browser_name)
-
         logger.info("✅ Create Claim Request表单验证通过")
 
     except Exception as e:
         logger.error(f"验证Create Claim Request表单失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "验证表单失败", context.browser_name)
         raise
 
 @then('I should verify the claim details match the input data:')
+@step_registry.screenshot("Claim详情验证", SAMPLED, failure_name="验证详情失败")
 def step_verify_claim_details_match_input(context):
     """验证Claim详情与输入数据匹配"""
     logger.info("验证Claim详情与输入数据匹配...")
@@ -483,12 +440,8 @@ def step_verify_claim_details_match_input(context):
 
         logger.info("✅ 所有Claim详情验证通过")
 
-        # 截图验证结果
-        context.screenshot_utils.take_screenshot(context.driver, "Claim详情验证", context.browser_name)
-
     except Exception as e:
         logger.error(f"验证Claim详情失败: {e}")
-        context.screenshot_utils.take_screenshot(context.driver, "验证详情失败", context.browser_name)
         raise
 
 # 所有Step定义已完成
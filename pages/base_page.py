@@ -2,19 +2,285 @@
 基础页面类
 所有页面对象的基类，提供通用的页面操作方法
 """
+import json
+import threading
+import time
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException
+)
 from loguru import logger
 from config.config_manager import config
+from utils.step_tracer import step_tracer, instrument_page_class
+from utils.driver_manager import on_driver_release
 
 
 class BasePage:
     """基础页面类"""
+
+    # 条件等待使用的通用定位器（OrangeHRM组件库）
+    LISTBOX_OPTIONS = (By.XPATH, "//div[@role='listbox']//*[@role='option']")
+    TOAST_MESSAGE = (By.CSS_SELECTOR, ".oxd-toast")
+    LOADING_SPINNER = (By.CSS_SELECTOR, ".oxd-loading-spinner, .oxd-form-loader")
+
+    # 记录网络请求数量的脚本：首次调用时挂钩XHR和fetch
+    _NETWORK_STATE_SCRIPT = """
+        if (!window.__autoTestNetwork) {
+            var state = {pending: 0};
+            window.__autoTestNetwork = state;
+            var done = function () { state.pending = Math.max(0, state.pending - 1); };
+            var originalSend = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                state.pending++;
+                this.addEventListener('loadend', done);
+                return originalSend.apply(this, arguments);
+            };
+            if (window.fetch) {
+                var originalFetch = window.fetch;
+                window.fetch = function () {
+                    state.pending++;
+                    return originalFetch.apply(this, arguments).finally(done);
+                };
+            }
+        }
+        return [document.readyState, window.__autoTestNetwork.pending,
+                performance.getEntriesByType('resource').length];
+    """
+
+    # 判断DOM是否稳定的脚本：首次调用时安装MutationObserver和滚动监听
+    _DOM_STABLE_SCRIPT = """
+        var stableMs = arguments[0];
+        if (!window.__autoTestDomObserver) {
+            var mark = function () { window.__autoTestLastMutation = performance.now(); };
+            mark();
+            window.__autoTestDomObserver = new MutationObserver(mark);
+            window.__autoTestDomObserver.observe(document.documentElement,
+                {childList: true, subtree: true, attributes: true, characterData: true});
+            window.addEventListener('scroll', mark, true);
+            return false;
+        }
+        return performance.now() - window.__autoTestLastMutation >= stableMs;
+    """
+    
+    # 脚本共用的定位器查询函数：查询格式为 [类型, 表达式]，类型为 css 或 xpath
+    _LOCATOR_HELPERS_SCRIPT = """
+        function matches(kind, value) {
+            if (kind === 'css') {
+                return Array.prototype.slice.call(document.querySelectorAll(value));
+            }
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        }
+        function visible(el) {
+            if (!el.getBoundingClientRect) return false;
+            var rect = el.getBoundingClientRect();
+            var style = window.getComputedStyle(el);
+            return (rect.width > 0 || rect.height > 0) && style.visibility !== 'hidden' && style.display !== 'none';
+        }
+    """
+
+    # 一次请求内按顺序评估所有候选定位器，返回第一个有（可见）匹配的候选序号及其匹配元素
+    _RACE_LOCATORS_SCRIPT = _LOCATOR_HELPERS_SCRIPT + """
+        var queries = arguments[0], visibleOnly = arguments[1];
+        for (var i = 0; i < queries.length; i++) {
+            var found;
+            try {
+                found = matches(queries[i][0], queries[i][1]);
+            } catch (e) {
+                continue;
+            }
+            if (visibleOnly) {
+                found = found.filter(visible);
+            }
+            if (found.length) {
+                return [i, found];
+            }
+        }
+        return null;
+    """
+
+    # 一次请求内读取多个定位器的匹配数量、可见性、文本和值（优先取第一个可见的匹配元素）
+    _READ_MANY_SCRIPT = _LOCATOR_HELPERS_SCRIPT + """
+        var queries = arguments[0], result = {};
+        Object.keys(queries).forEach(function (name) {
+            var found = [];
+            try {
+                found = matches(queries[name][0], queries[name][1]);
+            } catch (e) {}
+            var shown = found.filter(visible);
+            var el = shown[0] || found[0];
+            result[name] = {
+                count: found.length,
+                visible: shown.length > 0,
+                text: el ? (el.innerText || el.textContent || '').trim() : '',
+                value: el && el.value !== undefined ? String(el.value) : null
+            };
+        });
+        return result;
+    """
+
+    # 一次请求内读取表单中每个输入组的标签和当前值（输入框、文本域、下拉框和自动完成框）
+    _SNAPSHOT_FORM_SCRIPT = _LOCATOR_HELPERS_SCRIPT + """
+        var root = arguments[0] ? (matches(arguments[0][0], arguments[0][1])[0] || null) : document;
+        var result = {};
+        if (!root) return result;
+        root.querySelectorAll('.oxd-input-group').forEach(function (group) {
+            var label = group.querySelector('label');
+            if (!label) return;
+            var name = label.textContent.trim();
+            var field = group.querySelector('input, textarea');
+            var select = group.querySelector('.oxd-select-text-input');
+            var value = null;
+            if (select) {
+                value = select.textContent.trim();
+            } else if (field) {
+                value = field.type === 'checkbox' || field.type === 'radio' ? field.checked : field.value;
+            }
+            result[name] = {value: value, visible: visible(group)};
+        });
+        return result;
+    """
+
+    # 一次异步请求内按标签填写表单：普通输入框直接设置值并触发input/change事件，
+    # 下拉框点击后选择文本匹配的选项，自动完成输入框输入后选择包含该文本的候选项
+    _FILL_FORM_SCRIPT = _LOCATOR_HELPERS_SCRIPT + """
+        var done = arguments[arguments.length - 1];
+        var root = arguments[0] ? (matches(arguments[0][0], arguments[0][1])[0] || null) : document;
+        var values = arguments[1], optionTimeout = arguments[2];
+        var labels = Object.keys(values), result = {};
+        if (!root) {
+            labels.forEach(function (label) { result[label] = false; });
+            return done(result);
+        }
+        var groups = {};
+        root.querySelectorAll('.oxd-input-group').forEach(function (group) {
+            var label = group.querySelector('label');
+            if (label) groups[label.textContent.trim()] = group;
+        });
+        function setValue(field, value) {
+            var proto = field.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(field, value);
+            field.dispatchEvent(new Event('input', {bubbles: true}));
+            field.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        function pickOption(text, exact, callback) {
+            var deadline = Date.now() + optionTimeout;
+            (function poll() {
+                var options = Array.prototype.slice.call(document.querySelectorAll('[role="option"]')).filter(visible);
+                var option = options.filter(function (o) {
+                    var optionText = o.textContent.trim();
+                    return exact ? optionText === text : optionText.indexOf(text) !== -1;
+                })[0];
+                if (option) {
+                    option.click();
+                    return callback(true);
+                }
+                if (Date.now() > deadline) return callback(false);
+                setTimeout(poll, 100);
+            })();
+        }
+        (function next(index) {
+            if (index >= labels.length) return done(result);
+            var label = labels[index], value = values[label], group = groups[label];
+            function finish(filled) {
+                result[label] = filled;
+                next(index + 1);
+            }
+            if (!group) return finish(false);
+            var select = group.querySelector('.oxd-select-text');
+            var autocomplete = group.querySelector('.oxd-autocomplete-text-input input');
+            var field = group.querySelector('input, textarea');
+            if (select) {
+                select.click();
+                pickOption(value, true, finish);
+            } else if (autocomplete) {
+                autocomplete.focus();
+                setValue(autocomplete, value);
+                pickOption(value, false, finish);
+            } else if (field) {
+                setValue(field, value);
+                finish(true);
+            } else {
+                finish(false);
+            }
+        })(0);
+    """
+
+    # 一次请求内完成滚动定位：找到第一个有可见匹配（且文本符合要求）的候选，计算目标位置后无动画滚动，
+    # 没有候选匹配时按页面比例或滚动到底部，返回滚动后的位置信息
+    _SCROLL_TO_FIRST_SCRIPT = _LOCATOR_HELPERS_SCRIPT + """
+        var queries = arguments[0], options = arguments[1];
+        var textPattern = options.textPattern ? new RegExp(options.textPattern, 'i') : null;
+        var viewportHeight = window.innerHeight;
+        var pageHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+        var target = null, matched = -1, top = null;
+        for (var i = 0; i < queries.length && target === null; i++) {
+            var found = [];
+            try {
+                found = matches(queries[i][0], queries[i][1]).filter(visible);
+            } catch (e) {}
+            for (var j = 0; j < found.length; j++) {
+                if (textPattern && !textPattern.test(found[j].innerText || found[j].textContent || '')) continue;
+                target = found[j];
+                matched = i;
+                break;
+            }
+        }
+        if (target) {
+            var rect = target.getBoundingClientRect();
+            var elementTop = rect.top + window.pageYOffset;
+            if (options.block === 'start') {
+                top = elementTop;
+            } else if (options.block === 'end') {
+                top = elementTop + rect.height - viewportHeight;
+            } else {
+                top = elementTop + rect.height / 2 - viewportHeight / 2;
+            }
+            top += options.offset || 0;
+        } else if (options.fallback === 'bottom') {
+            top = pageHeight;
+        } else if (typeof options.fallback === 'number') {
+            top = pageHeight * options.fallback;
+        }
+        if (top === null) {
+            return {matched: -1, scrolled: false};
+        }
+        top = Math.max(0, Math.min(top, pageHeight - viewportHeight));
+        window.scrollTo({top: top, behavior: 'instant'});
+        var scrollY = window.pageYOffset;
+        return {
+            matched: matched,
+            scrolled: true,
+            scroll_y: scrollY,
+            element_top: target ? target.getBoundingClientRect().top : null,
+            viewport_height: viewportHeight,
+            page_height: pageHeight,
+            relative_position: pageHeight > 0 ? scrollY / pageHeight * 100 : 0
+        };
+    """
+
+    # 候选定位器链的胜出记录：(页面类名, 候选链) -> 胜出的定位器，进程内有效
+    _locator_winners = {}
+
+    # 按驱动缓存的页面对象：驱动 -> {页面类: 实例}，驱动归还会话池或关闭时由 evict_driver 清除
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        """子类定义时为其公开方法添加耗时追踪"""
+        super().__init_subclass__(**kwargs)
+        instrument_page_class(cls)
     
     def __init__(self, driver: WebDriver):
         """
@@ -24,9 +290,57 @@ class BasePage:
             driver: WebDriver实例
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, config.get('browser.explicit_wait', 20))
-        self.actions = ActionChains(driver)
+        # 条件等待记录：每次等待的实际耗时与原固定等待时间
+        self.wait_records = []
+        # 统计WebDriver命令次数与耗时（仅在耗时追踪激活时记录）
+        step_tracer.instrument_driver(driver)
     
+    @classmethod
+    def for_driver(cls, driver: WebDriver):
+        """
+        获取驱动对应的页面对象，同一驱动重复获取时返回同一个实例
+
+        Args:
+            driver: WebDriver实例
+
+        Returns:
+            页面对象
+        """
+        with BasePage._instances_lock:
+            try:
+                pages = BasePage._instances.setdefault(driver, {})
+            except TypeError:
+                # 驱动不可哈希时不缓存
+                return cls(driver)
+            page = pages.get(cls)
+            if page is None:
+                page = pages[cls] = cls(driver)
+            return page
+
+    @staticmethod
+    def evict_driver(driver):
+        """
+        清除驱动对应的页面对象缓存（驱动归还会话池、被回收或关闭时调用）
+
+        Args:
+            driver: WebDriver实例
+        """
+        with BasePage._instances_lock:
+            try:
+                BasePage._instances.pop(driver, None)
+            except TypeError:
+                pass
+
+    @cached_property
+    def wait(self) -> WebDriverWait:
+        """默认显式等待（首次使用时创建）"""
+        return WebDriverWait(self.driver, config.get('browser.explicit_wait', 20))
+
+    @cached_property
+    def actions(self) -> ActionChains:
+        """ActionChains（首次使用时创建）"""
+        return ActionChains(self.driver)
+
     def open_url(self, url: str):
         """
         打开指定URL
@@ -278,3 +592,380 @@ class BasePage:
         """刷新页面"""
         self.driver.refresh()
         logger.info("已刷新页面")
+
+    # ==================== 条件等待引擎 ====================
+
+    def wait_until(self, condition, timeout: float = 10, description: str = "条件等待",
+                   budget: float = None, poll_frequency: float = 0.1) -> bool:
+        """
+        等待条件满足，并记录实际等待时间
+
+        Args:
+            condition: 接收driver参数的条件函数，返回真值表示满足
+            timeout: 超时时间
+            description: 等待描述，用于日志和报告
+            budget: 被替换的固定等待时间（秒），用于对比节省的时间
+            poll_frequency: 轮询间隔
+
+        Returns:
+            条件是否在超时前满足
+        """
+        start = time.monotonic()
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=poll_frequency,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException, JavascriptException)
+            ).until(condition)
+            satisfied = True
+        except TimeoutException:
+            satisfied = False
+        elapsed = time.monotonic() - start
+
+        self.wait_records.append({
+            'description': description,
+            'elapsed': round(elapsed, 3),
+            'budget': budget,
+            'satisfied': satisfied
+        })
+        budget_text = f" / 原固定等待 {budget}s" if budget is not None else ""
+        status = "满足" if satisfied else "超时"
+        logger.debug(f"⏱ 等待[{description}] {status}，实际 {elapsed:.2f}s{budget_text}")
+        return satisfied
+
+    def wait_for_listbox_populated(self, timeout: float = 10, budget: float = None) -> bool:
+        """
+        等待下拉/自动完成列表加载出选项（忽略 "Searching..." 占位项）
+
+        Args:
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            列表是否已加载出选项
+        """
+        def populated(driver):
+            for option in driver.find_elements(*self.LISTBOX_OPTIONS):
+                try:
+                    text = option.text.strip()
+                except StaleElementReferenceException:
+                    return False
+                if text and not text.startswith("Searching"):
+                    return True
+            return False
+
+        return self.wait_until(populated, timeout, "下拉列表选项已加载", budget)
+
+    def wait_for_toast(self, timeout: float = 10, budget: float = None) -> bool:
+        """
+        等待提示消息（toast）出现
+
+        Args:
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            提示消息是否出现
+        """
+        return self.wait_until(EC.visibility_of_element_located(self.TOAST_MESSAGE),
+                               timeout, "提示消息出现", budget)
+
+    def wait_for_spinner_gone(self, timeout: float = 15, budget: float = None) -> bool:
+        """
+        等待加载动画消失
+
+        Args:
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            加载动画是否已消失
+        """
+        return self.wait_until(EC.invisibility_of_element_located(self.LOADING_SPINNER),
+                               timeout, "加载动画消失", budget)
+
+    def wait_for_network_idle(self, idle_ms: int = 500, timeout: float = 15, budget: float = None) -> bool:
+        """
+        等待网络空闲：页面加载完成、无进行中的XHR/fetch请求，且资源数量在idle_ms内保持不变
+
+        Args:
+            idle_ms: 需要保持空闲的时间（毫秒）
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            网络是否空闲
+        """
+        state = {'resources': None, 'since': None}
+
+        def idle(driver):
+            ready_state, pending, resources = driver.execute_script(self._NETWORK_STATE_SCRIPT)
+            now = time.monotonic()
+            if ready_state != "complete" or pending > 0 or resources != state['resources']:
+                state['resources'] = resources
+                state['since'] = now
+                return False
+            return (now - state['since']) * 1000 >= idle_ms
+
+        return self.wait_until(idle, self._budget_timeout(timeout, budget), f"网络空闲{idle_ms}ms", budget)
+
+    def wait_for_dom_stable(self, stable_ms: int = 300, timeout: float = 10, budget: float = None) -> bool:
+        """
+        等待DOM稳定：stable_ms内没有DOM变化和滚动
+
+        Args:
+            stable_ms: 需要保持稳定的时间（毫秒）
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            DOM是否已稳定
+        """
+        return self.wait_until(lambda driver: driver.execute_script(self._DOM_STABLE_SCRIPT, stable_ms),
+                               self._budget_timeout(timeout, budget), f"DOM稳定{stable_ms}ms", budget,
+                               poll_frequency=0.05)
+
+    @staticmethod
+    def _budget_timeout(timeout: float, budget: float = None) -> float:
+        """
+        替换固定等待时的超时时间：不超过原固定等待时间的2倍（至少1秒），
+        避免页面持续变化（加载动画、提示消息）时比原来的固定等待慢很多
+
+        Args:
+            timeout: 超时时间
+            budget: 被替换的固定等待时间
+
+        Returns:
+            实际使用的超时时间
+        """
+        if budget is None:
+            return timeout
+        return min(timeout, max(budget * 2, 1))
+
+    def get_wait_report(self) -> dict:
+        """
+        获取条件等待统计：实际等待总时间与原固定等待总时间对比
+
+        Returns:
+            统计信息字典
+        """
+        budgeted = [r for r in self.wait_records if r['budget'] is not None]
+        waited = sum(r['elapsed'] for r in budgeted)
+        budget = sum(r['budget'] for r in budgeted)
+        return {
+            'waits': len(self.wait_records),
+            'timeouts': len([r for r in self.wait_records if not r['satisfied']]),
+            'waited': round(waited, 2),
+            'budget': round(budget, 2),
+            'saved': round(budget - waited, 2),
+            'records': list(self.wait_records)
+        }
+
+
+    # ==================== 批量读取 ====================
+
+    def read_many(self, locators: Dict[str, tuple], timeout: float = 0,
+                  until: Callable[[Dict[str, dict]], bool] = None) -> Dict[str, dict]:
+        """
+        在一次execute_script中读取多个元素的文本、值和可见性
+
+        Args:
+            locators: 名称 -> 元素定位器
+            timeout: 大于0时轮询直到until满足或超时，返回最后一次读取结果
+            until: 读取结果满足的条件，默认要求所有定位器都有可见元素
+
+        Returns:
+            名称 -> {count: 匹配数量, visible: 是否有可见元素, text: 文本, value: 输入值（非输入元素为None）}
+        """
+        queries = {name: self._locator_to_query(locator) for name, locator in locators.items()}
+        if until is None:
+            until = lambda snapshot: all(field['visible'] for field in snapshot.values())
+
+        snapshot = self.driver.execute_script(self._READ_MANY_SCRIPT, queries)
+        if timeout > 0 and not until(snapshot):
+            def satisfied(driver):
+                nonlocal snapshot
+                snapshot = driver.execute_script(self._READ_MANY_SCRIPT, queries)
+                return until(snapshot)
+
+            self.wait_until(satisfied, timeout, f"批量读取{len(locators)}个元素")
+        return snapshot
+
+    def snapshot_form(self, form_locator: tuple = None) -> Dict[str, dict]:
+        """
+        在一次execute_script中读取表单所有输入组的当前值
+
+        Args:
+            form_locator: 表单定位器，None时读取整个页面
+
+        Returns:
+            标签文本 -> {value: 当前值, visible: 是否可见}
+        """
+        form_query = self._locator_to_query(form_locator) if form_locator else None
+        return self.driver.execute_script(self._SNAPSHOT_FORM_SCRIPT, form_query)
+
+    def fill_form(self, values: Dict[str, str], form_locator: tuple = None, option_timeout: float = 5) -> Dict[str, bool]:
+        """
+        在一次execute_async_script中按标签填写表单的多个输入组
+
+        Args:
+            values: 标签文本 -> 要填写的值（下拉框和自动完成输入框为选项文本）
+            form_locator: 表单定位器，None时在整个页面中查找
+            option_timeout: 每个下拉选项的等待时间（秒）
+
+        Returns:
+            标签文本 -> 是否填写成功
+        """
+        form_query = self._locator_to_query(form_locator) if form_locator else None
+        result = self.driver.execute_async_script(self._FILL_FORM_SCRIPT, form_query, values,
+                                                  int(option_timeout * 1000))
+        failed = [label for label, filled in result.items() if not filled]
+        if failed:
+            logger.warning(f"批量填写表单未完成的字段: {failed}")
+        else:
+            logger.info(f"批量填写表单完成: {list(values)}")
+        return result
+
+    # ==================== 多定位器候选链 ====================
+
+    def race_locators(self, candidates: Sequence[tuple], timeout: float = 5,
+                      visible: bool = True) -> Tuple[Optional[tuple], List[WebElement]]:
+        """
+        在一次请求中同时评估多个候选定位器，返回第一个有匹配的定位器及其匹配元素
+
+        候选按给定顺序评估，本页面类上次胜出的定位器排在最前；超时前每次轮询只需一次execute_script，
+        不再对每个候选单独等待
+
+        Args:
+            candidates: 候选定位器列表，按优先级排列
+            timeout: 超时时间
+            visible: 是否只匹配可见元素
+
+        Returns:
+            (胜出的定位器, 匹配元素列表)，全部候选都没有匹配时返回 (None, [])
+        """
+        candidates = tuple(tuple(locator) for locator in candidates)
+        winner_key = (type(self).__name__, candidates)
+        ordered = list(candidates)
+        winner = self._locator_winners.get(winner_key)
+        if winner in ordered:
+            ordered.remove(winner)
+            ordered.insert(0, winner)
+        queries = [self._locator_to_query(locator) for locator in ordered]
+
+        try:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=0.2)
+            index, elements = wait.until(
+                lambda driver: driver.execute_script(self._RACE_LOCATORS_SCRIPT, queries, visible)
+            )
+        except TimeoutException:
+            logger.warning(f"{len(candidates)}个候选定位器在{timeout}秒内都没有匹配元素")
+            return None, []
+
+        locator = ordered[index]
+        if locator != winner:
+            self._locator_winners[winner_key] = locator
+            logger.debug(f"候选定位器胜出（第{candidates.index(locator) + 1}个）: {locator}")
+        return locator, elements
+
+    def find_any_element(self, candidates: Sequence[tuple], timeout: float = 5,
+                         visible: bool = True) -> Optional[WebElement]:
+        """
+        查找多个候选定位器中第一个匹配的元素
+
+        Args:
+            candidates: 候选定位器列表，按优先级排列
+            timeout: 超时时间
+            visible: 是否只匹配可见元素
+
+        Returns:
+            WebElement对象，全部候选都没有匹配时返回None
+        """
+        _, elements = self.race_locators(candidates, timeout, visible)
+        return elements[0] if elements else None
+
+    # ==================== 滚动定位 ====================
+
+    def scroll_to_first(self, candidates: Sequence[tuple], block: str = "center", offset: float = 0,
+                        fallback=None, text_pattern: str = None, timeout: float = 0) -> Optional[dict]:
+        """
+        在一次execute_script中找到第一个可见的候选元素并无动画滚动到目标位置
+
+        Args:
+            candidates: 候选定位器列表，按优先级排列
+            block: 元素在视口中的位置（start、center、end）
+            offset: 在计算出的滚动位置上追加的像素（正数继续向下）
+            fallback: 没有候选匹配时的滚动位置：页面高度比例（0-1）或 "bottom"，None时不滚动
+            text_pattern: 元素文本需要匹配的正则表达式（不区分大小写）
+            timeout: 大于0时等待候选元素出现，超时后才使用fallback
+
+        Returns:
+            滚动后的位置信息 {matched: 匹配的候选序号（-1表示使用了fallback）, scroll_y, element_top,
+            viewport_height, page_height, relative_position}，没有滚动时返回None
+        """
+        queries = [self._locator_to_query(locator) for locator in candidates]
+        options = {'block': block, 'offset': offset, 'fallback': fallback, 'textPattern': text_pattern}
+        geometry = None
+
+        if timeout > 0 and queries:
+            def scrolled_to_candidate(driver):
+                nonlocal geometry
+                geometry = driver.execute_script(self._SCROLL_TO_FIRST_SCRIPT, queries, dict(options, fallback=None))
+                return geometry['matched'] >= 0
+
+            if not self.wait_until(scrolled_to_candidate, timeout, f"滚动定位{len(queries)}个候选"):
+                geometry = None
+
+        if geometry is None:
+            geometry = self.driver.execute_script(self._SCROLL_TO_FIRST_SCRIPT, queries, options)
+        if not geometry['scrolled']:
+            return None
+
+        if geometry['matched'] >= 0:
+            logger.debug(f"已滚动到候选元素（第{geometry['matched'] + 1}个）: {candidates[geometry['matched']]}")
+        logger.info(f"滚动完成，当前位置: {geometry['scroll_y']}px, 相对位置: {geometry['relative_position']:.1f}%")
+        return geometry
+
+    @staticmethod
+    def _locator_to_query(locator: tuple) -> list:
+        """
+        将Selenium定位器转换为脚本可执行的查询 [类型, 表达式]，类型为 css 或 xpath
+
+        Args:
+            locator: 元素定位器
+
+        Returns:
+            [类型, 表达式]
+        """
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return ["css", value]
+        if by == By.ID:
+            return ["css", f"[id={json.dumps(value)}]"]
+        if by == By.NAME:
+            return ["css", f"[name={json.dumps(value)}]"]
+        if by == By.CLASS_NAME:
+            return ["css", f".{value}"]
+        if by == By.TAG_NAME:
+            return ["css", value]
+        if by == By.LINK_TEXT:
+            return ["xpath", f"//a[normalize-space(.)={BasePage._xpath_literal(value)}]"]
+        if by == By.PARTIAL_LINK_TEXT:
+            return ["xpath", f"//a[contains(., {BasePage._xpath_literal(value)})]"]
+        return ["xpath", value]
+
+    @staticmethod
+    def _xpath_literal(text: str) -> str:
+        """将文本转换为XPath字符串字面量"""
+        if "'" not in text:
+            return f"'{text}'"
+        if '"' not in text:
+            return f'"{text}"'
+        parts = text.split("'")
+        return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+# 基础页面自身的公开方法同样纳入耗时追踪
+instrument_page_class(BasePage)
+
+# 驱动归还会话池或关闭时清除其页面对象缓存，避免驱动无法释放以及页面状态带入下一个用例
+on_driver_release(BasePage.evict_driver)
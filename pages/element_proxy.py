@@ -0,0 +1,103 @@
+"""
+页面元素延迟代理
+页面类用LazyElement声明元素，首次使用时才定位并缓存WebElement；
+缓存的元素过期（页面刷新、重新渲染）时自动重新定位并重试当前操作
+"""
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException
+from loguru import logger
+
+
+class ElementProxy:
+    """元素代理类：转发WebElement的属性和方法，元素过期时重新定位"""
+
+    def __init__(self, page, locator: tuple, visible: bool = False, timeout: float = None):
+        """
+        初始化元素代理
+
+        Args:
+            page: 页面对象
+            locator: 元素定位器
+            visible: 定位时是否等待元素可见
+            timeout: 定位超时时间，None时使用页面默认显式等待
+        """
+        self._page = page
+        self._locator = locator
+        self._visible = visible
+        self._timeout = timeout
+        self._element = None
+
+    @property
+    def locator(self) -> tuple:
+        """元素定位器"""
+        return self._locator
+
+    @property
+    def element(self) -> WebElement:
+        """缓存的WebElement（首次访问时定位），传给execute_script、ActionChains等需要原始元素的接口"""
+        if self._element is None:
+            if self._visible:
+                self._element = self._page.wait_for_element_visible(self._locator, self._timeout)
+            else:
+                self._element = self._page.find_element(self._locator, self._timeout)
+        return self._element
+
+    def reset(self):
+        """丢弃缓存的元素，下次使用时重新定位"""
+        self._element = None
+
+    def __getattr__(self, name):
+        try:
+            attr = getattr(self.element, name)
+        except StaleElementReferenceException:
+            self._relocate(name)
+            attr = getattr(self.element, name)
+        if not callable(attr):
+            return attr
+
+        def call_with_relocate(*args, **kwargs):
+            try:
+                return getattr(self.element, name)(*args, **kwargs)
+            except StaleElementReferenceException:
+                self._relocate(name)
+                return getattr(self.element, name)(*args, **kwargs)
+
+        return call_with_relocate
+
+    def _relocate(self, name: str):
+        """元素过期时丢弃缓存，下次访问重新定位"""
+        logger.debug(f"元素已过期，重新定位后重试 {name}: {self._locator}")
+        self.reset()
+
+    def __repr__(self):
+        state = "已定位" if self._element is not None else "未定位"
+        return f"<ElementProxy {self._locator} {state}>"
+
+
+class LazyElement:
+    """页面元素描述符：每个页面实例首次访问时创建ElementProxy并缓存到实例上"""
+
+    def __init__(self, locator: tuple, visible: bool = False, timeout: float = None):
+        """
+        初始化元素描述符
+
+        Args:
+            locator: 元素定位器
+            visible: 定位时是否等待元素可见
+            timeout: 定位超时时间，None时使用页面默认显式等待
+        """
+        self.locator = locator
+        self.visible = visible
+        self.timeout = timeout
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        proxy = ElementProxy(page, self.locator, self.visible, self.timeout)
+        # 非数据描述符：写入实例字典后，后续访问直接返回同一个代理
+        page.__dict__[self.name] = proxy
+        return proxy
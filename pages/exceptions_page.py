@@ -2,6 +2,8 @@
 异常测试页面页面对象
 URL: https://practicetestautomation.com/practice-test-exceptions/
 """
+import os
+import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
@@ -24,6 +26,60 @@ class ExceptionsPage(BasePage):
     CONFIRMATION_MESSAGE = (By.ID, "confirmation")
     PAGE_TITLE = (By.CSS_SELECTOR, "h2")  # 实际页面使用的是h2标签
     INSTRUCTIONS = (By.ID, "instructions")
+
+    # 快速模式的页面初始状态保存脚本：页面刚加载、尚未执行任何用例时调用（已保存时保持不变）
+    _SAVE_INITIAL_STATE_SCRIPT = """
+        if (!window.__autoTestPristine) {
+            var instructions = document.getElementById('instructions');
+            var row1Input = document.querySelector('#row1 input');
+            window.__autoTestPristine = {
+                instructions: instructions ? instructions.cloneNode(true) : null,
+                instructionsParent: instructions ? instructions.parentNode : null,
+                instructionsNext: instructions ? instructions.nextSibling : null,
+                row1Value: row1Input ? row1Input.value : null,
+                row1Disabled: row1Input ? row1Input.disabled : null,
+                confirmation: (document.getElementById('confirmation') || {}).outerHTML || null
+            };
+        }
+        return true;
+    """
+
+    # 快速模式的页面状态重置脚本：清除页面定时器和演示浮层、移除Row 2、恢复instructions和Row 1，
+    # 返回重置后页面是否为初始状态（没有保存过初始状态时不做任何修改，返回false）
+    _DOM_RESET_SCRIPT = """
+        if (!window.__autoTestPristine) return false;
+        var pristine = window.__autoTestPristine;
+
+        // 取消Add按钮等尚未触发的延时操作，避免Row 2在下一个用例中途出现
+        var lastTimer = setTimeout(function () {}, 0);
+        for (var id = 0; id <= lastTimer; id++) {
+            clearTimeout(id);
+        }
+
+        document.querySelectorAll('#exception-panel, [id^="selenium-exception-display"]').forEach(function (el) {
+            el.remove();
+        });
+        var row2 = document.getElementById('row2');
+        if (row2) row2.remove();
+        if (pristine.instructions && !document.getElementById('instructions') && pristine.instructionsParent) {
+            var next = pristine.instructionsNext && pristine.instructionsNext.parentNode === pristine.instructionsParent
+                ? pristine.instructionsNext : null;
+            pristine.instructionsParent.insertBefore(pristine.instructions.cloneNode(true), next);
+        }
+        var row1Input = document.querySelector('#row1 input');
+        if (row1Input && pristine.row1Value !== null) {
+            row1Input.value = pristine.row1Value;
+            row1Input.disabled = pristine.row1Disabled;
+        }
+        var confirmation = document.getElementById('confirmation');
+        if (confirmation && pristine.confirmation) {
+            confirmation.outerHTML = pristine.confirmation;
+        }
+        window.scrollTo(0, 0);
+
+        return !document.getElementById('row2') && !!document.getElementById('add_btn')
+            && (!pristine.instructions || !!document.getElementById('instructions'));
+    """
     
     def __init__(self, driver: WebDriver):
         """
@@ -34,13 +90,99 @@ class ExceptionsPage(BasePage):
         """
         super().__init__(driver)
         self.url = config.urls.get('exceptions_page', 'https://practicetestautomation.com/practice-test-exceptions/')
+
+    @staticmethod
+    def fast_mode() -> bool:
+        """
+        判断是否启用快速模式（环境变量 EXCEPTIONS_FAST_MODE 优先于配置文件）
+
+        快速模式关闭演示用的停顿和浮层，用例之间用局部DOM重置代替整页刷新，滚动不使用动画
+
+        Returns:
+            是否启用快速模式
+        """
+        env_value = os.environ.get("EXCEPTIONS_FAST_MODE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.exceptions_page_config.get('fast_mode', False))
+
+    @staticmethod
+    def presentation_pause(seconds: float):
+        """
+        演示用的停顿（让观看者看清页面），快速模式下跳过
+
+        Args:
+            seconds: 停顿时间（秒）
+        """
+        if not ExceptionsPage.fast_mode():
+            time.sleep(seconds)
     
     def open_page(self):
         """打开异常测试页面"""
         logger.info("正在打开异常测试页面...")
         self.open_url(self.url)
         self.wait_for_page_load()
+        self.save_initial_state()
         logger.info("异常测试页面已加载完成")
+
+    def save_initial_state(self):
+        """快速模式下保存页面初始状态，供用例之间局部重置（必须在执行任何用例之前调用）"""
+        if self.fast_mode():
+            self.driver.execute_script(self._SAVE_INITIAL_STATE_SCRIPT)
+
+    def wait_for_row2_added(self, fallback_seconds: float = 5):
+        """
+        等待点击Add后Row 2出现：快速模式下条件等待，否则按原固定时间等待
+
+        Args:
+            fallback_seconds: 非快速模式下的固定等待时间（秒）
+        """
+        if self.fast_mode():
+            self.wait_until(EC.presence_of_element_located(self.ROW2_INPUT), timeout=10,
+                            description="Row 2出现", budget=fallback_seconds)
+        else:
+            time.sleep(fallback_seconds)
+
+    def scroll_into_view(self, element, block: str = "center", settle: float = 1):
+        """
+        滚动元素到视口：快速模式下无动画滚动且不等待，否则平滑滚动并等待动画完成
+
+        Args:
+            element: WebElement对象
+            block: 垂直对齐方式（start、center、end、nearest）
+            settle: 非快速模式下等待滚动动画的时间（秒）
+        """
+        behavior = "instant" if self.fast_mode() else "smooth"
+        self.driver.execute_script(f"arguments[0].scrollIntoView({{behavior: '{behavior}', block: '{block}'}});", element)
+        self.presentation_pause(settle)
+
+    def restore_initial_state(self):
+        """
+        恢复页面初始状态：快速模式下局部重置DOM，否则刷新页面
+
+        没有保存过初始状态或重置后状态不一致时回退到整页刷新
+        """
+        if self.fast_mode():
+            if self.driver.execute_script(self._DOM_RESET_SCRIPT):
+                logger.info("已局部重置页面状态")
+                return
+            logger.warning("没有保存的初始状态或局部重置后页面状态不一致，改为刷新页面")
+        self.refresh_page()
+        self.wait_for_page_load()
+        self.save_initial_state()
+
+    def reset_page_state(self, case_name: str):
+        """
+        在用例之间重置页面：快速模式下直接恢复初始状态，否则等待3秒后刷新页面
+
+        Args:
+            case_name: 用例名称，用于日志记录
+        """
+        if not self.fast_mode():
+            self._wait_and_refresh_page(case_name)
+            return
+        logger.info(f"{case_name}执行完成，重置页面状态...")
+        self.restore_initial_state()
     
     def click_add_button(self):
         """点击Add按钮"""
@@ -160,9 +302,11 @@ class ExceptionsPage(BasePage):
             页面是否正确加载
         """
         try:
-            # 等待页面稳定
-            import time
-            time.sleep(2)
+            # 等待页面稳定（快速模式下等待DOM稳定即可）
+            if self.fast_mode():
+                self.wait_for_dom_stable(budget=2)
+            else:
+                time.sleep(2)
 
             # 检查页面URL是否正确
             current_url = self.get_current_url()
@@ -178,6 +322,8 @@ class ExceptionsPage(BasePage):
             row1_visible = self.is_element_visible(self.ROW1)
 
             is_loaded = url_correct and title_visible and add_button_visible and row1_visible
+            if is_loaded:
+                self.save_initial_state()
 
             logger.info(f"异常测试页面加载验证结果: {is_loaded}")
             logger.debug(f"URL正确: {url_correct}, 标题可见: {title_visible}, Add按钮可见: {add_button_visible}, Row1可见: {row1_visible}")
@@ -229,30 +375,29 @@ class ExceptionsPage(BasePage):
         # 用例1: NoSuchElementException测试
         logger.info("=== 执行用例1: NoSuchElementException测试 ===")
         self._execute_exception_test_case_1()
-        self._wait_and_refresh_page("用例1")
+        self.reset_page_state("用例1")
 
         # 用例2: ElementNotInteractableException测试（不可见元素）
         logger.info("=== 执行用例2: ElementNotInteractableException测试（不可见元素） ===")
         self._execute_exception_test_case_2()
-        self._wait_and_refresh_page("用例2")
+        self.reset_page_state("用例2")
 
         # 用例3: ElementNotInteractableException测试（禁用元素）
         logger.info("=== 执行用例3: ElementNotInteractableException测试（禁用元素） ===")
         self._execute_exception_test_case_3()
-        self._wait_and_refresh_page("用例3")
+        self.reset_page_state("用例3")
 
         # 用例4: InvalidElementStateException测试
         logger.info("=== 执行用例4: InvalidElementStateException测试 ===")
         self._execute_exception_test_case_4()
-        self._wait_and_refresh_page("用例4")
+        self.reset_page_state("用例4")
 
         # 用例5: StaleElementReferenceException测试
         logger.info("=== 执行用例5: StaleElementReferenceException测试 ===")
         self._execute_exception_test_case_5()
         # 最后一个用例不需要刷新页面
         logger.info("等待3秒完成最后一个用例...")
-        import time
-        time.sleep(3)
+        self.presentation_pause(3)
 
         logger.info("异常测试流程执行完成（5个异常验证用例全部完成）")
 
@@ -260,11 +405,9 @@ class ExceptionsPage(BasePage):
         """
         滚动页面到Add按钮位置
         """
-        import time
         try:
             add_button = self.driver.find_element(By.ID, "add_btn")
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", add_button)
-            time.sleep(1)  # 等待滚动完成
+            self.scroll_into_view(add_button, "center", settle=1)
             logger.info("已滚动到Add按钮位置")
         except Exception as e:
             logger.warning(f"滚动到Add按钮失败: {e}")
@@ -278,11 +421,13 @@ class ExceptionsPage(BasePage):
             exception_type: 异常类型
             exception_message: 异常消息
         """
-        import time
-
         logger.info(f"✅ {case_name}成功: 触发了真实的{exception_type}")
         logger.info(f"异常详情: {exception_message}")
 
+        if self.fast_mode():
+            # 快速模式不显示演示浮层
+            return
+
         # 在浏览器界面上显示异常信息
         display_message = f"{exception_type}: {exception_message[:50]}..."
         self.driver.execute_script(f"""
@@ -332,7 +477,6 @@ class ExceptionsPage(BasePage):
         Args:
             case_name: 用例名称，用于日志记录
         """
-        import time
         logger.info(f"{case_name}执行完成，等待3秒...")
         time.sleep(3)
 
@@ -359,14 +503,13 @@ class ExceptionsPage(BasePage):
         """
         logger.info("用例1: NoSuchElementException测试 - 点击Add后立即Submit")
 
-        import time
         from selenium.webdriver.common.by import By
         from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementNotInteractableException
 
         # 步骤1: Open page (已经打开) + 滚动到Add按钮
         logger.info("用例1步骤1: 页面已打开，滚动到Add按钮位置...")
         self._scroll_to_add_button()
-        time.sleep(1)
+        self.presentation_pause(1)
 
         # 步骤2: Click Add button
         logger.info("用例1步骤2: 点击Add按钮...")
@@ -403,7 +546,7 @@ class ExceptionsPage(BasePage):
 
             # 现在显示正常结果：等待Row2出现
             logger.info("用例1: 现在显示正常结果 - 等待Row2正确出现...")
-            time.sleep(2)  # 给Row2时间出现
+            self.wait_for_row2_added(2)  # 给Row2时间出现
 
             try:
                 # 使用正确的等待方式查找Row2
@@ -433,19 +576,18 @@ class ExceptionsPage(BasePage):
         """
         logger.info("用例2: ElementNotInteractableException测试 - 按照页面步骤执行")
 
-        import time
         from selenium.webdriver.common.by import By
         from selenium.common.exceptions import ElementNotInteractableException
 
         # 步骤1: Open page (已经打开) + 滚动到Add按钮
         logger.info("用例2步骤1: 页面已打开，滚动到Add按钮位置...")
         self._scroll_to_add_button()
-        time.sleep(1)
+        self.presentation_pause(1)
 
         # 步骤2: Click Add button
         logger.info("用例2步骤2: 点击Add按钮...")
         self.click_add_button()
-        time.sleep(3)  # 等待Row2出现
+        self.wait_for_row2_added(3)  # 等待Row2出现
 
         # 验证Row2已显示
         if not self.is_row2_displayed():
@@ -509,16 +651,15 @@ class ExceptionsPage(BasePage):
         """
         logger.info("用例3: ElementNotInteractableException测试 - 与禁用元素交互")
 
-        import time
         # 步骤1: 滚动到Add按钮位置
         logger.info("用例3步骤1: 滚动到Add按钮位置...")
         self._scroll_to_add_button()
-        time.sleep(1)
+        self.presentation_pause(1)
 
         # 步骤2: 点击Add按钮使Row2出现
         logger.info("用例3步骤2: 点击Add按钮使Row2出现...")
         self.click_add_button()
-        time.sleep(3)  # 等待Row2完全加载
+        self.wait_for_row2_added(3)  # 等待Row2完全加载
 
         # 验证Row2已显示
         if not self.is_row2_displayed():
@@ -590,16 +731,15 @@ class ExceptionsPage(BasePage):
         """
         logger.info("用例4: InvalidElementStateException测试 - 清除禁用的输入字段")
 
-        import time
         # 步骤1: 滚动到Add按钮位置
         logger.info("用例4步骤1: 滚动到Add按钮位置...")
         self._scroll_to_add_button()
-        time.sleep(1)
+        self.presentation_pause(1)
 
         # 步骤2: 点击Add按钮使Row2出现
         logger.info("用例4步骤2: 点击Add按钮使Row2出现...")
         self.click_add_button()
-        time.sleep(3)  # 等待Row2完全加载
+        self.wait_for_row2_added(3)  # 等待Row2完全加载
 
         # 验证Row2已显示
         if not self.is_row2_displayed():
@@ -667,11 +807,10 @@ class ExceptionsPage(BasePage):
         """
         logger.info("用例5: StaleElementReferenceException测试 - 元素引用过期")
 
-        import time
         # 步骤1: 滚动到Add按钮位置
         logger.info("用例5步骤1: 滚动到Add按钮位置...")
         self._scroll_to_add_button()
-        time.sleep(1)
+        self.presentation_pause(1)
 
         # 步骤2: 首先获取instructions元素的引用
         logger.info("用例5步骤2: 获取instructions元素的引用...")
@@ -690,7 +829,7 @@ class ExceptionsPage(BasePage):
         # 点击Add按钮，这会导致instructions元素被移除
         logger.info("用例5: 点击Add按钮（这会导致instructions元素被移除）...")
         self.click_add_button()
-        time.sleep(3)  # 等待页面变化完成
+        self.wait_for_row2_added(3)  # 等待页面变化完成
 
         # 现在尝试与之前获取的instructions元素交互
         logger.info("用例5: 尝试与之前获取的instructions元素交互...")
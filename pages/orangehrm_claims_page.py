@@ -1,13 +1,19 @@
 """
 OrangeHRM Claims页面对象
 """
+from typing import Dict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
 from pages.base_page import BasePage
+from pages.element_proxy import LazyElement
+from utils.api_client import record_created_claim, verify_claim_via_api
+from utils.click_strategy_cache import click_strategy_cache
+from utils.retry_policy import BACKOFF, GIVE_UP, RELOCATE, RetryPolicy, RetryableFailure, is_dead_session
 import time
 import os
+from datetime import datetime
 
 
 class OrangeHRMClaimsPage(BasePage):
@@ -50,6 +56,20 @@ class OrangeHRMClaimsPage(BasePage):
     # Claims列表
     CLAIMS_TABLE = (By.XPATH, "//div[@class='oxd-table-body']")
     CLAIMS_ROWS = (By.XPATH, "//div[@class='oxd-table-card']")
+    LATEST_RECORD_CANDIDATES = [
+        (By.XPATH, "//table//tr[last()]"),
+        (By.XPATH, "//table//tr[contains(@class,'latest-record')]"),
+    ]
+
+    # Claim Request表单字段标签 -> 批量填写失败时使用的单字段填写方法
+    CLAIM_REQUEST_FIELD_FILLERS = {
+        "Employee Name": "enter_employee_name",
+        "Event": "select_event",
+        "Currency": "select_currency",
+    }
+
+    # 延迟定位的元素（首次使用时定位，过期时自动重新定位）
+    employee_name_input = LazyElement(EMPLOYEE_NAME_FIELD, visible=True, timeout=10)
     
     def __init__(self, driver: WebDriver):
         """
@@ -136,53 +156,48 @@ class OrangeHRMClaimsPage(BasePage):
             ("最宽泛搜索", (By.XPATH, "//*[contains(.,'Assign Claim') and (self::button or self::a or @role='button' or contains(@class,'button') or contains(@class,'nav'))]")),
         ]
 
+        # 所有候选定位器在一次请求中同时评估，点击失败时去掉胜出的定位器重新评估剩余候选
+        strategy_names = {locator: strategy_name for strategy_name, locator in locators}
+        remaining = [locator for _, locator in locators]
         success = False
-        for i, (strategy_name, locator) in enumerate(locators, 1):
-            try:
-                logger.info(f"尝试定位策略 {i} ({strategy_name}): {locator[1]}")
-
-                # 先检查元素是否存在
-                elements = self.driver.find_elements(locator[0], locator[1])
-                if not elements:
-                    logger.warning(f"❌ 策略 {i} ({strategy_name}): 未找到匹配的元素")
-                    continue
-
-                logger.info(f"✅ 策略 {i} ({strategy_name}): 找到 {len(elements)} 个匹配元素")
-
-                # 尝试点击第一个可见且可点击的元素
-                for j, element in enumerate(elements):
-                    try:
-                        if element.is_displayed() and element.is_enabled():
-                            logger.info(f"策略 {i} ({strategy_name}): 尝试点击第 {j+1} 个元素")
-
-                            # 获取元素信息用于调试
-                            element_info = {
-                                'tag': element.tag_name,
-                                'text': element.text.strip(),
-                                'class': element.get_attribute('class'),
-                                'href': element.get_attribute('href')
-                            }
-                            logger.info(f"元素信息: {element_info}")
-
-                            # 滚动到元素位置
-                            self.scroll_to_element(element)
-                            time.sleep(1)
-
-                            # 直接点击元素（已经确认可见和可用）
-                            element.click()
-                            logger.info(f"🎉 策略 {i} ({strategy_name}) 成功点击Assign Claim按钮")
-                            success = True
-                            break
-                    except Exception as e:
-                        logger.warning(f"策略 {i} 元素 {j+1} 点击失败: {str(e)}")
+        while remaining and not success:
+            locator, elements = self.race_locators(remaining, timeout=5)
+            if locator is None:
+                logger.warning(f"❌ 剩余{len(remaining)}个定位策略都未找到可见的匹配元素")
+                break
+
+            remaining.remove(locator)
+            strategy_name = strategy_names[locator]
+            logger.info(f"✅ 定位策略 ({strategy_name}) 找到 {len(elements)} 个可见元素: {locator[1]}")
+
+            # 尝试点击第一个可用的元素
+            for j, element in enumerate(elements):
+                try:
+                    if not element.is_enabled():
                         continue
+                    logger.info(f"策略 ({strategy_name}): 尝试点击第 {j+1} 个元素")
+
+                    # 获取元素信息用于调试
+                    element_info = {
+                        'tag': element.tag_name,
+                        'text': element.text.strip(),
+                        'class': element.get_attribute('class'),
+                        'href': element.get_attribute('href')
+                    }
+                    logger.info(f"元素信息: {element_info}")
 
-                if success:
-                    break
+                    # 滚动到元素位置
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                    time.sleep(1)
 
-            except Exception as e:
-                logger.warning(f"❌ 策略 {i} 失败: {str(e)}")
-                continue
+                    # 直接点击元素（已经确认可见和可用）
+                    element.click()
+                    logger.info(f"🎉 策略 ({strategy_name}) 成功点击Assign Claim按钮")
+                    success = True
+                    break
+                except Exception as e:
+                    logger.warning(f"策略 ({strategy_name}) 元素 {j+1} 点击失败: {str(e)}")
+                    continue
 
         if not success:
             # 如果所有策略都失败，尝试JavaScript方法
@@ -367,7 +382,7 @@ class OrangeHRMClaimsPage(BasePage):
             logger.info(f"{element_name}元素信息: {element_info}")
 
             # 多种点击策略
-            return self._try_multiple_click_strategies(element, element_name)
+            return self._try_multiple_click_strategies(element, element_name, locator)
 
         except Exception as e:
             logger.error(f"❌ 点击{element_name}失败: {e}")
@@ -412,104 +427,121 @@ class OrangeHRMClaimsPage(BasePage):
             time.sleep(1)
 
             # 尝试多种点击策略
-            click_success = False
-
-            # 策略1: 直接点击
-            try:
-                element.click()
-                logger.info(f"🎉 策略1成功点击{element_name}")
-                click_success = True
-            except Exception as e1:
-                logger.warning(f"策略1点击失败: {e1}")
-
-                # 策略2: JavaScript点击
-                try:
-                    self.driver.execute_script("arguments[0].click();", element)
-                    logger.info(f"🎉 策略2(JavaScript)成功点击{element_name}")
-                    click_success = True
-                except Exception as e2:
-                    logger.warning(f"策略2(JavaScript)点击失败: {e2}")
-
-                    # 策略3: 滚动到中心后点击
-                    try:
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                        time.sleep(1)
-                        element.click()
-                        logger.info(f"🎉 策略3(滚动到中心)成功点击{element_name}")
-                        click_success = True
-                    except Exception as e3:
-                        logger.warning(f"策略3(滚动到中心)点击失败: {e3}")
-
-                        # 策略4: ActionChains点击
-                        try:
-                            from selenium.webdriver.common.action_chains import ActionChains
-                            actions = ActionChains(self.driver)
-                            actions.move_to_element(element).click().perform()
-                            logger.info(f"🎉 策略4(ActionChains)成功点击{element_name}")
-                            click_success = True
-                        except Exception as e4:
-                            logger.error(f"策略4(ActionChains)点击失败: {e4}")
-
-            if click_success:
-                self.wait_for_page_load()
-                return True
-            else:
-                raise Exception(f"所有点击策略都失败了")
+            return self._try_multiple_click_strategies(element, element_name, locator,
+                                                       strategies=self._link_click_strategies())
 
         except Exception as e:
             logger.error(f"❌ 点击{element_name}失败: {e}")
             return False
 
-    def _try_multiple_click_strategies(self, element, element_name):
+    def _link_click_strategies(self):
+        """
+        导航栏链接的点击策略（已滚动到元素后使用）
+
+        Returns:
+            [(策略名称, 说明, 点击函数)]
+        """
+        def native_click(target):
+            target.click()
+
+        def javascript_click(target):
+            self.driver.execute_script("arguments[0].click();", target)
+
+        def scroll_to_center_and_click(target):
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target)
+            time.sleep(1)
+            target.click()
+
+        def action_chains_click(target):
+            from selenium.webdriver.common.action_chains import ActionChains
+            actions = ActionChains(self.driver)
+            actions.move_to_element(target).click().perform()
+
+        return [
+            ("native_click", "直接点击", native_click),
+            ("javascript_click", "JavaScript点击", javascript_click),
+            ("center_click", "滚动到中心后点击", scroll_to_center_and_click),
+            ("action_chains", "ActionChains点击", action_chains_click),
+        ]
+
+    def _try_multiple_click_strategies(self, element, element_name, locator=None, strategies=None):
         """
         尝试多种点击策略专门针对内容区域按钮
 
+        尝试顺序来自点击策略缓存（按页面和定位器记录）：上次成功的策略最先尝试，连续失败的策略降级到最后。
+        每种策略按失败原因重试：元素引用过期时重新定位后立即重试，超时时退避后重试，
+        浏览器会话失效时不再尝试后续策略，其他错误直接换下一种策略
+
         Args:
             element: WebElement对象
             element_name: 元素名称
+            locator: 元素定位器，元素引用过期时用于重新定位，同时作为策略缓存的键
+            strategies: [(策略名称, 说明, 点击函数)]，None时使用内容区域按钮的6种策略
 
         Returns:
             bool: 点击是否成功
         """
         logger.info(f"开始尝试多种点击策略针对{element_name}")
+        current = {'element': element}
+        strategies = strategies or self._content_button_click_strategies()
+        strategy_map = {name: (description, click) for name, description, click in strategies}
+        cache_key = click_strategy_cache.key(type(self).__name__, locator or element_name)
+        ordered_names = click_strategy_cache.order(cache_key, [name for name, _, _ in strategies])
+
+        # 点击失败的其他原因（被遮挡、不可交互等）换下一种策略处理，不在同一策略上重试
+        policy = RetryPolicy(max_attempts=2, default_action=GIVE_UP)
+
+        def relocate_before_retry(attempt: int, error: BaseException, action: str):
+            if action == RELOCATE and locator is not None:
+                current['element'] = self.find_element(locator)
+
+        for index, name in enumerate(ordered_names, 1):
+            description, click = strategy_map[name]
+            logger.info(f"策略{index}: {description}")
+            try:
+                policy.call(lambda: click(current['element']), operation=f"点击{element_name}-{description}",
+                            on_retry=relocate_before_retry)
+            except Exception as e:
+                if is_dead_session(e):
+                    logger.error(f"❌ 浏览器会话已失效，停止尝试点击{element_name}: {e}")
+                    return False
+                click_strategy_cache.record(cache_key, name, False)
+                logger.warning(f"策略{index}({description})失败: {e}")
+                continue
 
-        # 策略1: 滚动到元素并直接点击
-        try:
-            logger.info("策略1: 滚动到元素并直接点击")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
-            element.click()
-            logger.info(f"🎉 策略1成功点击{element_name}")
+            click_strategy_cache.record(cache_key, name, True)
+            logger.info(f"🎉 策略{index}({description})成功点击{element_name}")
             self.wait_for_page_load()
             return True
-        except Exception as e1:
-            logger.warning(f"策略1失败: {e1}")
+
+        logger.error(f"❌ 所有{len(strategies)}种点击策略都失败了，无法点击{element_name}")
+        return False
+
+    def _content_button_click_strategies(self):
+        """
+        内容区域按钮的点击策略
+
+        Returns:
+            [(策略名称, 说明, 点击函数)]
+        """
+        # 策略1: 滚动到元素并直接点击
+        def scroll_and_click(target):
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", target)
+            time.sleep(1)
+            target.click()
 
         # 策略2: JavaScript直接点击
-        try:
-            logger.info("策略2: JavaScript直接点击")
-            self.driver.execute_script("arguments[0].click();", element)
-            logger.info(f"🎉 策略2(JavaScript)成功点击{element_name}")
-            self.wait_for_page_load()
-            return True
-        except Exception as e2:
-            logger.warning(f"策略2失败: {e2}")
+        def javascript_click(target):
+            self.driver.execute_script("arguments[0].click();", target)
 
         # 策略3: 滚动到视口中心后点击
-        try:
-            logger.info("策略3: 滚动到视口中心后点击")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", element)
+        def scroll_to_center_and_click(target):
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", target)
             time.sleep(2)
-            element.click()
-            logger.info(f"🎉 策略3(滚动到中心)成功点击{element_name}")
-            self.wait_for_page_load()
-            return True
-        except Exception as e3:
-            logger.warning(f"策略3失败: {e3}")
+            target.click()
 
         # 策略4: 移除可能的遮挡元素后点击
-        try:
-            logger.info("策略4: 移除可能的遮挡元素后点击")
+        def hide_topbar_and_click(target):
             # 尝试隐藏可能遮挡的顶部标题栏
             self.driver.execute_script("""
                 var topbar = document.querySelector('.oxd-topbar-header-title');
@@ -518,43 +550,32 @@ class OrangeHRMClaimsPage(BasePage):
                 }
             """)
             time.sleep(1)
-            element.click()
-            logger.info(f"🎉 策略4(移除遮挡)成功点击{element_name}")
-            self.wait_for_page_load()
-            return True
-        except Exception as e4:
-            logger.warning(f"策略4失败: {e4}")
+            target.click()
 
         # 策略5: ActionChains模拟用户点击
-        try:
-            logger.info("策略5: ActionChains模拟用户点击")
+        def action_chains_click(target):
             from selenium.webdriver.common.action_chains import ActionChains
             actions = ActionChains(self.driver)
-            actions.move_to_element(element).pause(1).click().perform()
-            logger.info(f"🎉 策略5(ActionChains)成功点击{element_name}")
-            self.wait_for_page_load()
-            return True
-        except Exception as e5:
-            logger.warning(f"策略5失败: {e5}")
+            actions.move_to_element(target).pause(1).click().perform()
 
         # 策略6: 强制JavaScript点击（忽略遮挡）
-        try:
-            logger.info("策略6: 强制JavaScript点击（忽略遮挡）")
+        def dispatch_click_event(target):
             self.driver.execute_script("""
                 arguments[0].dispatchEvent(new MouseEvent('click', {
                     view: window,
                     bubbles: true,
                     cancelable: true
                 }));
-            """, element)
-            logger.info(f"🎉 策略6(强制JavaScript)成功点击{element_name}")
-            self.wait_for_page_load()
-            return True
-        except Exception as e6:
-            logger.warning(f"策略6失败: {e6}")
-
-        logger.error(f"❌ 所有6种点击策略都失败了，无法点击{element_name}")
-        return False
+            """, target)
+
+        return [
+            ("scroll_click", "滚动到元素并直接点击", scroll_and_click),
+            ("javascript_click", "JavaScript直接点击", javascript_click),
+            ("center_click", "滚动到视口中心后点击", scroll_to_center_and_click),
+            ("hide_topbar_click", "移除可能的遮挡元素后点击", hide_topbar_and_click),
+            ("action_chains", "ActionChains模拟用户点击", action_chains_click),
+            ("dispatch_event", "强制JavaScript点击（忽略遮挡）", dispatch_click_event),
+        ]
 
     def enter_employee_name(self, employee_name: str):
         """
@@ -566,11 +587,8 @@ class OrangeHRMClaimsPage(BasePage):
         logger.info(f"正在输入员工姓名: {employee_name}")
 
         try:
-            # 等待输入框可见
-            self.wait_for_element_visible(self.EMPLOYEE_NAME_FIELD, timeout=10)
-
-            # 清空并输入员工姓名
-            element = self.find_element(self.EMPLOYEE_NAME_FIELD)
+            # 清空并输入员工姓名（等待输入框可见）
+            element = self.employee_name_input
             element.clear()
             element.send_keys(employee_name)
 
@@ -687,9 +705,33 @@ class OrangeHRMClaimsPage(BasePage):
             event: 事件类型
             currency: 货币类型
         """
-        self.enter_employee_name(employee_name)
-        self.select_event(event)
-        self.select_currency(currency)
+        self.fill_claim_request_fields({
+            "Employee Name": employee_name,
+            "Event": event,
+            "Currency": currency,
+        })
+
+    def fill_claim_request_fields(self, fields: Dict[str, str]):
+        """
+        批量填写Claim Request表单：等待所有字段出现后一次请求填写，未填写成功的字段逐个使用页面方法补填
+
+        Args:
+            fields: 字段标签 -> 值（如 {"Employee Name": "Amelia Brown", "Event": "Travel allowances"}）
+        """
+        logger.info(f"正在批量填写Claim Request表单: {fields}")
+
+        # 等待表单所有字段出现（每次轮询一次请求）
+        self.wait_until(lambda driver: set(fields) <= set(self.snapshot_form()), 10, "Claim Request表单加载")
+
+        result = self.fill_form(fields)
+        for label, value in fields.items():
+            if result.get(label):
+                continue
+            filler = self.CLAIM_REQUEST_FIELD_FILLERS.get(label)
+            if filler is None:
+                raise Exception(f"无法填写字段: {label}")
+            logger.info(f"批量填写未完成，逐个填写字段: {label}")
+            getattr(self, filler)(value)
     
     def is_success_message_displayed(self) -> bool:
         """
@@ -850,7 +892,9 @@ class OrangeHRMClaimsPage(BasePage):
 
     def _select_expense_type_with_retry(self, preferred_type: str, fallback_type: str, max_retries: int = 2):
         """
-        选择费用类型，带刷新重试机制
+        选择费用类型，带重试机制
+
+        下拉框未找到或元素引用过期时立即重试，下拉菜单没有数据或超时时指数退避后刷新页面重试
 
         Args:
             preferred_type: 优先选择的费用类型（Transport）
@@ -860,116 +904,115 @@ class OrangeHRMClaimsPage(BasePage):
         Returns:
             bool: 是否成功选择费用类型
         """
-        for attempt in range(max_retries + 1):
+        policy = RetryPolicy(max_attempts=max_retries + 1)
+
+        def reload_before_retry(attempt: int, error: BaseException, action: str):
+            if action == BACKOFF:
+                self._reload_add_expense_section()
+
+        try:
+            return policy.call(lambda: self._select_expense_type_once(preferred_type, fallback_type),
+                               operation="选择费用类型", on_retry=reload_before_retry)
+        except Exception as e:
+            logger.error(f"所有尝试都失败，无法选择费用类型: {e}")
+            return False
+
+    def _select_expense_type_once(self, preferred_type: str, fallback_type: str) -> bool:
+        """
+        选择一次费用类型
+
+        Args:
+            preferred_type: 优先选择的费用类型（Transport）
+            fallback_type: 备用费用类型
+
+        Returns:
+            bool: 选择成功时返回True
+
+        Raises:
+            RetryableFailure: 下拉框未找到、没有选项数据或选择失败
+        """
+        logger.info("尝试选择费用类型")
+
+        # 选择费用类型下拉框
+        expense_type_locators = [
+            (By.XPATH, "//label[text()='Expense Type']/following::div[contains(@class,'oxd-select-text-input')]"),
+            (By.XPATH, "//div[contains(@class,'oxd-select-text-input')]"),
+            (By.XPATH, "//div[contains(@class,'select')]//div[contains(@class,'input')]"),
+            (By.XPATH, "//select"),
+            (By.XPATH, "//input[@placeholder='-- Select --']")
+        ]
+
+        dropdown_clicked = False
+        for locator in expense_type_locators:
             try:
-                logger.info(f"尝试选择费用类型，第{attempt + 1}次尝试")
-
-                # 选择费用类型下拉框
-                expense_type_locators = [
-                    (By.XPATH, "//label[text()='Expense Type']/following::div[contains(@class,'oxd-select-text-input')]"),
-                    (By.XPATH, "//div[contains(@class,'oxd-select-text-input')]"),
-                    (By.XPATH, "//div[contains(@class,'select')]//div[contains(@class,'input')]"),
-                    (By.XPATH, "//select"),
-                    (By.XPATH, "//input[@placeholder='-- Select --']")
-                ]
-
-                dropdown_clicked = False
-                for locator in expense_type_locators:
-                    try:
-                        if self.is_element_visible(locator, timeout=3):
-                            self.click_element(locator)
-                            logger.info("✅ 成功点击费用类型下拉框")
-                            dropdown_clicked = True
-                            break
-                    except:
-                        continue
+                if self.is_element_visible(locator, timeout=3):
+                    self.click_element(locator)
+                    logger.info("✅ 成功点击费用类型下拉框")
+                    dropdown_clicked = True
+                    break
+            except:
+                continue
 
-                if not dropdown_clicked:
-                    logger.warning("未找到费用类型下拉框")
-                    if attempt < max_retries:
-                        continue
-                    else:
-                        return False
+        if not dropdown_clicked:
+            raise RetryableFailure("未找到费用类型下拉框", action=RELOCATE)
 
-                time.sleep(1)
+        time.sleep(1)
 
-                # 检查下拉菜单是否有数据
-                option_elements = []
-                try:
-                    option_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class,'oxd-select-option')]")
-                    if not option_elements:
-                        # 尝试其他选择器
-                        option_elements = self.driver.find_elements(By.XPATH, "//span[contains(@class,'option')] | //div[contains(@class,'option')] | //option")
-                except:
-                    pass
+        # 检查下拉菜单是否有数据
+        option_elements = []
+        try:
+            option_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class,'oxd-select-option')]")
+            if not option_elements:
+                # 尝试其他选择器
+                option_elements = self.driver.find_elements(By.XPATH, "//span[contains(@class,'option')] | //div[contains(@class,'option')] | //option")
+        except:
+            pass
 
-                if not option_elements or len(option_elements) <= 1:  # 只有"-- Select --"选项
-                    logger.warning(f"下拉菜单没有数据或只有默认选项，第{attempt + 1}次尝试")
-                    if attempt < max_retries:
-                        logger.info("刷新页面后重试...")
-                        self.driver.refresh()
-                        time.sleep(3)
-                        # 重新导航到添加费用区域
-                        self.navigate_to_add_expense_section()
-                        time.sleep(1)
-                        continue
-                    else:
-                        logger.error("下拉菜单始终没有数据")
-                        return False
+        if not option_elements or len(option_elements) <= 1:  # 只有"-- Select --"选项
+            raise RetryableFailure("下拉菜单没有数据或只有默认选项")
 
-                # 尝试选择优先类型（Transport）
-                logger.info(f"尝试选择优先费用类型: {preferred_type}")
-                if self._try_select_option(preferred_type):
-                    logger.info(f"✅ 成功选择优先费用类型: {preferred_type}")
-                    return True
+        # 尝试选择优先类型（Transport）
+        logger.info(f"尝试选择优先费用类型: {preferred_type}")
+        if self._try_select_option(preferred_type):
+            logger.info(f"✅ 成功选择优先费用类型: {preferred_type}")
+            return True
 
-                # 如果优先类型不可用，尝试选择任意可用选项
-                logger.info("优先类型不可用，尝试选择任意可用选项")
-                available_options = []
-                for element in option_elements:
-                    try:
-                        option_text = element.text.strip()
-                        if option_text and option_text != "-- Select --":
-                            available_options.append(option_text)
-                    except:
-                        continue
+        # 如果优先类型不可用，尝试选择任意可用选项
+        logger.info("优先类型不可用，尝试选择任意可用选项")
+        available_options = []
+        for element in option_elements:
+            try:
+                option_text = element.text.strip()
+                if option_text and option_text != "-- Select --":
+                    available_options.append(option_text)
+            except:
+                continue
 
-                if available_options:
-                    # 优先选择Transport，如果没有则选择第一个可用选项
-                    selected_option = None
-                    if preferred_type in available_options:
-                        selected_option = preferred_type
-                    elif fallback_type in available_options:
-                        selected_option = fallback_type
-                    else:
-                        selected_option = available_options[0]
-
-                    logger.info(f"选择费用类型: {selected_option}")
-                    if self._try_select_option(selected_option):
-                        logger.info(f"✅ 成功选择费用类型: {selected_option}")
-                        return True
-
-                logger.warning(f"第{attempt + 1}次尝试选择费用类型失败")
-                if attempt < max_retries:
-                    logger.info("刷新页面后重试...")
-                    self.driver.refresh()
-                    time.sleep(3)
-                    # 重新导航到添加费用区域
-                    self.navigate_to_add_expense_section()
-                    time.sleep(1)
+        if available_options:
+            # 优先选择Transport，如果没有则选择第一个可用选项
+            selected_option = None
+            if preferred_type in available_options:
+                selected_option = preferred_type
+            elif fallback_type in available_options:
+                selected_option = fallback_type
+            else:
+                selected_option = available_options[0]
 
-            except Exception as e:
-                logger.error(f"第{attempt + 1}次尝试选择费用类型时发生错误: {e}")
-                if attempt < max_retries:
-                    logger.info("刷新页面后重试...")
-                    self.driver.refresh()
-                    time.sleep(3)
-                    # 重新导航到添加费用区域
-                    self.navigate_to_add_expense_section()
-                    time.sleep(1)
+            logger.info(f"选择费用类型: {selected_option}")
+            if self._try_select_option(selected_option):
+                logger.info(f"✅ 成功选择费用类型: {selected_option}")
+                return True
 
-        logger.error("所有尝试都失败，无法选择费用类型")
-        return False
+        raise RetryableFailure("选择费用类型失败")
+
+    def _reload_add_expense_section(self):
+        """刷新页面并重新进入添加费用区域"""
+        logger.info("刷新页面后重试...")
+        self.driver.refresh()
+        self.wait_for_network_idle(budget=3)
+        # 重新导航到添加费用区域
+        self.navigate_to_add_expense_section()
+        self.wait_for_dom_stable(budget=1)
 
     def _try_select_option(self, option_text: str):
         """
@@ -1117,9 +1160,12 @@ class OrangeHRMClaimsPage(BasePage):
         for selector in create_selectors:
             try:
                 if self.is_element_visible(selector, timeout=3):
+                    started = datetime.now()
                     self.click_element(selector)
                     logger.info("✅ Create按钮点击成功")
                     self.wait_for_page_load()
+                    # 记录本次创建的申请，API验证时只匹配这条申请
+                    record_created_claim(self.driver, started)
                     return
             except:
                 continue
@@ -1244,6 +1290,11 @@ class OrangeHRMClaimsPage(BasePage):
         """验证指定员工的Claim记录存在"""
         logger.info(f"验证员工 {employee_name} 的Claim记录存在...")
 
+        # 优先通过Claims接口验证，接口不可用时再扫描页面表格
+        api_result = verify_claim_via_api(self.driver, employee_name)
+        if api_result is not None:
+            return api_result
+
         record_selectors = [
             (By.XPATH, f"//table//td[contains(text(),'{employee_name}')]"),
             (By.XPATH, f"//*[contains(@class,'oxd-table-row')]//*[contains(text(),'{employee_name}')]")
@@ -1265,9 +1316,14 @@ class OrangeHRMClaimsPage(BasePage):
         logger.info("验证Claim详情在列表中正确显示...")
 
         try:
-            # 这里可以添加具体的验证逻辑
-            # 比如检查表格中的数据是否与输入数据匹配
             employee_name = claim_data.get('Employee Name', '')
+
+            # 优先通过Claims接口按员工、事件和货币匹配，接口不可用时再检查页面表格
+            api_result = verify_claim_via_api(self.driver, employee_name,
+                                              claim_data.get('Event', ''), claim_data.get('Currency', ''))
+            if api_result is not None:
+                return api_result
+
             if employee_name:
                 return self.verify_claim_record_exists(employee_name)
             return True
@@ -1280,31 +1336,11 @@ class OrangeHRMClaimsPage(BasePage):
         """滚动到最新一条记录并保持可见"""
         logger.info("正在滚动到最新一条记录...")
         try:
-            # 等待表格加载
-            time.sleep(2)
-
-            # 定位最新记录行
-            latest_record_selectors = [
-                (By.XPATH, "//table//tr[last()]"),
-                (By.XPATH, "//table//tr[contains(@class,'latest-record')]"),
-                # ... 更多定位策略
-            ]
-
-            for selector in latest_record_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=5):
-                        element = self.find_element(selector)
-                        # 滚动到元素可见
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-                            element
-                        )
-                        time.sleep(1)
-                        return True
-                except:
-                    continue
-
-            raise Exception("无法定位最新记录行")
+            # 等待表格加载后，一次请求内定位最新记录行并居中显示
+            geometry = self.scroll_to_first(self.LATEST_RECORD_CANDIDATES, block="center", timeout=5)
+            if not geometry:
+                raise Exception("无法定位最新记录行")
+            return True
 
         except Exception as e:
             logger.error(f"滚动到最新记录失败: {str(e)}")
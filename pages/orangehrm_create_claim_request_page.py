@@ -7,8 +7,16 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
 from pages.base_page import BasePage
+from pages.element_proxy import LazyElement
+from utils.employee_cache import employee_name_cache
+from utils.api_client import OrangeHRMApiClient, get_api_client, record_created_claim, verify_claim_via_api
+from utils.screenshot_writer import screenshot_writer, flush_screenshots
+from utils.report_engine import ReportEngine, ReportCase
+from utils.screenshot_index import get_screenshot_index
+from utils.retry_policy import BACKOFF, RELOCATE, RetryPolicy, RetryableFailure
 import time
 import os
+from datetime import datetime
 
 class OrangeHRMCreateClaimRequestPage(BasePage):
     """Create Claim Request页面对象"""
@@ -38,7 +46,74 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
     # 按钮
     CREATE_BUTTON = (By.XPATH, "//button[@type='submit' and contains(.,'Create')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(.,'Cancel')]")
-    
+
+    # 延迟定位的元素（首次使用时定位，过期时自动重新定位）
+    remarks_textarea = LazyElement(REMARKS_TEXTAREA, visible=True)
+
+    # 候选定位器链（一次请求同时评估，胜出的定位器按页面类缓存）
+    EMPLOYEE_NAME_INPUT_CANDIDATES = [
+        (By.XPATH, "//label[text()='Employee Name']/following::input[1]"),
+        (By.XPATH, "//label[contains(text(),'Employee')]/following::input[1]"),
+        (By.XPATH, "//input[@placeholder='Type for hints...']"),
+        (By.XPATH, "//div[contains(@class,'oxd-autocomplete')]//input"),
+    ]
+    EMPLOYEE_OPTION_CANDIDATES = [
+        (By.XPATH, "//div[contains(@class,'oxd-autocomplete-dropdown')]//div[contains(@class,'oxd-autocomplete-option')]"),
+        (By.XPATH, "//div[contains(@class,'dropdown')]//div[contains(@class,'option')]"),
+        (By.XPATH, "//ul[contains(@class,'dropdown')]//li"),
+        (By.XPATH, "//div[contains(@class,'autocomplete')]//div[@role='option']"),
+    ]
+    INVALID_EMPLOYEE_HINT_CANDIDATES = [
+        (By.XPATH, "//*[contains(text(),'Invalid')]"),
+        (By.XPATH, "//*[contains(text(),'invalid')]"),
+        (By.XPATH, "//*[contains(text(),'not found')]"),
+        (By.XPATH, "//*[contains(text(),'No Records Found')]"),
+        (By.XPATH, "//span[contains(@class,'error')]"),
+        (By.XPATH, "//div[contains(@class,'error')]"),
+    ]
+
+    # 滚动定位候选（按优先级排列，一次请求内定位并滚动）
+    RECORDS_FOUND_TEXT = (By.XPATH, "//*[contains(text(),'Records Found')]")
+    RECORDS_FOUND_TOP_CONTROL_CANDIDATES = [
+        # Assign Claim、Reset、Search按钮
+        (By.XPATH, "//button[contains(text(),'Assign Claim')]"),
+        (By.XPATH, "//*[contains(text(),'Assign Claim')]"),
+        (By.XPATH, "//button[contains(text(),'Reset')]"),
+        (By.XPATH, "//*[contains(text(),'Reset')]"),
+        (By.XPATH, "//button[contains(text(),'Search')]"),
+        (By.XPATH, "//*[contains(text(),'Search')]"),
+        # Employee Claims标题
+        (By.XPATH, "//h6[contains(text(),'Employee Claims')]"),
+        (By.XPATH, "//*[contains(text(),'Employee Claims')]"),
+        # 表单区域和搜索输入框
+        (By.XPATH, "//div[contains(@class,'oxd-form')]"),
+        (By.XPATH, "//form"),
+        (By.XPATH, "//input[@placeholder='Type for hints...']"),
+        (By.XPATH, "//input[contains(@class,'oxd-input')]"),
+    ]
+    LATEST_RECORD_CANDIDATES = [
+        # 表格第一行记录
+        (By.XPATH, "//div[contains(@class,'oxd-table-row')][1]"),
+        (By.XPATH, "//table//tbody//tr[1]"),
+        (By.XPATH, "(//table//tr[td])[1]"),
+        (By.XPATH, "//table//tr[position()=1 and not(th)]"),
+        # 第一个View Details按钮
+        (By.XPATH, "(//button[contains(text(),'View Details')])[1]"),
+        (By.XPATH, "(//a[contains(text(),'View Details')])[1]"),
+        (By.XPATH, "//table//tr[1]//button[contains(text(),'View Details')]"),
+        (By.XPATH, "//table//tr[1]//a[contains(text(),'View Details')]"),
+    ]
+    TOTAL_AMOUNT_CANDIDATES = [
+        (By.XPATH, "//*[contains(text(),'Total Amount')]"),
+        (By.XPATH, "//*[contains(text(),'Total') and contains(text(),'Amount')]"),
+        (By.XPATH, "//div[contains(@class,'total-amount')]"),
+        (By.XPATH, "//span[contains(@class,'total')]"),
+        (By.XPATH, "//table//td[contains(text(),'Total Amount')] | //table//th[contains(text(),'Total Amount')]"),
+        (By.XPATH, "//*[contains(text(),'Total')]"),
+        # 金额数字（如9.00）
+        (By.XPATH, "//*[contains(text(),'.00') or contains(text(),'9.00')]"),
+    ]
+
     def verify_page_loaded(self):
         """验证Create Claim Request页面已加载"""
         logger.info("验证Create Claim Request页面是否已加载...")
@@ -77,7 +152,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                         element = self.find_element(locator)
                         element.clear()
                         element.send_keys(employee_name)
-                        time.sleep(2)  # 等待自动完成选项出现
+                        self.wait_for_listbox_populated(timeout=5, budget=2)  # 等待自动完成选项出现
                         
                         # 尝试选择第一个匹配项
                         try:
@@ -107,7 +182,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         try:
             # 点击Event下拉框
             self.click_element(self.EVENT_DROPDOWN)
-            time.sleep(2)  # 等待下拉选项加载
+            self.wait_for_listbox_populated(timeout=5, budget=2)  # 等待下拉选项加载
 
             # 获取所有可用的事件选项
             available_options = self._get_available_event_options()
@@ -178,7 +253,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 logger.info(f"✅ 找到精确匹配的首选事件: {preferred_event}")
                 try:
                     option['element'].click()
-                    time.sleep(1)
+                    self.wait_for_dom_stable(budget=1)
                     return option['text']
                 except Exception as e:
                     logger.warning(f"点击精确匹配事件失败: {e}")
@@ -190,7 +265,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 logger.info(f"✅ 找到部分匹配的首选事件: {option['text']}")
                 try:
                     option['element'].click()
-                    time.sleep(1)
+                    self.wait_for_dom_stable(budget=1)
                     return option['text']
                 except Exception as e:
                     logger.warning(f"点击部分匹配事件失败: {e}")
@@ -202,7 +277,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             logger.info(f"尝试选择备用事件: {option['text']}")
             try:
                 option['element'].click()
-                time.sleep(1)
+                self.wait_for_dom_stable(budget=1)
                 logger.info(f"✅ 成功选择备用事件: {option['text']}")
                 return option['text']
             except Exception as e:
@@ -218,7 +293,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         try:
             # 点击Currency下拉框
             self.click_element(self.CURRENCY_DROPDOWN)
-            time.sleep(2)  # 增加等待时间
+            self.wait_for_listbox_populated(timeout=5, budget=2)  # 等待货币选项加载
 
             # 尝试多种选项定位策略
             currency_option_locators = [
@@ -250,7 +325,8 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         """填写备注"""
         logger.info(f"正在填写备注: {remarks}")
         try:
-            self.input_text(self.REMARKS_TEXTAREA, remarks)
+            self.remarks_textarea.clear()
+            self.remarks_textarea.send_keys(remarks)
             logger.info(f"✅ 已填写备注: {remarks}")
             return True
         except Exception as e:
@@ -261,8 +337,11 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         """点击Create按钮"""
         logger.info("正在点击Create按钮...")
         try:
+            started = datetime.now()
             self.click_element(self.CREATE_BUTTON)
             self.wait_for_page_load()
+            # 记录本次创建的申请，API验证时只匹配这条申请
+            record_created_claim(self.driver, started)
             logger.info("✅ 已点击Create按钮")
             return True
         except Exception as e:
@@ -299,21 +378,21 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 logger.error("填写员工姓名失败")
                 return False
             
-            time.sleep(1)
+            self.wait_for_dom_stable(budget=1)
             
             # 选择事件
             if not self.select_event(event):
                 logger.error("选择事件失败")
                 return False
             
-            time.sleep(1)
+            self.wait_for_dom_stable(budget=1)
             
             # 选择货币
             if not self.select_currency(currency):
                 logger.error("选择货币失败")
                 return False
             
-            time.sleep(1)
+            self.wait_for_dom_stable(budget=1)
             
             # 填写备注（可选）
             if remarks:
@@ -341,7 +420,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 return False
             
             # 等待提交完成
-            time.sleep(3)
+            self.wait_for_toast(budget=3)
             
             # 截图提交结果
             self._take_screenshot("Claim_Request_提交完成")
@@ -384,8 +463,8 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshots/create_claim_request_{timestamp}.png"
 
-            # 保存截图
-            self.driver.save_screenshot(filename)
+            # 保存截图（启用异步写入时由后台线程落盘）
+            screenshot_writer.save(self.driver, filename)
             logger.info(f"📸 已保存截图: {filename}")
             return filename
 
@@ -403,8 +482,8 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"screenshots/{description}_{timestamp}.png"
 
-            # 保存截图
-            self.driver.save_screenshot(filename)
+            # 保存截图（启用异步写入时由后台线程落盘）
+            screenshot_writer.save(self.driver, filename)
             logger.info(f"📸 已保存截图: {filename}")
 
         except Exception as e:
@@ -448,7 +527,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
 
         try:
             # 等待页面加载完成
-            time.sleep(3)
+            self.wait_for_network_idle(budget=3)
 
             # 方法1: 检查成功消息
             success_message = self.get_success_message()
@@ -550,7 +629,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         logger.info("正在返回上一页...")
         try:
             self.driver.back()
-            time.sleep(2)
+            self.wait_for_network_idle(budget=2)
             logger.info("✅ 已返回上一页")
             return True
         except Exception as e:
@@ -573,7 +652,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     if self.is_element_visible(selector, timeout=5):
                         element = self.find_element(selector)
                         element.click()
-                        time.sleep(3)
+                        self.wait_for_network_idle(budget=3)
                         logger.info("✅ 已导航到Claim详情页")
                         return True
                 except:
@@ -632,6 +711,11 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             event = claim_data.get("event", "")
             currency = claim_data.get("currency", "")
 
+            # 优先通过Claims接口验证，接口不可用时再扫描页面表格
+            api_result = verify_claim_via_api(self.driver, employee_name, event, currency)
+            if api_result is not None:
+                return api_result
+
             # 查找包含这些信息的行
             found_employee = False
             found_event = False
@@ -779,7 +863,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                         element.click()
                         logger.info(f"✅ 成功点击Add按钮，策略 {i}")
                         add_button_clicked = True
-                        time.sleep(1)  # 减少等待时间
+                        self.wait_for_dom_stable(budget=1)  # 等待费用弹窗渲染完成
                         break
                 except Exception as e:
                     logger.debug(f"Add按钮策略 {i} 失败: {e}")
@@ -809,7 +893,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                             element = self.find_element(selector)
                             element.clear()
                             element.send_keys(date)
-                            time.sleep(1)
+                            self.wait_for_dom_stable(budget=1)  # 等待日期选择器关闭
                             break
                     except:
                         continue
@@ -828,7 +912,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                             element = self.find_element(selector)
                             element.clear()
                             element.send_keys(amount)
-                            time.sleep(1)
+                            self.wait_for_dom_stable(budget=1)
                             break
                     except:
                         continue
@@ -842,7 +926,10 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
 
     def _select_expense_type_with_retry(self, preferred_type: str, fallback_type: str, max_retries: int = 2):
         """
-        选择费用类型，带刷新重试机制
+        选择费用类型，带重试机制
+
+        按失败原因重试：下拉框未找到或元素引用过期时立即重试，下拉菜单没有数据或超时时
+        指数退避后刷新页面并重新进入添加费用区域，浏览器会话失效时直接放弃
 
         Args:
             preferred_type: 优先选择的费用类型（Transport）
@@ -852,127 +939,126 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         Returns:
             bool: 是否成功选择费用类型
         """
-        for attempt in range(max_retries + 1):
-            try:
-                logger.info(f"尝试选择费用类型，第{attempt + 1}次尝试")
+        policy = RetryPolicy(max_attempts=max_retries + 1)
 
-                # 选择费用类型下拉框
-                expense_type_selectors = [
-                    (By.XPATH, "//label[text()='Expense Type']/following::div[contains(@class,'oxd-select-text-input')]"),
-                    (By.XPATH, "//div[contains(@class,'oxd-select-text-input')]"),
-                    (By.XPATH, "//select[@name='expense_type']"),
-                ]
+        def reload_before_retry(attempt: int, error: BaseException, action: str):
+            if action == BACKOFF:
+                self._reload_add_expense_section()
 
-                dropdown_clicked = False
-                for selector in expense_type_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=5):
-                            element = self.find_element(selector)
-                            element.click()
-                            logger.info("✅ 成功点击费用类型下拉框")
-                            dropdown_clicked = True
-                            break
-                    except:
-                        continue
+        try:
+            return policy.call(lambda: self._select_expense_type_once(preferred_type, fallback_type),
+                               operation="选择费用类型", on_retry=reload_before_retry)
+        except Exception as e:
+            logger.error(f"所有尝试都失败，无法选择费用类型: {e}")
+            return False
 
-                if not dropdown_clicked:
-                    logger.warning("未找到费用类型下拉框")
-                    if attempt < max_retries:
-                        continue
-                    else:
-                        return False
+    def _select_expense_type_once(self, preferred_type: str, fallback_type: str) -> bool:
+        """
+        选择一次费用类型
 
-                time.sleep(1)
+        Args:
+            preferred_type: 优先选择的费用类型（Transport）
+            fallback_type: 备用费用类型
 
-                # 检查下拉菜单是否有数据
-                option_elements = []
-                try:
-                    # 扩展选项检测，包含更多可能的费用类型
-                    option_elements = self.driver.find_elements(By.XPATH,
-                        "//div[contains(@class,'oxd-select-option')] | "
-                        "//*[contains(text(),'Transport')] | "
-                        "//*[contains(text(),'Accommodation')] | "
-                        "//*[contains(text(),'Medical')] | "
-                        "//*[contains(text(),'Travel')] | "
-                        "//*[contains(text(),'Food')] | "
-                        "//*[contains(text(),'Fuel')] | "
-                        "//option[not(contains(text(),'Select'))]"
-                    )
-                    logger.debug(f"找到 {len(option_elements)} 个下拉选项")
-                except Exception as e:
-                    logger.debug(f"检查下拉选项时出错: {e}")
-                    pass
-
-                if not option_elements or len(option_elements) <= 1:  # 只有"-- Select --"选项
-                    logger.warning(f"下拉菜单没有数据或只有默认选项，第{attempt + 1}次尝试，找到选项数: {len(option_elements)}")
-                    if attempt < max_retries:
-                        logger.info("刷新页面后重试...")
-                        self.driver.refresh()
-                        time.sleep(3)
-                        # 重新导航到添加费用区域
-                        if self.navigate_to_add_expense_section():
-                            logger.info("✅ 重新导航到费用区域成功")
-                        else:
-                            logger.warning("⚠️ 重新导航到费用区域失败")
-                        time.sleep(1)
-                        continue
-                    else:
-                        logger.error("下拉菜单始终没有数据")
-                        return False
+        Returns:
+            bool: 选择成功时返回True
 
-                # 尝试选择优先类型（Transport）
-                logger.info(f"尝试选择优先费用类型: {preferred_type}")
-                if self._try_select_option(preferred_type):
-                    logger.info(f"✅ 成功选择优先费用类型: {preferred_type}")
-                    return True
+        Raises:
+            RetryableFailure: 下拉框未找到、没有选项数据或选择失败
+        """
+        logger.info("尝试选择费用类型")
 
-                # 如果优先类型不可用，尝试选择任意可用选项
-                logger.info("优先类型不可用，尝试选择任意可用选项")
-                available_options = []
-                for element in option_elements:
-                    try:
-                        option_text = element.text.strip()
-                        if option_text and option_text != "-- Select --":
-                            available_options.append(option_text)
-                    except:
-                        continue
+        # 选择费用类型下拉框
+        expense_type_selectors = [
+            (By.XPATH, "//label[text()='Expense Type']/following::div[contains(@class,'oxd-select-text-input')]"),
+            (By.XPATH, "//div[contains(@class,'oxd-select-text-input')]"),
+            (By.XPATH, "//select[@name='expense_type']"),
+        ]
 
-                if available_options:
-                    # 优先选择Transport，如果没有则选择第一个可用选项
-                    selected_option = None
-                    if preferred_type in available_options:
-                        selected_option = preferred_type
-                    elif fallback_type in available_options:
-                        selected_option = fallback_type
-                    else:
-                        selected_option = available_options[0]
+        dropdown_clicked = False
+        for selector in expense_type_selectors:
+            try:
+                if self.is_element_visible(selector, timeout=5):
+                    element = self.find_element(selector)
+                    element.click()
+                    logger.info("✅ 成功点击费用类型下拉框")
+                    dropdown_clicked = True
+                    break
+            except:
+                continue
 
-                    logger.info(f"选择费用类型: {selected_option}")
-                    if self._try_select_option(selected_option):
-                        logger.info(f"✅ 成功选择费用类型: {selected_option}")
-                        return True
+        if not dropdown_clicked:
+            raise RetryableFailure("未找到费用类型下拉框", action=RELOCATE)
 
-                logger.warning(f"第{attempt + 1}次尝试选择费用类型失败")
-                if attempt < max_retries:
-                    logger.info("刷新页面后重试...")
-                    self.driver.refresh()
-                    time.sleep(3)
-                    # 重新导航到添加费用区域
-                    self.navigate_to_add_expense_section()
-                    time.sleep(1)
+        self.wait_for_listbox_populated(timeout=5, budget=1)  # 等待费用类型选项加载
 
-            except Exception as e:
-                logger.error(f"第{attempt + 1}次尝试选择费用类型时发生错误: {e}")
-                if attempt < max_retries:
-                    logger.info("刷新页面后重试...")
-                    self.driver.refresh()
-                    time.sleep(3)
-                    # 重新导航到添加费用区域
-                    self.navigate_to_add_expense_section()
-                    time.sleep(1)
-
-        logger.error("所有尝试都失败，无法选择费用类型")
-        return False
+        # 检查下拉菜单是否有数据
+        option_elements = []
+        try:
+            # 扩展选项检测，包含更多可能的费用类型
+            option_elements = self.driver.find_elements(By.XPATH,
+                "//div[contains(@class,'oxd-select-option')] | "
+                "//*[contains(text(),'Transport')] | "
+                "//*[contains(text(),'Accommodation')] | "
+                "//*[contains(text(),'Medical')] | "
+                "//*[contains(text(),'Travel')] | "
+                "//*[contains(text(),'Food')] | "
+                "//*[contains(text(),'Fuel')] | "
+                "//option[not(contains(text(),'Select'))]"
+            )
+            logger.debug(f"找到 {len(option_elements)} 个下拉选项")
+        except Exception as e:
+            logger.debug(f"检查下拉选项时出错: {e}")
+            pass
+
+        if not option_elements or len(option_elements) <= 1:  # 只有"-- Select --"选项
+            raise RetryableFailure(f"下拉菜单没有数据或只有默认选项，找到选项数: {len(option_elements)}")
+
+        # 尝试选择优先类型（Transport）
+        logger.info(f"尝试选择优先费用类型: {preferred_type}")
+        if self._try_select_option(preferred_type):
+            logger.info(f"✅ 成功选择优先费用类型: {preferred_type}")
+            return True
+
+        # 如果优先类型不可用，尝试选择任意可用选项
+        logger.info("优先类型不可用，尝试选择任意可用选项")
+        available_options = []
+        for element in option_elements:
+            try:
+                option_text = element.text.strip()
+                if option_text and option_text != "-- Select --":
+                    available_options.append(option_text)
+            except:
+                continue
+
+        if available_options:
+            # 优先选择Transport，如果没有则选择第一个可用选项
+            selected_option = None
+            if preferred_type in available_options:
+                selected_option = preferred_type
+            elif fallback_type in available_options:
+                selected_option = fallback_type
+            else:
+                selected_option = available_options[0]
+
+            logger.info(f"选择费用类型: {selected_option}")
+            if self._try_select_option(selected_option):
+                logger.info(f"✅ 成功选择费用类型: {selected_option}")
+                return True
+
+        raise RetryableFailure("选择费用类型失败")
+
+    def _reload_add_expense_section(self):
+        """刷新页面并重新进入添加费用区域"""
+        logger.info("刷新页面后重试...")
+        self.driver.refresh()
+        self.wait_for_network_idle(budget=3)
+        # 重新导航到添加费用区域
+        if self.navigate_to_add_expense_section():
+            logger.info("✅ 重新导航到费用区域成功")
+        else:
+            logger.warning("⚠️ 重新导航到费用区域失败")
+        self.wait_for_dom_stable(budget=1)
 
     def _try_select_option(self, option_text: str):
         """
@@ -996,7 +1082,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 if self.is_element_visible(option_selector, timeout=5):
                     option_element = self.find_element(option_selector)
                     option_element.click()
-                    time.sleep(1)
+                    self.wait_for_dom_stable(budget=1)
 
                     # 验证是否选择成功
                     try:
@@ -1029,7 +1115,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     if self.is_element_visible(selector, timeout=5):
                         element = self.find_element(selector)
                         element.click()
-                        time.sleep(3)
+                        self.wait_for_toast(budget=3)  # 等待提交成功提示
                         logger.info("✅ 已提交费用")
                         return True
                 except:
@@ -1047,7 +1133,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         logger.info("正在验证费用提交成功...")
         try:
             # 等待页面响应
-            time.sleep(3)
+            self.wait_for_network_idle(budget=3)
 
             # 检查是否有错误提示
             error_indicators = [
@@ -1265,13 +1351,13 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             if element:
                 # 方法1: 使用JavaScript滚动到元素
                 self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-                time.sleep(1)
+                self.wait_for_dom_stable(budget=1)  # 等待平滑滚动结束
 
                 # 方法2: 使用ActionChains移动到元素
                 from selenium.webdriver.common.action_chains import ActionChains
                 actions = ActionChains(self.driver)
                 actions.move_to_element(element).perform()
-                time.sleep(1)
+                self.wait_for_dom_stable(budget=1)
 
                 logger.info("✅ 页面滚动到元素成功")
                 return True
@@ -1284,7 +1370,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             try:
                 # 备用方法：滚动到页面底部
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+                self.wait_for_dom_stable(budget=1)
                 logger.info("✅ 使用备用方法滚动到页面底部")
                 return True
             except:
@@ -1294,260 +1380,49 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         """滚动页面到底部"""
         logger.info("正在滚动页面到底部...")
         try:
-            # 方法1: 使用JavaScript滚动到页面底部
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-
-            # 方法2: 多次滚动确保到达底部
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            # 滚动几次确保完全到底部
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-
-                # 检查是否有新内容加载
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-
-            # 方法3: 使用Page Down键作为备用
-            try:
-                from selenium.webdriver.common.keys import Keys
-                body = self.driver.find_element(By.TAG_NAME, "body")
-                body.send_keys(Keys.END)
-                time.sleep(1)
-            except:
-                pass
-
+            self.scroll_to_first([], fallback="bottom")
+            # 等待底部懒加载的内容渲染后再次定位到底部
+            self.wait_for_dom_stable(budget=1)
+            self.scroll_to_first([], fallback="bottom")
             logger.info("✅ 页面滚动到底部成功")
             return True
-
         except Exception as e:
             logger.error(f"滚动到页面底部失败: {e}")
-            try:
-                # 最简单的备用方法
-                self.driver.execute_script("window.scrollTo(0, 9999);")
-                time.sleep(1)
-                logger.info("✅ 使用简单方法滚动到底部")
-                return True
-            except:
-                logger.error("所有滚动方法都失败")
-                return False
+            return False
 
     def scroll_to_Records_Found(self):
         """滚动到Records Found区域，通过定位Assign Claim、Reset、Search等控件并滚动到页面顶端，使Records Found显示在页面中上部"""
         logger.info("正在滚动到Records Found区域，通过定位页面上部控件实现...")
         try:
-            # 方案1：定位Assign Claim、Reset、Search等控件，将其滚动到页面顶端
-            # 这样Records Found区域就会自然显示在页面中上部
-            top_control_selectors = [
-                # Assign Claim按钮
-                (By.XPATH, "//button[contains(text(),'Assign Claim')]"),
-                (By.XPATH, "//*[contains(text(),'Assign Claim')]"),
-                # Reset按钮
-                (By.XPATH, "//button[contains(text(),'Reset')]"),
-                (By.XPATH, "//*[contains(text(),'Reset')]"),
-                # Search按钮
-                (By.XPATH, "//button[contains(text(),'Search')]"),
-                (By.XPATH, "//*[contains(text(),'Search')]"),
-                # Employee Claims标题
-                (By.XPATH, "//h6[contains(text(),'Employee Claims')]"),
-                (By.XPATH, "//*[contains(text(),'Employee Claims')]"),
-                # 表单区域
-                (By.XPATH, "//div[contains(@class,'oxd-form')]"),
-                (By.XPATH, "//form"),
-                # 搜索表单的输入框
-                (By.XPATH, "//input[@placeholder='Type for hints...']"),
-                (By.XPATH, "//input[contains(@class,'oxd-input')]"),
-            ]
-
-            target_control = None
-            for selector in top_control_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=3):
-                        target_control = self.find_element(selector)
-                        logger.info(f"✅ 找到页面上部控件: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"尝试定位控件失败: {selector}, 错误: {e}")
-                    continue
-
-            if target_control:
-                # 获取控件位置信息
-                control_location = target_control.location
-                window_height = self.driver.execute_script("return window.innerHeight;")
-
-                # 计算滚动位置：将控件滚动到页面顶部，这样Records Found会显示在页面中上部
-                # 我们需要大幅向上滚动，确保Records Found区域显示在页面中上部
-                target_scroll_y = max(0, control_location['y'] - 50)  # 将控件滚动到距离顶部50px的位置
-
-                logger.info(f"控件位置: y={control_location['y']}, 目标滚动位置: {target_scroll_y}")
-
-                # 执行滚动
-                self.driver.execute_script(f"window.scrollTo({{top: {target_scroll_y}, behavior: 'smooth'}});")
-                time.sleep(1.5)
-
-                # 验证滚动效果
-                current_scroll_y = self.driver.execute_script("return window.pageYOffset;")
-                page_height = self.driver.execute_script("return document.body.scrollHeight;")
-                relative_position = (current_scroll_y / page_height) * 100 if page_height > 0 else 0
-
-                logger.info(f"滚动完成，当前位置: {current_scroll_y}px, 相对位置: {relative_position:.1f}%")
-
-                # 如果滚动位置还是太靠下，再次向上滚动
-                if relative_position > 35:  # 如果还在页面35%以下
-                    additional_scroll = window_height  # 额外向上滚动一个窗口高度
-                    self.driver.execute_script(f"window.scrollBy(0, -{additional_scroll});")
-                    time.sleep(0.5)
-
-                    final_scroll_y = self.driver.execute_script("return window.pageYOffset;")
-                    final_relative_position = (final_scroll_y / page_height) * 100 if page_height > 0 else 0
-                    logger.info(f"额外滚动后位置: {final_scroll_y}px, 相对位置: {final_relative_position:.1f}%")
-
-                    # 如果还是太靠下，再次滚动
-                    if final_relative_position > 30:
-                        extra_scroll = window_height // 2
-                        self.driver.execute_script(f"window.scrollBy(0, -{extra_scroll});")
-                        time.sleep(0.5)
-
-                        ultra_final_scroll_y = self.driver.execute_script("return window.pageYOffset;")
-                        ultra_final_relative = (ultra_final_scroll_y / page_height) * 100 if page_height > 0 else 0
-                        logger.info(f"最终滚动后位置: {ultra_final_scroll_y}px, 相对位置: {ultra_final_relative:.1f}%")
-
-                logger.info("✅ 通过定位页面上部控件成功滚动，Records Found区域现在显示在页面中上部")
-                return True
-
-            # 方案2：直接操作滚动条，将页面滚动到合适位置
-            logger.warning("未找到页面上部控件，使用直接滚动方案...")
-
-            # 获取页面信息
-            page_height = self.driver.execute_script("return document.body.scrollHeight;")
-            window_height = self.driver.execute_script("return window.innerHeight;")
-
-            # 更激进的滚动策略：直接滚动到页面上部
-            # 将Records Found区域显示在页面中上部（约20-30%位置）
-            target_scroll_y = page_height * 0.2  # 滚动到页面20%位置
-
-            logger.info(f"页面高度: {page_height}px, 窗口高度: {window_height}px")
-            logger.info(f"目标滚动位置: {target_scroll_y}px (页面20%位置)")
-
-            # 执行滚动
-            self.driver.execute_script(f"window.scrollTo({{top: {target_scroll_y}, behavior: 'smooth'}});")
-            time.sleep(1.5)
-
-            # 验证滚动效果
-            current_scroll_y = self.driver.execute_script("return window.pageYOffset;")
-            relative_position = (current_scroll_y / page_height) * 100 if page_height > 0 else 0
-
-            logger.info(f"直接滚动完成，当前位置: {current_scroll_y}px, 相对位置: {relative_position:.1f}%")
-            logger.info("✅ Records Found区域应该显示在页面中上部")
+            # 将页面上部控件滚动到距离顶部50px的位置，Records Found区域就会自然显示在页面中上部；
+            # 找不到控件时滚动到页面20%位置
+            geometry = self.scroll_to_first(self.RECORDS_FOUND_TOP_CONTROL_CANDIDATES, block="start", offset=-50,
+                                            fallback=0.2, timeout=3)
+            if geometry['matched'] < 0:
+                logger.warning("未找到页面上部控件，已直接滚动到页面20%位置")
+            logger.info("✅ Records Found区域现在显示在页面中上部")
             return True
-
         except Exception as e:
             logger.error(f"滚动到Records Found区域失败: {e}")
-            # 最后的备用方案：简单向下滚动到页面中下部
-            try:
-                # 滚动到页面的60%位置，这样Records Found通常会显示在可视区域
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.6);")
-                time.sleep(1)
-                logger.info("✅ 使用备用滚动方案完成")
-                return True
-            except:
-                logger.error("所有滚动方案都失败")
-                return False
+            return False
 
     def scroll_to_latest_record(self):
-        """滚动到最新一条记录并保持可见 - 优化版本，优先定位第一行记录"""
+        """滚动到最新一条记录并保持可见 - 优先定位第一行记录"""
         logger.info("正在滚动到最新一条记录（优先定位第一行记录）...")
         try:
-            # 等待表格加载，减少等待时间
-            time.sleep(1)
-
-            # 首选策略：直接定位表格中的第一行记录（最快）
-            first_row_selectors = [
-                # OrangeHRM常见的表格行结构
-                (By.XPATH, "//div[contains(@class,'oxd-table-row')][1]"),
-                (By.XPATH, "//table//tbody//tr[1]"),
-                (By.XPATH, "(//table//tr[td])[1]"),  # 第一个包含td的行
-                (By.XPATH, "//table//tr[position()=1 and not(th)]"),  # 排除表头
-            ]
-
-            for i, selector in enumerate(first_row_selectors, 1):
-                try:
-                    logger.debug(f"尝试第一行记录策略 {i}: {selector[1]}")
-                    if self.is_element_visible(selector, timeout=1):  # 减少超时时间
-                        element = self.find_element(selector)
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-                            element
-                        )
-                        time.sleep(0.5)  # 减少等待时间
-                        logger.info(f"✅ 策略 {i} 通过第一行记录定位成功")
-                        return True
-                except Exception as e:
-                    logger.debug(f"策略 {i} 失败: {e}")
-                    continue
-
-            # 备用策略1：定位第一个View Details按钮
-            logger.warning("第一行记录定位失败，尝试View Details按钮...")
-            view_details_selectors = [
-                (By.XPATH, "(//button[contains(text(),'View Details')])[1]"),
-                (By.XPATH, "(//a[contains(text(),'View Details')])[1]"),
-                (By.XPATH, "//table//tr[1]//button[contains(text(),'View Details')]"),
-                (By.XPATH, "//table//tr[1]//a[contains(text(),'View Details')]"),
-            ]
+            self.wait_for_spinner_gone(budget=1)  # 等待表格加载
 
-            for i, selector in enumerate(view_details_selectors, 1):
-                try:
-                    logger.debug(f"尝试View Details策略 {i}: {selector[1]}")
-                    if self.is_element_visible(selector, timeout=1):
-                        element = self.find_element(selector)
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-                            element
-                        )
-                        time.sleep(0.5)
-                        logger.info(f"✅ 策略 {i} 通过View Details按钮定位成功")
-                        return True
-                except Exception as e:
-                    logger.debug(f"View Details策略 {i} 失败: {e}")
-                    continue
-
-            # 备用策略2：快速通过Records Found定位
-            logger.warning("尝试通过Records Found快速定位...")
-            try:
-                records_found_selector = (By.XPATH, "//*[contains(text(),'Records Found')]")
-                if self.is_element_visible(records_found_selector, timeout=1):
-                    element = self.find_element(records_found_selector)
-                    # 滚动到Records Found，然后向下滚动显示记录
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({block: 'start', behavior: 'smooth'});",
-                        element
-                    )
-                    time.sleep(0.3)
-                    # 向下滚动150px显示记录内容
-                    self.driver.execute_script("window.scrollBy(0, 150);")
-                    time.sleep(0.3)
-                    logger.info("✅ 通过Records Found快速定位成功")
-                    return True
-            except Exception as e:
-                logger.debug(f"Records Found定位失败: {e}")
-
-            # 最后的快速备用方案：滚动到页面中部
-            logger.warning("使用最终备用方案...")
-            try:
-                page_height = self.driver.execute_script("return document.body.scrollHeight;")
-                middle_position = page_height * 0.6  # 滚动到页面60%位置
-                self.driver.execute_script(f"window.scrollTo(0, {middle_position});")
-                time.sleep(0.5)
-                logger.info("✅ 快速滚动到页面中部")
+            # 第一行记录或第一个View Details按钮居中显示
+            geometry = self.scroll_to_first(self.LATEST_RECORD_CANDIDATES, block="center", timeout=1)
+            if geometry:
+                logger.info("✅ 通过第一行记录定位成功")
                 return True
-            except Exception as e:
-                logger.error(f"最终备用方案失败: {e}")
-                return False
 
+            # 备用方案：Records Found滚动到顶部后向下150px显示记录内容，找不到时滚动到页面60%位置
+            logger.warning("第一行记录定位失败，尝试通过Records Found定位...")
+            self.scroll_to_first([self.RECORDS_FOUND_TEXT], block="start", offset=150, fallback=0.6)
+            logger.info("✅ 已滚动到记录区域")
+            return True
         except Exception as e:
             logger.error(f"滚动到最新记录失败: {str(e)}")
             return False
@@ -1556,75 +1431,20 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         """滚动到Total Amount元素位置"""
         logger.info("正在滚动到Total Amount元素...")
         try:
-            # 等待页面加载
-            time.sleep(1)
-
-            # 定位Total Amount元素的多种策略
-            total_amount_selectors = [
-                # 精确匹配Total Amount文本
-                (By.XPATH, "//*[contains(text(),'Total Amount')]"),
-                # 匹配包含Total Amount的元素
-                (By.XPATH, "//*[contains(text(),'Total') and contains(text(),'Amount')]"),
-                # 通过class或id定位（如果有的话）
-                (By.XPATH, "//div[contains(@class,'total-amount')]"),
-                (By.XPATH, "//span[contains(@class,'total')]"),
-                # 通过表格结构定位
-                (By.XPATH, "//table//td[contains(text(),'Total Amount')] | //table//th[contains(text(),'Total Amount')]"),
-                # 更宽泛的搜索
-                (By.XPATH, "//*[contains(text(),'Total')]"),
-                # 通过数字模式匹配（如9.00）
-                (By.XPATH, "//*[contains(text(),'.00') or contains(text(),'9.00')]"),
-            ]
-
-            target_element = None
-            for selector in total_amount_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=3):
-                        element = self.find_element(selector)
-                        # 验证元素文本确实包含Total Amount相关内容
-                        element_text = element.text.lower()
-                        if 'total' in element_text or 'amount' in element_text or any(char.isdigit() for char in element_text):
-                            target_element = element
-                            logger.info(f"✅ 找到Total Amount元素: {selector}, 文本: '{element.text}'")
-                            break
-                except Exception as e:
-                    logger.debug(f"尝试定位Total Amount失败: {selector}, 错误: {e}")
-                    continue
-
-            if target_element:
-                # 滚动到元素位置，使其在视口中心显示
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-                    target_element
-                )
-                time.sleep(1)
+            self.wait_for_spinner_gone(budget=1)  # 等待页面加载
 
-                # 验证滚动效果
-                element_location = target_element.location
-                scroll_y = self.driver.execute_script("return window.pageYOffset;")
-
-                logger.info(f"Total Amount元素位置: y={element_location['y']}, 当前滚动位置: {scroll_y}px")
-                logger.info("✅ 成功滚动到Total Amount元素")
-                return True
+            # 元素文本需包含total、amount或数字，找不到时滚动到页面底部
+            geometry = self.scroll_to_first(self.TOTAL_AMOUNT_CANDIDATES, block="center", fallback="bottom",
+                                            text_pattern=r"total|amount|\d", timeout=3)
+            if geometry['matched'] < 0:
+                logger.warning("未找到Total Amount元素，已滚动到页面底部")
             else:
-                # 如果找不到Total Amount元素，滚动到页面底部
-                logger.warning("未找到Total Amount元素，滚动到页面底部")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-                logger.info("✅ 已滚动到页面底部")
-                return True
-
+                logger.info(f"Total Amount元素位置: y={geometry['element_top']}, 当前滚动位置: {geometry['scroll_y']}px")
+                logger.info("✅ 成功滚动到Total Amount元素")
+            return True
         except Exception as e:
             logger.error(f"滚动到Total Amount失败: {str(e)}")
-            # 备用方案：滚动到页面底部
-            try:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-                logger.info("✅ 使用备用方案滚动到页面底部")
-                return True
-            except:
-                logger.error("所有滚动方案都失败")
-                return False
+            return False
 
     def verify_expense_data(self):
         """验证费用数据"""
@@ -1657,6 +1477,11 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         """验证Claim记录存在"""
         logger.info(f"正在验证Claim记录存在: {employee_name}")
         try:
+            # 优先通过Claims接口验证，接口不可用时再扫描页面表格
+            api_result = verify_claim_via_api(self.driver, employee_name)
+            if api_result is not None:
+                return api_result
+
             # 查找包含员工姓名的记录
             record_selectors = [
                 (By.XPATH, f"//table//td[contains(text(),'{employee_name}')]"),
@@ -1697,7 +1522,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     if self.is_element_visible(selector, timeout=5):
                         element = self.find_element(selector)
                         element.click()
-                        time.sleep(2)
+                        self.wait_for_dom_stable(budget=2)  # 等待确认弹窗出现
 
                         # 确认删除
                         confirm_selectors = [
@@ -1711,7 +1536,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                                 if self.is_element_visible(confirm_selector, timeout=3):
                                     confirm_element = self.find_element(confirm_selector)
                                     confirm_element.click()
-                                    time.sleep(2)
+                                    self.wait_for_toast(budget=2)  # 等待删除成功提示
                                     break
                             except:
                                 continue
@@ -1799,13 +1624,12 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     (By.XPATH, "//*[contains(@class,'oxd-form')]"),
                 ]
 
-                found_elements = 0
-                for selector in detail_page_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            found_elements += 1
-                    except:
-                        continue
+                # 一次请求读取所有特征元素，最多等待3秒直到至少2个可见
+                snapshot = self.read_many(
+                    {str(i): selector for i, selector in enumerate(detail_page_selectors)}, timeout=3,
+                    until=lambda fields: sum(field['visible'] for field in fields.values()) >= 2
+                )
+                found_elements = sum(field['visible'] for field in snapshot.values())
 
                 if found_elements >= 2:
                     logger.info(f"✅ 验证Assign Claim详情页成功（找到{found_elements}个特征元素）")
@@ -1837,17 +1661,14 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             event = expected_data.get("event", "")
             currency = expected_data.get("currency", "")
 
-            verification_results = {}
-
-            # 验证员工姓名
+            # 各字段的候选定位器，所有候选在一次请求中读取
+            field_selectors = {}
+            name_parts = employee_name.split()
             if employee_name:
-                employee_found = False
                 # 分离姓名部分
-                name_parts = employee_name.split()
                 first_name = name_parts[0] if name_parts else ""
                 last_name = name_parts[-1] if len(name_parts) > 1 else ""
-
-                employee_selectors = [
+                field_selectors['employee'] = [
                     # 完整姓名匹配
                     (By.XPATH, f"//*[contains(text(),'{employee_name}')]"),
                     # 姓名部分匹配
@@ -1863,59 +1684,15 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     (By.XPATH, "//*[@class='oxd-select-text-input']"),
                     (By.XPATH, "//*[contains(@class,'employee')]"),
                 ]
-
-                for selector in employee_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            element = self.find_element(selector)
-                            element_text = element.text.strip()
-                            logger.info(f"检查元素文本: '{element_text}'")
-
-                            # 多种匹配策略
-                            if (employee_name.lower() in element_text.lower() or
-                                first_name.lower() in element_text.lower() or
-                                last_name.lower() in element_text.lower() or
-                                any(part.lower() in element_text.lower() for part in name_parts)):
-                                employee_found = True
-                                logger.info(f"✅ 员工姓名验证成功: 找到 '{element_text}'")
-                                break
-                    except Exception as e:
-                        logger.debug(f"员工姓名验证异常: {e}")
-                        continue
-
-                if not employee_found:
-                    logger.warning(f"❌ 员工姓名验证失败: 未找到 '{employee_name}'")
-
-                verification_results['employee'] = employee_found
-
-            # 验证事件类型
             if event:
-                event_found = False
-                event_selectors = [
+                field_selectors['event'] = [
                     (By.XPATH, f"//*[contains(text(),'{event}')]"),
                     (By.XPATH, f"//*[contains(text(),'Travel')]"),
                     (By.XPATH, "//label[text()='Event']/following::div[1]"),
                     (By.XPATH, "//div[contains(@class,'event')]//span"),
                 ]
-
-                for selector in event_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            element = self.find_element(selector)
-                            element_text = element.text.strip()
-                            if "Travel" in element_text or event in element_text:
-                                event_found = True
-                                logger.info(f"✅ 事件类型验证成功: 找到 '{element_text}'")
-                                break
-                    except:
-                        continue
-
-                verification_results['event'] = event_found
-
-            # 验证货币
             if currency:
-                currency_found = False
-                currency_selectors = [
+                field_selectors['currency'] = [
                     (By.XPATH, f"//*[contains(text(),'{currency}')]"),
                     (By.XPATH, f"//*[contains(text(),'EUR')]"),
                     (By.XPATH, f"//*[contains(text(),'Euro')]"),
@@ -1923,19 +1700,36 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     (By.XPATH, "//div[contains(@class,'currency')]//span"),
                 ]
 
-                for selector in currency_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            element = self.find_element(selector)
-                            element_text = element.text.strip()
-                            if currency in element_text or "EUR" in element_text:
-                                currency_found = True
-                                logger.info(f"✅ 货币验证成功: 找到 '{element_text}'")
-                                break
-                    except:
-                        continue
+            # 各字段的文本匹配规则
+            matchers = {
+                'employee': lambda text: any(part.lower() in text.lower() for part in name_parts),
+                'event': lambda text: "Travel" in text or event in text,
+                'currency': lambda text: currency in text or "EUR" in text,
+            }
 
-                verification_results['currency'] = currency_found
+            def field_texts(fields, field):
+                return [fields[f"{field}.{i}"]['text'] for i in range(len(field_selectors[field]))
+                        if fields[f"{field}.{i}"]['visible']]
+
+            def all_fields_found(fields):
+                return all(any(matchers[field](text) for text in field_texts(fields, field))
+                           for field in field_selectors)
+
+            # 最多等待3秒直到所有字段都找到匹配文本
+            snapshot = self.read_many(
+                {f"{field}.{i}": selector for field, selectors in field_selectors.items()
+                 for i, selector in enumerate(selectors)},
+                timeout=3, until=all_fields_found
+            )
+
+            verification_results = {}
+            for field in field_selectors:
+                matched_text = next((text for text in field_texts(snapshot, field) if matchers[field](text)), None)
+                verification_results[field] = matched_text is not None
+                if matched_text is not None:
+                    logger.info(f"✅ {field}验证成功: 找到 '{matched_text}'")
+                else:
+                    logger.warning(f"❌ {field}验证失败: 未找到匹配文本")
 
             # 总结验证结果
             total_checks = len(verification_results)
@@ -1984,7 +1778,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             try:
                 # 滚动到页面底部，费用区域通常在下方
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                self.wait_for_dom_stable(budget=2)
 
                 # 再次检查费用区域
                 for selector in expense_section_selectors:
@@ -2010,7 +1804,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     if self.is_element_visible(selector, timeout=3):
                         element = self.find_element(selector)
                         element.click()
-                        time.sleep(2)
+                        self.wait_for_network_idle(budget=2)
                         logger.info("✅ 点击费用标签页成功")
                         return True
                 except:
@@ -2039,7 +1833,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                     if self.is_element_visible(selector, timeout=5):
                         element = self.find_element(selector)
                         element.click()
-                        time.sleep(3)
+                        self.wait_for_network_idle(budget=3)
                         logger.info("✅ 通过面包屑导航到Claims列表页")
                         return True
                 except:
@@ -2052,14 +1846,14 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 if self.is_element_visible(sidebar_claim, timeout=5):
                     element = self.find_element(sidebar_claim)
                     element.click()
-                    time.sleep(2)
+                    self.wait_for_network_idle(budget=2)
 
                     # 然后点击Employee Claims
                     employee_claims = (By.XPATH, "//a[text()='Employee Claims']")
                     if self.is_element_visible(employee_claims, timeout=5):
                         element = self.find_element(employee_claims)
                         element.click()
-                        time.sleep(3)
+                        self.wait_for_network_idle(budget=3)
                         logger.info("✅ 通过侧边栏导航到Claims列表页")
                         return True
             except:
@@ -2071,7 +1865,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 base_url = current_url.split('/web/')[0]
                 claims_list_url = f"{base_url}/web/index.php/claim/viewEmployeeClaim"
                 self.driver.get(claims_list_url)
-                time.sleep(3)
+                self.wait_for_network_idle(budget=3)
                 logger.info("✅ 通过URL导航到Claims列表页")
                 return True
             except:
@@ -2115,9 +1909,9 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                         element = self.find_element(selector)
                         # 滚动到元素位置确保可点击
                         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                        time.sleep(0.2)  # 进一步减少等待时间
+                        self.wait_for_dom_stable(stable_ms=100, budget=0.2)
                         element.click()
-                        time.sleep(0.8)  # 减少等待时间
+                        self.wait_for_network_idle(budget=0.8)  # 等待页面跳转完成
                         logger.info(f"✅ 策略 {i} 点击Back按钮成功")
                         return True
                 except Exception as e:
@@ -2128,7 +1922,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             logger.warning("未找到页面Back按钮，使用浏览器回退...")
             try:
                 self.driver.back()
-                time.sleep(1.5)  # 减少等待时间
+                self.wait_for_network_idle(budget=1.5)
                 logger.info("✅ 使用浏览器回退功能成功")
                 return True
             except Exception as e:
@@ -2148,7 +1942,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             # 点击回退按钮
             if self.click_back_button():
                 # 等待页面加载
-                time.sleep(3)
+                self.wait_for_network_idle(budget=3)
 
                 # 验证是否回到了Assign Claim详情页
                 current_url = self.driver.current_url
@@ -2213,7 +2007,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
 
                         # 滚动到元素可见（使用更快的滚动方式）
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'auto'});", element)
-                        time.sleep(0.3)  # 减少滚动后等待时间
+                        self.wait_for_dom_stable(stable_ms=100, budget=0.3)
 
                         # 尝试点击
                         try:
@@ -2225,7 +2019,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                             logger.debug(f"✅ 策略 {i} JavaScript点击成功")
 
                         # 减少页面跳转等待时间，使用更智能的等待
-                        time.sleep(1)  # 从3秒减少到1秒
+                        self.wait_for_network_idle(budget=1)  # 等待页面跳转完成
                         logger.info("✅ 成功点击最新记录的View Details按钮")
                         return True
 
@@ -2307,142 +2101,128 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         logger.info("✅ 已清空全局员工姓名")
 
     def get_available_employee_names(self, search_query="a"):
-        """通过API获取可用的员工姓名列表"""
+        """通过API获取可用的员工姓名列表（启用缓存时复用之前的查询和验证结果）"""
         logger.info(f"正在通过API获取员工姓名列表，搜索关键词: {search_query}")
         try:
-            import requests
-
-            # 获取当前页面的cookies和session信息
-            cookies = self.driver.get_cookies()
-            session_cookies = {}
-            for cookie in cookies:
-                session_cookies[cookie['name']] = cookie['value']
-
-            # 构建API请求URL
-            current_url = self.driver.current_url
-            base_url = current_url.split('/web/')[0]
-            api_url = f"{base_url}/web/index.php/api/v2/pim/employees"
-
-            # API请求参数
-            params = {
-                'nameOrId': search_query,
-                'includeEmployees': 'onlyCurrent'
-            }
-
-            # 发送GET请求
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
+            base_url = self.driver.current_url.split('/web/')[0]
+            cache_key = None
+            if employee_name_cache.enabled():
+                cache_key = employee_name_cache.key(base_url, self._get_current_account(), search_query)
+                cached = employee_name_cache.get(cache_key)
+                if cached and cached["names"]:
+                    # 已验证过可选的姓名直接填写并确认仍然有效，跳过逐个尝试
+                    if self._use_cached_valid_name(cached["valid"], cache_key):
+                        return cached["names"]
+
+                    logger.info(f"✅ 使用缓存的员工列表({len(cached['names'])}个)，跳过API请求")
+                    # 缓存中的有效姓名此时都已被拒绝，一并跳过
+                    rejected = set(cached["invalid"]) | set(cached["valid"])
+                    candidates = [name for name in cached["names"] if name not in rejected]
+                    self._validate_employee_names(candidates, cache_key)
+                    return cached["names"]
+
+            available_names = self._fetch_employee_names_from_api(base_url, search_query)
+            if available_names is None:
+                # 如果API失败，回退到原来的方法
+                return self._get_available_employee_names_fallback()
 
-            logger.info(f"发送API请求: {api_url}")
-            response = requests.get(api_url, params=params, cookies=session_cookies, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                employees = data.get('data', [])
-
-                available_names = []
-                for employee in employees:
-                    # 构建完整姓名
-                    first_name = employee.get('firstName', '').strip()
-                    middle_name = employee.get('middleName', '').strip()
-                    last_name = employee.get('lastName', '').strip()
-
-                    # 组合姓名（根据实际显示格式）
-                    name_parts = []
-                    if first_name:
-                        name_parts.append(first_name)
-                    if middle_name:
-                        name_parts.append(middle_name)
-                    if last_name:
-                        name_parts.append(last_name)
-
-                    if name_parts:
-                        full_name = ' '.join(name_parts)
-                        available_names.append(full_name)
-                        logger.debug(f"找到员工: {full_name} (ID: {employee.get('empNumber')})")
-
-                if available_names:
-                    logger.info(f"✅ 通过API找到{len(available_names)}个员工: {available_names[:3]}...")
-
-                    # 逐个尝试员工姓名，直到找到有效的
-                    valid_name = self._try_employee_names_sequentially(available_names)
-                    if valid_name:
-                        self.set_valid_employee_name(valid_name)
-                        logger.info(f"✅ 找到有效的员工姓名: '{valid_name}'")
-                    else:
-                        logger.warning("❌ 所有API返回的员工姓名都无效")
+            if available_names:
+                logger.info(f"✅ 通过API找到{len(available_names)}个员工: {available_names[:3]}...")
+                if cache_key:
+                    employee_name_cache.put_names(cache_key, available_names)
 
-                    return available_names
-                else:
-                    logger.warning("API返回的员工列表为空")
-                    return []
+                # 逐个尝试员工姓名，直到找到有效的
+                self._validate_employee_names(available_names, cache_key)
+                return available_names
             else:
-                logger.error(f"API请求失败，状态码: {response.status_code}")
-                # 如果API失败，回退到原来的方法
-                return self._get_available_employee_names_fallback()
+                logger.warning("API返回的员工列表为空")
+                return []
 
         except Exception as e:
             logger.error(f"通过API获取员工姓名失败: {e}")
             # 如果API失败，回退到原来的方法
             return self._get_available_employee_names_fallback()
 
+    def _use_cached_valid_name(self, valid_names, cache_key):
+        """
+        填写缓存中已验证的员工姓名并重新检查，被拒绝的姓名标记为无效
+
+        Returns:
+            是否找到仍然有效的姓名
+        """
+        for employee_name in valid_names:
+            self._clear_employee_name_input()
+            if self.fill_employee_name(employee_name):
+                self.wait_for_dom_stable(budget=2)
+                if not self.check_invalid_employee_name():
+                    self.set_valid_employee_name(employee_name)
+                    logger.info(f"✅ 使用缓存中已验证的员工姓名: '{employee_name}'")
+                    return True
+            logger.warning(f"❌ 缓存中的员工姓名 '{employee_name}' 已不可用，标记为无效")
+            employee_name_cache.mark_invalid(cache_key, employee_name)
+        return False
+
+    def _validate_employee_names(self, employee_names, cache_key=None):
+        """逐个尝试员工姓名并设置找到的有效姓名"""
+        valid_name = self._try_employee_names_sequentially(employee_names, cache_key)
+        if valid_name:
+            self.set_valid_employee_name(valid_name)
+            logger.info(f"✅ 找到有效的员工姓名: '{valid_name}'")
+        else:
+            logger.warning("❌ 所有API返回的员工姓名都无效")
+        return valid_name
+
+    def _fetch_employee_names_from_api(self, base_url, search_query):
+        """通过共享的API客户端请求员工列表并组合姓名，请求失败时返回None"""
+        logger.info(f"发送API请求: {base_url}{OrangeHRMApiClient.API_PREFIX}{OrangeHRMApiClient.EMPLOYEES_PATH}")
+        employees = get_api_client(self.driver).get_employees(search_query)
+        if employees is None:
+            return None
+
+        available_names = []
+        for employee in employees:
+            if employee.full_name:
+                available_names.append(employee.full_name)
+                logger.debug(f"找到员工: {employee.full_name} (ID: {employee.emp_number})")
+
+        return available_names
+
+    def _get_current_account(self):
+        """读取右上角显示的当前登录账号，用作员工姓名缓存键的一部分"""
+        try:
+            account = self.driver.execute_script(
+                "var el = document.querySelector('.oxd-userdropdown-name');"
+                "return el ? el.textContent.trim() : '';"
+            )
+            return account or "default"
+        except Exception:
+            return "default"
+
     def _get_available_employee_names_fallback(self):
         """备用方法：通过页面元素获取可用的员工姓名列表"""
         logger.info("使用备用方法获取员工姓名列表...")
         try:
             # 清空输入框并输入'a'来触发下拉列表
-            employee_name_selectors = [
-                (By.XPATH, "//label[text()='Employee Name']/following::input[1]"),
-                (By.XPATH, "//label[contains(text(),'Employee')]/following::input[1]"),
-                (By.XPATH, "//input[@placeholder='Type for hints...']"),
-                (By.XPATH, "//div[contains(@class,'oxd-autocomplete')]//input"),
-            ]
-
-            employee_input = None
-            for selector in employee_name_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=5):
-                        employee_input = self.find_element(selector)
-                        break
-                except:
-                    continue
-
+            employee_input = self.find_any_element(self.EMPLOYEE_NAME_INPUT_CANDIDATES, timeout=5)
             if not employee_input:
                 logger.error("未找到员工姓名输入框")
                 return []
 
             # 清空输入框
             employee_input.clear()
-            time.sleep(1)
+            self.wait_for_dom_stable(budget=1)
 
             # 输入'a'触发下拉列表
             employee_input.send_keys("a")
-            time.sleep(2)
+            self.wait_for_listbox_populated(timeout=5, budget=2)  # 等待下拉列表出现
 
             # 获取下拉列表中的选项
-            dropdown_selectors = [
-                (By.XPATH, "//div[contains(@class,'oxd-autocomplete-dropdown')]//div[contains(@class,'oxd-autocomplete-option')]"),
-                (By.XPATH, "//div[contains(@class,'dropdown')]//div[contains(@class,'option')]"),
-                (By.XPATH, "//ul[contains(@class,'dropdown')]//li"),
-                (By.XPATH, "//div[contains(@class,'autocomplete')]//div[@role='option']"),
-            ]
-
+            _, options = self.race_locators(self.EMPLOYEE_OPTION_CANDIDATES, timeout=3)
             available_names = []
-            for selector in dropdown_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=3):
-                        options = self.driver.find_elements(*selector)
-                        for option in options:
-                            name_text = option.text.strip()
-                            if name_text and name_text not in available_names:
-                                available_names.append(name_text)
-                        if available_names:
-                            break
-                except:
-                    continue
+            for option in options:
+                name_text = option.text.strip()
+                if name_text and name_text not in available_names:
+                    available_names.append(name_text)
 
             logger.info(f"✅ 备用方法找到{len(available_names)}个可用员工姓名: {available_names}")
             return available_names
@@ -2451,8 +2231,8 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             logger.error(f"备用方法获取可用员工姓名失败: {e}")
             return []
 
-    def _try_employee_names_sequentially(self, employee_names):
-        """逐个尝试员工姓名，直到找到有效的"""
+    def _try_employee_names_sequentially(self, employee_names, cache_key=None):
+        """逐个尝试员工姓名，直到找到有效的（传入cache_key时记录验证结果）"""
         logger.info(f"正在逐个尝试{len(employee_names)}个员工姓名...")
 
         for index, employee_name in enumerate(employee_names, 1):
@@ -2461,19 +2241,23 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             try:
                 # 清空输入框
                 self._clear_employee_name_input()
-                time.sleep(1)
+                self.wait_for_dom_stable(budget=1)
 
                 # 填写当前员工姓名
                 if self.fill_employee_name(employee_name):
                     # 等待页面响应
-                    time.sleep(2)
+                    self.wait_for_dom_stable(budget=2)
 
                     # 检查是否有invalid提示
                     if self.check_invalid_employee_name():
                         logger.warning(f"❌ 第{index}个员工姓名 '{employee_name}' 无效，继续尝试下一个")
+                        if cache_key:
+                            employee_name_cache.mark_invalid(cache_key, employee_name)
                         continue
                     else:
                         logger.info(f"✅ 第{index}个员工姓名 '{employee_name}' 有效！")
+                        if cache_key:
+                            employee_name_cache.mark_valid(cache_key, employee_name)
                         return employee_name
                 else:
                     logger.warning(f"❌ 第{index}个员工姓名 '{employee_name}' 填写失败，继续尝试下一个")
@@ -2499,7 +2283,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             logger.info(f"尝试填写首选姓名: {preferred_name}")
             if self.fill_employee_name(preferred_name):
                 # 检查是否有invalid提示
-                time.sleep(2)
+                self.wait_for_dom_stable(budget=2)
                 if self.check_invalid_employee_name():
                     logger.warning(f"首选姓名 '{preferred_name}' 无效，尝试获取可用姓名")
 
@@ -2542,7 +2326,7 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             logger.info(f"尝试填写首选姓名: {preferred_name}")
             if self.fill_employee_name(preferred_name):
                 # 等待页面响应
-                time.sleep(2)
+                self.wait_for_dom_stable(budget=2)
 
                 # 检查是否有invalid提示
                 if self.check_invalid_employee_name():
@@ -2584,64 +2368,46 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         logger.info("正在清空员工姓名输入框...")
         try:
             # 查找员工姓名输入框
-            employee_name_selectors = [
-                (By.XPATH, "//label[text()='Employee Name']/following::input[1]"),
-                (By.XPATH, "//label[contains(text(),'Employee')]/following::input[1]"),
-                (By.XPATH, "//input[@placeholder='Type for hints...']"),
-                (By.XPATH, "//div[contains(@class,'oxd-autocomplete')]//input"),
-            ]
+            element = self.find_any_element(self.EMPLOYEE_NAME_INPUT_CANDIDATES, timeout=3)
+            if not element:
+                logger.warning("未找到员工姓名输入框进行清空")
+                return False
 
-            for selector in employee_name_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=3):
-                        element = self.find_element(selector)
+            # 多种清空方法确保彻底清空
+            logger.info(f"找到输入框，当前值: '{element.get_attribute('value')}'")
 
-                        # 多种清空方法确保彻底清空
-                        logger.info(f"找到输入框，当前值: '{element.get_attribute('value')}'")
+            # 方法1: 全选并删除
+            element.click()
+            element.send_keys(Keys.CONTROL + "a")
+            element.send_keys(Keys.DELETE)
 
-                        # 方法1: 全选并删除
-                        element.click()
-                        time.sleep(0.5)
-                        element.send_keys(Keys.CONTROL + "a")
-                        time.sleep(0.5)
-                        element.send_keys(Keys.DELETE)
-                        time.sleep(0.5)
+            # 方法2: 使用clear()
+            element.clear()
 
-                        # 方法2: 使用clear()
-                        element.clear()
-                        time.sleep(0.5)
+            # 方法3: 使用JavaScript清空
+            self.driver.execute_script("arguments[0].value = '';", element)
 
-                        # 方法3: 使用JavaScript清空
-                        self.driver.execute_script("arguments[0].value = '';", element)
-                        time.sleep(0.5)
+            # 方法4: 触发input事件确保页面响应
+            self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", element)
+            self.wait_for_dom_stable(budget=3.0)  # 等待清空后的输入事件处理完成
 
-                        # 方法4: 触发input事件确保页面响应
-                        self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", element)
-                        time.sleep(0.5)
+            # 验证是否真正清空
+            current_value = element.get_attribute('value')
+            if not current_value or current_value.strip() == "":
+                logger.info("✅ 员工姓名输入框已彻底清空")
+                return True
 
-                        # 验证是否真正清空
-                        current_value = element.get_attribute('value')
-                        if not current_value or current_value.strip() == "":
-                            logger.info("✅ 员工姓名输入框已彻底清空")
-                            return True
-                        else:
-                            logger.warning(f"输入框未完全清空，当前值: '{current_value}'")
-                            # 如果还有值，再次尝试清空
-                            for _ in range(3):
-                                element.send_keys(Keys.CONTROL + "a")
-                                element.send_keys(Keys.DELETE)
-                                time.sleep(0.3)
-                                if not element.get_attribute('value'):
-                                    logger.info("✅ 员工姓名输入框已强制清空")
-                                    return True
-
-                            logger.error(f"无法清空输入框，最终值: '{element.get_attribute('value')}'")
-                            return False
-                except Exception as e:
-                    logger.debug(f"清空输入框异常: {e}")
-                    continue
+            logger.warning(f"输入框未完全清空，当前值: '{current_value}'")
+            # 如果还有值，再次尝试清空
+            for _ in range(3):
+                element.send_keys(Keys.CONTROL + "a")
+                element.send_keys(Keys.DELETE)
+                self.wait_for_dom_stable(stable_ms=100, budget=0.3)
+                if not element.get_attribute('value'):
+                    logger.info("✅ 员工姓名输入框已强制清空")
+                    return True
 
-            logger.warning("未找到员工姓名输入框进行清空")
+            logger.error(f"无法清空输入框，最终值: '{element.get_attribute('value')}'")
             return False
 
         except Exception as e:
@@ -2651,23 +2417,10 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
     def check_invalid_employee_name(self):
         """检查是否有invalid员工姓名提示"""
         try:
-            invalid_selectors = [
-                (By.XPATH, "//*[contains(text(),'Invalid')]"),
-                (By.XPATH, "//*[contains(text(),'invalid')]"),
-                (By.XPATH, "//*[contains(text(),'not found')]"),
-                (By.XPATH, "//*[contains(text(),'No Records Found')]"),
-                (By.XPATH, "//span[contains(@class,'error')]"),
-                (By.XPATH, "//div[contains(@class,'error')]"),
-            ]
-
-            for selector in invalid_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=2):
-                        logger.info("✅ 检测到invalid提示")
-                        return True
-                except:
-                    continue
-
+            locator, _ = self.race_locators(self.INVALID_EMPLOYEE_HINT_CANDIDATES, timeout=2)
+            if locator:
+                logger.info("✅ 检测到invalid提示")
+                return True
             return False
 
         except Exception as e:
@@ -2679,37 +2432,24 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
         logger.info(f"正在从下拉列表中选择员工: {target_name}")
         try:
             # 等待下拉列表出现
-            time.sleep(2)
-
-            dropdown_selectors = [
-                (By.XPATH, "//div[contains(@class,'oxd-autocomplete-dropdown')]//div[contains(@class,'oxd-autocomplete-option')]"),
-                (By.XPATH, "//div[contains(@class,'dropdown')]//div[contains(@class,'option')]"),
-                (By.XPATH, "//ul[contains(@class,'dropdown')]//li"),
-                (By.XPATH, "//div[contains(@class,'autocomplete')]//div[@role='option']"),
-            ]
-
-            for selector in dropdown_selectors:
-                try:
-                    if self.is_element_visible(selector, timeout=3):
-                        options = self.driver.find_elements(*selector)
-                        for option in options:
-                            option_text = option.text.strip()
-                            if target_name:
-                                # 如果指定了目标姓名，查找匹配的选项
-                                if target_name.lower() in option_text.lower():
-                                    option.click()
-                                    logger.info(f"✅ 选择了员工: {option_text}")
-                                    self.set_valid_employee_name(option_text)
-                                    return True
-                            else:
-                                # 如果没有指定目标，选择第一个选项
-                                option.click()
-                                logger.info(f"✅ 选择了第一个可用员工: {option_text}")
-                                self.set_valid_employee_name(option_text)
-                                return True
-                        break
-                except:
-                    continue
+            self.wait_for_listbox_populated(timeout=5, budget=2)
+
+            _, options = self.race_locators(self.EMPLOYEE_OPTION_CANDIDATES, timeout=3)
+            for option in options:
+                option_text = option.text.strip()
+                if target_name:
+                    # 如果指定了目标姓名，查找匹配的选项
+                    if target_name.lower() in option_text.lower():
+                        option.click()
+                        logger.info(f"✅ 选择了员工: {option_text}")
+                        self.set_valid_employee_name(option_text)
+                        return True
+                else:
+                    # 如果没有指定目标，选择第一个选项
+                    option.click()
+                    logger.info(f"✅ 选择了第一个可用员工: {option_text}")
+                    self.set_valid_employee_name(option_text)
+                    return True
 
             logger.warning("未找到可选择的员工选项")
             return False
@@ -2726,55 +2466,34 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             date = expense_data.get("Date", "")
             amount = expense_data.get("Amount", "")
 
-            # 查找费用相关的表格或数据
-            found_type = False
-            found_date = False
-            found_amount = False
-
-            if expense_type:
-                type_selectors = [
-                    (By.XPATH, f"//*[contains(text(),'{expense_type}')]"),
-                    (By.XPATH, f"//td[contains(text(),'{expense_type}')]"),
-                    (By.XPATH, f"//div[contains(text(),'{expense_type}')]"),
-                ]
-                for selector in type_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            found_type = True
-                            logger.info(f"✅ 找到费用类型: {expense_type}")
-                            break
-                    except:
-                        continue
-
-            if date:
-                date_selectors = [
-                    (By.XPATH, f"//*[contains(text(),'{date}')]"),
-                    (By.XPATH, f"//td[contains(text(),'{date}')]"),
-                    (By.XPATH, f"//div[contains(text(),'{date}')]"),
-                ]
-                for selector in date_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            found_date = True
-                            logger.info(f"✅ 找到费用日期: {date}")
-                            break
-                    except:
-                        continue
-
-            if amount:
-                amount_selectors = [
-                    (By.XPATH, f"//*[contains(text(),'{amount}')]"),
-                    (By.XPATH, f"//td[contains(text(),'{amount}')]"),
-                    (By.XPATH, f"//div[contains(text(),'{amount}')]"),
-                ]
-                for selector in amount_selectors:
-                    try:
-                        if self.is_element_visible(selector, timeout=3):
-                            found_amount = True
-                            logger.info(f"✅ 找到费用金额: {amount}")
-                            break
-                    except:
-                        continue
+            # 查找费用相关的表格或数据，所有字段在一次请求中读取
+            expected_fields = {"type": expense_type, "date": date, "amount": amount}
+            locators = {}
+            for field, value in expected_fields.items():
+                if value:
+                    locators[f"{field}.0"] = (By.XPATH, f"//*[contains(text(),'{value}')]")
+                    locators[f"{field}.1"] = (By.XPATH, f"//td[contains(text(),'{value}')]")
+                    locators[f"{field}.2"] = (By.XPATH, f"//div[contains(text(),'{value}')]")
+
+            def field_found(fields, field):
+                return any(fields[name]['visible'] for name in fields if name.startswith(f"{field}."))
+
+            # 最多等待3秒直到所有字段都可见
+            snapshot = self.read_many(
+                locators, timeout=3,
+                until=lambda fields: all(field_found(fields, field)
+                                         for field, value in expected_fields.items() if value)
+            )
+
+            found_type = field_found(snapshot, "type")
+            found_date = field_found(snapshot, "date")
+            found_amount = field_found(snapshot, "amount")
+            if found_type:
+                logger.info(f"✅ 找到费用类型: {expense_type}")
+            if found_date:
+                logger.info(f"✅ 找到费用日期: {date}")
+            if found_amount:
+                logger.info(f"✅ 找到费用金额: {amount}")
 
             # 验证结果
             success = (found_type or not expense_type) and (found_date or not date) and (found_amount or not amount)
@@ -2797,46 +2516,31 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
             import os
             from datetime import datetime
 
-            # 创建报告目录
-            report_dir = "reports"
-            if not os.path.exists(report_dir):
-                os.makedirs(report_dir)
+            # 等待异步截图全部写入，报告才能列出所有截图
+            flush_screenshots()
 
-            # 生成报告文件名
+            # 报告目录支持通过环境变量 REPORT_DIR 指定
+            engine = ReportEngine()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_file = os.path.join(report_dir, f"test_report_{timestamp}.html")
-
-            # 获取截图目录 - 查找最新的BDD测试截图目录
-            screenshot_dir = "screenshots"
-            screenshots = []
-            actual_screenshot_dir = None
-
-            if os.path.exists(screenshot_dir):
-                # 查找最新的bdd_tests_*目录
-                bdd_dirs = [d for d in os.listdir(screenshot_dir) if d.startswith('bdd_tests_')]
-                if bdd_dirs:
-                    # 按时间戳排序，取最新的
-                    bdd_dirs.sort(reverse=True)
-                    bdd_screenshot_dir = os.path.join(screenshot_dir, bdd_dirs[0])
-                    if os.path.exists(bdd_screenshot_dir):
-                        screenshots = [f for f in os.listdir(bdd_screenshot_dir) if f.endswith('.png')]
-                        screenshots.sort()
-                        actual_screenshot_dir = bdd_screenshot_dir
-                        logger.info(f"找到BDD截图目录: {actual_screenshot_dir}, 包含 {len(screenshots)} 张截图")
-                    else:
-                        logger.info(f"BDD截图目录不存在: {bdd_screenshot_dir}")
-
-                # 如果没有找到BDD目录或BDD目录为空，尝试直接在screenshots目录查找
-                if not actual_screenshot_dir or not screenshots:
-                    fallback_screenshots = [f for f in os.listdir(screenshot_dir) if f.endswith('.png')]
-                    if fallback_screenshots:
-                        screenshots = fallback_screenshots
-                        screenshots.sort()
-                        actual_screenshot_dir = screenshot_dir
-                        logger.info(f"使用默认截图目录: {actual_screenshot_dir}, 包含 {len(screenshots)} 张截图")
-                    elif not actual_screenshot_dir:
-                        actual_screenshot_dir = screenshot_dir
-                        logger.info(f"未找到任何截图，使用默认目录: {actual_screenshot_dir}")
+
+            # 获取截图目录 - 从共享的截图索引中查找最新的BDD测试截图目录
+            screenshot_dir = os.environ.get("SCREENSHOT_DIR", "screenshots")
+            screenshot_index = get_screenshot_index(screenshot_dir)
+            actual_screenshot_dir = screenshot_dir
+            screenshots = {}
+
+            bdd_screenshot_dir = screenshot_index.latest_run("bdd_tests_")
+            if bdd_screenshot_dir:
+                actual_screenshot_dir = str(bdd_screenshot_dir)
+                screenshots = screenshot_index.steps(bdd_screenshot_dir)
+                logger.info(f"找到BDD截图目录: {actual_screenshot_dir}")
+
+            # 如果没有找到BDD目录或BDD目录为空，尝试直接在screenshots目录查找
+            if not screenshots:
+                screenshots = screenshot_index.steps()
+                actual_screenshot_dir = screenshot_dir
+            screenshot_count = len({str(info['path']) for info in screenshots.values()})
+            logger.info(f"使用截图目录: {actual_screenshot_dir}, 包含 {screenshot_count} 张截图")
 
             # 分析测试结果
             if test_results is None:
@@ -2857,358 +2561,119 @@ class OrangeHRMCreateClaimRequestPage(BasePage):
                 "UNKNOWN": "❓ 状态未知"
             }.get(test_results["overall_status"], "❓ 状态未知")
 
-            claim_status = "✅ 成功" if test_results.get("claim_request_success", False) else "❌ 失败"
-            expense_status = "✅ 成功" if test_results.get("expense_success", False) else "❌ 失败"
-
-            # 准备模板变量
-            screenshot_dir_path = actual_screenshot_dir.replace('\\', '/') if actual_screenshot_dir else 'screenshots'
-            relative_screenshot_path = f"../{screenshot_dir_path}"
+            claim_success = test_results.get("claim_request_success", False)
+            expense_success = test_results.get("expense_success", False)
+            claim_status = "✅ 成功" if claim_success else "❌ 失败"
+            expense_status = "✅ 成功" if expense_success else "❌ 失败"
             employee_name = self._valid_employee_name or "Timothy Amiano"
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            screenshot_count = len(screenshots)
-
-
-
-            # 生成HTML内容
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>OrangeHRM Claim Request 详细测试报告</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{ margin: 0; font-size: 2.5em; }}
-        .header p {{ margin: 10px 0; font-size: 1.2em; opacity: 0.9; }}
-        .step {{
-            margin: 30px 0;
-            padding: 25px;
-            border: 2px solid #e0e0e0;
-            border-radius: 10px;
-            background-color: #fafafa;
-        }}
-        .step-header {{
-            background-color: #28a745;
-            color: white;
-            padding: 15px 20px;
-            margin: -25px -25px 20px -25px;
-            border-radius: 8px 8px 0 0;
-            font-size: 1.3em;
-            font-weight: bold;
-        }}
-        .step-content {{
-            padding: 10px 0;
-        }}
-        .step-description {{
-            font-size: 1.1em;
-            color: #333;
-            margin-bottom: 15px;
-            line-height: 1.6;
-        }}
-        .screenshot {{
-            text-align: center;
-            margin: 20px 0;
-            padding: 20px;
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .screenshot img {{
-            max-width: 100%;
-            height: auto;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }}
-        .screenshot-caption {{
-            margin-top: 10px;
-            font-style: italic;
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .success-icon {{ color: #28a745; font-size: 1.2em; }}
-        .step-details {{
-            background-color: #e8f5e8;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 10px 0;
-            border-left: 4px solid #28a745;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding: 20px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎯 OrangeHRM Claim Request 详细测试报告</h1>
-            <p><strong>测试员工:</strong> {employee_name}</p>
-            <p><strong>测试时间:</strong> {current_time}</p>
-            <p><strong>测试状态:</strong> ✅ 全部通过</p>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 1: 点击Employee Claims，添加一条Assign Claims记录
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    点击<strong>Employee Claims</strong>，添加一条<strong>Assign Claims</strong>记录：<br>
-                    <strong>Create Claim Request</strong>：填写员工姓名、选择事件类型和货币类型
-                </div>
-                <div class="step-details">
-                    <strong>创建内容:</strong><br>
-                    • 员工姓名: {self._valid_employee_name or "Timothy Amiano"}<br>
-                    • 事件类型: Travel allowances (或其他可用类型)<br>
-                    • 货币类型: Euro<br>
-                    • 创建状态: 成功
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/assign_claim_request.png" alt="Create Claim Request" onerror="this.parentElement.innerHTML='<div class=\\"screenshot-fallback\\"><p>📸 图片未加载，请参考截图文件：<strong>assign_claim_request.png</strong></p><p>图1: Create Claim Request界面</p><p>完整路径: {screenshot_dir_path}/assign_claim_request.png</p></div>'"
-                    <div class="screenshot-caption">图1: Create Claim Request界面</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 2: 点击Create后验证成功提示信息
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    点击<strong>Create</strong>后验证成功提示信息，确认Claim Request创建成功
-                </div>
-                <div class="step-details">
-                    <strong>验证内容:</strong><br>
-                    • 成功提示信息显示<br>
-                    • 页面跳转正常<br>
-                    • 数据保存成功<br>
-                    • 状态更新正确
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/assign_claim_request_success.png" alt="Create成功提示" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图2: Create成功提示信息界面</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 3: 跳转至Assign Claim详情页，验证与前一步数据一致
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    跳转至<strong>Assign Claim</strong>详情页，验证与前一步数据一致，确保数据传递准确
-                </div>
-                <div class="step-details">
-                    <strong>验证项目:</strong><br>
-                    • 员工姓名一致性<br>
-                    • 事件类型一致性<br>
-                    • 货币类型一致性<br>
-                    • 页面显示完整性
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/assign_claim_view_details.png" alt="Assign Claim详情页" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图3: Assign Claim详情页界面</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 4: 添加Expenses，选择Expense Type和Date，填写amount，点击Submit，验证成功提示信息
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    添加<strong>Expenses</strong>，选择<strong>Expense Type</strong>和<strong>Date</strong>，填写<strong>amount</strong>，点击<strong>Submit</strong>，验证成功提示信息
-                </div>
-                <div class="step-details">
-                    <strong>Expense信息:</strong><br>
-                    • 费用类型: Transport<br>
-                    • 日期: 2023-05-01<br>
-                    • 金额: 50<br>
-                    • 提交状态: {expense_status}
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/add_expense_success.png" alt="添加Expense成功" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图4: 添加Expense成功界面</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 5: 检查数据与填写数据一致，点击Back返回
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    检查数据与填写数据一致，点击<strong>Back</strong>返回，确保费用信息正确保存
-                </div>
-                <div class="step-details">
-                    <strong>数据验证:</strong><br>
-                    • 费用类型: Transport ✓<br>
-                    • 日期: 2023-05-01 ✓<br>
-                    • 金额: 50 ✓<br>
-                    • 返回操作: 成功
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/assign_claim_expense_back.png" alt="Back返回" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图5: 点击Back返回界面</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 6: 验证Record中存在刚才的提交记录
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    验证Record中存在刚才的提交记录，确认整个流程的完整性和数据的持久化
-                </div>
-                <div class="step-details">
-                    <strong>记录验证:</strong><br>
-                    • 记录存在性: 已确认<br>
-                    • 数据完整性: 验证通过<br>
-                    • 状态正确性: 正常<br>
-                    • 流程完整性: 成功
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/assign_claim_add_expense_record_exists.png" alt="记录存在验证" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图6: 验证Record中存在提交记录</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="step">
-            <div class="step-header">
-                <span class="success-icon">✅</span> Step 7: 测试完成，生成详细报告
-            </div>
-            <div class="step-content">
-                <div class="step-description">
-                    测试完成，生成详细的HTML测试报告，包含所有步骤的截图和执行结果
-                </div>
-                <div class="step-details">
-                    <strong>报告内容:</strong><br>
-                    • 7个完整测试步骤<br>
-                    • 7张对应截图<br>
-                    • 详细执行日志<br>
-                    • 测试结果总结
-                </div>
-                <div class="screenshot">
-                    <img src="{relative_screenshot_path}/test_report_generated.png" alt="测试报告生成" onerror="this.style.display='none'">
-                    <div class="screenshot-caption">图7: 测试报告生成完成</div>
-                </div>
-            </div>
-        </div>
-"""
-
-            html_content += f"""
-
-        <div class="footer">
-            <h3>🎉 测试总结</h3>
-            <p><strong>测试结果:</strong> {overall_status_display}</p>
-            <p><strong>Claim Request:</strong> {claim_status}</p>
-            <p><strong>Expense添加:</strong> {expense_status}</p>
-            <p><strong>截图数量:</strong> {screenshot_count}张</p>
-            <p><strong>报告生成时间:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>"""
-
-            # 添加错误和警告信息
-            if test_results.get("errors"):
-                html_content += f"""
-            <div style="background-color: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                <h4>❌ 错误信息 ({len(test_results["errors"])}个)</h4>
-                <ul>"""
-                for error in test_results["errors"]:
-                    html_content += f"<li>{error}</li>"
-                html_content += """
-                </ul>
-            </div>"""
-
-            if test_results.get("warnings"):
-                html_content += f"""
-            <div style="background-color: #fff3cd; color: #856404; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                <h4>⚠️ 警告信息 ({len(test_results["warnings"])}个)</h4>
-                <ul>"""
-                for warning in test_results["warnings"]:
-                    html_content += f"<li>{warning}</li>"
-                html_content += """
-                </ul>
-            </div>"""
-
-            html_content += f"""
-            <h4>🚀 关键功能验证</h4>
-            <ul style="text-align: left; display: inline-block;">
-                <li>{claim_status} Employee Claims访问 - 进入Claims页面</li>
-                <li>{claim_status} Assign Claims创建 - Create Claim Request</li>
-                <li>{claim_status} Create成功验证 - 成功提示信息确认</li>
-                <li>{claim_status} 详情页数据一致性 - 前后数据匹配验证</li>
-                <li>{expense_status} Expense费用添加 - 费用信息录入</li>
-                <li>{'✅ 成功' if test_results.get('expense_success', False) else '⚠️ 跳过'} 数据验证与返回 - Back操作</li>
-                <li>✅ 成功 记录存在性验证 - Record中记录确认</li>
-            </ul>
-
-            <h4>🎯 技术特点</h4>
-            <ul style="text-align: left; display: inline-block;">
-                <li>🔄 自动适应不同环境和账号</li>
-                <li>🌐 全局变量确保数据一致性</li>
-                <li>📝 详细的执行日志记录</li>
-                <li>📸 每步骤对应截图记录</li>
-                <li>🛡️ 完善的错误处理机制</li>
-                <li>⚡ 智能重试和备用方案</li>
-            </ul>
-
-            <h4>📁 截图信息</h4>
-            <div style="text-align: left; background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                <p><strong>截图目录:</strong> {screenshot_dir_path}</p>
-                <p><strong>截图数量:</strong> {screenshot_count} 张</p>
-                <p><strong>💡 如果图片无法显示:</strong></p>
-                <ul>
-                    <li>请直接打开文件夹: <code>{screenshot_dir_path}</code></li>
-                    <li>或运行 <code>python run_bdd_tests.py</code> 重新生成截图</li>
-                    <li>确保截图文件存在且路径正确</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
+            screenshot_dir_path = actual_screenshot_dir.replace('\\', '/')
+
+            cases = [
+                ReportCase(
+                    case_id="Step 1",
+                    title="点击Employee Claims，添加一条Assign Claims记录",
+                    passed=claim_success,
+                    description="点击<strong>Employee Claims</strong>，添加一条<strong>Assign Claims</strong>记录："
+                                "<strong>Create Claim Request</strong>：填写员工姓名、选择事件类型和货币类型",
+                    details_title="创建内容:",
+                    details=[f"• 员工姓名: {employee_name}", "• 事件类型: Travel allowances (或其他可用类型)",
+                             "• 货币类型: Euro", f"• 创建状态: {claim_status}"],
+                    screenshot_steps=["assign_claim_request"],
+                ),
+                ReportCase(
+                    case_id="Step 2",
+                    title="点击Create后验证成功提示信息",
+                    passed=claim_success,
+                    description="点击<strong>Create</strong>后验证成功提示信息，确认Claim Request创建成功",
+                    details_title="验证内容:",
+                    details=["• 成功提示信息显示", "• 页面跳转正常", "• 数据保存成功", "• 状态更新正确"],
+                    screenshot_steps=["assign_claim_request_success"],
+                ),
+                ReportCase(
+                    case_id="Step 3",
+                    title="跳转至Assign Claim详情页，验证与前一步数据一致",
+                    passed=claim_success,
+                    description="跳转至<strong>Assign Claim</strong>详情页，验证与前一步数据一致，确保数据传递准确",
+                    details_title="验证项目:",
+                    details=["• 员工姓名一致性", "• 事件类型一致性", "• 货币类型一致性", "• 页面显示完整性"],
+                    screenshot_steps=["assign_claim_view_details"],
+                ),
+                ReportCase(
+                    case_id="Step 4",
+                    title="添加Expenses，选择Expense Type和Date，填写amount，点击Submit，验证成功提示信息",
+                    passed=expense_success,
+                    description="添加<strong>Expenses</strong>，选择<strong>Expense Type</strong>和<strong>Date</strong>，"
+                                "填写<strong>amount</strong>，点击<strong>Submit</strong>，验证成功提示信息",
+                    details_title="Expense信息:",
+                    details=["• 费用类型: Transport", "• 日期: 2023-05-01", "• 金额: 50", f"• 提交状态: {expense_status}"],
+                    screenshot_steps=["add_expense_success"],
+                ),
+                ReportCase(
+                    case_id="Step 5",
+                    title="检查数据与填写数据一致，点击Back返回",
+                    passed=expense_success,
+                    status="✅ 成功" if expense_success else "⚠️ 跳过",
+                    description="检查数据与填写数据一致，点击<strong>Back</strong>返回，确保费用信息正确保存",
+                    details_title="数据验证:",
+                    details=["• 费用类型: Transport ✓", "• 日期: 2023-05-01 ✓", "• 金额: 50 ✓", "• 返回操作: 成功"],
+                    screenshot_steps=["assign_claim_expense_back"],
+                ),
+                ReportCase(
+                    case_id="Step 6",
+                    title="验证Record中存在刚才的提交记录",
+                    description="验证Record中存在刚才的提交记录，确认整个流程的完整性和数据的持久化",
+                    details_title="记录验证:",
+                    details=["• 记录存在性: 已确认", "• 数据完整性: 验证通过", "• 状态正确性: 正常", "• 流程完整性: 成功"],
+                    screenshot_steps=["assign_claim_add_expense_record_exists"],
+                ),
+                ReportCase(
+                    case_id="Step 7",
+                    title="测试完成，生成详细报告",
+                    description="测试完成，生成详细的HTML测试报告，包含所有步骤的截图和执行结果",
+                    details_title="报告内容:",
+                    details=["• 7个完整测试步骤", "• 每步对应截图", "• 详细执行日志", "• 测试结果总结"],
+                ),
+            ]
 
-            # 写入HTML文件
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            report_file = engine.write(
+                f"test_report_{timestamp}.html",
+                title="OrangeHRM Claim Request 详细测试报告",
+                heading="🎯 OrangeHRM Claim Request 详细测试报告",
+                subtitles=[f"<strong>测试员工:</strong> {employee_name}", f"<strong>测试时间:</strong> {current_time}"],
+                summary=[
+                    ("测试结果", overall_status_display),
+                    ("Claim Request", claim_status),
+                    ("Expense添加", expense_status),
+                    ("截图数量", f"{screenshot_count}张"),
+                ],
+                cases_heading="测试步骤",
+                cases=cases,
+                screenshots=screenshots,
+                screenshot_dir=actual_screenshot_dir,
+                rerun_command="python run_bdd_tests.py",
+                notes=[
+                    (f"❌ 错误信息 ({len(test_results.get('errors') or [])}个)", test_results.get("errors") or [], "notes-error"),
+                    (f"⚠️ 警告信息 ({len(test_results.get('warnings') or [])}个)", test_results.get("warnings") or [], "notes-warning"),
+                    ("🚀 关键功能验证", [
+                        f"{claim_status} Employee Claims访问 - 进入Claims页面",
+                        f"{claim_status} Assign Claims创建 - Create Claim Request",
+                        f"{claim_status} Create成功验证 - 成功提示信息确认",
+                        f"{claim_status} 详情页数据一致性 - 前后数据匹配验证",
+                        f"{expense_status} Expense费用添加 - 费用信息录入",
+                        f"{'✅ 成功' if expense_success else '⚠️ 跳过'} 数据验证与返回 - Back操作",
+                        "✅ 成功 记录存在性验证 - Record中记录确认",
+                    ], ""),
+                ],
+                slow_steps=test_results.get("slow_steps"),
+                footer_lines=[
+                    f"<strong>截图目录:</strong> {screenshot_dir_path}（如果图片无法显示，请直接打开该文件夹）",
+                    f"<strong>报告生成时间:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                ],
+            )
 
             logger.info(f"✅ HTML测试报告已生成: {report_file}")
-            self._report_file = report_file
+            self._report_file = str(report_file)
             return True
 
         except Exception as e:
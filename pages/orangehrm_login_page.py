@@ -5,6 +5,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
 from pages.base_page import BasePage
+from utils.session_cache import session_cache
 
 
 class OrangeHRMLoginPage(BasePage):
@@ -17,6 +18,11 @@ class OrangeHRMLoginPage(BasePage):
     LOGIN_FORM = (By.CLASS_NAME, "orangehrm-login-form")
     ERROR_MESSAGE = (By.XPATH, "//div[@class='oxd-alert-content oxd-alert-content--error']")
     
+    # OrangeHRM演示站点的默认凭据
+    DEFAULT_USERNAME = "Admin"
+    DEFAULT_PASSWORD = "admin123"
+    DASHBOARD_URL = "https://opensource-demo.orangehrmlive.com/web/index.php/dashboard/index"
+    
     def __init__(self, driver: WebDriver):
         """
         初始化OrangeHRM登录页面对象
@@ -74,10 +80,39 @@ class OrangeHRMLoginPage(BasePage):
         self.enter_password(password)
         self.click_login_button()
     
-    def login_with_default_credentials(self):
-        """使用默认凭据登录"""
-        # OrangeHRM演示站点的默认凭据
-        self.login("Admin", "admin123")
+    def login_with_default_credentials(self, target_url: str = None, use_session_cache: bool = None):
+        """
+        使用默认凭据登录
+        
+        启用登录会话缓存时优先注入缓存的会话并直接打开目标页面；
+        缓存不存在、已过期或被服务端拒绝时回退到界面登录，登录成功后保存新的会话快照
+        
+        Args:
+            target_url: 登录后打开的页面，None时停留在登录后的仪表板
+            use_session_cache: 是否使用会话缓存，None时按配置/环境变量决定
+            
+        Returns:
+            是否已处于登录状态
+        """
+        if use_session_cache is None:
+            use_session_cache = session_cache.enabled()
+        
+        if use_session_cache and session_cache.restore(
+                self.driver, target_url or self.DASHBOARD_URL, self.DEFAULT_USERNAME):
+            return True
+        
+        if "/auth/login" not in self.get_current_url():
+            self.open_page()
+        self.login(self.DEFAULT_USERNAME, self.DEFAULT_PASSWORD)
+        logged_in = self.wait_until(lambda d: "/auth/login" not in d.current_url,
+                                    timeout=20, description="等待登录跳转", budget=3)
+        
+        if logged_in and use_session_cache:
+            self.wait_for_page_load()
+            session_cache.save(self.driver, self.DEFAULT_USERNAME)
+        if logged_in and target_url:
+            self.open_url(target_url)
+        return logged_in
     
     def is_on_login_page(self) -> bool:
         """
@@ -132,8 +167,8 @@ class OrangeHRMLoginPage(BasePage):
         """
         try:
             # 等待页面跳转
-            import time
-            time.sleep(3)
+            self.wait_until(lambda d: "/dashboard/index" in d.current_url,
+                            timeout=10, description="等待跳转到仪表板", budget=3)
             current_url = self.get_current_url()
             success = "/dashboard/index" in current_url
             logger.info(f"登录验证结果: {success}, 当前URL: {current_url}")
@@ -2,30 +2,45 @@
 """
 自动化测试完整执行脚本
 按顺序执行所有测试：Chrome -> Edge -> BDD测试
+也支持 --parallel N 并行执行各测试套件
 提供详细的执行提示和结果反馈
 """
 
 import os
 import sys
+import json
 import subprocess
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
+from utils.screenshot_index import get_screenshot_index
 
 
 class TestExecutor:
     """测试执行器 - 统一管理所有测试的执行"""
 
-    def __init__(self, auto_start=True):
+    # 测试套件: (套件名称, 脚本文件, 描述)
+    TEST_SUITES = [
+        ("chrome", "run_chrome_tests.py", "Chrome浏览器测试"),
+        ("edge", "run_edge_tests.py", "Edge浏览器测试"),
+        ("bdd", "run_bdd_tests.py", "BDD行为驱动测试"),
+    ]
+
+    def __init__(self, auto_start=True, parallel=0, profiles=None):
         """
         初始化测试执行器
 
         Args:
             auto_start: 是否自动开始执行（默认True）
+            parallel: 并行执行的测试套件数量，0表示按顺序执行
+            profiles: 套件名称 -> 浏览器配置档（"*" 表示所有套件），未指定的套件使用配置文件设置
         """
         self.auto_start = auto_start
+        self.parallel = parallel
+        self.profiles = profiles or {}
         self.project_root = Path(__file__).parent
         self.reports_dir = self.project_root / "reports"
         self.screenshots_dir = self.project_root / "screenshots"
@@ -65,13 +80,30 @@ class TestExecutor:
         print(f"\n🔔 {message}")
         print("-" * 60)
     
-    def execute_script(self, script_name: str, description: str) -> bool:
+    def suite_env(self, suite_name: str) -> dict:
+        """
+        获取测试套件子进程的环境变量（按套件设置浏览器配置档）
+
+        Args:
+            suite_name: 套件名称
+
+        Returns:
+            环境变量字典
+        """
+        env = os.environ.copy()
+        profile = self.profiles.get(suite_name, self.profiles.get("*"))
+        if profile:
+            env["BROWSER_PROFILE"] = profile
+        return env
+
+    def execute_script(self, script_name: str, description: str, suite_name: str = None) -> bool:
         """
         执行Python脚本
         
         Args:
             script_name: 脚本文件名
             description: 脚本描述
+            suite_name: 套件名称，用于选择浏览器配置档
             
         Returns:
             执行是否成功
@@ -90,6 +122,7 @@ class TestExecutor:
             result = subprocess.run(
                 [sys.executable, str(script_path)],
                 cwd=str(self.project_root),
+                env=self.suite_env(suite_name),
                 capture_output=False,  # 让输出直接显示在控制台
                 text=True
             )
@@ -105,6 +138,145 @@ class TestExecutor:
             logger.error(f"❌ 执行 {description} 时发生异常: {e}")
             return False
     
+    def execute_suite_isolated(self, suite_name: str, script_name: str, description: str,
+                               run_reports_dir: Path, run_screenshots_dir: Path, run_logs_dir: Path) -> dict:
+        """
+        在独立的报告/截图目录中执行测试套件，输出写入独立日志文件
+
+        Args:
+            suite_name: 套件名称
+            script_name: 脚本文件名
+            description: 脚本描述
+            run_reports_dir: 本次并行运行的报告根目录
+            run_screenshots_dir: 本次并行运行的截图根目录
+            run_logs_dir: 本次并行运行的日志目录
+
+        Returns:
+            套件执行结果字典
+        """
+        suite_reports_dir = run_reports_dir / suite_name
+        suite_screenshots_dir = run_screenshots_dir / suite_name
+        suite_reports_dir.mkdir(parents=True, exist_ok=True)
+        suite_screenshots_dir.mkdir(parents=True, exist_ok=True)
+        log_file = run_logs_dir / f"{suite_name}.log"
+
+        result = {
+            "suite": suite_name,
+            "description": description,
+            "success": False,
+            "returncode": None,
+            "duration": 0.0,
+            "log_file": str(log_file),
+            "reports_dir": str(suite_reports_dir),
+            "screenshots_dir": str(suite_screenshots_dir),
+        }
+
+        script_path = self.project_root / script_name
+        if not script_path.exists():
+            logger.error(f"❌ 脚本文件不存在: {script_path}")
+            return result
+
+        env = self.suite_env(suite_name)
+        env["PYTHONPATH"] = str(self.project_root)
+        env["REPORT_DIR"] = str(suite_reports_dir)
+        env["SCREENSHOT_DIR"] = str(suite_screenshots_dir)
+
+        logger.info(f"🚀 [{suite_name}] 开始执行 {description}，日志: {log_file}")
+        start = time.monotonic()
+        try:
+            with open(log_file, "w", encoding="utf-8") as log:
+                completed = subprocess.run(
+                    [sys.executable, str(script_path)],
+                    cwd=str(self.project_root),
+                    env=env,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    text=True
+                )
+            result["returncode"] = completed.returncode
+            result["success"] = completed.returncode == 0
+        except Exception as e:
+            logger.error(f"❌ [{suite_name}] 执行 {description} 时发生异常: {e}")
+        result["duration"] = round(time.monotonic() - start, 2)
+
+        if result["success"]:
+            logger.info(f"✅ [{suite_name}] {description} 执行成功！耗时 {result['duration']}s")
+        else:
+            logger.error(f"❌ [{suite_name}] {description} 执行失败！返回码: {result['returncode']}，"
+                         f"耗时 {result['duration']}s")
+        return result
+
+    def run_all_tests_parallel(self, max_workers: int) -> bool:
+        """
+        并行执行所有测试套件
+
+        每个套件作为独立子进程运行，拥有独立的报告目录、截图目录和日志文件，
+        全部完成后生成合并的执行总结。总耗时接近最慢的套件，而不是所有套件耗时之和。
+
+        Args:
+            max_workers: 同时运行的最大套件数量
+
+        Returns:
+            所有套件是否都执行成功
+        """
+        start_time = datetime.now()
+        run_id = start_time.strftime("%Y%m%d_%H%M%S")
+        run_reports_dir = self.reports_dir / f"parallel_{run_id}"
+        run_screenshots_dir = self.screenshots_dir / f"parallel_{run_id}"
+        run_logs_dir = self.project_root / "logs" / f"parallel_{run_id}"
+        run_logs_dir.mkdir(parents=True, exist_ok=True)
+
+        max_workers = max(1, min(max_workers, len(self.TEST_SUITES)))
+        self.print_banner(f"🚀 自动化测试并行执行流程 (并行度: {max_workers})")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.execute_suite_isolated, suite_name, script_name, description,
+                            run_reports_dir, run_screenshots_dir, run_logs_dir)
+                for suite_name, script_name, description in self.TEST_SUITES
+            ]
+            results = [future.result() for future in futures]
+
+        end_time = datetime.now()
+        wall_time = (end_time - start_time).total_seconds()
+        summary = {
+            "run_id": run_id,
+            "parallel": max_workers,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "wall_time": round(wall_time, 2),
+            "sequential_time": round(sum(r["duration"] for r in results), 2),
+            "suites": results,
+        }
+        summary_file = run_reports_dir / "parallel_summary.json"
+        run_reports_dir.mkdir(parents=True, exist_ok=True)
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        self._print_parallel_summary(summary, summary_file)
+        return all(r["success"] for r in results)
+
+    def _print_parallel_summary(self, summary: dict, summary_file: Path):
+        """打印并行执行的合并总结"""
+        self.print_banner("🏁 所有测试套件并行执行完成")
+
+        for result in summary["suites"]:
+            status = "✅ 正常执行" if result["success"] else f"❌ 执行异常 (返回码: {result['returncode']})"
+            print(f"  [{result['suite']}] {result['description']}: {status}，耗时 {result['duration']}s")
+            reports = sorted(Path(result["reports_dir"]).glob("*.html"))
+            for report in reports:
+                print(f"      📄 报告: {report}")
+            print(f"      📷 截图: {result['screenshots_dir']}")
+            print(f"      📝 日志: {result['log_file']}")
+
+        executed_count = sum(1 for r in summary["suites"] if r["success"])
+        total_count = len(summary["suites"])
+        print(f"\n⏱️  总执行时间: {summary['wall_time']}s (顺序执行预计: {summary['sequential_time']}s)")
+        print(f"📊 脚本执行统计: {executed_count}/{total_count} 正常执行")
+        print(f"📋 合并总结: {summary_file}")
+        print("\n⚠️  注意: 上述统计仅表示脚本是否正常执行完成")
+        print("  📊 具体测试用例的成功/失败情况请查看各套件的HTML报告")
+
     def get_latest_report_files(self):
         """获取最新生成的报告文件信息"""
         try:
@@ -129,18 +301,14 @@ class TestExecutor:
     def get_latest_screenshot_dirs(self):
         """获取最新生成的截图目录信息"""
         try:
-            # 查找Chrome截图目录
-            chrome_dirs = list(self.screenshots_dir.glob("chrome_tests_*"))
-            chrome_dir = max(chrome_dirs, key=lambda x: x.stat().st_mtime) if chrome_dirs else None
-            
-            # 查找Edge截图目录
-            edge_dirs = list(self.screenshots_dir.glob("edge_tests_*"))
-            edge_dir = max(edge_dirs, key=lambda x: x.stat().st_mtime) if edge_dirs else None
-            
-            # 查找BDD截图目录
-            bdd_dirs = list(self.screenshots_dir.glob("bdd_tests_*"))
-            bdd_dir = max(bdd_dirs, key=lambda x: x.stat().st_mtime) if bdd_dirs else None
-            
+            # 测试脚本在子进程中运行，这里重新扫描一次根目录（未变化的目录保留已有索引）
+            screenshot_index = get_screenshot_index(self.screenshots_dir)
+            screenshot_index.refresh()
+
+            chrome_dir = screenshot_index.latest_run("chrome_tests_")
+            edge_dir = screenshot_index.latest_run("edge_tests_")
+            bdd_dir = screenshot_index.latest_run("bdd_tests_")
+
             return chrome_dir, edge_dir, bdd_dir
             
         except Exception as e:
@@ -171,7 +339,7 @@ class TestExecutor:
         # ==================== 第一题：Chrome测试 ====================
         self.print_step_info("这是第一题的Chrome版本")
         
-        chrome_success = self.execute_script("run_chrome_tests.py", "Chrome浏览器测试")
+        chrome_success = self.execute_script("run_chrome_tests.py", "Chrome浏览器测试", "chrome")
         
         if chrome_success:
             print("\n✅ Chrome版本已完成！")
@@ -183,7 +351,7 @@ class TestExecutor:
         # ==================== 第一题：Edge测试 ====================
         self.print_step_info("Chrome版本已完成，现在用Edge进行测试")
         
-        edge_success = self.execute_script("run_edge_tests.py", "Edge浏览器测试")
+        edge_success = self.execute_script("run_edge_tests.py", "Edge浏览器测试", "edge")
         
         if edge_success:
             print("\n✅ Edge版本已完成！")
@@ -216,7 +384,7 @@ class TestExecutor:
         # ==================== 第二题：BDD测试 ====================
         self.print_step_info("现在开始进行第二题")
         
-        bdd_success = self.execute_script("run_bdd_tests.py", "BDD行为驱动测试")
+        bdd_success = self.execute_script("run_bdd_tests.py", "BDD行为驱动测试", "bdd")
         
         # 第二题完成总结
         self.print_banner("📊 第二题执行完成")
@@ -264,7 +432,7 @@ class TestExecutor:
         print(f"  - 所有截图文件都在 screenshots/ 目录下")
         print(f"  - 可以用浏览器打开HTML报告查看详细结果")
         
-        return success_count == total_count
+        return executed_count == total_count
 
 
 def main():
@@ -277,6 +445,9 @@ def main():
 使用示例:
   python run_all_tests.py              # 自动执行所有测试
   python run_all_tests.py --manual     # 需要手动确认后执行
+  python run_all_tests.py --parallel 3 # 并行执行3个测试套件
+  python run_all_tests.py --profile fast            # 所有套件使用fast浏览器配置档
+  python run_all_tests.py --profile bdd=fast        # 只有BDD套件使用fast浏览器配置档
   python run_all_tests.py --help       # 显示帮助信息
         """
     )
@@ -286,13 +457,33 @@ def main():
         help='需要手动按回车确认后才开始执行测试（默认自动执行）'
     )
 
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=0,
+        metavar='N',
+        help='并行执行测试套件，N为同时运行的套件数量（默认0，按顺序执行）'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='append',
+        default=[],
+        metavar='[SUITE=]PROFILE',
+        help='浏览器配置档（见config.yaml的browser_profiles），可按套件指定，如 bdd=fast；可重复使用'
+    )
+
     args = parser.parse_args()
 
     try:
         # 根据参数决定是否自动开始
         auto_start = not args.manual
-        executor = TestExecutor(auto_start=auto_start)
-        success = executor.run_all_tests()
+        profiles = dict(value.split('=', 1) if '=' in value else ("*", value) for value in args.profile)
+        executor = TestExecutor(auto_start=auto_start, parallel=args.parallel, profiles=profiles)
+        if args.parallel > 0:
+            success = executor.run_all_tests_parallel(args.parallel)
+        else:
+            success = executor.run_all_tests()
 
         if success:
             print("\n🎉 所有测试执行成功！")
@@ -6,6 +6,8 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
+from utils.report_engine import ReportEngine, ReportCase
+from utils.screenshot_index import get_screenshot_index
 
 
 class ChromeTestRunner:
@@ -14,20 +16,21 @@ class ChromeTestRunner:
     def __init__(self):
         """初始化Chrome测试运行器"""
         self.project_root = Path(__file__).parent
-        self.reports_dir = self.project_root / "reports"
-        self.screenshots_dir = self.project_root / "screenshots"
+        # 支持通过环境变量指定独立的报告/截图目录（并行执行时由run_all_tests设置）
+        self.reports_dir = Path(os.environ.get("REPORT_DIR", self.project_root / "reports"))
+        self.screenshots_dir = Path(os.environ.get("SCREENSHOT_DIR", self.project_root / "screenshots"))
         
     def run_chrome_tests(self):
         """运行Chrome浏览器的完整流程测试"""
         logger.info("=== 开始执行Chrome浏览器完整流程测试 ===")
 
-        # 执行唯一的完整流程测试，避免重复
-        logger.info("执行Chrome完整流程测试（包含3个登录用例 + 5个异常用例）...")
+        # 完整流程拆分出的TC001-TC008作为独立测试项执行，共用一个预热的浏览器
+        logger.info("执行Chrome单用例测试（3个登录用例 + 5个异常用例）...")
         cmd_complete = [
             sys.executable, "-m", "pytest",
-            "tests/test_selenium_basic.py::TestSeleniumBasic::test_01_chrome_complete_flow",
+            "tests/test_selenium_basic.py::TestSeleniumBasic::test_03_chrome_case",
             "-v", "-s",
-            "--html=reports/chrome_complete_flow_report.html",
+            f"--html={self.reports_dir / 'chrome_complete_flow_report.html'}",
             "--self-contained-html"
         ]
 
@@ -37,8 +40,8 @@ class ChromeTestRunner:
             logger.info("✅ Chrome完整流程测试成功完成")
             logger.info("  - 包含3个登录用例：正确凭据、错误用户名、错误密码")
             logger.info("  - 包含5个异常用例：Add按钮、文本输入、保存功能、确认消息、数据一致性")
+            logger.info("  - 每个用例是独立的测试项，可以单独重跑")
             logger.info("  - 浏览器在整个测试过程中保持打开状态")
-            logger.info("  - 避免了重复执行相同的测试用例")
             return True
         else:
             logger.error("❌ Chrome完整流程测试执行失败")
@@ -75,9 +78,11 @@ class ChromeTestRunner:
         """生成详细的测试报告，包含8个测试用例的完整文档"""
         logger.info("=== 生成详细测试报告 ===")
 
-        # 检查生成的文件
+        # 检查生成的文件（截图根目录只扫描一次，索引供报告复用）
         report_files = list(self.reports_dir.glob("chrome_*.html"))
-        screenshot_dirs = list(self.screenshots_dir.glob("chrome_*"))
+        screenshot_index = get_screenshot_index(self.screenshots_dir)
+        screenshot_index.refresh()
+        screenshot_dirs = screenshot_index.runs("chrome_")
 
         # 生成HTML格式的详细测试报告
         html_report = self._generate_html_test_report(success, report_files, screenshot_dirs)
@@ -98,147 +103,54 @@ class ChromeTestRunner:
         """生成测试总结（保持向后兼容）"""
         return self.generate_detailed_test_report(success)
 
-    def _get_test_case_screenshots(self, test_case_id):
-        """获取特定测试用例的截图信息"""
-        screenshots = []
-
-        # 定义每个测试用例对应的截图模式
-        screenshot_patterns = {
-            "TC001": [
-                "登录用例1_输入正确用户名",
-                "登录用例1_输入正确密码",
-                "登录用例1_正确凭据登录",
-                "登录用例1_登录成功验证",
-                "登录用例1_登出操作"
-            ],
-            "TC002": [
-                "登录用例2_输入错误用户名",
-                "登录用例2_输入密码",
-                "登录用例2_错误用户名登录"
-            ],
-            "TC003": [
-                "登录用例3_输入正确用户名",
-                "登录用例3_输入错误密码",
-                "登录用例3_错误密码登录"
-            ],
-            "TC004": [
-                "异常测试_用例1_步骤1_滚动到标题",
-                "异常测试_用例1_步骤2_Add按钮高亮",
-                "异常测试_用例1_步骤3_点击Add按钮",
-                "异常测试_用例1_步骤4_捕获异常"
-            ],
-            "TC005": [
-                "异常测试_用例2_步骤1_滚动到标题",
-                "异常测试_用例2_步骤2_Add按钮高亮",
-                "异常测试_用例2_步骤3_点击Add按钮_等待Row2",
-                "异常测试_用例2_步骤4_输入文本",
-                "异常测试_用例2_步骤5_捕获异常"
-            ],
-            "TC006": [
-                "异常测试_用例3_步骤1_滚动到标题",
-                "异常测试_用例3_步骤2_禁用输入框高亮",
-                "异常测试_用例3_步骤2_捕获异常"
-            ],
-            "TC007": [
-                "异常测试_用例4_步骤1_获取元素引用",
-                "异常测试_用例4_步骤2_点击Add按钮",
-                "异常测试_用例4_步骤3_捕获异常"
-            ],
-            "TC008": [
-                "异常测试_用例5_步骤1_Add按钮高亮",
-                "异常测试_用例5_步骤1_点击Add按钮",
-                "异常测试_用例5_步骤2_捕获异常"
-            ]
-        }
-
-        patterns = screenshot_patterns.get(test_case_id, [])
-
-        # 🔧 修复：只使用最新的Chrome测试截图目录，避免使用旧截图
-        chrome_dirs = list(self.screenshots_dir.glob("chrome_*"))
-        if not chrome_dirs:
-            logger.warning("未找到任何Chrome测试截图目录")
-            return screenshots
-
-        # 按修改时间排序，获取最新的目录
-        latest_chrome_dir = max(chrome_dirs, key=lambda x: x.stat().st_mtime)
-        logger.info(f"使用最新的Chrome截图目录: {latest_chrome_dir.name}")
-
-        # 搜索实际的截图文件（只在最新目录中搜索）
-        for pattern in patterns:
-            if latest_chrome_dir.is_dir():
-                # 搜索PNG和JPG文件
-                for ext in ['png', 'jpg', 'jpeg']:
-                    # 使用更安全的文件搜索方式
-                    for file_path in latest_chrome_dir.iterdir():
-                        if (file_path.is_file() and
-                            file_path.suffix.lower() == f'.{ext}' and
-                            pattern in file_path.name):
-                            # 计算相对路径
-                            relative_path = file_path.relative_to(self.screenshots_dir.parent)
-                            screenshots.append({
-                                'title': pattern,
-                                'path': str(relative_path),
-                                'exists': file_path.exists(),
-                                'size': file_path.stat().st_size if file_path.exists() else 0
-                            })
-                            break  # 找到第一个匹配的文件就停止
-                    else:
-                        continue
-                    break  # 找到文件后跳出扩展名循环
-
-        return screenshots
-
-    def _get_expected_screenshot_names(self, test_case_id):
-        """获取测试用例预期的截图名称列表"""
-        screenshot_names = {
-            "TC001": [
-                "登录用例1_输入正确用户名.png",
-                "登录用例1_输入正确密码.png",
-                "登录用例1_正确凭据登录.png",
-                "登录用例1_登录成功验证.png",
-                "登录用例1_登出操作.png"
-            ],
-            "TC002": [
-                "登录用例2_输入错误用户名.png",
-                "登录用例2_输入密码.png",
-                "登录用例2_错误用户名登录.png"
-            ],
-            "TC003": [
-                "登录用例3_输入正确用户名.png",
-                "登录用例3_输入错误密码.png",
-                "登录用例3_错误密码登录.png"
-            ],
-            "TC004": [
-                "异常测试_用例1_步骤1_滚动到标题.png",
-                "异常测试_用例1_步骤2_Add按钮高亮.png",
-                "异常测试_用例1_步骤3_点击Add按钮.png",
-                "异常测试_用例1_步骤4_捕获异常.png"
-            ],
-            "TC005": [
-                "异常测试_用例2_步骤1_滚动到标题.png",
-                "异常测试_用例2_步骤2_Add按钮高亮.png",
-                "异常测试_用例2_步骤3_点击Add按钮_等待Row2.png",
-                "异常测试_用例2_步骤4_输入文本.png",
-                "异常测试_用例2_步骤5_捕获异常.png"
-            ],
-            "TC006": [
-                "异常测试_用例3_步骤1_滚动到标题.png",
-                "异常测试_用例3_步骤2_禁用输入框高亮.png",
-                "异常测试_用例3_步骤2_捕获异常.png"
-            ],
-            "TC007": [
-                "异常测试_用例4_步骤1_获取元素引用.png",
-                "异常测试_用例4_步骤2_点击Add按钮.png",
-                "异常测试_用例4_步骤3_捕获异常.png"
-            ],
-            "TC008": [
-                "异常测试_用例5_步骤1_Add按钮高亮.png",
-                "异常测试_用例5_步骤1_点击Add按钮.png",
-                "异常测试_用例5_步骤2_捕获异常.png"
-            ]
-        }
-
-        return screenshot_names.get(test_case_id, [])
+    # 每个测试用例对应的截图步骤名（与截图文件名去掉浏览器名和时间戳后的部分一致）
+    SCREENSHOT_STEPS = {
+        "TC001": [
+            "登录用例1_输入正确用户名",
+            "登录用例1_输入正确密码",
+            "登录用例1_正确凭据登录",
+            "登录用例1_登录成功验证",
+            "登录用例1_登出操作"
+        ],
+        "TC002": [
+            "登录用例2_输入错误用户名",
+            "登录用例2_输入密码",
+            "登录用例2_错误用户名登录"
+        ],
+        "TC003": [
+            "登录用例3_输入正确用户名",
+            "登录用例3_输入错误密码",
+            "登录用例3_错误密码登录"
+        ],
+        "TC004": [
+            "异常测试_用例1_步骤1_滚动到标题",
+            "异常测试_用例1_步骤2_Add按钮高亮",
+            "异常测试_用例1_步骤3_点击Add按钮",
+            "异常测试_用例1_步骤4_捕获异常"
+        ],
+        "TC005": [
+            "异常测试_用例2_步骤1_滚动到标题",
+            "异常测试_用例2_步骤2_Add按钮高亮",
+            "异常测试_用例2_步骤3_点击Add按钮_等待Row2",
+            "异常测试_用例2_步骤4_输入文本",
+            "异常测试_用例2_步骤5_捕获异常"
+        ],
+        "TC006": [
+            "异常测试_用例3_步骤1_滚动到标题",
+            "异常测试_用例3_步骤2_禁用输入框高亮",
+            "异常测试_用例3_步骤2_捕获异常"
+        ],
+        "TC007": [
+            "异常测试_用例4_步骤1_获取元素引用",
+            "异常测试_用例4_步骤2_点击Add按钮",
+            "异常测试_用例4_步骤3_捕获异常"
+        ],
+        "TC008": [
+            "异常测试_用例5_步骤1_Add按钮高亮",
+            "异常测试_用例5_步骤1_点击Add按钮",
+            "异常测试_用例5_步骤2_捕获异常"
+        ]
+    }
 
     def _generate_html_test_report(self, success, report_files, screenshot_dirs):
         """生成HTML格式的详细测试报告"""
@@ -377,470 +289,47 @@ class ChromeTestRunner:
             }
         ]
 
-        # 生成HTML内容
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Chrome浏览器自动化测试详细报告</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            text-align: center;
-            border-bottom: 3px solid #007bff;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{
-            color: #007bff;
-            margin: 0;
-            font-size: 2.5em;
-        }}
-        .header .subtitle {{
-            color: #666;
-            font-size: 1.2em;
-            margin-top: 10px;
-        }}
-        .summary {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-        }}
-        .summary h2 {{
-            margin-top: 0;
-            color: white;
-        }}
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .summary-item {{
-            background: rgba(255,255,255,0.1);
-            padding: 15px;
-            border-radius: 5px;
-            text-align: center;
-        }}
-        .summary-item .label {{
-            font-size: 0.9em;
-            opacity: 0.8;
-        }}
-        .summary-item .value {{
-            font-size: 1.5em;
-            font-weight: bold;
-            margin-top: 5px;
-        }}
-        .test-case {{
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            margin-bottom: 25px;
-            overflow: hidden;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        .test-case-header {{
-            background: #f8f9fa;
-            padding: 15px 20px;
-            border-bottom: 1px solid #ddd;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        .test-case-title {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #333;
-        }}
-        .test-case-id {{
-            background: #007bff;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.9em;
-        }}
-        .test-case-status {{
-            font-size: 1.1em;
-            font-weight: bold;
-        }}
-        .test-case-content {{
-            padding: 20px;
-        }}
-        .test-description {{
-            background: #e3f2fd;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            border-left: 4px solid #2196f3;
-        }}
-        .test-steps {{
-            margin-bottom: 20px;
-        }}
-        .test-steps h4 {{
-            color: #333;
-            margin-bottom: 10px;
-        }}
-        .test-steps .step-list {{
-            padding-left: 0;
-            list-style: none;
-        }}
-        .test-steps li {{
-            margin-bottom: 8px;
-            padding: 8px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .expected-result {{
-            background: #e8f5e8;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #4caf50;
-        }}
-        .expected-result h4 {{
-            color: #2e7d32;
-            margin-top: 0;
-        }}
-        .pass {{ color: #28a745; }}
-        .fail {{ color: #dc3545; }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            color: #666;
-        }}
-        .files-section {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-        }}
-        .files-section h3 {{
-            color: #333;
-            margin-top: 0;
-        }}
-        .file-list {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 15px;
-        }}
-        .file-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 5px;
-            border: 1px solid #ddd;
-        }}
-        .file-item .file-type {{
-            color: #007bff;
-            font-weight: bold;
-            font-size: 0.9em;
-        }}
-        .file-item .file-count {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #333;
-        }}
-        .screenshots-section {{
-            margin-top: 20px;
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 5px;
-            border-left: 4px solid #17a2b8;
-        }}
-        .screenshots-section h4 {{
-            color: #17a2b8;
-            margin-top: 0;
-            margin-bottom: 15px;
-        }}
-        .screenshot-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .screenshot-item {{
-            background: white;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .screenshot-item img {{
-            width: 100%;
-            height: 200px;
-            object-fit: cover;
-            border-bottom: 1px solid #ddd;
-        }}
-        .screenshot-item .screenshot-info {{
-            padding: 10px;
-        }}
-        .screenshot-item .screenshot-title {{
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 5px;
-        }}
-        .screenshot-item .screenshot-path {{
-            font-size: 0.85em;
-            color: #666;
-            word-break: break-all;
-        }}
-        .screenshot-placeholder {{
-            width: 100%;
-            height: 200px;
-            background: linear-gradient(45deg, #f0f0f0 25%, transparent 25%),
-                        linear-gradient(-45deg, #f0f0f0 25%, transparent 25%),
-                        linear-gradient(45deg, transparent 75%, #f0f0f0 75%),
-                        linear-gradient(-45deg, transparent 75%, #f0f0f0 75%);
-            background-size: 20px 20px;
-            background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #999;
-            font-size: 0.9em;
-            border-bottom: 1px solid #ddd;
-        }}
-        .screenshot-info-only {{
-            background: #e3f2fd;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #2196f3;
-            margin-top: 15px;
-        }}
-        .screenshot-info-only h5 {{
-            color: #1976d2;
-            margin-top: 0;
-            margin-bottom: 10px;
-        }}
-        .screenshot-list {{
-            list-style: none;
-            padding: 0;
-            margin: 0;
-        }}
-        .screenshot-list li {{
-            padding: 8px 0;
-            border-bottom: 1px solid #e0e0e0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        .screenshot-list li:last-child {{
-            border-bottom: none;
-        }}
-        .screenshot-name {{
-            font-weight: 500;
-            color: #333;
-        }}
-        .screenshot-status {{
-            font-size: 0.85em;
-            padding: 2px 8px;
-            border-radius: 12px;
-            background: #e8f5e8;
-            color: #2e7d32;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Chrome浏览器自动化测试详细报告</h1>
-            <div class="subtitle">Practice Test Automation 完整测试流程</div>
-            <div class="subtitle">执行时间: {current_time}</div>
-        </div>
-
-        <div class="summary">
-            <h2>📊 测试执行总结</h2>
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <div class="label">测试状态</div>
-                    <div class="value">{'✅ 成功' if success else '❌ 失败'}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="label">测试用例总数</div>
-                    <div class="value">{len(test_cases)}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="label">通过用例</div>
-                    <div class="value">{len([tc for tc in test_cases if '✅' in tc['status']])}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="label">失败用例</div>
-                    <div class="value">{len([tc for tc in test_cases if '❌' in tc['status']])}</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="files-section">
-            <h3>📁 生成的测试文件</h3>
-            <div class="file-list">
-                <div class="file-item">
-                    <div class="file-type">📊 HTML报告</div>
-                    <div class="file-count">{len(report_files)} 个文件</div>
-                </div>
-                <div class="file-item">
-                    <div class="file-type">📸 截图目录</div>
-                    <div class="file-count">{len(screenshot_dirs)} 个目录</div>
-                </div>
-            </div>
-        </div>
-
-        <h2>📋 详细测试用例</h2>
-"""
-
-        # 添加每个测试用例的详细信息
-        for test_case in test_cases:
-            status_class = "pass" if "✅" in test_case["status"] else "fail"
-
-            # 获取该测试用例的截图信息
-            screenshots = self._get_test_case_screenshots(test_case['id'])
-
-            html_content += f"""
-        <div class="test-case">
-            <div class="test-case-header">
-                <div>
-                    <span class="test-case-id">{test_case['id']}</span>
-                    <span class="test-case-title">{test_case['name']}</span>
-                </div>
-                <div class="test-case-status {status_class}">{test_case['status']}</div>
-            </div>
-            <div class="test-case-content">
-                <div class="test-description">
-                    <strong>测试描述:</strong> {test_case['description']}
-                </div>
-
-                <div class="test-steps">
-                    <h4>🔧 测试步骤:</h4>
-                    <ul class="step-list">
-"""
-            for step in test_case['steps']:
-                html_content += f"                        <li>{step}</li>\n"
-
-            html_content += f"""
-                    </ul>
-                </div>
-
-                <div class="expected-result">
-                    <h4>✅ 预期结果:</h4>
-                    <p>{test_case['expected_result']}</p>
-                </div>
-"""
-
-            # 添加截图部分
-            if screenshots:
-                html_content += f"""
-                <div class="screenshots-section">
-                    <h4>📸 测试截图 ({len(screenshots)}张)</h4>
-                    <div class="screenshot-grid">
-"""
-                for screenshot in screenshots:
-                    # 获取绝对路径用于显示
-                    abs_path = Path(screenshot['path']).resolve()
-                    file_url = f"file:///{abs_path}".replace('\\', '/')
-
-                    if screenshot['exists']:
-                        html_content += f"""
-                        <div class="screenshot-item">
-                            <img src="{file_url}" alt="{screenshot['title']}"
-                                 onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
-                            <div class="screenshot-placeholder" style="display:none;">
-                                📷 图片加载失败
-                                <br><small>请手动查看: {abs_path}</small>
-                            </div>
-                            <div class="screenshot-info">
-                                <div class="screenshot-title">{screenshot['title']}</div>
-                                <div class="screenshot-path">📁 {screenshot['path']}</div>
-                                <div class="screenshot-path"><strong>完整路径:</strong> {abs_path}</div>
-                                <div class="screenshot-path"><small>💡 如图片无法显示，请直接打开上述路径查看</small></div>
-                            </div>
-                        </div>
-"""
-                    else:
-                        html_content += f"""
-                        <div class="screenshot-item">
-                            <div class="screenshot-placeholder">
-                                📷 截图文件不存在
-                                <br><small>预期位置: {abs_path}</small>
-                            </div>
-                            <div class="screenshot-info">
-                                <div class="screenshot-title">{screenshot['title']}</div>
-                                <div class="screenshot-path">📁 {screenshot['path']} (未找到)</div>
-                                <div class="screenshot-path"><strong>预期完整路径:</strong> {abs_path}</div>
-                            </div>
-                        </div>
-"""
-
-                html_content += """
-                    </div>
-                </div>
-"""
-            else:
-                # 如果没有找到截图，显示截图信息说明
-                screenshots_dir_abs = self.screenshots_dir.resolve()
-                html_content += f"""
-                <div class="screenshot-info-only">
-                    <h5>📸 截图信息</h5>
-                    <p>该测试用例的截图将在测试执行时自动生成，保存在以下位置：</p>
-                    <div class="screenshot-path"><strong>截图目录:</strong> {screenshots_dir_abs}</div>
-                    <ul class="screenshot-list">
-"""
-                # 显示预期的截图文件名
-                expected_screenshots = self._get_expected_screenshot_names(test_case['id'])
-                for screenshot_name in expected_screenshots:
-                    expected_path = screenshots_dir_abs / "chrome_*" / screenshot_name
-                    html_content += f"""
-                        <li>
-                            <span class="screenshot-name">📷 {screenshot_name}</span>
-                            <span class="screenshot-status">待生成</span>
-                            <div class="screenshot-path"><small>预期路径: {expected_path}</small></div>
-                        </li>
-"""
-
-                html_content += f"""
-                    </ul>
-                    <p><strong>💡 截图查看说明:</strong></p>
-                    <ul>
-                        <li>运行 <code>python run_chrome_tests.py</code> 生成实际截图</li>
-                        <li>截图保存在 <code>{screenshots_dir_abs}</code> 目录下</li>
-                        <li>如果图片无法在报告中显示，请直接打开文件夹查看</li>
-                        <li>支持的格式: PNG, JPG, JPEG</li>
-                    </ul>
-                </div>
-"""
-
-            html_content += """
-            </div>
-        </div>
-"""
-
-        # 添加页脚
-        html_content += f"""
-        <div class="footer">
-            <p>🤖 自动化测试报告 | 生成时间: {current_time}</p>
-            <p>📧 如有问题请联系测试团队</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        # 🔧 只使用最新的Chrome测试截图目录，步骤索引来自共享的截图索引
+        screenshot_index = get_screenshot_index(self.screenshots_dir)
+        latest_chrome_dir = screenshot_index.latest_run("chrome_")
+        if latest_chrome_dir:
+            logger.info(f"使用最新的Chrome截图目录: {latest_chrome_dir.name}")
+            screenshots = screenshot_index.steps(latest_chrome_dir)
+        else:
+            logger.warning("未找到任何Chrome测试截图目录")
+            screenshots = {}
+
+        cases = [
+            ReportCase(
+                case_id=test_case["id"],
+                title=test_case["name"],
+                passed="✅" in test_case["status"],
+                status=test_case["status"],
+                description=test_case["description"],
+                steps=test_case["steps"],
+                expected=test_case["expected_result"],
+                screenshot_steps=self.SCREENSHOT_STEPS.get(test_case["id"], []),
+            )
+            for test_case in test_cases
+        ]
 
-        return html_content
+        return ReportEngine(self.reports_dir).render(
+            title="Chrome浏览器自动化测试详细报告",
+            heading="🚀 Chrome浏览器自动化测试详细报告",
+            subtitles=["Practice Test Automation 完整测试流程", f"执行时间: {current_time}"],
+            summary=[
+                ("测试状态", '✅ 成功' if success else '❌ 失败'),
+                ("测试用例总数", str(len(cases))),
+                ("通过用例", str(len([case for case in cases if case.passed]))),
+                ("失败用例", str(len([case for case in cases if not case.passed]))),
+            ],
+            files=[("📊 HTML报告", f"{len(report_files)} 个文件"), ("📸 截图目录", f"{len(screenshot_dirs)} 个目录")],
+            cases=cases,
+            screenshots=screenshots,
+            screenshot_dir=latest_chrome_dir or self.screenshots_dir,
+            rerun_command="python run_chrome_tests.py",
+            footer_lines=[f"🤖 自动化测试报告 | 生成时间: {current_time}", "📧 如有问题请联系测试团队"],
+        )
 
     def _print_console_summary(self, success, report_files, screenshot_dirs):
         """打印控制台总结"""
@@ -913,8 +402,8 @@ class ChromeTestRunner:
 
         try:
             # 确保目录存在
-            self.reports_dir.mkdir(exist_ok=True)
-            self.screenshots_dir.mkdir(exist_ok=True)
+            self.reports_dir.mkdir(parents=True, exist_ok=True)
+            self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
             # 执行测试
             success = self.run_chrome_tests()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+BDD场景并行执行脚本
+把features中的场景和Scenario Outline示例行分配到多个behave工作进程执行，结束后生成合并报告
+
+用法:
+    python run_parallel_bdd_tests.py --workers 3
+    python run_parallel_bdd_tests.py --tags "@claims and not @negative" features/employee_claims.feature
+"""
+import sys
+import argparse
+
+from utils.parallel_behave import ParallelBehaveRunner
+
+
+def main() -> int:
+    """
+    主函数：解析参数并并行执行场景
+
+    Returns:
+        退出码（任一工作进程失败时非0）
+    """
+    parser = argparse.ArgumentParser(description="并行执行BDD场景")
+    parser.add_argument("paths", nargs="*", default=["features"], help="feature文件或目录")
+    parser.add_argument("--workers", type=int, default=None, help="工作进程数量，默认CPU核数（最多4个）")
+    parser.add_argument("--tags", default=None, help="behave标签表达式")
+    args = parser.parse_args()
+
+    runner = ParallelBehaveRunner(workers=args.workers)
+    result = runner.run(args.paths, tags=args.tags)
+
+    print(f"📋 共 {result['scenarios']} 个场景: {result['status_counts']}，耗时 {result['duration']}s")
+    print(f"📄 合并结果: {result['json_report']}")
+    print(f"📄 HTML报告: {result['html_report']}")
+    return result['exit_code']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
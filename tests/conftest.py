@@ -4,19 +4,32 @@ pytest配置文件
 """
 import pytest
 import sys
+import time
 from pathlib import Path
 from loguru import logger
-from utils.driver_manager import DriverManager
+from utils.worker_isolation import is_xdist_controller, isolate_worker_artifacts, merge_worker_reports
+
+# xdist工作进程使用独立的截图/报告目录，必须在下面的全局实例创建前设置
+isolate_worker_artifacts()
+
+from utils.driver_manager import DriverManager, driver_pool_enabled, get_driver_pool, shutdown_driver_pools
 from utils.screenshot_utils import screenshot_utils, ScreenshotUtils
 from utils.pytest_plugin import add_test_screenshot
+from utils.step_tracer import step_tracer
+from utils.api_client import close_api_clients
+from utils.screenshot_writer import flush_screenshots
+from utils.retry_policy import retry_metrics
+from utils.page_load_metrics import page_load_metrics
+from utils.click_strategy_cache import click_strategy_cache
 from config.config_manager import config
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# 暂时禁用自定义插件
-# pytest_plugins = ["utils.pytest_plugin"]
+# 测试报告插件：每个进程（xdist并行时为每个工作进程）写出NDJSON日志和报告，失败时自动截图；
+# tests.fakes提供不启动浏览器的模拟驱动夹具fake_driver
+pytest_plugins = ["utils.pytest_plugin", "tests.fakes"]
 
 
 def pytest_configure(config_obj):
@@ -46,6 +59,42 @@ def pytest_configure(config_obj):
     )
 
 
+# 主进程记录会话开始时间，用于只合并本次运行的工作进程日志
+_session_started_key = pytest.StashKey[float]()
+
+
+def pytest_sessionstart(session):
+    """记录会话开始时间"""
+    session.config.stash[_session_started_key] = time.time()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """xdist主进程合并各工作进程的测试报告"""
+    if not is_xdist_controller(session.config):
+        return
+    html_report, json_report = merge_worker_reports(since=session.config.stash.get(_session_started_key, 0))
+    if html_report:
+        logger.info(f"已合并各工作进程的HTML测试报告: {html_report}")
+    if json_report:
+        logger.info(f"已合并各工作进程的JSON测试报告: {json_report}")
+
+
+# 完整流程测试 -> 由它拆分出的单用例测试
+_SPLIT_FLOW_TESTS = {
+    "test_01_chrome_complete_flow": "test_03_chrome_case",
+    "test_02_edge_complete_flow": "test_04_edge_case",
+}
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """同一浏览器的完整流程测试和单用例测试同时被选中时只执行单用例测试，避免每个用例执行两次"""
+    selected = {item.originalname for item in items}
+    deselected = [item for item in items if _SPLIT_FLOW_TESTS.get(item.originalname) in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item not in deselected]
+
+
 @pytest.fixture(scope="session")
 def test_config():
     """测试配置夹具"""
@@ -66,9 +115,21 @@ def driver_manager():
     manager.quit_driver()
 
 
+def _pooled_driver(request, browser_name):
+    """从会话池获取驱动，用例结束后归还（失败时回收该驱动）"""
+    pool = get_driver_pool(browser_name)
+    driver = pool.acquire()
+    yield driver
+    call_report = getattr(request.node, "rep_call", None)
+    pool.release(driver, discard=bool(call_report and call_report.failed))
+
+
 @pytest.fixture
-def chrome_driver(driver_manager):
+def chrome_driver(request, driver_manager):
     """Chrome浏览器驱动夹具"""
+    if driver_pool_enabled():
+        yield from _pooled_driver(request, "chrome")
+        return
     driver = driver_manager.create_chrome_driver()
     yield driver
     driver_manager.quit_driver()
@@ -91,13 +152,42 @@ def edge_ie_driver(driver_manager):
 
 
 @pytest.fixture
-def edge_driver(driver_manager):
+def edge_driver(request, driver_manager):
     """Microsoft Edge浏览器驱动夹具"""
+    if driver_pool_enabled():
+        yield from _pooled_driver(request, "edge_standard")
+        return
     driver = driver_manager.create_edge_driver_standard()
     yield driver
     driver_manager.quit_driver()
 
 
+def _worker_driver(browser_name, create_driver):
+    """整个会话（xdist并行时为每个工作进程）只创建一次的驱动，会话结束时归还或关闭"""
+    if driver_pool_enabled():
+        pool = get_driver_pool(browser_name)
+        driver = pool.acquire()
+        yield driver
+        pool.release(driver)
+        return
+    manager = DriverManager()
+    driver = create_driver(manager)
+    yield driver
+    manager.quit_driver()
+
+
+@pytest.fixture(scope="session")
+def warm_chrome_driver():
+    """工作进程级Chrome浏览器驱动夹具（用例之间保持浏览器预热）"""
+    yield from _worker_driver("chrome", DriverManager.create_chrome_driver)
+
+
+@pytest.fixture(scope="session")
+def warm_edge_driver():
+    """工作进程级Microsoft Edge浏览器驱动夹具（用例之间保持浏览器预热）"""
+    yield from _worker_driver("edge_standard", DriverManager.create_edge_driver_standard)
+
+
 @pytest.fixture
 def browser_driver(browser_name, driver_manager):
     """参数化浏览器驱动夹具"""
@@ -106,19 +196,37 @@ def browser_driver(browser_name, driver_manager):
     driver_manager.quit_driver()
 
 
+# 提供浏览器驱动的夹具
+_DRIVER_FIXTURES = ("chrome_driver", "edge_driver", "edge_ie_driver", "browser_driver",
+                    "warm_chrome_driver", "warm_edge_driver")
+
+
 @pytest.fixture(autouse=True)
 def test_setup_teardown(request):
     """测试设置和清理夹具"""
     test_name = request.node.name
     logger.info(f"=== 开始测试: {test_name} ===")
     
+    # 记录页面操作耗时，每个使用浏览器驱动的用例输出一个trace文件（纯单元测试不追踪）
+    tracing = step_tracer.enabled() and any(name in request.fixturenames for name in _DRIVER_FIXTURES)
+    if tracing:
+        step_tracer.start(test_name)
+    
     yield
     
+    if tracing:
+        step_tracer.stop()
     logger.info(f"=== 结束测试: {test_name} ===")
 
 
+@pytest.fixture(scope="session")
+def screenshot_sessions():
+    """按会话名称缓存的截图工具，同一浏览器、同一类型的用例截图写入同一个运行目录"""
+    return {}
+
+
 @pytest.fixture
-def screenshot_helper(request):
+def screenshot_helper(request, screenshot_sessions):
     """截图助手夹具"""
     # 从测试名称中提取测试会话名称
     test_name = request.node.name
@@ -148,8 +256,11 @@ def screenshot_helper(request):
     # 创建测试会话名称
     session_name = f"{browser}_{test_type}"
 
-    # 创建带会话名称的截图工具
-    session_screenshot_utils = ScreenshotUtils(test_session_name=session_name)
+    # 创建带会话名称的截图工具（拆分后的用例共用一个运行目录）
+    session_screenshot_utils = screenshot_sessions.get(session_name)
+    if session_screenshot_utils is None:
+        session_screenshot_utils = ScreenshotUtils(test_session_name=session_name)
+        screenshot_sessions[session_name] = session_screenshot_utils
 
     class ScreenshotHelper:
         def __init__(self, request_obj, session_utils):
@@ -180,27 +291,18 @@ def screenshot_helper(request):
     return ScreenshotHelper(request, session_screenshot_utils)
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """测试报告生成钩子"""
+    outcome = yield
+    # 记录各阶段结果，供会话池夹具判断是否需要回收驱动
+    setattr(item, f"rep_{call.when}", outcome.get_result())
+
     if call.when == "call":
-        # 获取测试结果
+        # 获取测试结果（失败截图由utils.pytest_plugin处理）
         if call.excinfo is not None:
             # 测试失败
             logger.error(f"测试失败: {item.name}")
-            
-            # 如果有driver夹具，尝试截图
-            if hasattr(item, "funcargs"):
-                for fixture_name in ["chrome_driver", "edge_driver", "browser_driver"]:
-                    if fixture_name in item.funcargs:
-                        driver = item.funcargs[fixture_name]
-                        browser_name = getattr(item.funcargs.get("browser_name", "unknown"), "param", "unknown")
-                        screenshot_utils.take_failure_screenshot(
-                            driver, 
-                            item.name, 
-                            str(call.excinfo.value),
-                            browser_name
-                        )
-                        break
         else:
             # 测试成功
             logger.info(f"测试成功: {item.name}")
@@ -217,8 +319,25 @@ def setup_test_environment():
     
     yield
     
+    # 等待异步截图全部写入磁盘
+    flush_screenshots()
+    
+    # 关闭WebDriver会话池和API客户端连接池
+    shutdown_driver_pools()
+    close_api_clients()
+
+    # 写回本次会话学习到的点击策略和页面加载耗时
+    click_strategy_cache.flush()
+    page_load_metrics.flush()
+
     # 清理旧截图
     screenshot_utils.cleanup_old_screenshots(days=7)
+
+    # 输出重试次数和重试耗时
+    retry_metrics.log_summary()
+
+    # 输出页面加载耗时及浏览器配置档节省的时间
+    page_load_metrics.log_summary()
     
     logger.info("=== 自动化测试完成 ===")
 
@@ -0,0 +1,164 @@
+"""
+测试用模拟驱动
+FakeDriver模拟WebDriver命令执行和浏览器状态，FakeChromiumDriver额外支持CDP命令；
+fake_driver夹具由conftest.py通过pytest_plugins注册，供不启动浏览器的单元测试使用
+"""
+import base64
+import pytest
+from selenium.webdriver.remote.command import Command
+
+
+class FakeDriver:
+    """
+    模拟WebDriver
+
+    与真实驱动一样，所有操作都经过 execute(命令, 参数)（耗时追踪和页面加载统计包装的就是这个方法）；
+    执行的命令记录在 commands 中，脚本结果由 on_script 决定，未设置时依次返回 script_results（最后一个重复返回）
+    """
+
+    def __init__(self, current_url: str = "about:blank", on_script=None, script_results=(),
+                 on_async_script=None, on_get=None, cookies=(), screenshot: bytes = b""):
+        """
+        初始化模拟驱动
+
+        Args:
+            current_url: 当前页面地址
+            on_script: execute_script的结果 on_script(script, *args)
+            script_results: 未设置on_script时依次返回的脚本结果
+            on_async_script: execute_async_script的结果 on_async_script(script, *args)
+            on_get: 打开页面后实际停留的地址 on_get(url)（模拟重定向）
+            cookies: 浏览器中的cookie
+            screenshot: 截图的PNG数据
+        """
+        self.current_url = current_url
+        self.on_script = on_script
+        self.script_results = list(script_results)
+        self.on_async_script = on_async_script
+        self.on_get = on_get
+        self.cookies = [dict(cookie) for cookie in cookies]
+        self.screenshot = screenshot
+        self.window_handles = ["main"]
+        self.switch_to = self
+        # 页面中的window全局变量，打开或刷新页面后清空
+        self.window_state = {}
+        self.healthy = True
+        self.quit_called = False
+        self.commands = []
+        self.scripts = []
+        self.async_scripts = []
+        self.visited = []
+        self.refreshes = 0
+        self.cookie_reads = 0
+        self.added_cookies = []
+        self.saved_screenshots = []
+
+    def execute(self, driver_command, params=None):
+        """执行WebDriver命令：记录命令并更新模拟的浏览器状态"""
+        if not self.healthy and driver_command != Command.QUIT:
+            raise RuntimeError("session deleted")
+        self.commands.append(driver_command)
+        params = params or {}
+        value = None
+        if driver_command == Command.W3C_EXECUTE_SCRIPT:
+            self.scripts.append((params["script"], tuple(params["args"])))
+            value = self._script_result(params["script"], params["args"])
+        elif driver_command == Command.W3C_EXECUTE_SCRIPT_ASYNC:
+            self.async_scripts.append((params["script"], tuple(params["args"])))
+            if self.on_async_script:
+                value = self.on_async_script(params["script"], *params["args"])
+        elif driver_command == Command.GET:
+            self.visited.append(params["url"])
+            self.current_url = self.on_get(params["url"]) if self.on_get else params["url"]
+            self.window_state = {}
+        elif driver_command == Command.REFRESH:
+            self.refreshes += 1
+            self.window_state = {}
+        elif driver_command == Command.GET_ALL_COOKIES:
+            self.cookie_reads += 1
+            value = [dict(cookie) for cookie in self.cookies]
+        elif driver_command == Command.ADD_COOKIE:
+            self.added_cookies.append(params["cookie"])
+        elif driver_command == Command.SCREENSHOT:
+            value = base64.b64encode(self.screenshot).decode("ascii")
+        elif driver_command == Command.FIND_ELEMENTS:
+            value = []
+        elif driver_command == Command.QUIT:
+            self.quit_called = True
+        return {"value": value}
+
+    def _script_result(self, script, args):
+        if self.on_script:
+            return self.on_script(script, *args)
+        if len(self.script_results) > 1:
+            return self.script_results.pop(0)
+        return self.script_results[0] if self.script_results else None
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})["value"]
+
+    def execute_async_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT_ASYNC, {"script": script, "args": list(args)})["value"]
+
+    def get(self, url):
+        self.execute(Command.GET, {"url": url})
+
+    def refresh(self):
+        self.execute(Command.REFRESH)
+
+    def get_cookies(self):
+        return self.execute(Command.GET_ALL_COOKIES)["value"]
+
+    def add_cookie(self, cookie):
+        self.execute(Command.ADD_COOKIE, {"cookie": cookie})
+
+    def delete_all_cookies(self):
+        self.execute(Command.DELETE_ALL_COOKIES)
+
+    def find_elements(self, by, value):
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"]
+
+    def window(self, handle):
+        self.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+
+    def close(self):
+        self.execute(Command.CLOSE)
+
+    def quit(self):
+        self.execute(Command.QUIT)
+
+    def get_screenshot_as_base64(self):
+        return self.execute(Command.SCREENSHOT)["value"]
+
+    def save_screenshot(self, filepath):
+        self.saved_screenshots.append(filepath)
+        with open(filepath, "wb") as f:
+            f.write(self.screenshot)
+        return True
+
+
+class FakeChromiumDriver(FakeDriver):
+    """模拟Chromium内核驱动：额外支持CDP命令"""
+
+    def __init__(self, on_cdp=None, **options):
+        """
+        Args:
+            on_cdp: CDP命令的结果 on_cdp(cmd, params)
+            **options: 见FakeDriver
+        """
+        super().__init__(**options)
+        self.on_cdp = on_cdp
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append((cmd, params))
+        return self.on_cdp(cmd, params) if self.on_cdp else {}
+
+
+@pytest.fixture
+def fake_driver():
+    """
+    模拟驱动工厂：fake_driver(**options) 创建FakeDriver，fake_driver(cdp=True, ...) 创建支持CDP的Chromium驱动
+    """
+    def create(cdp: bool = False, **options):
+        return FakeChromiumDriver(**options) if cdp else FakeDriver(**options)
+    return create
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+测试OrangeHRM API客户端
+验证Session复用、cookie增量同步、401重试、类型化解析和Claim匹配
+"""
+import sys
+import os
+from datetime import datetime
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import OrangeHRMApiClient, get_api_client, record_created_claim, verify_claim_via_api
+from utils.driver_manager import notify_driver_released
+
+BASE_URL = "https://opensource-demo.orangehrmlive.com"
+
+
+DRIVER_OPTIONS = {
+    "current_url": BASE_URL + "/web/index.php/dashboard/index",
+    "cookies": [{"name": "orangehrm", "value": "s1", "domain": "opensource-demo.orangehrmlive.com", "path": "/web"}],
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def json(self):
+        return self._payload
+
+
+def test_client_reused_per_driver(fake_driver):
+    """同一驱动返回同一个客户端，不同驱动互不共享"""
+    driver = fake_driver(**DRIVER_OPTIONS)
+    assert get_api_client(driver) is get_api_client(driver)
+    assert get_api_client(driver) is not get_api_client(fake_driver(**DRIVER_OPTIONS))
+
+
+def test_client_closed_when_driver_released(fake_driver, monkeypatch):
+    """驱动归还会话池或关闭时关闭并移除其客户端"""
+    driver = fake_driver(**DRIVER_OPTIONS)
+    client = get_api_client(driver)
+    closed = []
+    monkeypatch.setattr(client, "close", lambda: closed.append(client))
+
+    notify_driver_released(driver)
+
+    assert closed == [client]
+    assert get_api_client(driver) is not client
+
+
+def test_cookies_synced_once_and_resynced_on_401(fake_driver, monkeypatch):
+    """cookie只在首次请求前同步；会话失效(401)时增量同步后重试"""
+    driver = fake_driver(**DRIVER_OPTIONS)
+    client = OrangeHRMApiClient(driver)
+    sent_cookies = []
+    responses = [FakeResponse(200, {"data": []}), FakeResponse(401), FakeResponse(200, {"data": []})]
+
+    def fake_get(url, params=None, timeout=None):
+        sent_cookies.append(client.session.cookies.get("orangehrm"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    assert client.get_json("/pim/employees") == {"data": []}
+    driver.cookies = [{"name": "orangehrm", "value": "s2", "domain": "opensource-demo.orangehrmlive.com", "path": "/web"}]
+    assert client.get_json("/pim/employees") == {"data": []}
+
+    assert sent_cookies == ["s1", "s1", "s2"]
+    assert driver.cookie_reads == 2
+    assert client.base_url == BASE_URL
+
+
+def test_typed_helpers_parse_api_payload(fake_driver, monkeypatch):
+    """员工、报销申请和费用接口返回类型化对象"""
+    client = OrangeHRMApiClient(fake_driver(**DRIVER_OPTIONS))
+    payloads = {
+        "/pim/employees": {"data": [{"empNumber": 7, "firstName": "Peter", "middleName": "Mac", "lastName": "Anderson"}]},
+        "/claim/employees/requests": {"data": [{
+            "id": 12, "referenceId": "202501010000012",
+            "employee": {"empNumber": 7, "firstName": "Peter", "lastName": "Anderson"},
+            "claimEvent": {"id": 1, "name": "Travel allowances"},
+            "currencyType": {"id": "EUR", "name": "Euro"},
+            "status": "Initiated", "amount": "50.00", "submittedDate": "2025-01-01",
+        }]},
+        "/claim/employees/requests/12": {"data": {"id": 12, "referenceId": "202501010000012"}},
+        "/claim/requests/12/expenses": {"data": [{"id": 3, "expenseType": {"name": "Transport"}, "amount": "50", "date": "2023-05-01"}]},
+    }
+    monkeypatch.setattr(client, "get_json", lambda path, params=None: payloads.get(path))
+
+    assert client.get_employee_names("a") == ["Peter Mac Anderson"]
+    claim = client.get_claims(limit=1)[0]
+    assert (claim.id, claim.event_name, claim.currency, claim.amount) == (12, "Travel allowances", "Euro", 50.0)
+    assert claim.employee.full_name == "Peter Anderson"
+    assert client.get_claim(12).reference_id == "202501010000012"
+    assert client.get_claim(13) is None
+    expense = client.get_claim_expenses(12)[0]
+    assert (expense.expense_type, expense.amount) == ("Transport", 50.0)
+
+
+def test_find_claims_matches_employee_event_and_currency(fake_driver, monkeypatch):
+    """按员工、事件、货币匹配最新记录，只需固定次数的请求"""
+    client = OrangeHRMApiClient(fake_driver(**DRIVER_OPTIONS))
+    requests_sent = []
+
+    def fake_get_json(path, params=None):
+        requests_sent.append((path, params))
+        if path == "/pim/employees":
+            return {"data": [{"empNumber": 7, "firstName": "Peter", "middleName": "Mac", "lastName": "Anderson"}]}
+        return {"data": [
+            {"id": 2, "employee": {"firstName": "Peter", "middleName": "Mac", "lastName": "Anderson"},
+             "claimEvent": {"name": "Medical"}, "currencyType": {"name": "Euro"}},
+            {"id": 1, "employee": {"firstName": "Peter", "middleName": "Mac", "lastName": "Anderson"},
+             "claimEvent": {"name": "Travel allowances"}, "currencyType": {"name": "Euro"}},
+        ]}
+
+    monkeypatch.setattr(client, "get_json", fake_get_json)
+
+    claims = client.find_claims("Peter Anderson", "Travel allowances", "Euro")
+    assert [claim.id for claim in claims] == [1]
+    assert len(requests_sent) == 2
+    assert requests_sent[1][1]["empNumber"] == 7
+    assert client.find_claims("Peter Anderson", "Travel allowances", "Dollar") == []
+
+
+def test_verify_claim_via_api_respects_mode(fake_driver, monkeypatch):
+    """UI模式或接口不可用时返回None，由页面对象回退到表格扫描"""
+    driver = fake_driver(**DRIVER_OPTIONS)
+    client = get_api_client(driver)
+
+    monkeypatch.setenv("CLAIM_VERIFY_MODE", "ui")
+    assert verify_claim_via_api(driver, "Peter Anderson") is None
+
+    monkeypatch.setenv("CLAIM_VERIFY_MODE", "api")
+    monkeypatch.setattr(client, "find_claims", lambda *args, **kwargs: None)
+    assert verify_claim_via_api(driver, "Peter Anderson") is None
+    monkeypatch.setattr(client, "find_claims", lambda *args, **kwargs: [])
+    assert verify_claim_via_api(driver, "Peter Anderson") is False
+
+
+def test_verify_matches_only_claim_created_in_this_flow(fake_driver, monkeypatch):
+    """记录了本次创建的申请后直接按ID查询该申请，以前运行留下的相同员工/事件/货币的记录不算匹配"""
+    monkeypatch.setenv("CLAIM_VERIFY_MODE", "api")
+    driver = fake_driver(**DRIVER_OPTIONS)
+    client = get_api_client(driver)
+    claim = {"id": 9, "employee": {"firstName": "Peter", "lastName": "Anderson"},
+             "claimEvent": {"name": "Travel allowances"}, "currencyType": {"name": "Euro"}, "submittedDate": "2020-01-01"}
+    payloads = {"/claim/employees/requests": {"data": [claim]}}
+    requests_sent = []
+
+    def fake_get_json(path, params=None):
+        requests_sent.append(path)
+        return payloads.get(path)
+
+    monkeypatch.setattr(client, "get_json", fake_get_json)
+    started = datetime(2025, 6, 1, 9, 30)
+
+    # 按ID查不到本次创建的申请时回退到界面验证，不从申请列表中匹配
+    driver.current_url = BASE_URL + "/web/index.php/claim/assignClaim/id/12"
+    assert record_created_claim(driver, started) == 12
+    assert verify_claim_via_api(driver, "", "Travel allowances", "Euro") is None
+    assert requests_sent == ["/claim/employees/requests/12"]
+
+    payloads["/claim/employees/requests/12"] = {"data": dict(claim, id=12)}
+    assert verify_claim_via_api(driver, "", "Travel allowances", "Euro") is True
+    assert verify_claim_via_api(driver, "", "Medical", "Euro") is False
+    assert "/claim/employees/requests" not in requests_sent
+
+    # 地址中没有申请ID时按提交日期过滤
+    driver.current_url = BASE_URL + "/web/index.php/claim/assignClaim"
+    assert record_created_claim(driver, started, timeout=0.1) is None
+    assert verify_claim_via_api(driver, "", "Travel allowances", "Euro") is False
+    claim["submittedDate"] = "2025-06-01"
+    assert verify_claim_via_api(driver, "", "Travel allowances", "Euro") is True
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+测试点击策略学习缓存
+验证上次成功的策略优先、连续失败的策略降级、磁盘共享，以及页面对象按学习结果调整点击顺序
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.webdriver.common.by import By
+from utils.click_strategy_cache import ClickStrategyCache
+from pages import orangehrm_claims_page as claims_page_module
+from pages.orangehrm_claims_page import OrangeHRMClaimsPage
+
+STRATEGIES = ["scroll_click", "javascript_click", "center_click"]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLICK_STRATEGY_CACHE", "true")
+    return ClickStrategyCache(str(tmp_path / "click_strategies.json"), demote_after=2)
+
+
+def test_last_success_tried_first(cache):
+    """上次成功的策略排在最前，没有记录时保持原有顺序"""
+    key = ClickStrategyCache.key("OrangeHRMClaimsPage", (By.XPATH, "//button"))
+    assert key == "OrangeHRMClaimsPage|xpath=//button"
+    assert cache.order(key, STRATEGIES) == STRATEGIES
+
+    cache.record(key, "scroll_click", False)
+    cache.record(key, "center_click", True)
+
+    assert cache.order(key, STRATEGIES) == ["center_click", "javascript_click", "scroll_click"]
+    assert cache.stats(key)["last_success"] == "center_click"
+
+
+def test_consecutive_failures_demoted(cache):
+    """连续失败达到阈值的策略降级到最后，成功一次后恢复"""
+    key = ClickStrategyCache.key("OrangeHRMClaimsPage", "内容区域按钮")
+    cache.record(key, "center_click", True)
+    cache.record(key, "center_click", True)
+    cache.record(key, "center_click", False)
+    assert cache.stats(key)["last_success"] is None
+    assert cache.order(key, STRATEGIES)[0] == "center_click"
+
+    cache.record(key, "center_click", False)
+    assert cache.order(key, STRATEGIES)[-1] == "center_click"
+
+    cache.record(key, "center_click", True)
+    assert cache.order(key, STRATEGIES)[0] == "center_click"
+
+
+def test_entries_shared_through_disk(cache, tmp_path):
+    """记录只在flush时批量写回磁盘，写回后另一个缓存实例可以直接读取，其它进程写入的键保持不变"""
+    cache_file = tmp_path / "click_strategies.json"
+    cache.record("page|a", "javascript_click", True)
+    cache.record("page|a", "center_click", False)
+    assert not cache_file.exists()
+
+    other = ClickStrategyCache(str(cache_file), demote_after=2)
+    other.record("page|b", "center_click", True)
+    other.flush()
+    cache.flush()
+
+    reader = ClickStrategyCache(str(cache_file), demote_after=2)
+    assert reader.order("page|b", STRATEGIES)[0] == "center_click"
+    assert reader.order("page|a", STRATEGIES)[0] == "javascript_click"
+
+    cache.clear()
+    assert not (tmp_path / "click_strategies.json").exists()
+    assert cache.order("page|a", STRATEGIES) == STRATEGIES
+
+
+def test_disabled_cache_keeps_order(cache, monkeypatch):
+    """关闭缓存时不记录也不调整顺序"""
+    monkeypatch.setenv("CLICK_STRATEGY_CACHE", "false")
+    cache.record("page|a", "center_click", True)
+    assert cache.order("page|a", STRATEGIES) == STRATEGIES
+    assert cache.stats("page|a") == {}
+
+
+def test_page_tries_learned_strategy_first(cache, fake_driver, monkeypatch):
+    """页面对象第二次点击时先尝试上次成功的策略，跳过已知失败的尝试"""
+    monkeypatch.setattr(claims_page_module, "click_strategy_cache", cache)
+    page = OrangeHRMClaimsPage(fake_driver(current_url="https://opensource-demo.orangehrmlive.com/web/index.php/claim/viewAssignClaim"))
+    monkeypatch.setattr(page, "wait_for_page_load", lambda *args, **kwargs: None)
+    attempts = []
+
+    def failing(name):
+        def click(target):
+            attempts.append(name)
+            raise ElementClickInterceptedException("被遮挡")
+        return click
+
+    def succeeding(target):
+        attempts.append("center_click")
+
+    strategies = [
+        ("scroll_click", "滚动到元素并直接点击", failing("scroll_click")),
+        ("javascript_click", "JavaScript直接点击", failing("javascript_click")),
+        ("center_click", "滚动到视口中心后点击", succeeding),
+    ]
+    locator = OrangeHRMClaimsPage.ASSIGN_CLAIM_LINK_HEADER
+
+    assert page._try_multiple_click_strategies(object(), "导航栏链接", locator, strategies=strategies)
+    assert attempts == ["scroll_click", "javascript_click", "center_click"]
+
+    attempts.clear()
+    assert page._try_multiple_click_strategies(object(), "导航栏链接", locator, strategies=strategies)
+    assert attempts == ["center_click"]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+测试WebDriver会话池
+验证复用、重置、回收逻辑
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from utils import driver_manager as driver_manager_module
+from utils.driver_manager import DriverPool
+
+
+@pytest.fixture
+def fake_drivers(fake_driver, monkeypatch):
+    """替换DriverManager.create_driver，返回模拟驱动"""
+    created = []
+
+    def create_driver(self, browser_name=None, headless=None, ie_mode=False):
+        driver = fake_driver(cdp=True)
+        created.append(driver)
+        self.driver = driver
+        return driver
+
+    monkeypatch.setattr(driver_manager_module.DriverManager, "create_driver", create_driver)
+    return created
+
+
+def test_release_resets_and_reuses_driver(fake_drivers):
+    """归还后再次获取应复用同一个浏览器，并已清理状态"""
+    pool = DriverPool("chrome", size=1, max_uses=5, prelaunch=False)
+
+    driver = pool.acquire(timeout=1)
+    pool.release(driver)
+    again = pool.acquire(timeout=1)
+
+    assert again is driver
+    assert len(fake_drivers) == 1
+    assert driver.cdp_commands == [("Network.clearBrowserCookies", {})]
+    assert driver.visited == ["about:blank"]
+    assert any("localStorage.clear()" in script for script, _ in driver.scripts)
+    pool.shutdown()
+
+
+def test_release_notifies_cached_state_cleanup(fake_drivers, monkeypatch):
+    """归还和关闭驱动时调用释放回调，清除按驱动缓存的状态"""
+    released = []
+    monkeypatch.setattr(driver_manager_module, "_driver_release_callbacks", [released.append])
+    pool = DriverPool("chrome", size=1, max_uses=5, prelaunch=False)
+
+    driver = pool.acquire(timeout=1)
+    pool.release(driver)
+    pool.shutdown()
+
+    assert released == [driver, driver]
+
+
+def test_driver_recycled_after_max_uses(fake_drivers):
+    """达到最大复用次数后应关闭旧驱动并启动新驱动"""
+    pool = DriverPool("chrome", size=1, max_uses=2, prelaunch=False)
+
+    first = pool.acquire(timeout=1)
+    pool.release(first)
+    assert pool.acquire(timeout=1) is first
+    pool.release(first)
+
+    second = pool.acquire(timeout=5)
+    assert second is not first
+    assert first.quit_called
+    pool.shutdown()
+
+
+def test_unhealthy_driver_replaced_on_acquire(fake_drivers):
+    """池中驱动会话失效时，获取操作应回收它并返回新驱动"""
+    pool = DriverPool("chrome", size=1, max_uses=5, prelaunch=False)
+
+    driver = pool.acquire(timeout=1)
+    pool.release(driver)
+    driver.healthy = False
+
+    replacement = pool.acquire(timeout=5)
+    assert replacement is not driver
+    assert driver.quit_called
+    pool.shutdown()
+
+
+def test_acquire_times_out_when_pool_exhausted(fake_drivers):
+    """所有驱动都被占用时，超时后抛出TimeoutError"""
+    pool = DriverPool("chrome", size=1, prelaunch=False)
+    pool.acquire(timeout=1)
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.1)
+    pool.shutdown()
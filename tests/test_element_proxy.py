@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+测试延迟页面对象和元素代理
+验证元素首次使用时才定位、过期时自动重新定位，以及页面对象按驱动缓存
+"""
+import sys
+import os
+import gc
+import weakref
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.element_proxy import ElementProxy, LazyElement
+from pages.orangehrm_claims_page import OrangeHRMClaimsPage
+from utils.driver_manager import DriverManager
+
+REMARKS = (By.XPATH, "//textarea")
+
+
+class FakeElement:
+    """模拟WebElement：stale为True时所有操作抛出过期异常"""
+
+    def __init__(self):
+        self.stale = False
+        self.keys = []
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return "备注"
+
+    def send_keys(self, value):
+        if self.stale:
+            raise StaleElementReferenceException()
+        self.keys.append(value)
+
+
+class RemarksPage(BasePage):
+    remarks = LazyElement(REMARKS)
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.lookups = []
+
+    def find_element(self, locator, timeout=None):
+        element = FakeElement()
+        self.lookups.append((locator, element))
+        return element
+
+
+def test_element_resolved_on_first_use(fake_driver):
+    """声明元素不触发定位，首次使用时定位一次并缓存"""
+    page = RemarksPage(fake_driver())
+    proxy = page.remarks
+    assert isinstance(proxy, ElementProxy)
+    assert page.lookups == []
+
+    proxy.send_keys("a")
+    assert page.remarks.text == "备注"
+    assert page.remarks is proxy
+    assert len(page.lookups) == 1
+    assert isinstance(RemarksPage.remarks, LazyElement)
+
+
+def test_stale_element_relocated(fake_driver):
+    """缓存元素过期时重新定位并重试操作"""
+    page = RemarksPage(fake_driver())
+    page.remarks.send_keys("a")
+    page.lookups[0][1].stale = True
+
+    page.remarks.send_keys("b")
+    assert page.remarks.text == "备注"
+
+    assert len(page.lookups) == 2
+    assert page.lookups[1][1].keys == ["b"]
+
+
+def test_page_cached_per_driver(fake_driver):
+    """同一驱动返回同一个页面对象，不同驱动或页面类各自创建"""
+    driver = fake_driver()
+    page = OrangeHRMClaimsPage.for_driver(driver)
+
+    assert OrangeHRMClaimsPage.for_driver(driver) is page
+    assert OrangeHRMClaimsPage.for_driver(fake_driver()) is not page
+    assert RemarksPage.for_driver(driver) is not page
+    assert "wait" not in vars(page) and "actions" not in vars(page)
+    assert page.wait is page.wait
+
+
+def test_page_cache_evicted_when_driver_quits(fake_driver):
+    """驱动关闭后清除其页面对象缓存，驱动可以被回收"""
+    driver = fake_driver()
+    page = OrangeHRMClaimsPage.for_driver(driver)
+    driver_ref = weakref.ref(driver)
+
+    manager = DriverManager()
+    manager.driver = driver
+    manager.quit_driver()
+    assert OrangeHRMClaimsPage.for_driver(driver) is not page
+
+    BasePage.evict_driver(driver)
+    del driver, page
+    gc.collect()
+    assert driver_ref() is None
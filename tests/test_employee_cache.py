@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+测试员工姓名查询缓存
+验证TTL过期、LRU淘汰、磁盘共享以及页面对象跳过API请求和姓名探测
+"""
+import sys
+import os
+import time
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from utils.employee_cache import EmployeeNameCache
+from pages import orangehrm_create_claim_request_page as claim_page_module
+from pages.orangehrm_create_claim_request_page import OrangeHRMCreateClaimRequestPage
+
+BASE_URL = "https://opensource-demo.orangehrmlive.com"
+
+
+# 页面地址和当前登录用户（缓存键的组成部分）
+DRIVER_OPTIONS = {"current_url": BASE_URL + "/web/index.php/claim/assignClaim", "script_results": ["manda user"]}
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "employee_names.json")
+
+
+def test_entries_shared_through_disk(cache_file):
+    """一个进程写入的姓名和验证结果，另一个缓存实例可以直接读取"""
+    key = EmployeeNameCache.key(BASE_URL, "Admin", "a")
+    writer = EmployeeNameCache(cache_file, ttl=60, max_entries=5)
+    writer.put_names(key, ["Amelia Brown", "Peter Anderson"])
+    writer.mark_invalid(key, "Amelia Brown")
+    writer.mark_valid(key, "Peter Anderson")
+
+    entry = EmployeeNameCache(cache_file, ttl=60, max_entries=5).get(key)
+    assert entry["names"] == ["Amelia Brown", "Peter Anderson"]
+    assert entry["valid"] == ["Peter Anderson"]
+    assert entry["invalid"] == ["Amelia Brown"]
+
+
+def test_expired_entry_is_ignored(cache_file):
+    """超过TTL的条目视为不存在"""
+    cache = EmployeeNameCache(cache_file, ttl=0.05, max_entries=5)
+    cache.put_names("k", ["A"])
+    time.sleep(0.1)
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entry_evicted(cache_file):
+    """超过最大条目数时淘汰最久未使用的查询"""
+    cache = EmployeeNameCache(cache_file, ttl=60, max_entries=2)
+    cache.put_names("a", ["A"])
+    cache.put_names("b", ["B"])
+    cache.get("a")
+    cache.put_names("c", ["C"])
+
+    fresh = EmployeeNameCache(cache_file, ttl=60, max_entries=2)
+    assert fresh.get("b") is None
+    assert fresh.get("a")["names"] == ["A"]
+    assert fresh.get("c")["names"] == ["C"]
+
+
+def test_page_skips_api_and_discovery_with_cached_valid_name(cache_file, fake_driver, monkeypatch):
+    """缓存中有已验证姓名时，页面对象不再请求API也不再逐个尝试"""
+    cache = EmployeeNameCache(cache_file, ttl=60, max_entries=5)
+    monkeypatch.setattr(claim_page_module, "employee_name_cache", cache)
+    monkeypatch.setenv("EMPLOYEE_CACHE", "true")
+
+    page = OrangeHRMCreateClaimRequestPage(fake_driver(**DRIVER_OPTIONS))
+    calls = {"api": 0, "tried": []}
+
+    def fake_fetch(base_url, search_query):
+        calls["api"] += 1
+        return ["Amelia Brown", "Peter Anderson"]
+
+    def fake_try(names, cache_key=None):
+        calls["tried"].append(list(names))
+        cache.mark_invalid(cache_key, "Amelia Brown")
+        cache.mark_valid(cache_key, "Peter Anderson")
+        return "Peter Anderson"
+
+    filled = []
+    monkeypatch.setattr(page, "_fetch_employee_names_from_api", fake_fetch)
+    monkeypatch.setattr(page, "_try_employee_names_sequentially", fake_try)
+    monkeypatch.setattr(page, "_clear_employee_name_input", lambda: None)
+    monkeypatch.setattr(page, "wait_for_dom_stable", lambda **kwargs: True)
+    monkeypatch.setattr(page, "fill_employee_name", lambda name: filled.append(name) or True)
+    monkeypatch.setattr(page, "check_invalid_employee_name", lambda: False)
+
+    assert page.get_available_employee_names() == ["Amelia Brown", "Peter Anderson"]
+    OrangeHRMCreateClaimRequestPage.clear_valid_employee_name()
+    assert page.get_available_employee_names() == ["Amelia Brown", "Peter Anderson"]
+
+    assert calls["api"] == 1
+    assert len(calls["tried"]) == 1
+    # 缓存命中时仍然把姓名填入输入框
+    assert filled == ["Peter Anderson"]
+    assert OrangeHRMCreateClaimRequestPage.get_valid_employee_name() == "Peter Anderson"
+    OrangeHRMCreateClaimRequestPage.clear_valid_employee_name()
+
+
+def test_rejected_cached_name_falls_back_to_discovery(cache_file, fake_driver, monkeypatch):
+    """缓存中的姓名被页面拒绝时标记为无效，并从其余姓名中重新探测"""
+    cache = EmployeeNameCache(cache_file, ttl=60, max_entries=5)
+    monkeypatch.setattr(claim_page_module, "employee_name_cache", cache)
+    monkeypatch.setenv("EMPLOYEE_CACHE", "true")
+    key = EmployeeNameCache.key(BASE_URL, "manda user", "a")
+    cache.put_names(key, ["Amelia Brown", "Peter Anderson", "Linda Jane"])
+    cache.mark_invalid(key, "Amelia Brown")
+    cache.mark_valid(key, "Peter Anderson")
+
+    page = OrangeHRMCreateClaimRequestPage(fake_driver(**DRIVER_OPTIONS))
+    tried = []
+    monkeypatch.setattr(page, "_clear_employee_name_input", lambda: None)
+    monkeypatch.setattr(page, "wait_for_dom_stable", lambda **kwargs: True)
+    monkeypatch.setattr(page, "fill_employee_name", lambda name: True)
+    monkeypatch.setattr(page, "check_invalid_employee_name", lambda: True)
+    monkeypatch.setattr(page, "_try_employee_names_sequentially",
+                        lambda names, cache_key=None: tried.append(list(names)) or "Linda Jane")
+
+    page.get_available_employee_names()
+
+    assert tried == [["Linda Jane"]]
+    assert cache.get(key)["invalid"] == ["Amelia Brown", "Peter Anderson"]
+    assert OrangeHRMCreateClaimRequestPage.get_valid_employee_name() == "Linda Jane"
+    OrangeHRMCreateClaimRequestPage.clear_valid_employee_name()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+测试异常测试页面的快速模式
+验证快速模式的开关、跳过演示停顿、局部DOM重置及其刷新回退
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from pages import exceptions_page as exceptions_page_module
+from pages.exceptions_page import ExceptionsPage
+
+
+@pytest.fixture
+def page_driver(fake_driver):
+    """
+    异常测试页面的模拟驱动工厂：页面初始状态保存在window_state中，刷新后随window一起丢失；
+    DOM重置脚本在初始状态存在时返回reset_result
+    """
+    def create(reset_result=True, saved=True):
+        driver = fake_driver(current_url="https://practicetestautomation.com/practice-test-exceptions/")
+        if saved:
+            driver.window_state["pristine"] = True
+
+        def on_script(script, *args):
+            if script == ExceptionsPage._SAVE_INITIAL_STATE_SCRIPT:
+                driver.window_state["pristine"] = True
+                return True
+            if script == ExceptionsPage._DOM_RESET_SCRIPT:
+                return "pristine" in driver.window_state and reset_result
+            return "complete"
+
+        driver.on_script = on_script
+        return driver
+    return create
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """记录固定等待时间而不真正等待"""
+    recorded = []
+    monkeypatch.setattr(exceptions_page_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_env_overrides_config(monkeypatch):
+    """环境变量优先于配置文件"""
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "true")
+    assert ExceptionsPage.fast_mode()
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "off")
+    assert not ExceptionsPage.fast_mode()
+
+
+def test_fast_mode_skips_presentation_delays(page_driver, monkeypatch, sleeps):
+    """快速模式下跳过演示停顿和浮层，滚动不使用动画"""
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "true")
+    driver = page_driver()
+    page = ExceptionsPage(driver)
+
+    ExceptionsPage.presentation_pause(3)
+    page._show_exception_then_continue("用例1", "NoSuchElementException", "Row2 input field not found")
+    page.scroll_into_view(object(), "center", settle=2)
+
+    assert sleeps == []
+    assert len(driver.scripts) == 1
+    assert "behavior: 'instant'" in driver.scripts[0][0]
+
+
+def test_demo_mode_keeps_delays(page_driver, monkeypatch, sleeps):
+    """关闭快速模式时保留原有的停顿和平滑滚动"""
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "false")
+    driver = page_driver()
+    ExceptionsPage(driver).scroll_into_view(object(), "start", settle=2)
+
+    assert sleeps == [2]
+    assert "behavior: 'smooth', block: 'start'" in driver.scripts[0][0]
+
+
+def test_fast_mode_resets_dom_instead_of_reload(page_driver, monkeypatch, sleeps):
+    """快速模式下用局部DOM重置代替刷新，重置后状态不一致时回退到刷新"""
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "true")
+    driver = page_driver()
+    ExceptionsPage(driver).reset_page_state("用例1")
+    assert driver.refreshes == 0
+    assert sleeps == []
+
+    driver = page_driver(reset_result=False)
+    ExceptionsPage(driver).restore_initial_state()
+    assert driver.refreshes == 1
+    assert driver.scripts[-1] == (ExceptionsPage._SAVE_INITIAL_STATE_SCRIPT, ())
+
+
+def test_page_reached_without_open_page(page_driver, monkeypatch, sleeps):
+    """通过首页链接进入页面（没有调用open_page）时不把用例执行后的页面保存为初始状态"""
+    monkeypatch.setenv("EXCEPTIONS_FAST_MODE", "true")
+    driver = page_driver(saved=False)
+    page = ExceptionsPage(driver)
+
+    page.restore_initial_state()
+    assert driver.refreshes == 1
+    assert "pristine" in driver.window_state
+
+    driver = page_driver(saved=False)
+    page = ExceptionsPage(driver)
+    monkeypatch.setattr(page, "wait_for_dom_stable", lambda **kwargs: True)
+    monkeypatch.setattr(page, "is_element_visible", lambda locator, timeout=None: True)
+    assert page.is_page_loaded()
+    assert "pristine" in driver.window_state
+    page.restore_initial_state()
+    assert driver.refreshes == 0
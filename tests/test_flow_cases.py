@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+测试完整流程拆分出的独立用例
+验证TC001-TC008与运行器报告中的用例编号一致，每个用例都有对应的单用例方法，pytest收集到的参数化用例ID与报告一致，
+且完整流程测试与单用例测试同时被选中时只执行单用例测试
+"""
+import sys
+import os
+import subprocess
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 以模块方式导入，避免测试类被本文件重复收集
+import tests.test_selenium_basic as selenium_basic
+from run_chrome_tests import ChromeTestRunner
+from run_edge_tests import EdgeTestRunner
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def collect(*node_ids, tmp_path=None):
+    """
+    用pytest --collect-only收集测试项（不启动浏览器）
+
+    Args:
+        node_ids: 要收集的测试节点
+        tmp_path: 指定时加载conftest，报告和截图写入该目录；None时不加载conftest
+
+    Returns:
+        收集到的测试节点ID列表
+    """
+    env = dict(os.environ)
+    options = ["--noconftest"]
+    if tmp_path is not None:
+        env.update(REPORT_DIR=str(tmp_path / "reports"), SCREENSHOT_DIR=str(tmp_path / "screenshots"))
+        options = []
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", "-p", "no:cacheprovider",
+         *options, *node_ids],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, encoding="utf-8", timeout=60)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return [line for line in result.stdout.splitlines() if line.startswith("tests/")]
+
+
+def collect_case_ids(test_name):
+    """单用例测试收集到的参数化ID"""
+    node_ids = collect(f"tests/test_selenium_basic.py::TestSeleniumBasic::{test_name}")
+    return [node_id.rsplit("[", 1)[1].rstrip("]") for node_id in node_ids]
+
+
+def test_flow_cases_match_runner_report():
+    """拆分后的用例ID与两个运行器报告的用例编号一一对应，并有对应的单用例方法"""
+    flow_cases = selenium_basic.FLOW_CASES
+
+    assert list(flow_cases) == list(ChromeTestRunner.SCREENSHOT_STEPS)
+    assert list(flow_cases) == list(EdgeTestRunner.SCREENSHOT_STEPS)
+    method_prefixes = {"login": "_execute_login_case_", "exceptions": "_execute_exception_case_"}
+    for page_name, case_number in flow_cases.values():
+        assert hasattr(selenium_basic.TestSeleniumBasic, f"{method_prefixes[page_name]}{case_number}")
+
+
+def test_collected_case_ids_match_runner_report():
+    """Chrome和Edge单用例测试收集到的参数化ID与报告的用例编号一致"""
+    expected = list(ChromeTestRunner.SCREENSHOT_STEPS)
+    assert collect_case_ids("test_03_chrome_case") == expected
+    assert collect_case_ids("test_04_edge_case") == expected
+
+
+def test_complete_flow_deselected_when_cases_selected(tmp_path):
+    """执行整个测试类时完整流程测试不再重复执行拆分出的用例，单独指定时仍可执行"""
+    node_ids = collect("tests/test_selenium_basic.py", tmp_path=tmp_path)
+    assert len(node_ids) == 2 * len(selenium_basic.FLOW_CASES)
+    assert not any("complete_flow" in node_id for node_id in node_ids)
+
+    complete_flow = "tests/test_selenium_basic.py::TestSeleniumBasic::test_01_chrome_complete_flow"
+    assert collect(complete_flow, tmp_path=tmp_path) == [complete_flow]
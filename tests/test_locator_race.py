@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+测试多定位器候选链
+验证所有候选在一次execute_script中评估、胜出的定位器按页面类缓存并优先评估
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+
+CANDIDATES = [
+    (By.XPATH, "//label[text()='Employee Name']/following::input[1]"),
+    (By.CSS_SELECTOR, "input.oxd-input"),
+    (By.LINK_TEXT, "Assign Claim"),
+]
+
+
+@pytest.fixture
+def race_driver(fake_driver):
+    """模拟驱动工厂：候选查询返回指定表达式的匹配元素"""
+    def create(matching_value=None):
+        def on_script(script, queries, visible):
+            for index, (_, value) in enumerate(queries):
+                if value == matching_value:
+                    return [index, ["element"]]
+            return None
+        return fake_driver(on_script=on_script)
+    return create
+
+
+def queried_values(driver):
+    """每次候选查询中按评估顺序排列的表达式"""
+    return [[value for _, value in args[0]] for _, args in driver.scripts]
+
+
+class RacePage(BasePage):
+    pass
+
+
+class OtherRacePage(BasePage):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear_winners(monkeypatch):
+    monkeypatch.setattr(BasePage, "_locator_winners", {})
+
+
+def test_candidates_evaluated_in_one_call(race_driver):
+    """一次请求评估所有候选，返回胜出的定位器及其元素"""
+    driver = race_driver(matching_value="input.oxd-input")
+    page = RacePage(driver)
+
+    locator, elements = page.race_locators(CANDIDATES)
+
+    assert locator == CANDIDATES[1]
+    assert elements == ["element"]
+    assert len(queried_values(driver)) == 1
+    assert queried_values(driver)[0][2] == "//a[normalize-space(.)='Assign Claim']"
+
+
+def test_winner_cached_per_page_class(race_driver):
+    """同一页面类再次查找时胜出的定位器最先评估，其他页面类不受影响"""
+    driver = race_driver(matching_value="input.oxd-input")
+    RacePage(driver).race_locators(CANDIDATES)
+
+    assert RacePage(driver).find_any_element(CANDIDATES) == "element"
+    assert queried_values(driver)[-1][0] == "input.oxd-input"
+
+    OtherRacePage(driver).race_locators(CANDIDATES)
+    assert queried_values(driver)[-1][0] == CANDIDATES[0][1]
+
+
+def test_no_match_returns_empty(race_driver):
+    """所有候选都没有匹配时超时返回空结果"""
+    page = RacePage(race_driver())
+    assert page.race_locators(CANDIDATES, timeout=0.3) == (None, [])
+    assert page.find_any_element(CANDIDATES, timeout=0.3) is None
+
+
+def test_locator_conversion():
+    """各类Selenium定位器转换为CSS或XPath查询"""
+    assert BasePage._locator_to_query((By.ID, "app")) == ["css", '[id="app"]']
+    assert BasePage._locator_to_query((By.CLASS_NAME, "oxd-input")) == ["css", ".oxd-input"]
+    assert BasePage._locator_to_query((By.PARTIAL_LINK_TEXT, "Claim")) == ["xpath", "//a[contains(., 'Claim')]"]
+    assert BasePage._xpath_literal("it's \"x\"") == "concat('it', \"'\", 's \"x\"')"
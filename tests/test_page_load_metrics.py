@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+测试fast浏览器配置档和页面加载耗时统计
+验证配置档选择顺序、配置档设置只覆盖Chrome的browser配置、CDP屏蔽请求，按配置档记录页面导航耗时并计算节省时间，以及在文件锁保护下合并写回历史耗时
+"""
+import sys
+import os
+import json
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.remote.command import Command
+from utils.driver_manager import DriverManager
+import utils.page_load_metrics as page_load_metrics_module
+from utils.page_load_metrics import PageLoadMetrics
+
+
+def test_resolve_profile_precedence(monkeypatch):
+    """参数优先于环境变量，未定义的配置档回退到standard"""
+    monkeypatch.setenv("BROWSER_PROFILE", "fast")
+    assert DriverManager.resolve_profile() == "fast"
+    assert DriverManager.resolve_profile("standard") == "standard"
+    assert DriverManager.resolve_profile("turbo") == "standard"
+
+    monkeypatch.delenv("BROWSER_PROFILE")
+    assert DriverManager.resolve_profile() == "standard"
+
+
+def test_fast_profile_overrides_chrome_config(fake_driver):
+    """fast配置档为Chrome启用无头模式、eager加载策略，并通过CDP屏蔽统计请求和关闭动画；Edge使用的browser配置不变"""
+    manager = DriverManager("fast")
+    standard = DriverManager("standard")
+    assert manager.chrome_config['headless'] is True
+    assert manager.chrome_config['page_load_strategy'] == "eager"
+    assert manager.chrome_config['implicit_wait'] == standard.chrome_config['implicit_wait']
+    assert manager.browser_config == standard.browser_config
+    assert 'blocked_urls' not in manager.browser_config
+
+    driver = fake_driver(cdp=True)
+    manager._apply_cdp_profile(driver)
+    commands = dict(driver.cdp_commands)
+    assert "*google-analytics.com*" in commands['Network.setBlockedURLs']['urls']
+    assert 'Page.addScriptToEvaluateOnNewDocument' in commands
+
+    standard_driver = fake_driver(cdp=True)
+    DriverManager("standard")._apply_cdp_profile(standard_driver)
+    assert standard_driver.cdp_commands == []
+
+
+def test_instrument_driver_records_navigation_only(fake_driver, tmp_path):
+    """只记录页面导航耗时，同一驱动只包装一次"""
+    metrics = PageLoadMetrics(stats_file=str(tmp_path / "times.json"))
+    driver = fake_driver(cdp=True)
+    metrics.instrument_driver(driver, "fast")
+    metrics.instrument_driver(driver, "fast")
+
+    driver.execute(Command.GET, {'url': "https://example.com/login?next=1"})
+    driver.execute(Command.GET, {'url': "about:blank"})
+    driver.execute(Command.FIND_ELEMENT, {'using': 'css selector', 'value': 'body'})
+
+    assert driver.commands == [Command.GET, Command.GET, Command.FIND_ELEMENT]
+    assert not (tmp_path / "times.json").exists()
+    metrics.flush()
+    with open(tmp_path / "times.json", encoding="utf-8") as f:
+        history = json.load(f)
+    assert list(history) == ["fast"]
+    assert history["fast"]["https://example.com/login"]["count"] == 1
+
+
+def test_savings_against_baseline_history(tmp_path):
+    """与基准配置档历史平均耗时比较，没有基准记录的页面不计入节省时间"""
+    stats_file = tmp_path / "times.json"
+    stats_file.write_text(json.dumps({"standard": {"https://example.com/a": {"count": 2, "total": 6.0}}}))
+    metrics = PageLoadMetrics(stats_file=str(stats_file), baseline="standard")
+
+    metrics.record("fast", "https://example.com/a", 1.0)
+    metrics.record("fast", "https://example.com/b", 0.5)
+
+    assert metrics.savings("fast") == {
+        'loads': 2, 'compared': 1, 'duration': 1.5, 'baseline_duration': 3.0, 'saved': 2.0}
+    with open(stats_file, encoding="utf-8") as f:
+        assert json.load(f)["standard"]["https://example.com/a"]["count"] == 2
+    metrics.flush()
+    assert metrics.savings("fast")['saved'] == 2.0
+
+    metrics.reset()
+    assert metrics.savings("fast")['loads'] == 0
+
+
+def test_flush_adds_to_history_written_by_other_processes(tmp_path):
+    """flush时把本进程累加的耗时加到磁盘上的最新统计，不覆盖其它进程期间写入的记录，也不重复写入已写回的耗时"""
+    stats_file = tmp_path / "times.json"
+    first = PageLoadMetrics(stats_file=str(stats_file))
+    second = PageLoadMetrics(stats_file=str(stats_file))
+
+    first.record("fast", "https://example.com/a", 1.0)
+    second.record("fast", "https://example.com/a", 2.0)
+    first.flush()
+    second.flush()
+    first.record("fast", "https://example.com/a", 3.0)
+    first.flush()
+    first.flush()
+
+    with open(stats_file, encoding="utf-8") as f:
+        assert json.load(f)["fast"]["https://example.com/a"] == {"count": 3, "total": 6.0}
+    assert not (tmp_path / "times.json.lock").exists()
+
+
+def test_flush_waits_for_lock_and_removes_stale_lock(tmp_path, monkeypatch):
+    """其它进程持有文件锁时等待超时后保留本次耗时，崩溃进程残留的锁文件会被删除"""
+    monkeypatch.setattr(page_load_metrics_module, "LOCK_TIMEOUT", 0.1)
+    stats_file = tmp_path / "times.json"
+    lock_file = tmp_path / "times.json.lock"
+    lock_file.touch()
+    metrics = PageLoadMetrics(stats_file=str(stats_file))
+    metrics.record("fast", "https://example.com/a", 1.0)
+
+    metrics.flush()
+    assert not stats_file.exists()
+
+    os.utime(lock_file, (0, 0))
+    metrics.flush()
+    with open(stats_file, encoding="utf-8") as f:
+        assert json.load(f)["fast"]["https://example.com/a"] == {"count": 1, "total": 1.0}
+    assert not lock_file.exists()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+测试behave场景并行执行
+验证Scenario Outline按示例行展开和按标签筛选、场景轮流分配到工作进程、工作进程使用专属目录和单驱动会话池，
+以及各工作进程的JSON结果合并为一份报告
+"""
+import sys
+import os
+import json
+import time
+import subprocess
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.parallel_behave as parallel_behave_module
+from utils.parallel_behave import ParallelBehaveRunner, collect_scenarios, merge_behave_results, shard
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FEATURE = """Feature: Parallel demo
+
+  @fast
+  Scenario: first
+    Given a step that passes
+
+  @fast
+  Scenario Outline: row <value>
+    Given a step with "<value>"
+
+    Examples:
+      | value |
+      | one   |
+      | two   |
+
+  @slow
+  Scenario: failing
+    Given a step that fails
+"""
+
+STEPS = """
+from behave import given
+
+@given('a step that passes')
+def step_passes(context):
+    pass
+
+@given('a step with "{value}"')
+def step_with_value(context, value):
+    assert os.environ["BEHAVE_WORKER"].startswith("bw")
+
+@given('a step that fails')
+def step_fails(context):
+    assert False, "预期的失败"
+"""
+
+
+def write_features(tmp_path):
+    features_dir = tmp_path / "features"
+    (features_dir / "steps").mkdir(parents=True)
+    (features_dir / "demo.feature").write_text(FEATURE, encoding="utf-8")
+    (features_dir / "steps" / "demo_steps.py").write_text("import os\n" + STEPS, encoding="utf-8")
+    return features_dir
+
+
+def test_collect_expands_outline_rows_and_filters_tags(tmp_path):
+    """Scenario Outline每个示例行是一个场景，标签表达式在收集时筛选"""
+    features_dir = write_features(tmp_path)
+
+    locations = collect_scenarios([str(features_dir)])
+    assert [location.rsplit(":", 1)[1] for location in locations] == ["4", "13", "14", "17"]
+    assert len(collect_scenarios([str(features_dir)], tags="@fast")) == 3
+
+    assert shard(locations, 3) == [[locations[0], locations[3]], [locations[1]], [locations[2]]]
+    assert shard(locations[:1], 3) == [[locations[0]]]
+
+
+def test_worker_env(tmp_path, monkeypatch):
+    """工作进程使用专属目录，默认启用单驱动会话池"""
+    monkeypatch.delenv("DRIVER_POOL", raising=False)
+    monkeypatch.delenv("DRIVER_POOL_SIZE", raising=False)
+    runner = ParallelBehaveRunner(workers=2, report_dir=str(tmp_path / "reports"),
+                                  screenshot_dir=str(tmp_path / "screenshots"))
+
+    env = runner.worker_env("bw1")
+
+    assert env["SCREENSHOT_DIR"] == str(tmp_path / "screenshots" / "bw1")
+    assert env["REPORT_DIR"] == str(tmp_path / "reports" / "bw1")
+    assert env["DRIVER_POOL"] == "true"
+    assert env["DRIVER_POOL_SIZE"] == "1"
+
+
+def test_merge_behave_results(tmp_path):
+    """同一feature的场景按行号合并，任一场景失败时feature失败"""
+    def scenario(line, status):
+        return {"name": f"s{line}", "location": f"demo.feature:{line}", "status": status, "steps": []}
+
+    feature = {"name": "demo", "location": "demo.feature:1", "status": "passed"}
+    (tmp_path / "bw0.json").write_text(json.dumps([dict(feature, elements=[scenario(9, "failed")])]))
+    (tmp_path / "bw1.json").write_text(json.dumps([dict(feature, elements=[scenario(4, "passed")])]))
+
+    merged = merge_behave_results([tmp_path / "bw0.json", tmp_path / "bw1.json", tmp_path / "missing.json"])
+
+    assert len(merged) == 1
+    assert merge_behave_results([tmp_path / "bw0.json"], shards=[["demo.feature:4"]])[0]["elements"] == []
+    assert [element["location"] for element in merged[0]["elements"]] == ["demo.feature:4", "demo.feature:9"]
+    assert merged[0]["status"] == "failed"
+
+
+def test_parallel_run_merges_worker_results(tmp_path, monkeypatch):
+    """场景分配到多个behave工作进程执行，结果合并为一份JSON和HTML报告"""
+    features_dir = write_features(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", PROJECT_ROOT)
+    runner = ParallelBehaveRunner(workers=2, report_dir=str(tmp_path / "reports"),
+                                  screenshot_dir=str(tmp_path / "screenshots"))
+
+    result = runner.run([str(features_dir)])
+
+    assert result["scenarios"] == 4
+    assert result["status_counts"] == {"passed": 3, "failed": 1}
+    assert result["exit_code"] != 0
+    with open(result["json_report"], encoding="utf-8") as f:
+        merged = json.load(f)
+    assert [element["name"] for element in merged[0]["elements"]] == [
+        "first", "row one -- @1.1 ", "row two -- @1.2 ", "failing"]
+    assert os.path.dirname(result["html_report"]) == str(tmp_path / "reports")
+    assert (tmp_path / "screenshots" / "bw1").is_dir()
+
+
+def test_crashed_worker_scenarios_count_as_failed(tmp_path, monkeypatch):
+    """工作进程没有写出JSON时其场景按失败统计，退出码取第一个非0值（被信号终止时为负数）"""
+    features_dir = write_features(tmp_path)
+    runner = ParallelBehaveRunner(workers=2, report_dir=str(tmp_path / "reports"),
+                                  screenshot_dir=str(tmp_path / "screenshots"))
+    exit_codes = {0: -9, 1: 0}
+
+    def fake_worker(index, locations):
+        json_path = tmp_path / f"bw{index}.json"
+        if index == 1:
+            elements = [{"name": location, "location": location, "status": "passed", "steps": []}
+                        for location in locations]
+            json_path.write_text(json.dumps([{"name": "demo", "location": "demo.feature:1", "elements": elements}]))
+        return exit_codes[index], json_path
+
+    monkeypatch.setattr(runner, "_run_worker", fake_worker)
+
+    result = runner.run([str(features_dir)])
+    assert result["exit_code"] == -9
+    assert result["status_counts"] == {"passed": 2, "failed": 2}
+    assert [location.rsplit(":", 1)[1] for location in result["missing"]] == ["4", "14"]
+
+    exit_codes[0] = 0
+    assert runner.run([str(features_dir)])["exit_code"] == 1
+
+
+def test_previous_run_results_not_reused(tmp_path, monkeypatch):
+    """工作进程没有写出JSON时不会读取上次运行留下的结果，修改时间早于本次运行的结果文件被忽略"""
+    features_dir = write_features(tmp_path)
+    runner = ParallelBehaveRunner(workers=1, report_dir=str(tmp_path / "reports"),
+                                  screenshot_dir=str(tmp_path / "screenshots"))
+    stale = tmp_path / "reports" / "bw0" / "behave_results.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text(json.dumps([{"name": "demo", "location": "demo.feature:1", "elements": [
+        {"name": "first", "location": f"{features_dir / 'demo.feature'}:4", "status": "passed", "steps": []}]}]))
+    monkeypatch.setattr(parallel_behave_module.subprocess, "run",
+                        lambda command, **kwargs: subprocess.CompletedProcess(command, -9, "", "killed"))
+
+    result = runner.run([str(features_dir)])
+    assert not stale.exists()
+    assert result["exit_code"] == -9
+    assert len(result["missing"]) == 4
+
+    stale.write_text(json.dumps([{"name": "demo", "location": "demo.feature:1", "elements": []}]))
+    os.utime(stale, (0, 0))
+    assert merge_behave_results([stale], since=time.time() - 60) == []
+    assert len(merge_behave_results([stale])) == 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+测试批量DOM读取
+验证多个字段在一次execute_script中读取、轮询直到条件满足，以及页面验证方法只需一次请求
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.orangehrm_create_claim_request_page import OrangeHRMCreateClaimRequestPage
+
+
+@pytest.fixture
+def dom_driver(fake_driver):
+    """模拟驱动工厂：表达式包含visible_texts中的文本时视为可见元素，表单快照返回form"""
+    def create(visible_texts=(), form=None):
+        driver = fake_driver(current_url="https://opensource-demo.orangehrmlive.com/web/index.php/claim/assignClaim/id/1")
+        driver.visible_texts = list(visible_texts)
+
+        def on_script(script, *args):
+            if script == BasePage._SNAPSHOT_FORM_SCRIPT:
+                return form or {}
+            snapshot = {}
+            for name, (_, value) in args[0].items():
+                text = next((t for t in driver.visible_texts if t in value), None)
+                snapshot[name] = {'count': int(bool(text)), 'visible': bool(text), 'text': text or '', 'value': None}
+            return snapshot
+
+        driver.on_script = on_script
+        return driver
+    return create
+
+
+def test_read_many_single_call(dom_driver):
+    """所有字段一次请求读取"""
+    driver = dom_driver(visible_texts=["Travel"])
+    page = BasePage(driver)
+
+    snapshot = page.read_many({
+        "event": (By.XPATH, "//*[contains(text(),'Travel')]"),
+        "currency": (By.ID, "currency"),
+    })
+
+    assert len(driver.scripts) == 1
+    assert snapshot["event"] == {'count': 1, 'visible': True, 'text': "Travel", 'value': None}
+    assert snapshot["currency"]["visible"] is False
+    assert driver.scripts[0][1][0]["currency"] == ["css", '[id="currency"]']
+
+
+def test_read_many_polls_until_condition(dom_driver):
+    """条件不满足时轮询直到字段出现"""
+    driver = dom_driver()
+    page = BasePage(driver)
+    original = driver.on_script
+
+    def appear_on_third_call(script, *args):
+        if len(driver.scripts) == 3:
+            driver.visible_texts.append("Euro")
+        return original(script, *args)
+
+    driver.on_script = appear_on_third_call
+    snapshot = page.read_many({"currency": (By.XPATH, "//*[contains(text(),'Euro')]")}, timeout=2)
+
+    assert snapshot["currency"]["visible"]
+    assert len(driver.scripts) == 3
+    assert page.read_many({"missing": (By.XPATH, "//none")}, timeout=0.2)["missing"]["visible"] is False
+
+
+def test_snapshot_form(dom_driver):
+    """表单快照传入表单定位器并返回各输入组的值"""
+    form = {"Event": {'value': "Travel Allowance", 'visible': True}}
+    driver = dom_driver(form=form)
+
+    assert BasePage(driver).snapshot_form((By.CSS_SELECTOR, "form")) == form
+    assert driver.scripts[-1][1] == (["css", "form"],)
+
+
+def test_verify_expense_details_in_one_round_trip(dom_driver):
+    """费用详情验证只需一次批量读取"""
+    driver = dom_driver(visible_texts=["Accommodation", "2024-01-15", "100.00"])
+    page = OrangeHRMCreateClaimRequestPage(driver)
+
+    assert page.verify_expense_details_in_list({"Expense Type": "Accommodation", "Date": "2024-01-15",
+                                                "Amount": "100.00"})
+    assert len(driver.scripts) == 1
+
+
+def test_verify_claim_data_consistency_in_one_round_trip(dom_driver):
+    """Claim数据一致性验证一次读取所有字段的候选定位器"""
+    driver = dom_driver(visible_texts=["Peter", "Travel", "EUR"])
+    page = OrangeHRMCreateClaimRequestPage(driver)
+    page._valid_employee_name = None
+
+    assert page.verify_claim_data_consistency({"employee_name": "Peter Anderson", "event": "Travel",
+                                               "currency": "EUR"})
+    assert len(driver.scripts) == 1
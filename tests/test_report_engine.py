@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+测试统一报告引擎
+验证截图目录一次扫描建立步骤名索引，以及Chrome/Edge运行器和Claim流程报告都通过引擎渲染
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.report_engine import ReportEngine, ReportCase
+from utils.screenshot_index import index_screenshot_dir, screenshot_step_name
+
+
+def touch(path, size=10):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_step_name_strips_browser_and_timestamp():
+    """截图文件名去掉浏览器名和时间戳后得到步骤名"""
+    assert screenshot_step_name("登录用例1_输入正确用户名_Chrome_20250913_164634.png") == "登录用例1_输入正确用户名"
+    assert screenshot_step_name("打开登录页面_chrome_2025-09-13_16-46-34-103.png") == "打开登录页面"
+    assert screenshot_step_name("assign_claim_request.png") == "assign_claim_request"
+
+
+def test_index_screenshot_dir(tmp_path):
+    """一次扫描建立索引，忽略非图片文件和子目录"""
+    touch(tmp_path / "步骤1_Edge_20250101_000001.png", size=2048)
+    touch(tmp_path / "步骤1_Edge_20250101_000009.png")
+    touch(tmp_path / "manifest.json")
+    (tmp_path / "store").mkdir()
+
+    index = index_screenshot_dir(tmp_path)
+
+    assert index["步骤1"]["path"].name == "步骤1_Edge_20250101_000001.png"
+    assert index["步骤1"]["size"] == 2048
+    assert "manifest" not in index
+    assert index_screenshot_dir(tmp_path / "missing") == {}
+
+
+def test_render_found_and_missing_screenshots(tmp_path):
+    """找到的截图按相对路径延迟加载，缺失时列出预期文件名"""
+    touch(tmp_path / "screenshots" / "run" / "步骤1_chrome_20250101_000001.png")
+    engine = ReportEngine(tmp_path / "reports")
+    cases = [
+        ReportCase(case_id="TC001", title="用例1", steps=["1. 打开页面"], screenshot_steps=["步骤1"]),
+        ReportCase(case_id="TC002", title="用例2", passed=False, screenshot_steps=["步骤2"]),
+    ]
+
+    content = engine.render(title="报告", cases=cases,
+                            screenshots=index_screenshot_dir(tmp_path / "screenshots" / "run"),
+                            notes=[("错误", ["<Timeout>"], "notes-error")], rerun_command="python run.py")
+
+    assert 'src="../screenshots/run/步骤1_chrome_20250101_000001.png"' in content
+    assert 'loading="lazy"' in content
+    assert "步骤2.png" in content and "待生成" in content
+    assert "&lt;Timeout&gt;" in content
+    assert "❌ FAIL" in content
+
+
+def test_chrome_runner_report_uses_latest_directory(tmp_path, monkeypatch):
+    """Chrome运行器只索引最新的截图目录"""
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path / "reports"))
+    monkeypatch.setenv("SCREENSHOT_DIR", str(tmp_path / "screenshots"))
+    old = touch(tmp_path / "screenshots" / "chrome_old" / "登录用例1_输入正确用户名_Chrome_20240101_000000.png")
+    os.utime(old.parent, (0, 0))
+    touch(tmp_path / "screenshots" / "chrome_new" / "登录用例1_输入正确用户名_Chrome_20250101_000000.png")
+
+    from run_chrome_tests import ChromeTestRunner
+    runner = ChromeTestRunner()
+    content = runner._generate_html_test_report(True, [], list(runner.screenshots_dir.glob("chrome_*")))
+
+    assert "chrome_new/登录用例1_输入正确用户名_Chrome_20250101_000000.png" in content
+    assert "chrome_old" not in content
+    assert content.count('class="test-case"') == 8
+
+
+def test_claim_report_written_through_engine(tmp_path, monkeypatch):
+    """Claim流程报告从最新的BDD截图目录取图并写入报告目录"""
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path / "reports"))
+    monkeypatch.setenv("SCREENSHOT_DIR", str(tmp_path / "screenshots"))
+    touch(tmp_path / "screenshots" / "bdd_tests_20250101_000000" / "assign_claim_request.png")
+
+    from pages.orangehrm_create_claim_request_page import OrangeHRMCreateClaimRequestPage
+    page = OrangeHRMCreateClaimRequestPage(None)
+    assert page.generate_html_report({"overall_status": "SUCCESS", "claim_request_success": True,
+                                      "expense_success": True, "errors": [], "warnings": []})
+
+    content = open(page._report_file, encoding="utf-8").read()
+    assert "bdd_tests_20250101_000000/assign_claim_request.png" in content
+    assert "✅ 全部成功" in content
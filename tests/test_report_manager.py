@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+测试流式报告管理器
+验证结果逐条写入NDJSON日志和HTML报告、中断时部分报告可用、截图按引用延迟加载，以及会话结束后关闭文件、没有结果时不留下文件
+"""
+import sys
+import os
+import json
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.report_manager import ReportManager
+
+
+def make_step(name, duration):
+    return {"name": name, "duration": duration, "commands": 1, "command_time": 0.1, "sleep_time": 0.0}
+
+
+def test_results_are_streamed_before_session_end(tmp_path):
+    """每条结果立即写入磁盘，未生成最终报告时也能读到部分结果"""
+    manager = ReportManager(report_dir=str(tmp_path))
+    manager.start_test_session()
+    manager.add_test_result("test_login", "PASSED", 1.5)
+    manager.add_test_result("test_claim", "FAILED", 2.0, error_message="<TimeoutException>")
+
+    journal_lines = manager.journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in journal_lines] == ["test_login", "test_claim"]
+
+    partial_html = manager.html_report_path.read_text(encoding="utf-8")
+    assert 'data-status="failed"' in partial_html
+    assert "&lt;TimeoutException&gt;" in partial_html
+    assert 'id="report-complete"' not in partial_html
+    assert [result["status"] for result in manager.test_results] == ["PASSED", "FAILED"]
+
+
+def test_finalized_reports(tmp_path):
+    """生成报告时补全页脚和最慢步骤，JSON报告从日志逐条写出"""
+    manager = ReportManager(report_dir=str(tmp_path))
+    manager.start_test_session()
+    for index in range(15):
+        manager.add_test_result(f"test_{index}", "PASSED", 1.0, slow_steps=[make_step(f"step_{index}", index)])
+    manager.end_test_session()
+
+    html_path = manager.generate_html_report()
+    json_path = manager.generate_json_report()
+
+    html_content = open(html_path, encoding="utf-8").read()
+    assert html_content.rstrip().endswith("</html>")
+    assert 'id="report-complete"' in html_content
+    assert "step_14" in html_content
+    assert len(manager._slowest_steps) == 10
+
+    with open(json_path, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["summary"]["total_tests"] == 15
+    assert report["summary"]["pass_rate"] == 100.0
+    assert len(report["test_results"]) == 15
+
+
+def test_screenshots_referenced_relative_to_report(tmp_path):
+    """截图以相对报告目录的路径引用并延迟加载"""
+    manager = ReportManager(report_dir=str(tmp_path / "reports"))
+    screenshot = tmp_path / "screenshots" / "01_login_page.png"
+    manager.add_test_result("test_login", "PASSED", 1.0, screenshots=[str(screenshot)])
+
+    html_content = manager.html_report_path.read_text(encoding="utf-8")
+    assert 'src="../screenshots/01_login_page.png"' in html_content
+    assert 'loading="lazy"' in html_content
+    assert "base64" not in html_content
+
+
+def test_no_results_no_report(tmp_path):
+    """没有测试结果时不生成报告，也不留下空的日志和HTML文件"""
+    manager = ReportManager(report_dir=str(tmp_path))
+    manager.start_test_session()
+    manager.end_test_session()
+    assert manager.generate_html_report() is None
+    assert manager.generate_json_report() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_session_files_closed_after_report(tmp_path):
+    """结束会话时关闭日志，生成HTML报告后关闭报告文件，之后的结果开始新会话"""
+    manager = ReportManager(report_dir=str(tmp_path))
+    manager.start_test_session()
+    manager.add_test_result("test_login", "PASSED", 1.0)
+    manager.end_test_session()
+    assert manager._journal_file is None
+    manager.add_test_result("test_claim", "PASSED", 1.0)
+    manager.end_test_session()
+    assert [result["name"] for result in manager.test_results] == ["test_login", "test_claim"]
+
+    html_path = manager.generate_html_report()
+    assert manager._journal_file is None and manager._html_file is None
+    assert open(html_path, encoding="utf-8").read().count('data-status="passed"') == 2
+
+    manager.add_test_result("test_logout", "PASSED", 1.0)
+    assert [result["name"] for result in manager.test_results] == ["test_logout"]
+    manager.generate_html_report()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+测试重试策略引擎
+验证按异常类型选择重试动作、指数退避加抖动、会话失效时重建驱动，以及重试统计
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    InvalidSessionIdException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+import utils.retry_policy as retry_policy_module
+from utils.retry_policy import (
+    BACKOFF, GIVE_UP, RECREATE, RELOCATE, RetryMetrics, RetryPolicy, RetryableFailure, is_dead_session
+)
+
+
+class FlakyOperation:
+    """按顺序抛出预设异常，之后返回结果"""
+
+    def __init__(self, errors, result="ok"):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """记录退避等待时间而不真正等待"""
+    recorded = []
+    monkeypatch.setattr(retry_policy_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_policy(**kwargs):
+    options = dict(max_attempts=4, base_delay=1.0, max_delay=3.0, multiplier=2.0, jitter=0.0, metrics=RetryMetrics())
+    options.update(kwargs)
+    return RetryPolicy(**options)
+
+
+def test_classification():
+    """元素过期重新定位、超时退避、会话失效重建、其他异常使用默认动作"""
+    policy = make_policy()
+    assert policy.classify(StaleElementReferenceException()) == RELOCATE
+    assert policy.classify(TimeoutException()) == BACKOFF
+    assert policy.classify(InvalidSessionIdException()) == RECREATE
+    assert policy.classify(WebDriverException("chrome not reachable")) == RECREATE
+    assert policy.classify(RetryableFailure("no data", action=RELOCATE)) == RELOCATE
+    assert make_policy(default_action=GIVE_UP).classify(ElementClickInterceptedException()) == GIVE_UP
+    assert is_dead_session(WebDriverException("disconnected: not connected to DevTools"))
+    assert not is_dead_session(TimeoutException())
+
+
+def test_stale_retries_immediately_and_timeout_backs_off(sleeps):
+    """元素过期不等待，超时按指数退避并受上限约束"""
+    policy = make_policy()
+    retries = []
+    operation = FlakyOperation([StaleElementReferenceException(), TimeoutException(), TimeoutException()])
+
+    result = policy.call(operation, operation="点击", on_retry=lambda attempt, e, action: retries.append(action))
+
+    assert result == "ok"
+    assert retries == [RELOCATE, BACKOFF, BACKOFF]
+    assert sleeps == [1.0, 2.0]
+    assert policy.backoff_delay(5) == 3.0
+
+
+def test_jitter_reduces_delay():
+    """抖动使退避时间落在 [delay*(1-jitter), delay] 区间"""
+    policy = make_policy(jitter=0.5)
+    delays = [policy.backoff_delay(2) for _ in range(50)]
+    assert all(1.0 <= delay <= 2.0 for delay in delays)
+
+
+def test_dead_session_recreates_or_gives_up(sleeps):
+    """会话失效时调用重建回调，没有回调时立即放弃"""
+    recreated = []
+    operation = FlakyOperation([InvalidSessionIdException()])
+    assert make_policy().call(operation, on_recreate=lambda: recreated.append(True)) == "ok"
+    assert recreated == [True]
+
+    operation = FlakyOperation([InvalidSessionIdException()])
+    with pytest.raises(InvalidSessionIdException):
+        make_policy().call(operation)
+    assert operation.calls == 1
+
+
+def test_metrics_track_attempts_and_failures(sleeps):
+    """统计尝试次数、重试次数、失败次数和重试动作"""
+    metrics = RetryMetrics()
+    policy = make_policy(max_attempts=2, metrics=metrics)
+
+    policy.call(FlakyOperation([]), operation="打开浏览器")
+    policy.call(FlakyOperation([TimeoutException()]), operation="打开浏览器")
+    with pytest.raises(RetryableFailure):
+        policy.call(FlakyOperation([RetryableFailure("无数据"), RetryableFailure("无数据")]), operation="选择费用类型")
+
+    summary = metrics.summary()
+    assert summary["打开浏览器"]["calls"] == 2
+    assert summary["打开浏览器"]["attempts"] == 3
+    assert summary["打开浏览器"]["retries"] == 1
+    assert summary["打开浏览器"]["actions"] == {BACKOFF: 1}
+    assert summary["选择费用类型"]["failures"] == 1
+    assert summary["选择费用类型"]["retry_time"] >= 0
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+测试截图目录索引
+验证运行目录只扫描一次、按前缀查找最新目录、刷新时复用未变化目录的索引，以及写入器增量登记
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.screenshot_index as screenshot_index_module
+from utils.screenshot_index import ScreenshotIndex, get_screenshot_index
+from utils.screenshot_writer import AsyncScreenshotWriter
+
+
+def touch(path, size=10):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def count_scandir(monkeypatch):
+    """统计os.scandir调用次数"""
+    calls = []
+    original = os.scandir
+
+    def counting_scandir(path):
+        calls.append(str(path))
+        return original(path)
+
+    monkeypatch.setattr(screenshot_index_module.os, "scandir", counting_scandir)
+    return calls
+
+
+def test_latest_run_and_steps_scanned_once(tmp_path, monkeypatch):
+    """按前缀取最新运行目录，同一目录的步骤索引只建立一次"""
+    old = touch(tmp_path / "chrome_tests_1" / "步骤1_Chrome_20250101_000000.png")
+    os.utime(old.parent, (0, 0))
+    touch(tmp_path / "chrome_tests_2" / "步骤1_Chrome_20250102_000000.png", size=20)
+    touch(tmp_path / "bdd_tests_1" / "assign_claim_request.png")
+    calls = count_scandir(monkeypatch)
+
+    index = ScreenshotIndex(tmp_path)
+    latest = index.latest_run("chrome_")
+    assert latest.name == "chrome_tests_2"
+    assert [run.name for run in index.runs("chrome_")] == ["chrome_tests_1", "chrome_tests_2"]
+    assert index.steps(latest)["步骤1"]["size"] == 20
+    assert index.steps("chrome_tests_2") is index.steps(latest)
+    assert index.steps(index.latest_run("bdd_tests_"))["assign_claim_request"]["size"] == 10
+    assert len(calls) == 3
+
+
+def test_refresh_keeps_unchanged_directories(tmp_path, monkeypatch):
+    """刷新只重新扫描根目录，修改时间未变的运行目录保留已有索引"""
+    touch(tmp_path / "edge_tests_1" / "步骤1_Edge_20250101_000000.png")
+    index = ScreenshotIndex(tmp_path)
+    steps = index.steps(index.latest_run("edge_"))
+
+    touch(tmp_path / "edge_tests_2" / "步骤2_Edge_20250102_000000.png")
+    os.utime(tmp_path / "edge_tests_2", (4102444800, 4102444800))
+    index.refresh()
+
+    assert index.steps("edge_tests_1") is steps
+    assert index.latest_run("edge_").name == "edge_tests_2"
+
+
+def test_writer_records_new_screenshots(fake_driver, tmp_path, monkeypatch):
+    """截图写入器写入的文件会登记到已建立的共享索引"""
+    monkeypatch.setenv("SCREENSHOT_ASYNC", "false")
+    monkeypatch.setenv("SCREENSHOT_STORE", "false")
+    old = touch(tmp_path / "bdd_tests_1" / "assign_claim_request.png")
+    os.utime(old.parent, (0, 0))
+    index = get_screenshot_index(tmp_path)
+    assert get_screenshot_index(str(tmp_path)) is index
+    steps = index.steps("bdd_tests_1")
+
+    writer = AsyncScreenshotWriter()
+    writer.save(fake_driver(screenshot=b"png"), tmp_path / "bdd_tests_1" / "add_expense_success.png")
+    (tmp_path / "bdd_tests_2").mkdir()
+    writer.save(fake_driver(screenshot=b"png"), tmp_path / "bdd_tests_2" / "assign_claim_request.png")
+
+    assert steps["add_expense_success"]["size"] == 3
+    assert index.latest_run("bdd_tests_").name == "bdd_tests_2"
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+测试内容寻址截图存储
+验证相同截图共享blob、manifest记录、感知哈希去重和未引用blob清理
+"""
+import sys
+import os
+import io
+import json
+import time
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from utils.screenshot_store import ScreenshotStore
+from utils.screenshot_writer import AsyncScreenshotWriter
+
+
+def make_png(shade: int, dot: bool = False) -> bytes:
+    """生成左暗右亮的渐变测试图片，dot=True时右下角多一个像素点"""
+    image = Image.new("RGB", (90, 80))
+    for x in range(90):
+        for y in range(80):
+            image.putpixel((x, y), (shade + x, shade + x, shade + x))
+    if dot:
+        image.putpixel((89, 79), (0, 0, 0))
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_identical_screenshots_share_one_blob(tmp_path):
+    """完全相同的截图只保存一个blob，截图路径通过链接指向它"""
+    store = ScreenshotStore(store_dir=str(tmp_path / "store"), phash_threshold=0)
+    run_dir = tmp_path / "run"
+    png = make_png(10)
+
+    blob_a = store.put(png, run_dir / "01_login.png")
+    blob_b = store.put(png, run_dir / "02_dashboard.png")
+
+    assert blob_a == blob_b
+    assert len(list((tmp_path / "store").glob("*/*.png"))) == 1
+    assert (run_dir / "02_dashboard.png").read_bytes() == png
+    assert os.stat(blob_a).st_nlink == 3
+
+    manifest = json.loads((run_dir / ScreenshotStore.MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert [frame["step"] for frame in manifest["frames"]] == ["01_login", "02_dashboard"]
+    assert [frame["deduplicated"] for frame in manifest["frames"]] == [False, True]
+    assert manifest["distinct"] == 1
+
+
+def test_near_duplicate_reuses_previous_blob(tmp_path):
+    """感知哈希距离在阈值内的截图复用上一张的blob，明显不同的画面单独保存"""
+    store = ScreenshotStore(store_dir=str(tmp_path / "store"), phash_threshold=4)
+    run_dir = tmp_path / "run"
+
+    first = store.put(make_png(10), run_dir / "01_form.png")
+    second = store.put(make_png(10, dot=True), run_dir / "02_form_again.png")
+    inverted = Image.open(io.BytesIO(make_png(10))).transpose(Image.FLIP_LEFT_RIGHT)
+    output = io.BytesIO()
+    inverted.save(output, format="PNG")
+    third = store.put(output.getvalue(), run_dir / "03_other_page.png")
+
+    assert second == first
+    assert third != first
+    manifest = json.loads((run_dir / ScreenshotStore.MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest["distinct"] == 2
+
+
+def test_prune_removes_only_unreferenced_blobs(tmp_path):
+    """清理时只删除没有截图引用且过期的blob"""
+    store = ScreenshotStore(store_dir=str(tmp_path / "store"), phash_threshold=0)
+    kept = store.put(make_png(10), tmp_path / "run" / "kept.png")
+    orphan = store.put(make_png(50), tmp_path / "run" / "orphan.png")
+    (tmp_path / "run" / "orphan.png").unlink()
+    old = time.time() - 10 * 24 * 60 * 60
+    os.utime(kept, (old, old))
+    os.utime(orphan, (old, old))
+
+    store.prune(days=7)
+
+    assert os.path.exists(kept)
+    assert not os.path.exists(orphan)
+
+
+def test_reused_blob_survives_cleanup(tmp_path):
+    """复用旧blob的新截图共享其修改时间，清理旧截图时不能被当作过期文件删除"""
+    store = ScreenshotStore(store_dir=str(tmp_path / "store"), phash_threshold=0)
+    png = make_png(10)
+    blob = store.put(png, tmp_path / "old_run" / "login.png")
+    (tmp_path / "old_run" / "login.png").unlink()
+    old = time.time() - 10 * 24 * 60 * 60
+    os.utime(blob, (old, old))
+
+    fresh = tmp_path / "new_run" / "login.png"
+    store.put(png, fresh)
+    store.prune(days=7)
+
+    assert os.path.exists(blob)
+    assert fresh.stat().st_mtime > old
+
+
+def test_writer_routes_screenshots_through_store(fake_driver, tmp_path, monkeypatch):
+    """启用存储时截图写入器把截图交给存储保存"""
+    monkeypatch.setenv("SCREENSHOT_ASYNC", "false")
+    monkeypatch.setenv("SCREENSHOT_STORE", "true")
+    monkeypatch.setenv("SCREENSHOT_DIR", str(tmp_path))
+    png = make_png(10)
+
+    writer = AsyncScreenshotWriter()
+    path = writer.save(fake_driver(screenshot=png), tmp_path / "run" / "step.png")
+
+    assert open(path, "rb").read() == png
+    assert len(list((tmp_path / "store").glob("*/*.png"))) == 1
+    assert writer.written == 1
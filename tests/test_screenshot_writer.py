@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+测试异步截图写入器
+验证后台写入、背压、flush和同步回退
+"""
+import sys
+import os
+import threading
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.screenshot_writer import AsyncScreenshotWriter
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\nfake-png"
+
+
+def test_async_writes_complete_after_flush(fake_driver, tmp_path, monkeypatch):
+    """异步模式下flush后所有截图都已解码写入"""
+    monkeypatch.setenv("SCREENSHOT_ASYNC", "true")
+    monkeypatch.setenv("SCREENSHOT_STORE", "false")
+    writer = AsyncScreenshotWriter(workers=2, queue_size=2)
+    paths = [writer.save(fake_driver(screenshot=PNG_BYTES), tmp_path / "sub" / f"shot_{i}.png") for i in range(10)]
+
+    assert writer.flush(timeout=5)
+    for path in paths:
+        with open(path, "rb") as f:
+            assert f.read() == PNG_BYTES
+    assert writer.written == 10
+    writer.shutdown()
+
+
+def test_full_queue_blocks_capture(fake_driver, tmp_path, monkeypatch):
+    """队列已满时截图调用等待后台线程写完（背压）"""
+    monkeypatch.setenv("SCREENSHOT_ASYNC", "true")
+    monkeypatch.setenv("SCREENSHOT_STORE", "false")
+    writer = AsyncScreenshotWriter(workers=1, queue_size=1)
+    release = threading.Event()
+    original_write = writer._write
+    monkeypatch.setattr(writer, "_write", lambda data, path: (release.wait(5), original_write(data, path)))
+
+    writer.save(fake_driver(screenshot=PNG_BYTES), tmp_path / "a.png")   # 被后台线程取走并阻塞
+    writer.save(fake_driver(screenshot=PNG_BYTES), tmp_path / "b.png")   # 占满队列
+    third = threading.Thread(target=writer.save, args=(fake_driver(screenshot=PNG_BYTES), tmp_path / "c.png"))
+    third.start()
+    third.join(timeout=0.3)
+    assert third.is_alive()
+
+    release.set()
+    third.join(timeout=5)
+    assert writer.flush(timeout=5)
+    assert writer.written == 3
+    writer.shutdown()
+
+
+def test_sync_mode_uses_save_screenshot(fake_driver, tmp_path, monkeypatch):
+    """关闭异步写入时直接调用driver.save_screenshot"""
+    monkeypatch.setenv("SCREENSHOT_ASYNC", "false")
+    monkeypatch.setenv("SCREENSHOT_STORE", "false")
+    driver = fake_driver(screenshot=PNG_BYTES)
+    writer = AsyncScreenshotWriter()
+    path = writer.save(driver, tmp_path / "sync.png")
+
+    assert driver.saved_screenshots == [path]
+    assert writer.flush()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+测试单次请求滚动定位
+验证第一个匹配的候选在一次execute_script中完成定位和滚动、没有匹配时使用fallback，以及等待候选出现
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.orangehrm_create_claim_request_page import OrangeHRMCreateClaimRequestPage
+
+
+@pytest.fixture
+def scroll_driver(fake_driver):
+    """模拟驱动工厂：表达式包含present中的文本时视为匹配，按候选序号和fallback返回滚动位置"""
+    def create(present=()):
+        driver = fake_driver(current_url="https://opensource-demo.orangehrmlive.com/web/index.php/claim/viewAssignClaim")
+        driver.present = list(present)
+
+        def on_script(script, queries, options):
+            matched = next((i for i, (_, value) in enumerate(queries)
+                            if any(text in value for text in driver.present)), -1)
+            if matched >= 0:
+                scroll_y = 100 * (matched + 1) + options['offset']
+            elif options['fallback'] == 'bottom':
+                scroll_y = 2000
+            elif isinstance(options['fallback'], float):
+                scroll_y = 3000 * options['fallback']
+            else:
+                return {'matched': -1, 'scrolled': False}
+            return {'matched': matched, 'scrolled': True, 'scroll_y': scroll_y, 'element_top': 0,
+                    'viewport_height': 1000, 'page_height': 3000, 'relative_position': scroll_y / 30}
+
+        driver.on_script = on_script
+        return driver
+    return create
+
+
+def test_scroll_to_first_single_call(scroll_driver):
+    """第一个匹配的候选一次请求完成滚动，并传入位置参数"""
+    driver = scroll_driver(present=["Reset"])
+    page = BasePage(driver)
+
+    geometry = page.scroll_to_first([(By.ID, "missing"), (By.XPATH, "//button[contains(text(),'Reset')]")],
+                                    block="start", offset=-50, fallback=0.2)
+
+    assert len(driver.scripts) == 1
+    assert geometry['matched'] == 1
+    assert geometry['scroll_y'] == 150
+    queries, options = driver.scripts[0][1]
+    assert queries[0] == ["css", '[id="missing"]']
+    assert options == {'block': "start", 'offset': -50, 'fallback': 0.2, 'textPattern': None}
+
+
+def test_scroll_to_first_fallback(scroll_driver):
+    """没有匹配时按fallback滚动，没有fallback时返回None"""
+    page = BasePage(scroll_driver())
+
+    assert page.scroll_to_first([(By.ID, "missing")], fallback="bottom")['scroll_y'] == 2000
+    assert page.scroll_to_first([], fallback="bottom")['matched'] == -1
+    assert page.scroll_to_first([(By.ID, "missing")]) is None
+
+
+def test_scroll_to_first_waits_for_candidate(scroll_driver):
+    """设置timeout时轮询到候选出现，等待期间不使用fallback"""
+    driver = scroll_driver()
+    page = BasePage(driver)
+    original = driver.on_script
+
+    def appear_on_third_call(script, *args):
+        if len(driver.scripts) == 3:
+            driver.present.append("View Details")
+        return original(script, *args)
+
+    driver.on_script = appear_on_third_call
+    geometry = page.scroll_to_first(OrangeHRMCreateClaimRequestPage.LATEST_RECORD_CANDIDATES, fallback=0.6, timeout=2)
+
+    assert geometry['matched'] == 4
+    assert len(driver.scripts) == 3
+    assert all(options['fallback'] is None for _, (_, options) in driver.scripts)
+
+
+def test_scroll_to_total_amount_single_call(scroll_driver, monkeypatch):
+    """页面方法按文本过滤候选，一次请求完成定位和滚动"""
+    driver = scroll_driver(present=["Total Amount"])
+    page = OrangeHRMCreateClaimRequestPage(driver)
+    monkeypatch.setattr(page, "wait_for_spinner_gone", lambda *args, **kwargs: True)
+
+    assert page.scroll_to_Total_Amount()
+    assert len(driver.scripts) == 1
+    options = driver.scripts[0][1][1]
+    assert options['textPattern'] == r"total|amount|\d"
+    assert options['fallback'] is None
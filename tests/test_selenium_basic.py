@@ -17,6 +17,15 @@ import pytest
 import time
 # 导入loguru日志库 - 用于记录测试执行过程中的日志信息
 from loguru import logger
+# 导入Selenium定位方式和异常类型 - 异常用例需要捕获的各类异常
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    ElementNotInteractableException,
+    InvalidElementStateException,
+    StaleElementReferenceException,
+    TimeoutException
+)
 # 导入页面对象模型 - 封装了页面元素和操作的类
 from pages.practice_home_page import PracticeHomePage  # 练习网站首页页面对象
 from pages.login_page import LoginPage                 # 登录页面页面对象
@@ -25,6 +34,20 @@ from pages.exceptions_page import ExceptionsPage       # 异常测试页面页
 from utils.screenshot_utils import screenshot_utils
 
 
+# 完整流程拆分出的8个用例：用例ID -> (所在页面, 页面内用例序号)
+# 用例ID与截图步骤名和 run_chrome_tests.py / run_edge_tests.py 报告中的用例编号一致
+FLOW_CASES = {
+    "TC001": ("login", 1),
+    "TC002": ("login", 2),
+    "TC003": ("login", 3),
+    "TC004": ("exceptions", 1),
+    "TC005": ("exceptions", 2),
+    "TC006": ("exceptions", 3),
+    "TC007": ("exceptions", 4),
+    "TC008": ("exceptions", 5),
+}
+
+
 class TestSeleniumBasic:
     """
     Selenium基础验证测试类
@@ -124,7 +147,6 @@ class TestSeleniumBasic:
     
     # ==================== 主要测试用例：完整流程测试 ====================
 
-    @pytest.mark.order(1)                    # 指定为第1个执行的测试
     @pytest.mark.smoke                       # 标记为冒烟测试
     @pytest.mark.regression                  # 标记为回归测试，用于全面验证功能
     def test_01_chrome_complete_flow(self, chrome_driver, screenshot_helper):
@@ -145,6 +167,7 @@ class TestSeleniumBasic:
         - 浏览器在整个测试过程中保持打开状态
         - 避免了登录和异常测试的重复执行
         - 包含完整的截图记录
+        - 与拆分出的单用例测试（test_03_chrome_case）同时被选中时不执行（见conftest.py）
 
         Args:
             chrome_driver: Chrome浏览器驱动实例
@@ -153,7 +176,6 @@ class TestSeleniumBasic:
         # 调用私有方法执行Chrome浏览器完整流程测试
         self._execute_complete_flow_test(chrome_driver, "Chrome", screenshot_helper)
 
-    @pytest.mark.order(2)                    # 指定为第2个执行的测试
     @pytest.mark.smoke                       # 标记为冒烟测试
     @pytest.mark.regression                  # 标记为回归测试，用于全面验证功能
     def test_02_edge_complete_flow(self, edge_driver, screenshot_helper):
@@ -174,12 +196,46 @@ class TestSeleniumBasic:
         - 唯一不同的是使用Edge浏览器执行
         - 测试流程、用例、验证点完全相同
         - 实现UI测试的兼容性验证
+        - 与拆分出的单用例测试（test_04_edge_case）同时被选中时不执行（见conftest.py）
         """
         logger.info("=== 开始执行Microsoft Edge浏览器完整流程测试 ===")
 
         # 调用私有方法执行完整流程测试
         self._execute_complete_flow_test(edge_driver, "Edge", screenshot_helper)
 
+    # ==================== 独立用例：完整流程拆分为TC001-TC008 ====================
+
+    @pytest.mark.regression                  # 标记为回归测试
+    @pytest.mark.parametrize("case_id", list(FLOW_CASES))
+    def test_03_chrome_case(self, warm_chrome_driver, screenshot_helper, case_id):
+        """
+        Chrome浏览器 - 单个用例测试
+
+        完整流程中的3个登录用例和5个异常用例拆分为独立的测试项，可以单独执行、重跑或跳过，
+        并可由pytest-xdist分发到多个工作进程；同一工作进程内的用例共用一个预热的浏览器
+
+        Args:
+            warm_chrome_driver: 工作进程级Chrome浏览器驱动
+            screenshot_helper: 截图助手实例
+            case_id: 用例ID（TC001-TC008）
+        """
+        self._execute_flow_case(warm_chrome_driver, "Chrome", screenshot_helper, case_id)
+
+    @pytest.mark.regression                  # 标记为回归测试
+    @pytest.mark.parametrize("case_id", list(FLOW_CASES))
+    def test_04_edge_case(self, warm_edge_driver, screenshot_helper, case_id):
+        """
+        Microsoft Edge浏览器 - 单个用例测试
+
+        与Chrome单个用例测试相同，使用Edge浏览器执行
+
+        Args:
+            warm_edge_driver: 工作进程级Edge浏览器驱动
+            screenshot_helper: 截图助手实例
+            case_id: 用例ID（TC001-TC008）
+        """
+        self._execute_flow_case(warm_edge_driver, "Edge", screenshot_helper, case_id)
+
     # ==================== Edge完整流程测试（暂时注释，专注Chrome优化） ====================
 
     # @pytest.mark.regression                  # 回归测试标记
@@ -570,6 +626,42 @@ class TestSeleniumBasic:
             # 重新抛出异常，让pytest框架能够正确处理测试失败
             raise
 
+    def _execute_flow_case(self, driver, browser_name, screenshot_helper, case_id):
+        """
+        独立执行完整流程中的单个用例
+
+        不依赖前一个用例留下的页面状态：每个用例直接打开所在页面再执行，
+        用例步骤和截图名称与完整流程测试完全相同
+
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+            case_id: 用例ID（TC001-TC008）
+        """
+        page_name, case_number = FLOW_CASES[case_id]
+        logger.info(f"开始执行{browser_name}浏览器用例{case_id}")
+
+        try:
+            if page_name == "login":
+                login_page = LoginPage(driver)
+                login_page.open_page()
+                assert login_page.is_page_loaded(), "登录页面未正确加载"
+                execute_case = getattr(self, f"_execute_login_case_{case_number}")
+                execute_case(login_page, driver, browser_name, screenshot_helper)
+            else:
+                exceptions_page = ExceptionsPage(driver)
+                exceptions_page.open_page()
+                assert exceptions_page.is_page_loaded(), "异常测试页面未正确加载"
+                execute_case = getattr(self, f"_execute_exception_case_{case_number}")
+                execute_case(driver, browser_name, screenshot_helper)
+        except Exception as e:
+            logger.error(f"{browser_name}浏览器用例{case_id}失败: {e}")
+            screenshot_helper.take_failure_screenshot(driver, f"用例{case_id}", str(e), browser_name)
+            raise
+
+        logger.info(f"{browser_name}浏览器用例{case_id}完成")
+
     def _execute_exceptions_test_with_screenshots(self, exceptions_page, driver, browser_name, screenshot_helper):
         """
         执行异常测试的5个用例，每个用例都有详细的截图记录
@@ -587,17 +679,46 @@ class TestSeleniumBasic:
         """
         logger.info("开始执行异常测试的5个用例，使用run_chrome_exceptions_cases.py中的详细逻辑...")
 
-        # 导入必要的模块
-        import time
-        from selenium.webdriver.common.by import By
-        from selenium.common.exceptions import (
-            NoSuchElementException,
-            ElementNotInteractableException,
-            InvalidElementStateException,
-            StaleElementReferenceException,
-            TimeoutException
-        )
+        # 通过首页链接进入页面时没有经过open_page，在执行用例前保存初始状态
+        exceptions_page.save_initial_state()
+        cases = [
+            self._execute_exception_case_1,
+            self._execute_exception_case_2,
+            self._execute_exception_case_3,
+            self._execute_exception_case_4,
+            self._execute_exception_case_5,
+        ]
+        for case_number, execute_case in enumerate(cases, start=1):
+            execute_case(driver, browser_name, screenshot_helper)
+            if case_number == len(cases):
+                break
+
+            # 等待3秒并刷新页面（快速模式下不等待，局部重置页面状态）
+            logger.info(f"用例{case_number}完成，等待3秒...")
+            ExceptionsPage.presentation_pause(3)
+            screenshot_helper.take_screenshot(driver, f"异常测试_用例{case_number}_等待3秒后", browser_name)
+
+            logger.info(f"刷新页面，准备执行用例{case_number + 1}...")
+            exceptions_page.restore_initial_state()
+            ExceptionsPage.presentation_pause(2)
+            screenshot_helper.take_screenshot(driver, f"异常测试_用例{case_number}_刷新页面后", browser_name)
 
+        # 最后一个用例等待3秒（不需要刷新）
+        logger.info("用例5完成，等待3秒完成所有测试...")
+        ExceptionsPage.presentation_pause(3)
+        screenshot_helper.take_screenshot(driver, "异常测试_用例5_最终完成", browser_name)
+
+        logger.info("异常测试的5个用例全部执行完成！")
+
+    def _execute_exception_case_1(self, driver, browser_name, screenshot_helper):
+        """
+        异常用例1: NoSuchElementException - 点击Add后立即查找尚未出现的Row 2输入框
+
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 用例1: NoSuchElementException测试 ==========
         logger.info("=== 开始执行Case1: NoSuchElementException ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例1_开始", browser_name)
@@ -607,7 +728,7 @@ class TestSeleniumBasic:
             logger.info("步骤1: 滚动到标题处")
             target_header = driver.find_element(By.XPATH, "/html/body/div/div/section/section/h2")
             driver.execute_script("arguments[0].scrollIntoView();", target_header)
-            time.sleep(1)
+            ExceptionsPage.presentation_pause(1)
             screenshot_helper.take_screenshot(driver, "异常测试_用例1_步骤1_滚动到标题", browser_name)
 
             # 2. 定位Add按钮并进行红色高亮
@@ -637,7 +758,7 @@ class TestSeleniumBasic:
                 driver.switch_to.window(driver.current_window_handle)
 
                 logger.info("Case1异常已显示在浏览器中，等待3秒...")
-                time.sleep(3)
+                ExceptionsPage.presentation_pause(3)
                 screenshot_helper.take_screenshot(driver, "异常测试_用例1_步骤4_异常显示完成", browser_name)
 
         except Exception as e:
@@ -647,16 +768,15 @@ class TestSeleniumBasic:
         logger.info("=== Case1测试完成 ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例1_完成", browser_name)
 
-        # 等待3秒并刷新页面
-        logger.info("用例1完成，等待3秒...")
-        time.sleep(3)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例1_等待3秒后", browser_name)
-
-        logger.info("刷新页面，准备执行用例2...")
-        driver.refresh()
-        time.sleep(2)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例1_刷新页面后", browser_name)
+    def _execute_exception_case_2(self, driver, browser_name, screenshot_helper):
+        """
+        异常用例2: ElementNotInteractableException - 点击不可见的Save按钮
 
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 用例2: ElementNotInteractableException测试 - 不可见的Save按钮 ==========
         logger.info("=== 开始执行Case2: ElementNotInteractableException (不可见按钮) ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例2_开始", browser_name)
@@ -666,7 +786,7 @@ class TestSeleniumBasic:
             logger.info("步骤1: 滚动到标题处")
             target_header = driver.find_element(By.XPATH, "/html/body/div/div/section/section/h2")
             driver.execute_script("arguments[0].scrollIntoView();", target_header)
-            time.sleep(1)
+            ExceptionsPage.presentation_pause(1)
             screenshot_helper.take_screenshot(driver, "异常测试_用例2_步骤1_滚动到标题", browser_name)
 
             # 2. 定位Add按钮并进行红色高亮
@@ -678,7 +798,7 @@ class TestSeleniumBasic:
             # 3. 点击Add按钮
             logger.info("步骤3: 点击Add按钮")
             add_button.click()
-            time.sleep(5)  # 等待Row 2出现
+            ExceptionsPage.for_driver(driver).wait_for_row2_added(5)  # 等待Row 2出现
             screenshot_helper.take_screenshot(driver, "异常测试_用例2_步骤3_点击Add按钮_等待Row2", browser_name)
 
             # 4. 在Row 2输入框中输入文本
@@ -713,7 +833,7 @@ class TestSeleniumBasic:
                 driver.switch_to.window(driver.current_window_handle)
 
                 logger.info("Case2异常已显示在浏览器中，等待3秒...")
-                time.sleep(3)
+                ExceptionsPage.presentation_pause(3)
                 screenshot_helper.take_screenshot(driver, "异常测试_用例2_步骤5_异常显示完成", browser_name)
 
         except Exception as e:
@@ -723,16 +843,15 @@ class TestSeleniumBasic:
         logger.info("=== Case2测试完成 ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例2_完成", browser_name)
 
-        # 等待3秒并刷新页面
-        logger.info("用例2完成，等待3秒...")
-        time.sleep(3)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例2_等待3秒后", browser_name)
-
-        logger.info("刷新页面，准备执行用例3...")
-        driver.refresh()
-        time.sleep(2)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例2_刷新页面后", browser_name)
+    def _execute_exception_case_3(self, driver, browser_name, screenshot_helper):
+        """
+        异常用例3: InvalidElementStateException - 清空禁用的输入框
 
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 用例3: InvalidElementStateException测试 - 清空禁用输入框 ==========
         logger.info("=== 开始执行Case3: InvalidElementStateException ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例3_开始", browser_name)
@@ -742,7 +861,7 @@ class TestSeleniumBasic:
             logger.info("步骤1: 滚动到标题处")
             target_header = driver.find_element(By.XPATH, "/html/body/div/div/section/section/h2")
             driver.execute_script("arguments[0].scrollIntoView();", target_header)
-            time.sleep(1)
+            ExceptionsPage.presentation_pause(1)
             screenshot_helper.take_screenshot(driver, "异常测试_用例3_步骤1_滚动到标题", browser_name)
 
             # 2. 尝试清空禁用的输入框(预期失败)
@@ -767,7 +886,7 @@ class TestSeleniumBasic:
                 driver.switch_to.window(driver.current_window_handle)
 
                 logger.info("Case3异常已显示在浏览器中，等待3秒...")
-                time.sleep(3)
+                ExceptionsPage.presentation_pause(3)
                 screenshot_helper.take_screenshot(driver, "异常测试_用例3_步骤2_异常显示完成", browser_name)
 
         except Exception as e:
@@ -777,16 +896,15 @@ class TestSeleniumBasic:
         logger.info("=== Case3测试完成 ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例3_完成", browser_name)
 
-        # 等待3秒并刷新页面
-        logger.info("用例3完成，等待3秒...")
-        time.sleep(3)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例3_等待3秒后", browser_name)
-
-        logger.info("刷新页面，准备执行用例4...")
-        driver.refresh()
-        time.sleep(2)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例3_刷新页面后", browser_name)
+    def _execute_exception_case_4(self, driver, browser_name, screenshot_helper):
+        """
+        异常用例4: StaleElementReferenceException - 访问已被移除的instructions元素
 
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 用例4: StaleElementReferenceException测试 - 元素引用过期 ==========
         logger.info("=== 开始执行Case4: StaleElementReferenceException ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例4_开始", browser_name)
@@ -802,7 +920,7 @@ class TestSeleniumBasic:
             logger.info("步骤2: 点击Add按钮移除instructions元素")
             add_button = driver.find_element(By.XPATH, "//button[text()='Add']")
             add_button.click()
-            time.sleep(5)  # 等待Row 2出现，此时instructions元素被移除
+            ExceptionsPage.for_driver(driver).wait_for_row2_added(5)  # 等待Row 2出现，此时instructions元素被移除
             screenshot_helper.take_screenshot(driver, "异常测试_用例4_步骤2_点击Add按钮", browser_name)
 
             # 3. 尝试与已过期的instructions元素交互(预期失败)
@@ -823,7 +941,7 @@ class TestSeleniumBasic:
                 driver.switch_to.window(driver.current_window_handle)
 
                 logger.info("Case4异常已显示在浏览器中，等待3秒...")
-                time.sleep(3)
+                ExceptionsPage.presentation_pause(3)
                 screenshot_helper.take_screenshot(driver, "异常测试_用例4_步骤3_异常显示完成", browser_name)
 
         except Exception as e:
@@ -833,16 +951,15 @@ class TestSeleniumBasic:
         logger.info("=== Case4测试完成 ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例4_完成", browser_name)
 
-        # 等待3秒并刷新页面
-        logger.info("用例4完成，等待3秒...")
-        time.sleep(3)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例4_等待3秒后", browser_name)
-
-        logger.info("刷新页面，准备执行用例5...")
-        driver.refresh()
-        time.sleep(2)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例4_刷新页面后", browser_name)
+    def _execute_exception_case_5(self, driver, browser_name, screenshot_helper):
+        """
+        异常用例5: TimeoutException - 用3秒超时等待5秒后才出现的Row 2
 
+        Args:
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 用例5: TimeoutException测试 - 短超时等待 ==========
         logger.info("=== 开始执行Case5: TimeoutException ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例5_开始", browser_name)
@@ -877,7 +994,7 @@ class TestSeleniumBasic:
                 driver.switch_to.window(driver.current_window_handle)
 
                 logger.info("Case5异常已显示在浏览器中，等待3秒...")
-                time.sleep(3)
+                ExceptionsPage.presentation_pause(3)
                 screenshot_helper.take_screenshot(driver, "异常测试_用例5_步骤2_异常显示完成", browser_name)
 
         except Exception as e:
@@ -887,13 +1004,6 @@ class TestSeleniumBasic:
         logger.info("=== Case5测试完成 ===")
         screenshot_helper.take_screenshot(driver, "异常测试_用例5_完成", browser_name)
 
-        # 最后一个用例等待3秒（不需要刷新）
-        logger.info("用例5完成，等待3秒完成所有测试...")
-        time.sleep(3)
-        screenshot_helper.take_screenshot(driver, "异常测试_用例5_最终完成", browser_name)
-
-        logger.info("异常测试的5个用例全部执行完成！")
-
     def _highlight_element(self, driver, element, color, duration=2):
         """
         简单高亮元素
@@ -909,7 +1019,7 @@ class TestSeleniumBasic:
 
             # 红色高亮
             driver.execute_script(f"arguments[0].style.border='3px solid {color}';", element)
-            time.sleep(duration)
+            ExceptionsPage.presentation_pause(duration)
 
             # 恢复原始样式
             driver.execute_script(f"arguments[0].style='{original_style}';", element)
@@ -925,6 +1035,8 @@ class TestSeleniumBasic:
             message: 异常信息
         """
         try:
+            # f-string表达式中不能包含反斜杠（Python 3.12之前），先转义再插入脚本
+            escaped_message = message.replace('`', '\\`').replace("'", "\\'")
             js = f"""
             // 移除已存在的面板
             const existingPanel = document.getElementById('exception-panel');
@@ -947,7 +1059,7 @@ class TestSeleniumBasic:
                     异常捕获成功
                 </h3>
                 <div style="white-space:pre-wrap; font-size:12px; line-height:1.4;">
-                    {message.replace('`', '\\`').replace("'", "\\'")}
+                    {escaped_message}
                 </div>
             `;
             document.body.appendChild(panel);
@@ -978,8 +1090,7 @@ class TestSeleniumBasic:
             # 方法1: 尝试滚动到Add按钮位置
             logger.info("尝试滚动到Add按钮位置...")
             add_button = driver.find_element(By.ID, "add_btn")
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", add_button)
-            time.sleep(2)  # 等待滚动动画完成
+            ExceptionsPage.for_driver(driver).scroll_into_view(add_button, "center", settle=2)  # 等待滚动动画完成
 
             # 截图记录滚动到Add按钮后的状态
             screenshot_helper.take_screenshot(driver, "异常测试_滚动到Add按钮", browser_name)
@@ -1042,7 +1153,7 @@ class TestSeleniumBasic:
 
         # 短暂等待，让用户观察页面状态
         logger.info("滚动完成，等待2秒让用户观察页面状态...")
-        time.sleep(2)
+        ExceptionsPage.presentation_pause(2)
 
         logger.info("页面滚动完成，现在可以开始执行测试用例")
 
@@ -1066,8 +1177,7 @@ class TestSeleniumBasic:
             if case_number in [1, 2]:
                 logger.info(f"用例{case_number}: 直接滚动到Add按钮位置")
                 add_button = driver.find_element(By.ID, "add_btn")
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", add_button)
-                time.sleep(2)
+                ExceptionsPage.for_driver(driver).scroll_into_view(add_button, "center", settle=2)
                 logger.info(f"用例{case_number}: 成功滚动到Add按钮位置")
 
             else:
@@ -1083,16 +1193,14 @@ class TestSeleniumBasic:
 
                 try:
                     case_element = driver.find_element(By.XPATH, f"//*[contains(text(), '{case_text}')]")
-                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", case_element)
-                    time.sleep(2)
+                    ExceptionsPage.for_driver(driver).scroll_into_view(case_element, "start", settle=2)
                     logger.info(f"成功滚动到用例{case_number}标题位置")
 
                 except Exception as e:
                     logger.warning(f"通过标题滚动失败: {e}")
                     # 备选方案：滚动到Add按钮附近
                     add_button = driver.find_element(By.ID, "add_btn")
-                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", add_button)
-                    time.sleep(1)
+                    ExceptionsPage.for_driver(driver).scroll_into_view(add_button, "center", settle=1)
                     logger.info(f"备选方案：滚动到Add按钮位置")
 
             # 截图记录滚动后的状态
@@ -1126,9 +1234,27 @@ class TestSeleniumBasic:
         """
         logger.info("开始执行3个登录测试用例...")
 
-        # 导入time模块用于等待
-        import time
+        self._execute_login_case_1(login_page, driver, browser_name, screenshot_helper)
+        self._execute_login_case_2(login_page, driver, browser_name, screenshot_helper)
+        self._execute_login_case_3(login_page, driver, browser_name, screenshot_helper)
+
+        # 清理页面状态，为后续导航做准备
+        logger.info("清理登录页面状态，准备导航到practice页面...")
+        login_page.clear_form()  # 清空表单
+        time.sleep(0.5)  # 短暂等待，确保清理完成
 
+        logger.info("3个登录测试用例全部执行完成！")
+
+    def _execute_login_case_1(self, login_page, driver, browser_name, screenshot_helper):
+        """
+        登录用例1: 正确凭据登录，验证登录成功后登出
+
+        Args:
+            login_page: 登录页面对象
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 登录用例1: 正确凭据登录测试 ==========
         logger.info("=== 执行登录用例1: 正确凭据登录测试 ===")
 
@@ -1158,6 +1284,16 @@ class TestSeleniumBasic:
         time.sleep(2)
         screenshot_helper.take_screenshot(driver, "登录用例1_登出操作", browser_name)
 
+    def _execute_login_case_2(self, login_page, driver, browser_name, screenshot_helper):
+        """
+        登录用例2: 错误用户名登录，验证用户名错误提示
+
+        Args:
+            login_page: 登录页面对象
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 登录用例2: 错误用户名登录测试 ==========
         logger.info("=== 执行登录用例2: 错误用户名登录测试 ===")
 
@@ -1188,6 +1324,16 @@ class TestSeleniumBasic:
         login_page.clear_form()
         time.sleep(1)
 
+    def _execute_login_case_3(self, login_page, driver, browser_name, screenshot_helper):
+        """
+        登录用例3: 错误密码登录，验证密码错误提示
+
+        Args:
+            login_page: 登录页面对象
+            driver: WebDriver实例
+            browser_name: 浏览器名称
+            screenshot_helper: 截图助手
+        """
         # ========== 登录用例3: 错误密码登录测试 ==========
         logger.info("=== 执行登录用例3: 错误密码登录测试 ===")
 
@@ -1213,10 +1359,3 @@ class TestSeleniumBasic:
         error_message = login_page.get_error_message()
         assert "password" in error_message.lower(), f"登录用例3失败: 错误消息不正确 - {error_message}"
         logger.info(f"登录用例3成功: 错误密码测试通过，错误消息: {error_message}")
-
-        # 清理页面状态，为后续导航做准备
-        logger.info("清理登录页面状态，准备导航到practice页面...")
-        login_page.clear_form()  # 清空表单
-        time.sleep(0.5)  # 短暂等待，确保清理完成
-
-        logger.info("3个登录测试用例全部执行完成！")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+测试登录会话缓存
+验证快照原子保存、过期、注入恢复和失效回退
+"""
+import sys
+import os
+import json
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from utils.session_cache import SessionCache
+
+ORIGIN = "https://opensource-demo.orangehrmlive.com"
+DASHBOARD = ORIGIN + "/web/index.php/dashboard/index"
+
+
+@pytest.fixture
+def session_driver(fake_driver):
+    """
+    已登录页面的模拟驱动工厂：读取storage返回固定数据，带参数的脚本视为注入storage；
+    session_valid为False时打开系统页面会被重定向到登录页
+    """
+    def create(session_valid=True, cdp=False):
+        def on_get(url):
+            if url.startswith(ORIGIN + "/web") and not session_valid:
+                return ORIGIN + "/web/index.php/auth/login"
+            return url
+
+        def on_script(script, *args):
+            if args:
+                driver.restored_storage = args
+                return None
+            return [{"token": "1"}, {"tab": "claims"}]
+
+        driver = fake_driver(cdp=cdp, current_url=DASHBOARD, on_get=on_get, on_script=on_script,
+                             cookies=[{"name": "orangehrm", "value": "abc", "path": "/web",
+                                       "domain": "opensource-demo.orangehrmlive.com", "expiry": 1e10,
+                                       "sameSite": "Lax"}])
+        if cdp:
+            driver.on_cdp = lambda cmd, params: {"identifier": "1"}
+        return driver
+    return create
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """使用临时目录的会话缓存"""
+    return SessionCache(cache_dir=str(tmp_path), ttl=60)
+
+
+def test_save_and_restore_with_navigation(session_driver, cache):
+    """保存快照后，新驱动应注入cookie和storage并直接打开目标页面"""
+    assert cache.save(session_driver(), "Admin")
+
+    driver = session_driver()
+    driver.current_url = "data:,"
+    assert cache.restore(driver, DASHBOARD, "Admin")
+    assert driver.visited[-1] == DASHBOARD
+    assert driver.added_cookies[0]["expiry"] == int(1e10)
+    assert driver.restored_storage == ({"token": "1"}, {"tab": "claims"})
+
+
+def test_failed_save_keeps_previous_snapshot(session_driver, cache):
+    """快照先写入临时文件再替换，写入失败时保留原有快照"""
+    snapshot_file = cache.save(session_driver(), "Admin")
+
+    driver = session_driver()
+    driver.on_script = lambda script, *args: [{"token": object()}, {}]
+    assert cache.save(driver, "Admin") is None
+    assert cache.load(ORIGIN, "Admin")["local_storage"] == {"token": "1"}
+    assert os.path.exists(snapshot_file)
+
+
+def test_restore_with_cdp_needs_single_navigation(session_driver, cache):
+    """Chromium驱动通过CDP注入，只加载一次目标页面"""
+    cache.save(session_driver(), "Admin")
+
+    driver = session_driver(cdp=True)
+    assert cache.restore(driver, DASHBOARD, "Admin")
+    assert driver.visited == [DASHBOARD]
+    commands = [cmd for cmd, _ in driver.cdp_commands]
+    assert commands == ["Network.setCookies", "Page.addScriptToEvaluateOnNewDocument",
+                        "Page.removeScriptToEvaluateOnNewDocument"]
+    assert driver.cdp_commands[0][1]["cookies"][0]["expires"] == 1e10
+
+
+def test_expired_snapshot_is_ignored(session_driver, cache, tmp_path):
+    """过期的快照不会被使用，并且会被删除"""
+    snapshot_file = cache.save(session_driver(), "Admin")
+    with open(snapshot_file, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    snapshot["expires"] = 0
+    with open(snapshot_file, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+
+    assert not cache.restore(session_driver(), DASHBOARD, "Admin")
+    assert not os.path.exists(snapshot_file)
+
+
+def test_rejected_session_falls_back(session_driver, cache):
+    """服务端拒绝缓存会话（重定向到登录页）时恢复失败并删除快照"""
+    snapshot_file = cache.save(session_driver(), "Admin")
+
+    assert not cache.restore(session_driver(session_valid=False), DASHBOARD, "Admin")
+    assert not os.path.exists(snapshot_file)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+测试BDD步骤注册表
+验证页面对象按驱动缓存、按名称分派页面操作、步骤截图策略，以及Claim表单批量填写
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from types import SimpleNamespace
+from pages.base_page import BasePage
+from pages.orangehrm_claims_page import OrangeHRMClaimsPage
+from utils.step_registry import ALWAYS, NEVER, ON_FAILURE, SAMPLED, PageRegistry, StepRegistry
+
+
+class FakeScreenshots:
+    """记录截图步骤名"""
+
+    def __init__(self):
+        self.steps = []
+
+    def take_screenshot(self, driver, step_name, browser_name):
+        self.steps.append(step_name)
+
+
+def make_context(driver):
+    context = SimpleNamespace(driver=driver, screenshot_utils=FakeScreenshots(), browser_name="chrome")
+    context.pages = PageRegistry(context)
+    return context
+
+
+@pytest.fixture
+def form_driver(fake_driver):
+    """模拟驱动工厂：表单快照返回form，批量填写返回fill_result"""
+    def create(form=None, fill_result=None):
+        return fake_driver(
+            current_url="https://opensource-demo.orangehrmlive.com/web/index.php/claim/assignClaim",
+            on_script=lambda script, *args: (form or {}) if script == BasePage._SNAPSHOT_FORM_SCRIPT else None,
+            on_async_script=lambda script, *args: fill_result or {})
+    return create
+
+
+@pytest.fixture(autouse=True)
+def no_policy_override(monkeypatch):
+    monkeypatch.delenv("BDD_SCREENSHOT_POLICY", raising=False)
+
+
+def test_pages_cached_per_driver(form_driver):
+    """同一驱动返回同一页面对象，驱动更换后重新创建"""
+    context = make_context(form_driver())
+    claims_page = context.pages.get(OrangeHRMClaimsPage)
+    assert context.pages.get(OrangeHRMClaimsPage) is claims_page
+
+    context.driver = form_driver()
+    assert context.pages.get(OrangeHRMClaimsPage) is not claims_page
+
+
+def test_perform_dispatches_registered_action(form_driver, monkeypatch):
+    """按名称分派到页面方法，未注册的名称返回False"""
+    registry = StepRegistry()
+    registry.register_action("tab", "Employee Claims", OrangeHRMClaimsPage, "click_employee_claims")
+    context = make_context(form_driver())
+    clicked = []
+    monkeypatch.setattr(context.pages.get(OrangeHRMClaimsPage), "click_employee_claims", lambda: clicked.append(True))
+
+    assert registry.perform(context, "tab", "Employee Claims")
+    assert clicked == [True]
+    assert not registry.perform(context, "tab", "Unknown")
+
+
+def test_screenshot_policies(form_driver, monkeypatch):
+    """always每步截图，on_failure仅失败时截图，sampled按比例截图，环境变量覆盖步骤声明"""
+    registry = StepRegistry(sample_rate=0)
+    context = make_context(form_driver())
+
+    @registry.screenshot("点击_{button_text}", ALWAYS)
+    def always_step(context, button_text):
+        pass
+
+    @registry.screenshot("填写表单", ON_FAILURE)
+    def failing_step(context):
+        raise AssertionError("失败")
+
+    @registry.screenshot("抽样", SAMPLED)
+    def sampled_step(context):
+        pass
+
+    always_step(context, button_text="Create")
+    with pytest.raises(AssertionError):
+        failing_step(context)
+    sampled_step(context)
+    assert context.screenshot_utils.steps == ["点击_Create", "填写表单失败"]
+
+    registry.sample_rate = 1
+    sampled_step(context)
+    assert context.screenshot_utils.steps[-1] == "抽样"
+
+    monkeypatch.setenv("BDD_SCREENSHOT_POLICY", NEVER)
+    always_step(context, button_text="Back")
+    assert len(context.screenshot_utils.steps) == 3
+
+
+def test_claim_request_filled_in_one_batch(form_driver, monkeypatch):
+    """表格字段一次批量填写，未填写成功的字段使用单字段方法补填"""
+    fields = {"Employee Name": "Amelia Brown", "Event": "Travel allowances", "Currency": "Euro"}
+    driver = form_driver(form={label: {'value': '', 'visible': True} for label in fields},
+                        fill_result={"Employee Name": True, "Event": True, "Currency": False})
+    page = OrangeHRMClaimsPage(driver)
+    fallback = []
+    monkeypatch.setattr(page, "select_currency", fallback.append)
+
+    page.fill_claim_request_fields(fields)
+
+    assert len(driver.async_scripts) == 1
+    assert driver.async_scripts[0][1][1] == fields
+    assert fallback == ["Euro"]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+测试页面操作耗时追踪
+验证嵌套步骤、WebDriver命令统计、sleep统计与trace文件输出
+"""
+import sys
+import os
+import json
+import time
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from selenium.webdriver.remote.command import Command
+from pages.base_page import BasePage
+from utils.step_tracer import step_tracer
+
+
+class DemoPage(BasePage):
+    """用于测试的页面对象"""
+
+    def outer_step(self):
+        self.inner_step()
+        time.sleep(0.01)
+
+    def inner_step(self):
+        self.driver.execute_script("return 1")
+        self.driver.execute_script("return 2")
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    """将trace文件写入临时目录，用例结束后停止追踪"""
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path))
+    yield step_tracer
+    step_tracer.stop()
+
+
+def test_page_methods_are_instrumented():
+    """子类和基础页面的公开方法都应被包装，私有方法保持原样"""
+    assert getattr(DemoPage.outer_step, "__step_traced__", False)
+    assert getattr(BasePage.click_element, "__step_traced__", False)
+    assert not getattr(BasePage.__init__, "__step_traced__", False)
+
+
+def test_nested_steps_record_commands_and_sleep(fake_driver, tracer, tmp_path):
+    """嵌套步骤的命令数与sleep时间应计入外层步骤，并输出trace文件"""
+    page = DemoPage(fake_driver())
+    tracer.start("demo/test[case]")
+    page.outer_step()
+    trace_file = tracer.stop()
+
+    steps = {step["name"]: step for step in tracer.steps}
+    outer = steps["DemoPage.outer_step"]
+    inner = steps["DemoPage.inner_step"]
+    assert inner["commands"] == 2
+    assert outer["commands"] == 2
+    assert outer["sleep_time"] >= 0.01
+    assert inner["sleep_time"] == 0
+    assert outer["depth"] == 0 and inner["depth"] == 1
+    assert tracer.top_steps(1)[0]["name"] == "DemoPage.outer_step"
+
+    with open(trace_file, encoding="utf-8") as f:
+        trace = json.load(f)
+    categories = {event["cat"] for event in trace["traceEvents"]}
+    assert {"step", "webdriver", "sleep"} <= categories
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    assert os.path.dirname(trace_file) == str(tmp_path / "traces")
+    assert time.sleep.__name__ == "sleep"
+
+
+def test_no_recording_when_inactive(fake_driver, tracer):
+    """追踪未激活时页面方法照常执行且不记录"""
+    page = DemoPage(fake_driver())
+    tracer.stop()
+    tracer.steps = []
+    page.inner_step()
+    assert step_tracer.steps == []
+    assert page.driver.commands == [Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT]
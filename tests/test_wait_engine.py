@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+测试BasePage条件等待引擎
+验证等待记录、网络空闲判断和耗时统计
+"""
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.base_page import BasePage
+
+
+def test_wait_until_records_elapsed_and_budget(fake_driver):
+    """满足条件的等待应记录实际耗时与原固定等待时间"""
+    page = BasePage(fake_driver())
+
+    assert page.wait_until(lambda driver: True, timeout=1, description="立即满足", budget=2)
+
+    record = page.wait_records[0]
+    assert record['description'] == "立即满足"
+    assert record['satisfied'] is True
+    assert record['budget'] == 2
+    assert record['elapsed'] < 1
+
+
+def test_wait_until_timeout_returns_false(fake_driver):
+    """条件未满足时应在超时后返回False而不是抛出异常"""
+    page = BasePage(fake_driver())
+
+    assert not page.wait_until(lambda driver: False, timeout=0.2, budget=1)
+    assert page.wait_records[0]['satisfied'] is False
+
+
+def test_network_idle_waits_for_pending_requests(fake_driver):
+    """存在进行中的请求时不应判定为网络空闲"""
+    driver = fake_driver(script_results=[
+        ["complete", 1, 10],
+        ["complete", 0, 12],
+        ["complete", 0, 12],
+    ])
+    page = BasePage(driver)
+
+    assert page.wait_for_network_idle(idle_ms=100, timeout=2, budget=3)
+    assert len(driver.script_results) == 1
+
+
+def test_dom_stable_timeout_bounded_by_budget(fake_driver):
+    """页面持续变化时，替换固定等待的等待最多持续原固定等待时间的2倍"""
+    page = BasePage(fake_driver(script_results=[False]))
+
+    assert not page.wait_for_dom_stable(timeout=10, budget=0.3)
+    assert page.wait_records[0]['elapsed'] < 2
+    assert BasePage._budget_timeout(15, 3) == 6
+    assert BasePage._budget_timeout(15, None) == 15
+
+
+def test_listbox_ignores_searching_placeholder(fake_driver):
+    """自动完成列表只显示 "Searching..." 时不应判定为已加载"""
+
+    class Option:
+        def __init__(self, text):
+            self.text = text
+
+    driver = fake_driver()
+    driver.find_elements = lambda by, value: [Option("Searching....")]
+    page = BasePage(driver)
+
+    assert not page.wait_for_listbox_populated(timeout=0.2)
+
+    driver.find_elements = lambda by, value: [Option("Amelia Brown")]
+    assert page.wait_for_listbox_populated(timeout=1)
+
+
+def test_wait_report_summarizes_saved_time(fake_driver):
+    """等待报告应汇总实际等待时间与节省的时间"""
+    page = BasePage(fake_driver())
+    page.wait_until(lambda driver: True, timeout=1, budget=2)
+    page.wait_until(lambda driver: True, timeout=1, budget=3)
+    page.wait_until(lambda driver: True, timeout=1)
+
+    report = page.get_wait_report()
+    assert report['waits'] == 3
+    assert report['budget'] == 5
+    assert report['saved'] > 4
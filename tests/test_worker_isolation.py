@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+测试pytest-xdist并行支持
+验证工作进程使用独立的截图/报告目录，以及主进程合并各工作进程的测试日志
+"""
+import sys
+import os
+import json
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.report_manager import ReportManager
+from utils.worker_isolation import isolate_worker_artifacts, merge_worker_reports, worker_report_journals
+
+
+def test_worker_directories_are_suffixed(tmp_path, monkeypatch):
+    """工作进程的截图和报告目录追加工作进程ID，并默认启用会话池"""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    monkeypatch.setenv("SCREENSHOT_DIR", str(tmp_path / "screenshots"))
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path / "reports"))
+    monkeypatch.delenv("DRIVER_POOL", raising=False)
+
+    isolate_worker_artifacts()
+    isolate_worker_artifacts()
+
+    assert os.environ["SCREENSHOT_DIR"] == str(tmp_path / "screenshots" / "gw1")
+    assert os.environ["REPORT_DIR"] == str(tmp_path / "reports" / "gw1")
+    assert os.environ["DRIVER_POOL"] == "true"
+
+
+def test_controller_directories_unchanged(tmp_path, monkeypatch):
+    """非工作进程不修改目录和会话池设置"""
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("DRIVER_POOL", "false")
+
+    isolate_worker_artifacts()
+
+    assert os.environ["REPORT_DIR"] == str(tmp_path)
+    assert os.environ["DRIVER_POOL"] == "false"
+
+
+def test_merge_worker_reports(tmp_path):
+    """合并各工作进程的NDJSON日志生成一份汇总报告"""
+    for worker, names in (("gw0", ["test_a", "test_b"]), ("gw1", ["test_c"])):
+        manager = ReportManager(report_dir=str(tmp_path / worker))
+        for name in names:
+            manager.add_test_result(name, "FAILED" if name == "test_c" else "PASSED", 1.0,
+                                    screenshots=[str(tmp_path.parent / "screenshots" / worker / f"{name}.png")])
+        manager._close_files()
+
+    assert len(worker_report_journals(tmp_path)) == 2
+    assert worker_report_journals(tmp_path, since=4102444800) == []
+
+    html_path, json_path = merge_worker_reports(tmp_path)
+
+    with open(json_path, encoding="utf-8") as f:
+        report = json.load(f)
+    assert [result["name"] for result in report["test_results"]] == ["test_a", "test_b", "test_c"]
+    assert report["summary"]["failed_tests"] == 1
+    html_content = open(html_path, encoding="utf-8").read()
+    assert os.path.dirname(html_path) == str(tmp_path)
+    assert 'src="../screenshots/gw1/test_c.png"' in html_content
+    assert 'id="report-complete"' in html_content
+
+
+def test_merge_without_worker_journals(tmp_path):
+    """没有工作进程日志时不生成报告"""
+    assert merge_worker_reports(tmp_path) == (None, None)
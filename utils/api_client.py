@@ -0,0 +1,476 @@
+"""
+OrangeHRM API客户端
+每个WebDriver共享一个带连接池的requests.Session，按需从浏览器增量同步cookie，
+并提供员工、报销申请(Claim)和费用(Expense)的类型化查询方法
+"""
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from loguru import logger
+from config.config_manager import config
+from utils.driver_manager import on_driver_release
+
+
+@dataclass
+class Employee:
+    """员工信息"""
+
+    emp_number: int
+    first_name: str = ""
+    middle_name: str = ""
+    last_name: str = ""
+    employee_id: str = ""
+
+    @property
+    def full_name(self) -> str:
+        """页面下拉列表中显示的完整姓名"""
+        return " ".join(part for part in (self.first_name, self.middle_name, self.last_name) if part)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Employee":
+        return cls(
+            emp_number=data.get("empNumber"),
+            first_name=(data.get("firstName") or "").strip(),
+            middle_name=(data.get("middleName") or "").strip(),
+            last_name=(data.get("lastName") or "").strip(),
+            employee_id=data.get("employeeId") or "",
+        )
+
+
+@dataclass
+class Claim:
+    """报销申请"""
+
+    id: int
+    reference_id: str = ""
+    employee: Optional[Employee] = None
+    event_name: str = ""
+    currency: str = ""
+    status: str = ""
+    amount: float = 0.0
+    submitted_date: str = ""
+    remarks: str = ""
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Claim":
+        employee = data.get("employee")
+        return cls(
+            id=data.get("id"),
+            reference_id=data.get("referenceId") or "",
+            employee=Employee.from_api(employee) if employee else None,
+            event_name=(data.get("claimEvent") or {}).get("name", ""),
+            currency=(data.get("currencyType") or {}).get("name", ""),
+            status=data.get("status") or "",
+            amount=float(data.get("amount") or 0),
+            submitted_date=data.get("submittedDate") or "",
+            remarks=data.get("remarks") or data.get("description") or "",
+        )
+
+
+@dataclass
+class Expense:
+    """报销费用明细"""
+
+    id: int
+    expense_type: str = ""
+    date: str = ""
+    amount: float = 0.0
+    note: str = ""
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Expense":
+        return cls(
+            id=data.get("id"),
+            expense_type=(data.get("expenseType") or {}).get("name", ""),
+            date=data.get("date") or "",
+            amount=float(data.get("amount") or 0),
+            note=data.get("note") or "",
+        )
+
+
+class OrangeHRMApiClient:
+    """OrangeHRM API客户端类"""
+
+    API_PREFIX = "/web/index.php/api/v2"
+    EMPLOYEES_PATH = "/pim/employees"
+    CLAIM_REQUESTS_PATH = "/claim/employees/requests"
+    CLAIM_REQUEST_PATH = "/claim/employees/requests/{request_id}"
+    CLAIM_EXPENSES_PATH = "/claim/requests/{request_id}/expenses"
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'application/json',
+        'X-Requested-With': 'XMLHttpRequest'
+    }
+
+    def __init__(self, driver, base_url: str = None):
+        """
+        初始化API客户端
+
+        Args:
+            driver: 已登录的WebDriver实例，用于同步会话cookie
+            base_url: 站点地址，None时从驱动当前URL推断
+        """
+        api_config = config.api_client_config
+        self.driver = driver
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.timeout = api_config.get('timeout', 10)
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=api_config.get('pool_size', 4))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._synced_cookies: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        # 本次流程创建的报销申请：{id: 申请ID（无法获取时为None）, started: 点击Create的时间}
+        self.created_claim: Optional[Dict[str, Any]] = None
+
+    def sync_cookies(self, force: bool = False):
+        """
+        从浏览器同步cookie到Session，只更新有变化的cookie
+
+        Args:
+            force: 是否强制同步（默认只在首次请求前同步）
+        """
+        with self._lock:
+            if self._synced_cookies and not force:
+                return
+            if self.base_url is None:
+                self.base_url = self.driver.current_url.split('/web/')[0]
+
+            browser_cookies = {cookie['name']: cookie for cookie in self.driver.get_cookies()}
+            for name in set(self._synced_cookies) - set(browser_cookies):
+                self.session.cookies.set(name, None)
+                del self._synced_cookies[name]
+            for name, cookie in browser_cookies.items():
+                if self._synced_cookies.get(name) != cookie['value']:
+                    self.session.cookies.set(name, cookie['value'],
+                                             domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+                    self._synced_cookies[name] = cookie['value']
+            logger.debug(f"API会话cookie已同步: {len(self._synced_cookies)}个")
+
+    def get_json(self, path: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """
+        发送GET请求并返回JSON，会话失效(401)时重新同步cookie重试一次
+
+        Args:
+            path: API路径（不含 /web/index.php/api/v2 前缀）
+            params: 查询参数
+
+        Returns:
+            响应JSON，请求失败时返回None
+        """
+        self.sync_cookies()
+        url = f"{self.base_url}{self.API_PREFIX}{path}"
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            if response.status_code == 401:
+                logger.info("API会话已失效，重新同步cookie后重试")
+                self.sync_cookies(force=True)
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            if response.status_code != 200:
+                logger.error(f"API请求失败: {url}，状态码: {response.status_code}")
+                return None
+            return response.json()
+        except Exception as e:
+            logger.error(f"API请求异常: {url} - {e}")
+            return None
+
+    def get_employees(self, name_or_id: str = "", include: str = "onlyCurrent", limit: int = 50) -> Optional[List[Employee]]:
+        """
+        查询员工
+
+        Args:
+            name_or_id: 姓名或工号关键词
+            include: 员工范围 (onlyCurrent, onlyPast, currentAndPast)
+            limit: 最大返回数量
+
+        Returns:
+            员工列表，请求失败时返回None
+        """
+        params = {'includeEmployees': include, 'limit': limit}
+        if name_or_id:
+            params['nameOrId'] = name_or_id
+        data = self.get_json(self.EMPLOYEES_PATH, params)
+        if data is None:
+            return None
+        return [Employee.from_api(item) for item in data.get('data', [])]
+
+    def get_employee_names(self, name_or_id: str = "") -> Optional[List[str]]:
+        """
+        查询员工完整姓名
+
+        Args:
+            name_or_id: 姓名或工号关键词
+
+        Returns:
+            姓名列表，请求失败时返回None
+        """
+        employees = self.get_employees(name_or_id)
+        if employees is None:
+            return None
+        return [employee.full_name for employee in employees if employee.full_name]
+
+    def get_claims(self, limit: int = 50, offset: int = 0, emp_number: int = None,
+                   status: str = None, reference_id: str = None) -> Optional[List[Claim]]:
+        """
+        查询员工报销申请（按提交时间倒序）
+
+        Args:
+            limit: 最大返回数量
+            offset: 偏移量
+            emp_number: 员工编号
+            status: 申请状态
+            reference_id: 申请编号
+
+        Returns:
+            报销申请列表，请求失败时返回None
+        """
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'sortField': 'claimRequest.submittedDate',
+            'sortOrder': 'DESC',
+        }
+        if emp_number is not None:
+            params['empNumber'] = emp_number
+        if status:
+            params['status'] = status
+        if reference_id:
+            params['referenceId'] = reference_id
+        data = self.get_json(self.CLAIM_REQUESTS_PATH, params)
+        if data is None:
+            return None
+        return [Claim.from_api(item) for item in data.get('data', [])]
+
+    def get_claim(self, request_id: int) -> Optional[Claim]:
+        """
+        按ID查询报销申请
+
+        Args:
+            request_id: 报销申请ID
+
+        Returns:
+            报销申请，不存在或请求失败时返回None
+        """
+        data = self.get_json(self.CLAIM_REQUEST_PATH.format(request_id=request_id))
+        if not data or not data.get('data'):
+            return None
+        return Claim.from_api(data['data'])
+
+    def get_claim_expenses(self, request_id: int) -> Optional[List[Expense]]:
+        """
+        查询报销申请的费用明细
+
+        Args:
+            request_id: 报销申请ID
+
+        Returns:
+            费用列表，请求失败时返回None
+        """
+        data = self.get_json(self.CLAIM_EXPENSES_PATH.format(request_id=request_id), {'limit': 50})
+        if data is None:
+            return None
+        return [Expense.from_api(item) for item in data.get('data', [])]
+
+    def find_claims(self, employee_name: str = "", event: str = "", currency: str = "",
+                    limit: int = None, claim_id: int = None,
+                    submitted_since: datetime = None) -> Optional[List[Claim]]:
+        """
+        按员工、事件和货币查找最新的报销申请（请求数固定，与记录总数无关；已知申请ID时直接按ID查询该申请）
+
+        Args:
+            employee_name: 员工姓名
+            event: 事件名称
+            currency: 货币名称
+            limit: 最多检查的最新记录数，None时使用配置 claim_verification.max_records
+            claim_id: 只匹配该申请ID（创建后从页面地址获取），不再查询申请列表
+            submitted_since: 只匹配提交日期不早于该时间的申请（接口只返回日期，按日期比较）
+
+        Returns:
+            匹配的报销申请列表（最新在前），请求失败或指定ID的申请不存在时返回None
+        """
+        if claim_id is not None:
+            claim = self.get_claim(claim_id)
+            if claim is None:
+                return None
+            return [claim] if self._claim_matches(claim, employee_name, event, currency) else []
+
+        if limit is None:
+            limit = config.claim_verification_config.get('max_records', 50)
+
+        emp_number = None
+        if employee_name:
+            employees = self.get_employees(employee_name, include="currentAndPast")
+            if employees is None:
+                return None
+            matched = [employee for employee in employees if _same_name(employee.full_name, employee_name)]
+            if not matched:
+                logger.warning(f"API中未找到员工: {employee_name}")
+                return []
+            if len(matched) == 1:
+                emp_number = matched[0].emp_number
+
+        claims = self.get_claims(limit=limit, emp_number=emp_number)
+        if claims is None:
+            return None
+        since_date = submitted_since.date().isoformat() if submitted_since else ""
+        return [
+            claim for claim in claims
+            if (not since_date or claim.submitted_date[:10] >= since_date)
+            and self._claim_matches(claim, employee_name, event, currency)
+        ]
+
+    @staticmethod
+    def _claim_matches(claim: Claim, employee_name: str, event: str, currency: str) -> bool:
+        """报销申请是否与员工、事件和货币一致（为空的条件不比较）"""
+        return bool(
+            (not employee_name or (claim.employee and _same_name(claim.employee.full_name, employee_name)))
+            and (not event or claim.event_name.strip().lower() == event.strip().lower())
+            and (not currency or claim.currency.strip().lower() == currency.strip().lower())
+        )
+
+    def close(self):
+        """关闭Session及其连接池"""
+        self.session.close()
+
+
+def _same_name(actual: str, expected: str) -> bool:
+    """比较员工姓名（忽略大小写和多余空格，允许省略中间名）"""
+    actual_parts = actual.lower().split()
+    expected_parts = expected.lower().split()
+    if actual_parts == expected_parts:
+        return True
+    return (len(actual_parts) >= 2 and len(expected_parts) >= 2
+            and actual_parts[0] == expected_parts[0] and actual_parts[-1] == expected_parts[-1])
+
+
+# 创建报销申请后的详情页地址中的申请ID
+_CLAIM_ID_PATTERN = re.compile(r"/claim/\w+/id/(\d+)")
+
+# 按驱动缓存的API客户端，驱动归还会话池或关闭时由 close_api_client 关闭并移除
+_api_clients: Dict[Any, "OrangeHRMApiClient"] = {}
+_api_clients_lock = threading.Lock()
+
+
+def get_api_client(driver) -> OrangeHRMApiClient:
+    """
+    获取驱动对应的API客户端（同一驱动复用同一个Session和连接池）
+
+    Args:
+        driver: WebDriver实例
+
+    Returns:
+        API客户端
+    """
+    with _api_clients_lock:
+        client = _api_clients.get(driver)
+        if client is None:
+            client = OrangeHRMApiClient(driver)
+            _api_clients[driver] = client
+        return client
+
+
+def close_api_client(driver):
+    """
+    关闭并移除驱动对应的API客户端（驱动归还会话池、被回收或关闭时调用）
+
+    Args:
+        driver: WebDriver实例
+    """
+    with _api_clients_lock:
+        client = _api_clients.pop(driver, None)
+    if client is not None:
+        client.close()
+
+
+def close_api_clients():
+    """关闭所有API客户端"""
+    with _api_clients_lock:
+        for client in list(_api_clients.values()):
+            client.close()
+        _api_clients.clear()
+
+
+# 驱动释放时关闭其Session，避免Session和驱动一直累积到会话结束
+on_driver_release(close_api_client)
+
+
+def claim_verification_mode() -> str:
+    """
+    获取Claim验证方式（环境变量 CLAIM_VERIFY_MODE 优先于配置文件）
+
+    Returns:
+        "api" 或 "ui"
+    """
+    mode = os.environ.get("CLAIM_VERIFY_MODE") or config.claim_verification_config.get('mode', 'ui')
+    return mode.strip().lower()
+
+
+def record_created_claim(driver, started: datetime, timeout: float = 5) -> Optional[int]:
+    """
+    记录刚创建的报销申请（点击Create后调用），API验证时只匹配这条申请，避免匹配到以前运行留下的记录
+
+    创建成功后页面跳转到 /claim/<页面>/id/<申请ID>，从地址中获取申请ID；
+    获取不到时按点击Create的时间过滤提交日期
+
+    Args:
+        driver: WebDriver实例
+        started: 点击Create的时间
+        timeout: 等待页面跳转的最长时间（秒）
+
+    Returns:
+        申请ID，未启用API验证或获取不到时返回None
+    """
+    if claim_verification_mode() != "api":
+        return None
+
+    def created_id(current_driver):
+        match = _CLAIM_ID_PATTERN.search(current_driver.current_url)
+        return int(match.group(1)) if match else None
+
+    try:
+        claim_id = WebDriverWait(driver, timeout, poll_frequency=0.2).until(created_id)
+    except TimeoutException:
+        claim_id = None
+        logger.warning(f"创建后页面地址中没有申请ID，API验证将按提交日期过滤: {driver.current_url}")
+    get_api_client(driver).created_claim = {'id': claim_id, 'started': started}
+    return claim_id
+
+
+def verify_claim_via_api(driver, employee_name: str = "", event: str = "", currency: str = "") -> Optional[bool]:
+    """
+    通过Claims接口验证报销申请是否存在（记录过本次创建的申请时只匹配该申请）
+
+    Args:
+        driver: 已登录的WebDriver实例
+        employee_name: 员工姓名
+        event: 事件名称
+        currency: 货币名称
+
+    Returns:
+        是否找到匹配记录；未启用API验证或接口不可用时返回None，调用方应回退到界面验证
+    """
+    if claim_verification_mode() != "api":
+        return None
+
+    client = get_api_client(driver)
+    created = client.created_claim or {}
+    claims = client.find_claims(employee_name, event, currency, claim_id=created.get('id'),
+                                submitted_since=None if created.get('id') else created.get('started'))
+    if claims is None:
+        logger.warning("Claims接口不可用或未查询到本次创建的申请，回退到界面验证")
+        return None
+    if claims:
+        logger.info(f"✅ 通过API找到匹配的Claim记录: {claims[0].reference_id} "
+                    f"(员工={employee_name or '-'}, 事件={event or '-'}, 货币={currency or '-'})")
+        return True
+    logger.warning(f"API中未找到匹配的Claim记录: 员工={employee_name}, 事件={event}, 货币={currency}")
+    return False
@@ -0,0 +1,195 @@
+"""
+点击策略学习缓存
+按 页面类 + 定位器 记录每种点击策略（或候选定位器）的成功/失败次数和上次成功的策略，
+下次先尝试上次成功的策略，连续失败的策略降级到最后；结果在会话结束时批量写回磁盘JSON文件，重复运行时跳过已知无效的尝试
+"""
+import os
+import json
+import atexit
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+from loguru import logger
+from config.config_manager import config
+
+
+class ClickStrategyCache:
+    """点击策略学习缓存类"""
+
+    def __init__(self, cache_file: str = None, demote_after: int = None):
+        """
+        初始化点击策略缓存
+
+        Args:
+            cache_file: 磁盘缓存文件，None时使用配置 click_strategy_cache.file
+            demote_after: 连续失败多少次后降级到最后尝试，None时使用配置 click_strategy_cache.demote_after
+        """
+        cache_config = config.click_strategy_cache_config
+        self.cache_file = Path(cache_file or cache_config.get('file', '.cache/click_strategies.json'))
+        self.demote_after = demote_after if demote_after is not None else cache_config.get('demote_after', 3)
+        self._entries: Dict[str, Dict[str, Any]] = None
+        # 本进程修改过、尚未写回磁盘的缓存键
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用点击策略缓存（环境变量 CLICK_STRATEGY_CACHE 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("CLICK_STRATEGY_CACHE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.click_strategy_cache_config.get('enabled', False))
+
+    @staticmethod
+    def key(page: str, target) -> str:
+        """
+        生成缓存键
+
+        Args:
+            page: 页面类名
+            target: 定位器元组 (By, value) 或元素名称
+
+        Returns:
+            缓存键
+        """
+        if isinstance(target, (tuple, list)):
+            target = f"{target[0]}={target[1]}"
+        return f"{page}|{target}"
+
+    def order(self, key: str, strategies: List[str]) -> List[str]:
+        """
+        按学习结果排序策略：上次成功的最先，连续失败达到阈值的降级到最后，其余按成功率排序，
+        没有记录的策略保持原有顺序
+
+        Args:
+            key: 缓存键
+            strategies: 策略名称列表（原有尝试顺序）
+
+        Returns:
+            排序后的策略名称列表
+        """
+        if not self.enabled():
+            return list(strategies)
+
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry:
+            return list(strategies)
+
+        stats = entry.get("strategies", {})
+        last_success = entry.get("last_success")
+
+        def sort_key(item):
+            index, name = item
+            record = stats.get(name, {})
+            successes = record.get("success", 0)
+            failures = record.get("failure", 0)
+            demoted = record.get("consecutive_failures", 0) >= self.demote_after
+            # 拉普拉斯平滑的成功率，没有记录的策略为0.5
+            success_rate = (successes + 1) / (successes + failures + 2)
+            return demoted, name != last_success, -success_rate, index
+
+        ordered = [name for _, name in sorted(enumerate(strategies), key=sort_key)]
+        if ordered != list(strategies):
+            logger.debug(f"按点击策略缓存调整尝试顺序: {key} -> {ordered}")
+        return ordered
+
+    def record(self, key: str, strategy: str, success: bool):
+        """
+        记录一次策略尝试结果（只更新进程内缓存，由flush批量写回磁盘）
+
+        Args:
+            key: 缓存键
+            strategy: 策略名称
+            success: 是否成功
+        """
+        if not self.enabled():
+            return
+
+        with self._lock:
+            entries = self._load()
+            entry = entries.setdefault(key, {"last_success": None, "strategies": {}})
+            record = entry["strategies"].setdefault(strategy, {"success": 0, "failure": 0, "consecutive_failures": 0})
+            if success:
+                record["success"] += 1
+                record["consecutive_failures"] = 0
+                entry["last_success"] = strategy
+            else:
+                record["failure"] += 1
+                record["consecutive_failures"] += 1
+                if entry["last_success"] == strategy:
+                    entry["last_success"] = None
+            self._dirty.add(key)
+
+    def flush(self):
+        """把本进程修改过的条目与磁盘文件合并后原子写回（其它进程写入的键保持不变）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = self._read_file()
+            for key in self._dirty:
+                entries[key] = self._entries[key]
+            self._dirty.clear()
+            self._write_file(entries)
+
+    def stats(self, key: str) -> Dict[str, Any]:
+        """
+        获取缓存键的策略统计
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            {last_success, strategies: {名称: {success, failure, consecutive_failures}}}
+        """
+        with self._lock:
+            return json.loads(json.dumps(self._load().get(key, {})))
+
+    def clear(self):
+        """清空进程内缓存和磁盘缓存"""
+        with self._lock:
+            self._entries = {}
+            self._dirty.clear()
+            try:
+                self.cache_file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """首次使用时读取磁盘缓存"""
+        if self._entries is None:
+            self._entries = self._read_file()
+        return self._entries
+
+    def _write_file(self, entries: Dict[str, Dict[str, Any]]):
+        """原子写入磁盘缓存文件"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"写入点击策略缓存文件失败: {e}")
+
+    def _read_file(self) -> Dict[str, Dict[str, Any]]:
+        """读取磁盘缓存文件"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"读取点击策略缓存文件失败: {e}")
+            return {}
+
+
+# 全局点击策略缓存实例
+click_strategy_cache = ClickStrategyCache()
+# 未显式flush时（如脚本直接运行页面对象），进程退出前写回
+atexit.register(click_strategy_cache.flush)
@@ -3,6 +3,11 @@ WebDriver管理器
 负责创建和管理不同浏览器的WebDriver实例
 """
 import os
+import atexit
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -14,15 +19,84 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager, IEDriverManager
 from loguru import logger
 from config.config_manager import config
+from utils.page_load_metrics import page_load_metrics
+
+# 关闭CSS动画、过渡和平滑滚动的样式（在每个新文档创建时注入）
+_DISABLE_ANIMATIONS_SCRIPT = """
+    (function () {
+        var style = document.createElement('style');
+        style.textContent = '*, *::before, *::after { animation: none !important; ' +
+            'transition: none !important; scroll-behavior: auto !important; caret-color: auto !important; }';
+        (document.head || document.documentElement).appendChild(style);
+    })();
+"""
+
+# 驱动被归还会话池或关闭时调用的清理回调（清除按驱动缓存的页面对象等状态）
+_driver_release_callbacks: List[Callable] = []
+
+
+def on_driver_release(callback: Callable) -> Callable:
+    """
+    注册驱动释放回调：驱动归还会话池、被回收或关闭时以驱动为参数调用
+
+    Args:
+        callback: 回调函数 callback(driver)
+
+    Returns:
+        回调函数本身（可用作装饰器）
+    """
+    if callback not in _driver_release_callbacks:
+        _driver_release_callbacks.append(callback)
+    return callback
+
+
+def notify_driver_released(driver):
+    """
+    调用所有驱动释放回调（单个回调出错不影响其它回调）
+
+    Args:
+        driver: 被释放的WebDriver实例
+    """
+    for callback in list(_driver_release_callbacks):
+        try:
+            callback(driver)
+        except Exception as e:
+            logger.debug(f"驱动释放回调执行失败: {e}")
 
 
 class DriverManager:
     """WebDriver管理器类"""
     
-    def __init__(self):
-        """初始化DriverManager"""
+    def __init__(self, profile: str = None):
+        """
+        初始化DriverManager
+
+        Args:
+            profile: 浏览器配置档（如 "fast"），None时使用环境变量 BROWSER_PROFILE 或配置 browser.profile
+        """
         self.driver = None
-        self.browser_config = config.browser_config
+        self.profile = self.resolve_profile(profile)
+        self.browser_config = dict(config.browser_config)
+        # 配置档只作用于Chrome：其中的设置覆盖 browser 中的同名设置，Edge仍使用 browser 配置
+        self.chrome_config = {**self.browser_config, **config.browser_profiles_config.get(self.profile, {})}
+
+    @staticmethod
+    def resolve_profile(profile: str = None) -> str:
+        """
+        确定使用的浏览器配置档（参数优先，其次环境变量 BROWSER_PROFILE，最后配置 browser.profile）
+
+        Args:
+            profile: 指定的配置档
+
+        Returns:
+            配置档名称，未定义的配置档回退到 "standard"
+        """
+        profile = profile or os.environ.get('BROWSER_PROFILE') or config.browser_config.get('profile', 'standard')
+        profile = profile.strip().lower()
+        if profile != 'standard' and profile not in config.browser_profiles_config:
+            logger.warning(f"未定义的浏览器配置档: {profile}，使用standard")
+            return 'standard'
+        return profile
     
     def create_chrome_driver(self, headless: bool = None) -> webdriver.Chrome:
         """
@@ -41,12 +115,14 @@ class DriverManager:
         
         # 设置无头模式
         if headless is None:
-            headless = self.browser_config.get('headless', False)
+            headless = self.chrome_config.get('headless', False)
         if headless:
-            chrome_options.add_argument('--headless')
+            headless_mode = self.chrome_config.get('headless_mode')
+            chrome_options.add_argument(f'--headless={headless_mode}' if headless_mode else '--headless')
         
         # 基本选项
-        chrome_options.add_argument('--start-maximized')
+        if not headless:
+            chrome_options.add_argument('--start-maximized')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--no-sandbox')
@@ -75,8 +151,17 @@ class DriverManager:
         chrome_options.add_argument('--enable-features=NetworkService,NetworkServiceLogging')
         
         # 设置窗口大小
-        window_size = self.browser_config.get('window_size', '1920,1080')
+        window_size = self.chrome_config.get('window_size', '1920,1080')
         chrome_options.add_argument(f'--window-size={window_size}')
+
+        # 配置档的加载优化：页面加载策略、禁用图片和动画
+        chrome_options.page_load_strategy = self.chrome_config.get('page_load_strategy', 'normal')
+        if self.chrome_config.get('disable_images', False):
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2})
+        if self.chrome_config.get('disable_animations', False):
+            chrome_options.add_argument('--force-prefers-reduced-motion')
         
         # 禁用自动化检测
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -99,10 +184,12 @@ class DriverManager:
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             # 设置超时
-            self._set_timeouts(driver)
+            self._set_timeouts(driver, self.chrome_config)
+            self._apply_cdp_profile(driver)
+            page_load_metrics.instrument_driver(driver, self.profile)
             
             self.driver = driver
-            logger.info("Chrome浏览器驱动创建成功")
+            logger.info(f"Chrome浏览器驱动创建成功 (配置档: {self.profile})")
             return driver
             
         except Exception as e:
@@ -288,31 +375,53 @@ class DriverManager:
         else:
             raise ValueError(f"不支持的浏览器类型: {browser_name}")
     
-    def _set_timeouts(self, driver):
+    def _set_timeouts(self, driver, browser_config: Dict = None):
         """
         设置WebDriver超时时间
 
         Args:
             driver: WebDriver实例
+            browser_config: 浏览器设置，None时使用 browser 配置
         """
+        browser_config = browser_config or self.browser_config
         # 隐式等待
-        implicit_wait = self.browser_config.get('implicit_wait', 15)  # 增加到15秒
+        implicit_wait = browser_config.get('implicit_wait', 15)  # 增加到15秒
         driver.implicitly_wait(implicit_wait)
 
         # 页面加载超时 - 增加到60秒以应对网络问题
-        page_load_timeout = self.browser_config.get('page_load_timeout', 60)
+        page_load_timeout = browser_config.get('page_load_timeout', 60)
         driver.set_page_load_timeout(page_load_timeout)
 
         # 脚本执行超时 - 增加到45秒
-        script_timeout = self.browser_config.get('script_timeout', 45)
+        script_timeout = browser_config.get('script_timeout', 45)
         driver.set_script_timeout(script_timeout)
 
         logger.info(f"设置超时时间 - 隐式等待: {implicit_wait}s, 页面加载: {page_load_timeout}s, 脚本执行: {script_timeout}s")
     
+    def _apply_cdp_profile(self, driver):
+        """
+        通过CDP应用配置档设置：屏蔽统计和广告请求、在每个新文档中关闭CSS动画
+
+        Args:
+            driver: Chromium内核的WebDriver实例
+        """
+        blocked_urls = self.chrome_config.get('blocked_urls') or []
+        try:
+            if blocked_urls:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(blocked_urls)})
+                logger.info(f"已屏蔽 {len(blocked_urls)} 个统计/广告地址模式")
+            if self.chrome_config.get('disable_animations', False):
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                       {'source': _DISABLE_ANIMATIONS_SCRIPT})
+        except Exception as e:
+            logger.warning(f"应用浏览器配置档 {self.profile} 的CDP设置失败: {e}")
+
     def quit_driver(self):
         """关闭浏览器驱动"""
         if self.driver:
             logger.info("正在关闭浏览器驱动...")
+            notify_driver_released(self.driver)
             try:
                 self.driver.quit()
                 logger.info("浏览器驱动已关闭")
@@ -324,3 +433,296 @@ class DriverManager:
     def get_driver(self):
         """获取当前驱动实例"""
         return self.driver
+
+
+class DriverPool:
+    """
+    WebDriver会话池
+
+    在后台预启动若干浏览器实例，通过 acquire()/release() 复用同一个浏览器会话。
+    归还驱动时清理cookies、localStorage、sessionStorage并重置当前URL，
+    而不是关闭后重新启动浏览器；驱动达到最大复用次数或不健康时会被回收并补充新实例。
+    """
+
+    def __init__(self, browser_name: str = None, size: int = None, max_uses: int = None,
+                 headless: bool = None, prelaunch: bool = None):
+        """
+        初始化会话池
+
+        Args:
+            browser_name: 浏览器名称，None时使用配置文件中的默认浏览器
+            size: 池中驱动数量上限，None时使用环境变量 DRIVER_POOL_SIZE 或配置文件设置
+            max_uses: 单个驱动最多复用次数，None时使用配置文件设置
+            headless: 是否无头模式，None时使用配置文件设置
+            prelaunch: 是否在后台预启动驱动，None时使用配置文件设置
+        """
+        pool_config = config.driver_pool_config
+        if browser_name is None:
+            browser_name = config.browser_config.get('default', 'chrome')
+
+        self.browser_name = browser_name.lower()
+        if size is None:
+            size = int(os.environ.get('DRIVER_POOL_SIZE') or pool_config.get('size', 2))
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses if max_uses is not None else pool_config.get('max_uses', 20))
+        self.headless = headless
+        self.acquire_timeout = pool_config.get('acquire_timeout', 120)
+        self.blank_url = pool_config.get('blank_url', 'about:blank')
+
+        self._condition = threading.Condition()
+        self._idle = deque()
+        self._managers: Dict[int, DriverManager] = {}
+        self._uses: Dict[int, int] = {}
+        self._in_use = set()
+        self._total = 0  # 已创建 + 正在启动的驱动数量
+        self._closed = False
+
+        if prelaunch is None:
+            prelaunch = pool_config.get('prelaunch', True)
+        if prelaunch:
+            for _ in range(self.size):
+                self._launch_in_background()
+
+    def acquire(self, timeout: float = None) -> webdriver.Remote:
+        """
+        从池中获取一个干净的驱动
+
+        Args:
+            timeout: 最长等待时间（秒），None时使用配置文件设置
+
+        Returns:
+            WebDriver实例
+
+        Raises:
+            TimeoutError: 等待超时仍未获得可用驱动
+        """
+        if timeout is None:
+            timeout = self.acquire_timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            driver = None
+            launch_now = False
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"{self.browser_name} 会话池已关闭")
+                    if self._idle:
+                        driver = self._idle.popleft()
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        launch_now = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"等待 {self.browser_name} 会话池驱动超时 ({timeout}s)")
+                    self._condition.wait(remaining)
+
+            if launch_now:
+                driver = self._launch()
+            elif not self._is_healthy(driver):
+                logger.warning(f"{self.browser_name} 池中驱动不健康，回收后重新获取")
+                self._discard(driver)
+                continue
+
+            with self._condition:
+                self._in_use.add(id(driver))
+            logger.info(f"从会话池获取 {self.browser_name} 驱动 (已使用 {self._uses.get(id(driver), 0)} 次)")
+            return driver
+
+    def release(self, driver, discard: bool = False):
+        """
+        归还驱动到池中
+
+        Args:
+            driver: 通过 acquire() 获取的WebDriver实例
+            discard: 是否直接回收该驱动（例如用例失败后浏览器状态不可信）
+        """
+        if driver is None:
+            return
+
+        key = id(driver)
+        with self._condition:
+            if key not in self._in_use:
+                logger.warning("归还的驱动不属于当前会话池，忽略")
+                return
+            self._in_use.discard(key)
+            self._uses[key] = self._uses.get(key, 0) + 1
+            uses = self._uses[key]
+            closed = self._closed
+
+        # 下一个用例拿到的驱动不带上一个用例缓存的页面对象等状态
+        notify_driver_released(driver)
+
+        if closed or discard or uses >= self.max_uses or not self._reset(driver):
+            if not closed and uses >= self.max_uses:
+                logger.info(f"{self.browser_name} 驱动已复用 {uses} 次，回收并重新启动")
+            self._discard(driver)
+            if not closed:
+                self._launch_in_background()
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+        logger.info(f"{self.browser_name} 驱动已归还会话池")
+
+    def shutdown(self):
+        """关闭会话池中的所有驱动"""
+        with self._condition:
+            self._closed = True
+            managers = list(self._managers.values())
+            self._idle.clear()
+            self._managers.clear()
+            self._uses.clear()
+            self._in_use.clear()
+            self._total = 0
+            self._condition.notify_all()
+
+        for manager in managers:
+            manager.quit_driver()
+        if managers:
+            logger.info(f"{self.browser_name} 会话池已关闭，共关闭 {len(managers)} 个驱动")
+
+    def _launch(self):
+        """启动一个新驱动（调用前需已占用 _total 名额）"""
+        manager = DriverManager()
+        try:
+            driver = manager.create_driver(self.browser_name, self.headless)
+        except Exception:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            if self._closed:
+                self._total = max(0, self._total - 1)
+                closed = True
+            else:
+                self._managers[id(driver)] = manager
+                self._uses[id(driver)] = 0
+                closed = False
+        if closed:
+            manager.quit_driver()
+            raise RuntimeError(f"{self.browser_name} 会话池已关闭")
+        return driver
+
+    def _launch_in_background(self):
+        """在后台线程中启动一个驱动并放入空闲队列"""
+        with self._condition:
+            if self._closed or self._total >= self.size:
+                return
+            self._total += 1
+
+        def worker():
+            try:
+                driver = self._launch()
+            except Exception as e:
+                logger.error(f"后台预启动 {self.browser_name} 驱动失败: {e}")
+                return
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+            logger.info(f"后台预启动 {self.browser_name} 驱动完成")
+
+        threading.Thread(target=worker, name=f"DriverPool-{self.browser_name}", daemon=True).start()
+
+    def _reset(self, driver) -> bool:
+        """
+        重置驱动状态：关闭多余窗口、清理cookies和存储、回到空白页
+
+        Returns:
+            重置是否成功
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            try:
+                # Chromium内核可一次性清除所有域名的cookies
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get(self.blank_url)
+            return True
+        except Exception as e:
+            logger.warning(f"重置 {self.browser_name} 驱动失败: {e}")
+            return False
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        """检查驱动会话是否仍然可用"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        """关闭并移除驱动"""
+        with self._condition:
+            manager = self._managers.pop(id(driver), None)
+            self._uses.pop(id(driver), None)
+            self._in_use.discard(id(driver))
+            if manager is not None:
+                self._total = max(0, self._total - 1)
+            self._condition.notify()
+
+        if manager is not None:
+            manager.quit_driver()
+
+
+# 每种浏览器一个进程级会话池
+_driver_pools: Dict[str, DriverPool] = {}
+_driver_pools_lock = threading.Lock()
+
+
+def driver_pool_enabled() -> bool:
+    """判断是否启用WebDriver会话池（环境变量 DRIVER_POOL 优先于配置文件）"""
+    env_value = os.environ.get('DRIVER_POOL')
+    if env_value is not None:
+        return env_value.lower() in ('1', 'true', 'yes', 'on')
+    return bool(config.driver_pool_config.get('enabled', False))
+
+
+def get_driver_pool(browser_name: str = None) -> DriverPool:
+    """
+    获取指定浏览器的共享会话池，不存在时创建
+
+    Args:
+        browser_name: 浏览器名称，None时使用配置文件中的默认浏览器
+
+    Returns:
+        DriverPool实例
+    """
+    if browser_name is None:
+        browser_name = config.browser_config.get('default', 'chrome')
+    key = browser_name.lower()
+
+    with _driver_pools_lock:
+        pool = _driver_pools.get(key)
+        if pool is None:
+            pool = DriverPool(key)
+            _driver_pools[key] = pool
+        return pool
+
+
+def shutdown_driver_pools():
+    """关闭所有共享会话池"""
+    with _driver_pools_lock:
+        pools = list(_driver_pools.values())
+        _driver_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_driver_pools)
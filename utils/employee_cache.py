@@ -0,0 +1,186 @@
+"""
+员工姓名查询缓存
+按 站点地址 + 登录账号 + 搜索关键词 缓存员工API返回的姓名列表以及已验证可选/不可选的姓名，
+进程内LRU缓存与磁盘JSON文件共享，重复运行和并行进程都可以跳过姓名探测阶段
+"""
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from config.config_manager import config
+
+
+class EmployeeNameCache:
+    """员工姓名查询缓存类"""
+
+    def __init__(self, cache_file: str = None, ttl: int = None, max_entries: int = None):
+        """
+        初始化员工姓名缓存
+
+        Args:
+            cache_file: 磁盘缓存文件，None时使用配置 employee_cache.file
+            ttl: 缓存有效期（秒），None时使用配置 employee_cache.ttl
+            max_entries: 最多保留的查询条目数（按最近使用淘汰），None时使用配置 employee_cache.max_entries
+        """
+        cache_config = config.employee_cache_config
+        self.cache_file = Path(cache_file or cache_config.get('file', '.cache/employee_names.json'))
+        self.ttl = ttl if ttl is not None else cache_config.get('ttl', 3600)
+        self.max_entries = max_entries if max_entries is not None else cache_config.get('max_entries', 50)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用员工姓名缓存（环境变量 EMPLOYEE_CACHE 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("EMPLOYEE_CACHE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.employee_cache_config.get('enabled', False))
+
+    @staticmethod
+    def key(base_url: str, account: str, query: str) -> str:
+        """
+        生成缓存键
+
+        Args:
+            base_url: 站点地址
+            account: 登录账号
+            query: 搜索关键词
+
+        Returns:
+            缓存键
+        """
+        return f"{base_url.rstrip('/')}|{account}|{query}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        获取未过期的缓存条目（先查进程内缓存，再查磁盘）
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            条目副本 {names, valid, invalid, updated}，不存在或已过期时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._read_file().get(key)
+                if entry is not None:
+                    self._entries[key] = entry
+            if entry is None:
+                return None
+            if time.time() - entry.get("updated", 0) > self.ttl:
+                logger.info(f"员工姓名缓存已过期: {key}")
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            entry["accessed"] = time.time()
+            self._trim(self._entries)
+            return json.loads(json.dumps(entry))
+
+    def put_names(self, key: str, names: List[str]):
+        """
+        保存API返回的姓名列表（重新查询后之前的验证结果作废）
+
+        Args:
+            key: 缓存键
+            names: 员工姓名列表
+        """
+        now = time.time()
+        self._store(key, {"names": list(names), "valid": [], "invalid": [], "updated": now, "accessed": now})
+        logger.info(f"员工姓名已缓存: {key} ({len(names)}个)")
+
+    def mark_valid(self, key: str, name: str):
+        """
+        记录可选择的员工姓名
+
+        Args:
+            key: 缓存键
+            name: 员工姓名
+        """
+        self._mark(key, name, "valid", "invalid")
+
+    def mark_invalid(self, key: str, name: str):
+        """
+        记录无效（不可选择）的员工姓名
+
+        Args:
+            key: 缓存键
+            name: 员工姓名
+        """
+        self._mark(key, name, "invalid", "valid")
+
+    def clear(self):
+        """清空进程内缓存和磁盘缓存"""
+        with self._lock:
+            self._entries.clear()
+            try:
+                self.cache_file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _mark(self, key: str, name: str, add_to: str, remove_from: str):
+        """将姓名加入一个集合并从另一个集合移除"""
+        entry = self.get(key)
+        if entry is None:
+            return
+        if name in entry[remove_from]:
+            entry[remove_from].remove(name)
+        if name not in entry[add_to]:
+            entry[add_to].append(name)
+        self._store(key, entry)
+
+    def _store(self, key: str, entry: Dict[str, Any]):
+        """写入进程内缓存，并与磁盘文件合并后原子写回"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._trim(self._entries)
+
+            # 与磁盘中其它进程写入的条目合并，只同步本进程记录的访问时间
+            entries = self._read_file()
+            for cached_key, cached_entry in self._entries.items():
+                if cached_key in entries:
+                    entries[cached_key]["accessed"] = max(entries[cached_key].get("accessed", 0),
+                                                          cached_entry.get("accessed", 0))
+            entries[key] = entry
+            entries = OrderedDict(sorted(entries.items(), key=lambda item: item[1].get("accessed", 0)))
+            self._trim(entries)
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(temp_file, self.cache_file)
+            except Exception as e:
+                logger.warning(f"写入员工姓名缓存文件失败: {e}")
+
+    def _read_file(self) -> Dict[str, Dict[str, Any]]:
+        """读取磁盘缓存文件"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"读取员工姓名缓存文件失败: {e}")
+            return {}
+
+    def _trim(self, entries: "OrderedDict[str, Dict[str, Any]]"):
+        """按最近使用顺序淘汰超出数量的条目"""
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+# 全局员工姓名缓存实例
+employee_name_cache = EmployeeNameCache()
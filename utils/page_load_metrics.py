@@ -0,0 +1,232 @@
+"""
+页面加载耗时统计
+包装驱动的execute方法，按浏览器配置档和页面地址记录每次页面导航（driver.get）的耗时；
+耗时先在进程内累加，会话结束时由flush()在文件锁保护下一次性合并到磁盘JSON文件；
+各配置档的历史平均值用于计算fast等配置档相对基准配置档节省的页面加载时间
+"""
+import atexit
+import os
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+from loguru import logger
+from selenium.webdriver.remote.command import Command
+from config.config_manager import config
+
+# 等待其它进程释放文件锁的最长时间（秒），以及锁文件视为残留的存在时间（秒）
+LOCK_TIMEOUT = 10
+STALE_LOCK_AGE = 60
+
+
+class PageLoadMetrics:
+    """页面加载耗时统计类"""
+
+    def __init__(self, stats_file: str = None, baseline: str = None):
+        """
+        初始化页面加载耗时统计
+
+        Args:
+            stats_file: 历史耗时文件，None时使用配置 page_load_metrics.file
+            baseline: 计算节省时间的基准配置档，None时使用配置 page_load_metrics.baseline
+        """
+        metrics_config = config.page_load_metrics_config
+        self.stats_file = Path(stats_file or metrics_config.get('file', '.cache/page_load_times.json'))
+        self.baseline = baseline or metrics_config.get('baseline', 'standard')
+        self._loads: List[Dict[str, Any]] = []
+        self._history: Dict[str, Dict[str, Dict[str, float]]] = None
+        self._pending: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def page_key(url: str) -> str:
+        """
+        页面地址的统计键（去掉查询参数和锚点）
+
+        Args:
+            url: 页面地址
+
+        Returns:
+            统计键
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def instrument_driver(self, driver, profile: str):
+        """
+        包装驱动的execute方法，记录每次页面导航的耗时（同一驱动只包装一次）
+
+        Args:
+            driver: WebDriver实例
+            profile: 驱动使用的浏览器配置档
+        """
+        original_execute = getattr(driver, "execute", None)
+        if original_execute is None or getattr(driver, "_page_load_instrumented", False):
+            return
+
+        metrics = self
+
+        def execute(driver_command, params=None):
+            if driver_command != Command.GET:
+                return original_execute(driver_command, params)
+            start = time.perf_counter()
+            result = original_execute(driver_command, params)
+            metrics.record(profile, params.get('url', ''), time.perf_counter() - start)
+            return result
+
+        try:
+            driver.execute = execute
+            driver._page_load_instrumented = True
+        except AttributeError:
+            logger.debug("驱动不支持页面加载耗时统计，跳过包装")
+
+    def record(self, profile: str, url: str, seconds: float):
+        """
+        记录一次页面加载耗时（只累加到进程内，由flush合并写回磁盘）
+
+        Args:
+            profile: 浏览器配置档
+            url: 页面地址
+            seconds: 耗时（秒）
+        """
+        if url.startswith(('about:', 'data:')):
+            return
+        key = self.page_key(url)
+        with self._lock:
+            self._loads.append({'profile': profile, 'page': key, 'duration': seconds})
+            stats = self._pending.setdefault(profile, {}).setdefault(key, {'count': 0, 'total': 0.0})
+            stats['count'] += 1
+            stats['total'] += seconds
+
+    def flush(self):
+        """在文件锁保护下把本进程累加的耗时合并到磁盘上的最新统计后原子写回（保留其它进程写入的次数和耗时）"""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                with self._file_lock():
+                    history = self._merge(self._read_file(), self._pending)
+                    self._write_file(history)
+            except (OSError, TimeoutError) as e:
+                logger.warning(f"写入页面加载耗时文件失败: {e}")
+                return
+            self._history = history
+            self._pending = {}
+
+    def savings(self, profile: str) -> Dict[str, Any]:
+        """
+        计算本进程中某配置档相对基准配置档节省的页面加载时间
+
+        只统计基准配置档有历史记录的页面：节省时间 = 基准配置档该页面的平均耗时 - 本次耗时
+
+        Args:
+            profile: 浏览器配置档
+
+        Returns:
+            {loads: 本次加载次数, compared: 有基准可比较的次数, duration: 本次总耗时,
+             baseline_duration: 基准配置档同样页面的预计耗时, saved: 节省的时间}
+        """
+        with self._lock:
+            loads = [load for load in self._loads if load['profile'] == profile]
+            history = self._merge(self._load_history(), self._pending)
+            baseline = history.get(self.baseline, {})
+
+        compared = [load for load in loads if baseline.get(load['page'], {}).get('count')]
+        baseline_duration = sum(baseline[load['page']]['total'] / baseline[load['page']]['count']
+                                for load in compared)
+        duration = sum(load['duration'] for load in compared)
+        return {
+            'loads': len(loads),
+            'compared': len(compared),
+            'duration': round(sum(load['duration'] for load in loads), 3),
+            'baseline_duration': round(baseline_duration, 3),
+            'saved': round(baseline_duration - duration, 3),
+        }
+
+    def log_summary(self):
+        """输出本进程各配置档的页面加载耗时，以及相对基准配置档节省的时间"""
+        with self._lock:
+            profiles = sorted({load['profile'] for load in self._loads})
+        for profile in profiles:
+            stats = self.savings(profile)
+            message = f"页面加载耗时 [{profile}]: {stats['loads']}次, 共{stats['duration']:.2f}s"
+            if profile != self.baseline and stats['compared']:
+                message += (f", 与{self.baseline}配置档相比{stats['compared']}次加载节省 {stats['saved']:.2f}s "
+                            f"(基准 {stats['baseline_duration']:.2f}s)")
+            logger.info(message)
+
+    def reset(self):
+        """清空本进程的加载记录（不影响磁盘上的历史平均值）"""
+        with self._lock:
+            self._loads.clear()
+
+    def _load_history(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """首次使用时读取历史耗时文件"""
+        if self._history is None:
+            self._history = self._read_file()
+        return self._history
+
+    @staticmethod
+    def _merge(history: Dict[str, Dict[str, Dict[str, float]]],
+               pending: Dict[str, Dict[str, Dict[str, float]]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """把进程内累加的次数和耗时加到历史统计上（返回新的字典，不修改参数）"""
+        merged = json.loads(json.dumps(history))
+        for profile, pages in pending.items():
+            for key, delta in pages.items():
+                stats = merged.setdefault(profile, {}).setdefault(key, {'count': 0, 'total': 0.0})
+                stats['count'] += delta['count']
+                stats['total'] += delta['total']
+        return merged
+
+    @contextmanager
+    def _file_lock(self):
+        """跨进程文件锁：独占创建锁文件，超过STALE_LOCK_AGE的锁文件视为崩溃进程残留并删除"""
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = self.stats_file.with_name(f"{self.stats_file.name}.lock")
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_file.stat().st_mtime > STALE_LOCK_AGE:
+                        lock_file.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"等待文件锁超时: {lock_file}")
+                time.sleep(0.05)
+        try:
+            os.close(fd)
+            yield
+        finally:
+            lock_file.unlink(missing_ok=True)
+
+    def _write_file(self, history: Dict[str, Dict[str, Dict[str, float]]]):
+        """原子写入历史耗时文件"""
+        temp_file = self.stats_file.with_name(f"{self.stats_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False)
+        os.replace(temp_file, self.stats_file)
+
+    def _read_file(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """读取历史耗时文件"""
+        if not self.stats_file.exists():
+            return {}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"读取页面加载耗时文件失败: {e}")
+            return {}
+
+
+# 全局页面加载耗时统计实例
+page_load_metrics = PageLoadMetrics()
+# 未显式flush时（如脚本直接运行页面对象），进程退出前写回
+atexit.register(page_load_metrics.flush)
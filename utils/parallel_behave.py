@@ -0,0 +1,269 @@
+"""
+behave场景并行执行
+把feature文件中的场景和Scenario Outline的每个示例行分配到多个工作进程：每个工作进程是一个behave子进程，
+启用进程级WebDriver会话池（每个工作进程一个预热的驱动，在分配到的场景间复用），截图和结果写入工作进程专属目录，
+全部完成后把各工作进程的behave JSON结果合并为一份报告
+"""
+import os
+import sys
+import json
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+from loguru import logger
+
+# behave场景状态 -> 报告状态
+_REPORT_STATUS = {"passed": "PASSED", "skipped": "SKIPPED"}
+
+
+def collect_scenarios(paths: Sequence[str], tags: str = None) -> List[str]:
+    """
+    收集要执行的场景位置，Scenario Outline按示例行展开
+
+    Args:
+        paths: feature文件或目录
+        tags: behave标签表达式（如 "@claims and not @negative"），None时收集全部场景
+
+    Returns:
+        场景位置列表（"<feature文件>:<行号>"，可直接作为behave参数）
+    """
+    from behave.parser import parse_file
+    from behave.tag_expression import make_tag_expression
+
+    tag_expression = make_tag_expression(tags) if tags else None
+    feature_files = []
+    for path in paths:
+        path = Path(path)
+        feature_files.extend(sorted(path.rglob("*.feature")) if path.is_dir() else [path])
+
+    locations = []
+    for feature_file in feature_files:
+        feature = parse_file(str(feature_file))
+        if feature is None:
+            continue
+        for scenario in feature.walk_scenarios():
+            if tag_expression is not None and not tag_expression.check(scenario.effective_tags):
+                continue
+            locations.append(f"{feature_file}:{scenario.location.line}")
+    return locations
+
+
+def shard(locations: Sequence[str], workers: int) -> List[List[str]]:
+    """
+    把场景轮流分配给工作进程
+
+    Args:
+        locations: 场景位置列表
+        workers: 工作进程数量
+
+    Returns:
+        每个工作进程的场景位置列表（不含空列表）
+    """
+    shards = [list(locations[index::workers]) for index in range(max(1, workers))]
+    return [locations for locations in shards if locations]
+
+
+def merge_behave_results(json_paths: Sequence[Path], shards: Sequence[Sequence[str]] = None,
+                         since: float = 0) -> List[Dict[str, Any]]:
+    """
+    合并多个behave JSON结果：同一feature的场景合并到一起并按行号排序
+
+    Args:
+        json_paths: 各工作进程的behave JSON结果文件
+        shards: 与json_paths一一对应的、分配给各工作进程的场景位置，None时保留全部场景；
+            behave会把同一feature中未分配给该工作进程的场景记为skipped，合并时按此去掉
+        since: 忽略修改时间早于该时间戳的结果文件（以前的运行留下的）
+
+    Returns:
+        合并后的feature列表（behave JSON格式）
+    """
+    features: Dict[str, Dict[str, Any]] = {}
+    for index, json_path in enumerate(json_paths):
+        selected = {_location_key(location) for location in shards[index]} if shards is not None else None
+        try:
+            if os.path.getmtime(json_path) < since:
+                logger.warning(f"忽略以前运行留下的behave结果: {json_path}")
+                continue
+            with open(json_path, 'r', encoding='utf-8') as f:
+                worker_features = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取behave结果失败: {json_path}, {e}")
+            continue
+        for feature in worker_features:
+            merged = features.setdefault(feature['location'], dict(feature, elements=[]))
+            merged['elements'].extend(
+                element for element in feature.get('elements', [])
+                if selected is None or _location_key(element.get('location', '')) in selected
+            )
+
+    for feature in features.values():
+        feature['elements'].sort(key=lambda element: _line(element.get('location', '')))
+        statuses = {element.get('status') for element in feature['elements']}
+        feature['status'] = "failed" if statuses - {"passed", "skipped"} else (
+            "passed" if "passed" in statuses else "skipped")
+    return sorted(features.values(), key=lambda feature: feature['location'])
+
+
+def _line(location: str) -> int:
+    """从 "<文件>:<行号>" 中取出行号"""
+    try:
+        return int(location.rsplit(":", 1)[1])
+    except (IndexError, ValueError):
+        return 0
+
+
+def _location_key(location: str):
+    """场景位置的比较键（绝对路径, 行号）"""
+    filename = location.rsplit(":", 1)[0]
+    return os.path.normcase(os.path.abspath(filename)), _line(location)
+
+
+class ParallelBehaveRunner:
+    """behave场景并行执行器"""
+
+    def __init__(self, workers: int = None, report_dir: str = None, screenshot_dir: str = None,
+                 behave_args: Sequence[str] = ()):
+        """
+        初始化并行执行器
+
+        Args:
+            workers: 工作进程数量，None时使用CPU核数（最多4个）
+            report_dir: 报告目录，None时使用环境变量 REPORT_DIR 或 "reports"
+            screenshot_dir: 截图目录，None时使用环境变量 SCREENSHOT_DIR 或 "screenshots"
+            behave_args: 传给每个behave工作进程的额外参数
+        """
+        self.workers = max(1, workers or min(4, os.cpu_count() or 1))
+        self.report_dir = Path(report_dir or os.environ.get("REPORT_DIR", "reports"))
+        self.screenshot_dir = Path(screenshot_dir or os.environ.get("SCREENSHOT_DIR", "screenshots"))
+        self.behave_args = list(behave_args)
+
+    def run(self, paths: Sequence[str] = ("features",), tags: str = None) -> Dict[str, Any]:
+        """
+        并行执行场景并合并结果
+
+        Args:
+            paths: feature文件或目录
+            tags: behave标签表达式
+
+        Returns:
+            {exit_code, scenarios, missing, status_counts, duration, json_report, html_report}
+        """
+        locations = collect_scenarios(paths, tags)
+        shards = shard(locations, self.workers)
+        logger.info(f"共 {len(locations)} 个场景，分配到 {len(shards)} 个behave工作进程")
+
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        started_at = time.time()
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=len(shards) or 1) as executor:
+            worker_results = list(executor.map(self._run_worker, range(len(shards)), shards))
+        duration = time.monotonic() - start
+
+        # 留出1秒余量：文件系统记录的修改时间可能略早于time.time()
+        features = merge_behave_results([json_path for _, json_path in worker_results], shards,
+                                        since=started_at - 1)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        json_report = self.report_dir / f"behave_results_{timestamp}.json"
+        with open(json_report, 'w', encoding='utf-8') as f:
+            json.dump(features, f, ensure_ascii=False, indent=2)
+
+        # 工作进程崩溃或未写出JSON时，分配给它的场景不会出现在合并结果中，按失败统计
+        reported = {_location_key(element.get('location', ''))
+                    for feature in features for element in feature['elements']}
+        missing = [location for location in locations if _location_key(location) not in reported]
+        if missing:
+            logger.warning(f"{len(missing)} 个场景没有执行结果，按失败统计: {missing}")
+        html_report = self._write_report(features, missing)
+
+        status_counts: Dict[str, int] = {}
+        for feature in features:
+            for element in feature['elements']:
+                status_counts[element.get('status')] = status_counts.get(element.get('status'), 0) + 1
+        if missing:
+            status_counts['failed'] = status_counts.get('failed', 0) + len(missing)
+        # 取第一个非0退出码：退出码是进程状态而不是严重程度，负数（被信号终止）不能被max忽略
+        exit_code = next((returncode for returncode, _ in worker_results if returncode != 0), 0)
+        if missing and exit_code == 0:
+            exit_code = 1
+        logger.info(f"并行执行完成: {status_counts}, 耗时 {duration:.1f}s, 合并结果: {json_report}")
+        return {
+            'exit_code': exit_code,
+            'scenarios': len(locations),
+            'missing': missing,
+            'status_counts': status_counts,
+            'duration': round(duration, 3),
+            'json_report': str(json_report),
+            'html_report': html_report,
+        }
+
+    def worker_env(self, worker: str) -> Dict[str, str]:
+        """
+        工作进程的环境变量：专属截图/报告目录，并启用单驱动会话池
+
+        Args:
+            worker: 工作进程ID（如 "bw0"）
+
+        Returns:
+            环境变量字典
+        """
+        env = dict(os.environ)
+        env["BEHAVE_WORKER"] = worker
+        env["SCREENSHOT_DIR"] = str(self.screenshot_dir / worker)
+        env["REPORT_DIR"] = str(self.report_dir / worker)
+        # 每个工作进程同一时间只执行一个场景，预热一个驱动并在场景间复用（显式设置时以其为准）
+        env.setdefault("DRIVER_POOL", "true")
+        env.setdefault("DRIVER_POOL_SIZE", "1")
+        return env
+
+    def _run_worker(self, index: int, locations: List[str]):
+        """
+        在behave子进程中执行分配到的场景
+
+        Returns:
+            (退出码, behave JSON结果文件)
+        """
+        worker = f"bw{index}"
+        env = self.worker_env(worker)
+        Path(env["REPORT_DIR"]).mkdir(parents=True, exist_ok=True)
+        Path(env["SCREENSHOT_DIR"]).mkdir(parents=True, exist_ok=True)
+        json_path = Path(env["REPORT_DIR"]) / "behave_results.json"
+        # 删除上次运行的结果，工作进程没有写出JSON时不会把旧结果当作本次结果
+        json_path.unlink(missing_ok=True)
+
+        command = [sys.executable, "-m", "behave", *self.behave_args,
+                   "-f", "json", "-o", str(json_path), "-f", "progress", *locations]
+        logger.info(f"工作进程 {worker} 执行 {len(locations)} 个场景: {locations}")
+        completed = subprocess.run(command, env=env, capture_output=True, text=True,
+                                   encoding='utf-8', errors='replace')
+        if completed.returncode != 0:
+            logger.warning(f"工作进程 {worker} 退出码 {completed.returncode}\n{completed.stdout[-2000:]}"
+                           f"{completed.stderr[-2000:]}")
+        return completed.returncode, json_path
+
+    def _write_report(self, features: List[Dict[str, Any]], missing: Sequence[str] = ()) -> str:
+        """把合并后的场景结果写入HTML测试报告，没有执行结果的场景记为失败"""
+        from utils.report_manager import ReportManager
+
+        manager = ReportManager(report_dir=str(self.report_dir))
+        manager.start_test_session()
+        for feature in features:
+            for element in feature['elements']:
+                steps = element.get('steps', [])
+                results = [step.get('result', {}) for step in steps]
+                error_message = next((result.get('error_message') for result in results
+                                      if result.get('status') == "failed"), None)
+                if isinstance(error_message, list):
+                    error_message = "\n".join(error_message)
+                manager.add_test_result(
+                    f"{feature['name']} / {element['name']}",
+                    _REPORT_STATUS.get(element.get('status'), "FAILED"),
+                    sum(result.get('duration', 0) for result in results),
+                    error_message=error_message,
+                )
+        for location in missing:
+            manager.add_test_result(location, "FAILED", 0, error_message="工作进程没有输出该场景的执行结果")
+        manager.end_test_session()
+        return manager.generate_html_report()
@@ -8,6 +8,9 @@ import pytest
 from loguru import logger
 from utils.report_manager import report_manager
 from utils.screenshot_utils import screenshot_utils
+from utils.step_tracer import step_tracer
+from utils.screenshot_writer import flush_screenshots
+from utils.worker_isolation import is_xdist_controller
 
 
 class TestReportPlugin:
@@ -22,13 +25,21 @@ class TestReportPlugin:
     def pytest_sessionstart(self, session):
         """测试会话开始"""
         logger.info("=== 开始自动化测试会话 ===")
+        if is_xdist_controller(session.config):
+            # xdist主进程不执行用例，各工作进程的报告在conftest中合并
+            return
         report_manager.start_test_session()
     
     @pytest.hookimpl(trylast=True)
     def pytest_sessionfinish(self, session, exitstatus):
         """测试会话结束"""
+        if is_xdist_controller(session.config):
+            return
         report_manager.end_test_session()
         
+        # 等待异步截图全部写入磁盘
+        flush_screenshots()
+        
         # 生成报告
         html_report = report_manager.generate_html_report()
         json_report = report_manager.generate_json_report()
@@ -93,7 +104,8 @@ class TestReportPlugin:
                 status=status,
                 duration=duration,
                 error_message=error_message,
-                screenshots=screenshots
+                screenshots=screenshots,
+                slow_steps=step_tracer.top_steps() if step_tracer.active else None
             )
 
             logger.info(f"测试结果: {test_name} - {status} ({duration:.2f}s)")
@@ -115,7 +127,8 @@ class TestReportPlugin:
             
             if hasattr(item, "funcargs"):
                 # 查找driver夹具
-                for fixture_name in ["chrome_driver", "edge_driver", "browser_driver"]:
+                for fixture_name in ["chrome_driver", "edge_driver", "browser_driver",
+                                     "warm_chrome_driver", "warm_edge_driver"]:
                     if fixture_name in item.funcargs:
                         driver = item.funcargs[fixture_name]
                         browser_name = fixture_name.replace("_driver", "")
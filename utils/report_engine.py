@@ -0,0 +1,638 @@
+"""
+统一的HTML报告引擎
+Chrome/Edge运行器的详细报告和Claim流程报告共用同一套预编译模板；
+截图按步骤名从共享的截图索引中查找，生成报告的开销为 O(文件数 + 步骤数)
+"""
+import os
+import html
+from dataclasses import dataclass, field
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+
+
+@dataclass
+class ReportCase:
+    """
+    报告中的一个测试用例（或流程步骤）
+
+    description、details 和 expected 由调用方编写，允许包含HTML标记；
+    screenshot_steps 为要展示的截图步骤名，按顺序从截图索引中查找
+    """
+
+    title: str
+    case_id: str = ""
+    passed: bool = True
+    status: str = ""
+    description: str = ""
+    steps: List[str] = field(default_factory=list)
+    details_title: str = ""
+    details: List[str] = field(default_factory=list)
+    expected: str = ""
+    screenshot_steps: List[str] = field(default_factory=list)
+
+    @property
+    def status_text(self) -> str:
+        return self.status or ("✅ PASS" if self.passed else "❌ FAIL")
+
+
+_PAGE = Template("""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+        }
+        .header {
+            text-align: center;
+            border-bottom: 3px solid #007bff;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            color: #007bff;
+            margin: 0;
+            font-size: 2.5em;
+        }
+        .header .subtitle {
+            color: #666;
+            font-size: 1.2em;
+            margin-top: 10px;
+        }
+        .summary {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+        }
+        .summary h2 {
+            margin-top: 0;
+            color: white;
+        }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        .summary-item {
+            background: rgba(255,255,255,0.1);
+            padding: 15px;
+            border-radius: 5px;
+            text-align: center;
+        }
+        .summary-item .label {
+            font-size: 0.9em;
+            opacity: 0.8;
+        }
+        .summary-item .value {
+            font-size: 1.5em;
+            font-weight: bold;
+            margin-top: 5px;
+        }
+        .test-case {
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            margin-bottom: 25px;
+            overflow: hidden;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        .test-case-header {
+            background: #f8f9fa;
+            padding: 15px 20px;
+            border-bottom: 1px solid #ddd;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }
+        .test-case-title {
+            font-size: 1.3em;
+            font-weight: bold;
+            color: #333;
+        }
+        .test-case-id {
+            background: #007bff;
+            color: white;
+            padding: 5px 10px;
+            border-radius: 15px;
+            font-size: 0.9em;
+            margin-right: 8px;
+        }
+        .test-case-status {
+            font-size: 1.1em;
+            font-weight: bold;
+            white-space: nowrap;
+        }
+        .test-case-content {
+            padding: 20px;
+        }
+        .test-description {
+            background: #e3f2fd;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            border-left: 4px solid #2196f3;
+        }
+        .test-steps {
+            margin-bottom: 20px;
+        }
+        .test-steps h4 {
+            color: #333;
+            margin-bottom: 10px;
+        }
+        .test-steps .step-list {
+            padding-left: 0;
+            list-style: none;
+        }
+        .test-steps li {
+            margin-bottom: 8px;
+            padding: 8px;
+            background: #f8f9fa;
+            border-radius: 4px;
+        }
+        .expected-result {
+            background: #e8f5e8;
+            padding: 15px;
+            border-radius: 5px;
+            border-left: 4px solid #4caf50;
+            margin-bottom: 20px;
+        }
+        .expected-result h4 {
+            color: #2e7d32;
+            margin-top: 0;
+        }
+        .pass { color: #28a745; }
+        .fail { color: #dc3545; }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            color: #666;
+        }
+        .files-section {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+        }
+        .files-section h3 {
+            color: #333;
+            margin-top: 0;
+        }
+        .file-list {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 15px;
+        }
+        .file-item {
+            background: white;
+            padding: 15px;
+            border-radius: 5px;
+            border: 1px solid #ddd;
+        }
+        .file-item .file-type {
+            color: #007bff;
+            font-weight: bold;
+            font-size: 0.9em;
+        }
+        .file-item .file-count {
+            font-size: 1.2em;
+            font-weight: bold;
+            color: #333;
+        }
+        .screenshots-section {
+            margin-top: 20px;
+            padding: 15px;
+            background: #f8f9fa;
+            border-radius: 5px;
+            border-left: 4px solid #17a2b8;
+        }
+        .screenshots-section h4 {
+            color: #17a2b8;
+            margin-top: 0;
+            margin-bottom: 15px;
+        }
+        .screenshot-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        .screenshot-item {
+            background: white;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            overflow: hidden;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .screenshot-item img {
+            width: 100%;
+            height: 200px;
+            object-fit: cover;
+            border-bottom: 1px solid #ddd;
+            cursor: pointer;
+        }
+        .screenshot-item .screenshot-info {
+            padding: 10px;
+        }
+        .screenshot-item .screenshot-title {
+            font-weight: bold;
+            color: #333;
+            margin-bottom: 5px;
+        }
+        .screenshot-path {
+            font-size: 0.85em;
+            color: #666;
+            word-break: break-all;
+        }
+        .screenshot-placeholder {
+            width: 100%;
+            height: 200px;
+            background: #f0f0f0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            flex-direction: column;
+            color: #999;
+            font-size: 0.9em;
+            border-bottom: 1px solid #ddd;
+        }
+        .screenshot-info-only {
+            background: #e3f2fd;
+            padding: 15px;
+            border-radius: 5px;
+            border-left: 4px solid #2196f3;
+            margin-top: 15px;
+        }
+        .screenshot-info-only h5 {
+            color: #1976d2;
+            margin-top: 0;
+            margin-bottom: 10px;
+        }
+        .screenshot-list {
+            list-style: none;
+            padding: 0;
+            margin: 0;
+        }
+        .screenshot-list li {
+            padding: 8px 0;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .screenshot-list li:last-child {
+            border-bottom: none;
+        }
+        .screenshot-name {
+            font-weight: 500;
+            color: #333;
+        }
+        .screenshot-status {
+            font-size: 0.85em;
+            padding: 2px 8px;
+            border-radius: 12px;
+            background: #e8f5e8;
+            color: #2e7d32;
+        }
+        .notes {
+            text-align: left;
+            margin: 20px 0;
+        }
+        .notes-error {
+            background-color: #f8d7da;
+            color: #721c24;
+            padding: 15px;
+            border-radius: 5px;
+        }
+        .notes-warning {
+            background-color: #fff3cd;
+            color: #856404;
+            padding: 15px;
+            border-radius: 5px;
+        }
+        .slow-steps {
+            margin: 10px auto;
+            border-collapse: collapse;
+            text-align: left;
+        }
+        .slow-steps th, .slow-steps td {
+            border: 1px solid #ddd;
+            padding: 6px 10px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>$heading</h1>
+$subtitles
+        </div>
+
+        <div class="summary">
+            <h2>📊 测试执行总结</h2>
+            <div class="summary-grid">
+$summary_items
+            </div>
+        </div>
+$files_section
+        <h2>📋 $cases_heading</h2>
+$cases
+$notes
+        <div class="footer">
+$footer_lines
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+_SUBTITLE = Template("""            <div class="subtitle">$text</div>""")
+
+_SUMMARY_ITEM = Template("""                <div class="summary-item">
+                    <div class="label">$label</div>
+                    <div class="value">$value</div>
+                </div>""")
+
+_FILES_SECTION = Template("""
+        <div class="files-section">
+            <h3>📁 生成的测试文件</h3>
+            <div class="file-list">
+$items
+            </div>
+        </div>
+""")
+
+_FILE_ITEM = Template("""                <div class="file-item">
+                    <div class="file-type">$label</div>
+                    <div class="file-count">$value</div>
+                </div>""")
+
+_CASE = Template("""
+        <div class="test-case">
+            <div class="test-case-header">
+                <div>
+                    $case_id<span class="test-case-title">$title</span>
+                </div>
+                <div class="test-case-status $status_class">$status</div>
+            </div>
+            <div class="test-case-content">
+$body
+            </div>
+        </div>
+""")
+
+_DESCRIPTION = Template("""                <div class="test-description">
+                    <strong>测试描述:</strong> $description
+                </div>""")
+
+_STEPS = Template("""                <div class="test-steps">
+                    <h4>🔧 测试步骤:</h4>
+                    <ul class="step-list">
+$items
+                    </ul>
+                </div>""")
+
+_DETAILS = Template("""                <div class="expected-result">
+                    <h4>$title</h4>
+                    <p>$items</p>
+                </div>""")
+
+_EXPECTED = Template("""                <div class="expected-result">
+                    <h4>✅ 预期结果:</h4>
+                    <p>$expected</p>
+                </div>""")
+
+_SCREENSHOTS = Template("""                <div class="screenshots-section">
+                    <h4>📸 测试截图 ($count张)</h4>
+                    <div class="screenshot-grid">
+$items
+                    </div>
+                </div>""")
+
+_SCREENSHOT = Template("""                        <div class="screenshot-item">
+                            <img src="$src" alt="$title" loading="lazy" onclick="window.open(this.src)"
+                                 onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
+                            <div class="screenshot-placeholder" style="display:none;">
+                                📷 图片加载失败
+                                <small>请手动查看: $abs_path</small>
+                            </div>
+                            <div class="screenshot-info">
+                                <div class="screenshot-title">$title</div>
+                                <div class="screenshot-path">📁 $path ($size KB)</div>
+                            </div>
+                        </div>""")
+
+_MISSING_SCREENSHOTS = Template("""                <div class="screenshot-info-only">
+                    <h5>📸 截图信息</h5>
+                    <p>该测试用例的截图将在测试执行时自动生成，保存在以下位置：</p>
+                    <div class="screenshot-path"><strong>截图目录:</strong> $screenshot_dir</div>
+                    <ul class="screenshot-list">
+$items
+                    </ul>
+                    <p><strong>💡 截图查看说明:</strong></p>
+                    <ul>
+                        <li>运行 <code>$rerun_command</code> 生成实际截图</li>
+                        <li>截图保存在 <code>$screenshot_dir</code> 目录下</li>
+                        <li>支持的格式: PNG, JPG, JPEG</li>
+                    </ul>
+                </div>""")
+
+_MISSING_ITEM = Template("""                        <li><span class="screenshot-name">📷 $name</span> <span class="screenshot-status">待生成</span></li>""")
+
+_NOTES = Template("""
+        <div class="notes $css_class">
+            <h4>$title</h4>
+            <ul>
+$items
+            </ul>
+        </div>
+""")
+
+_SLOW_STEPS = Template("""
+        <div class="notes">
+            <h4>⏱️ 最慢步骤 Top $count</h4>
+            <table class="slow-steps">
+                <tr><th>步骤</th><th>耗时</th><th>WebDriver命令数</th><th>命令耗时</th><th>sleep耗时</th></tr>
+$rows
+            </table>
+        </div>
+""")
+
+_SLOW_STEP_ROW = Template("""                <tr><td>$name</td><td>${duration}s</td><td>$commands</td><td>${command_time}s</td><td>${sleep_time}s</td></tr>""")
+
+
+class ReportEngine:
+    """HTML报告渲染引擎类"""
+
+    def __init__(self, report_dir=None):
+        """
+        初始化报告引擎
+
+        Args:
+            report_dir: 报告保存目录，None时使用环境变量 REPORT_DIR 或 "reports"
+        """
+        if report_dir is None:
+            report_dir = os.environ.get("REPORT_DIR", "reports")
+        self.report_dir = Path(report_dir)
+
+    def render(self, title: str, cases: Sequence[ReportCase], screenshots: Dict[str, Dict] = None,
+               heading: str = None, subtitles: Sequence[str] = (), summary: Sequence[Tuple[str, str]] = None,
+               files: Sequence[Tuple[str, str]] = (), cases_heading: str = "详细测试用例",
+               notes: Sequence[Tuple[str, Sequence[str], str]] = (), slow_steps: List[Dict] = None,
+               footer_lines: Sequence[str] = (), screenshot_dir=None, rerun_command: str = "") -> str:
+        """
+        渲染HTML报告
+
+        Args:
+            title: 页面标题
+            cases: 测试用例列表
+            screenshots: 截图索引（步骤名 -> 文件信息），见 utils.screenshot_index
+            heading: 报告大标题，None时使用title
+            subtitles: 标题下方的说明行
+            summary: 总结卡片 (标签, 值)，None时按用例状态统计
+            files: 生成文件卡片 (标签, 值)
+            cases_heading: 用例列表标题
+            notes: 附加列表 (标题, 条目, 样式: ""/"notes-error"/"notes-warning")，条目会被转义
+            slow_steps: 最慢步骤（来自耗时追踪器）
+            footer_lines: 页脚文字
+            screenshot_dir: 截图目录，用于未找到截图时的提示
+            rerun_command: 未找到截图时提示的重新运行命令
+
+        Returns:
+            HTML内容字符串
+        """
+        screenshots = screenshots or {}
+        if summary is None:
+            passed = sum(1 for case in cases if case.passed)
+            summary = [("测试用例总数", str(len(cases))), ("通过用例", str(passed)),
+                       ("失败用例", str(len(cases) - passed))]
+
+        return _PAGE.substitute(
+            title=html.escape(title),
+            heading=heading or html.escape(title),
+            subtitles="\n".join(_SUBTITLE.substitute(text=text) for text in subtitles),
+            summary_items="\n".join(_SUMMARY_ITEM.substitute(label=label, value=value) for label, value in summary),
+            files_section=_FILES_SECTION.substitute(
+                items="\n".join(_FILE_ITEM.substitute(label=label, value=value) for label, value in files)
+            ) if files else "",
+            cases_heading=cases_heading,
+            cases="".join(self._render_case(case, screenshots, screenshot_dir, rerun_command) for case in cases),
+            notes=self._render_notes(notes) + self._render_slow_steps(slow_steps),
+            footer_lines="\n".join(f"            <p>{line}</p>" for line in footer_lines),
+        )
+
+    def write(self, filename: str, **render_kwargs) -> Path:
+        """
+        渲染并保存报告
+
+        Args:
+            filename: 报告文件名（保存在报告目录下）
+            **render_kwargs: 传给 render() 的参数
+
+        Returns:
+            报告文件路径
+        """
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        report_path = self.report_dir / filename
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(self.render(**render_kwargs))
+        logger.info(f"HTML报告已生成: {report_path}")
+        return report_path
+
+    def _render_case(self, case: ReportCase, screenshots: Dict[str, Dict],
+                     screenshot_dir, rerun_command: str) -> str:
+        """渲染单个测试用例"""
+        body = []
+        if case.description:
+            body.append(_DESCRIPTION.substitute(description=case.description))
+        if case.steps:
+            body.append(_STEPS.substitute(
+                items="\n".join(f"                        <li>{step}</li>" for step in case.steps)))
+        if case.details:
+            body.append(_DETAILS.substitute(title=case.details_title, items="<br>\n".join(case.details)))
+        if case.expected:
+            body.append(_EXPECTED.substitute(expected=case.expected))
+        if case.screenshot_steps:
+            body.append(self._render_screenshots(case, screenshots, screenshot_dir, rerun_command))
+
+        return _CASE.substitute(
+            case_id=f'<span class="test-case-id">{case.case_id}</span>' if case.case_id else "",
+            title=case.title,
+            status_class="pass" if case.passed else "fail",
+            status=case.status_text,
+            body="\n".join(body),
+        )
+
+    def _render_screenshots(self, case: ReportCase, screenshots: Dict[str, Dict],
+                            screenshot_dir, rerun_command: str) -> str:
+        """渲染用例截图（按步骤名从索引中查找，图片按相对路径延迟加载）"""
+        found = [(step, screenshots[step]) for step in case.screenshot_steps if step in screenshots]
+        if not found:
+            screenshot_dir_abs = Path(screenshot_dir or ".").resolve()
+            return _MISSING_SCREENSHOTS.substitute(
+                screenshot_dir=html.escape(str(screenshot_dir_abs)),
+                rerun_command=html.escape(rerun_command),
+                items="\n".join(_MISSING_ITEM.substitute(name=html.escape(f"{step}.png"))
+                                for step in case.screenshot_steps),
+            )
+
+        items = []
+        for step, info in found:
+            path = Path(info['path'])
+            try:
+                src = Path(os.path.relpath(path, self.report_dir)).as_posix()
+            except ValueError:
+                src = path.resolve().as_uri()
+            items.append(_SCREENSHOT.substitute(
+                src=html.escape(src),
+                title=html.escape(step),
+                abs_path=html.escape(str(path.resolve())),
+                path=html.escape(path.as_posix()),
+                size=f"{info.get('size', 0) / 1024:.1f}",
+            ))
+        return _SCREENSHOTS.substitute(count=len(items), items="\n".join(items))
+
+    @staticmethod
+    def _render_notes(notes: Sequence[Tuple[str, Sequence[str], str]]) -> str:
+        """渲染附加列表（错误、警告、功能清单等）"""
+        return "".join(
+            _NOTES.substitute(
+                title=title,
+                css_class=css_class,
+                items="\n".join(f"                <li>{html.escape(str(item))}</li>" for item in items),
+            )
+            for title, items, css_class in notes if items
+        )
+
+    @staticmethod
+    def _render_slow_steps(slow_steps: Optional[List[Dict]]) -> str:
+        """渲染最慢步骤表格"""
+        if not slow_steps:
+            return ""
+        rows = "\n".join(
+            _SLOW_STEP_ROW.substitute(
+                name=html.escape(step['name']),
+                duration=f"{step['duration']:.3f}",
+                commands=step['commands'],
+                command_time=f"{step['command_time']:.3f}",
+                sleep_time=f"{step['sleep_time']:.3f}",
+            )
+            for step in slow_steps
+        )
+        return _SLOW_STEPS.substitute(count=len(slow_steps), rows=rows)
@@ -1,251 +1,134 @@
 """
 测试报告管理器
 负责生成和管理测试报告
+
+测试结果在到达时立即追加到NDJSON日志，并通过模板增量写入HTML报告，
+内存中只保留统计计数和最慢步骤；进程中途退出时已写入的部分报告仍然可以查看
 """
 import os
 import json
+import heapq
+import html
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from string import Template
+from typing import Dict, Iterator, List, Any
 from loguru import logger
 from config.config_manager import config
 
 
-class ReportManager:
-    """测试报告管理器类"""
-    
-    def __init__(self, report_dir: str = "reports"):
-        """
-        初始化报告管理器
-        
-        Args:
-            report_dir: 报告保存目录
-        """
-        self.report_dir = Path(report_dir)
-        self.report_config = config.report_config
-        self._ensure_directory_exists()
-        self.test_results = []
-        self.start_time = None
-        self.end_time = None
-    
-    def _ensure_directory_exists(self):
-        """确保报告目录存在"""
-        self.report_dir.mkdir(parents=True, exist_ok=True)
-    
-    def start_test_session(self):
-        """开始测试会话"""
-        self.start_time = datetime.now()
-        self.test_results = []
-        logger.info("测试会话开始")
-    
-    def end_test_session(self):
-        """结束测试会话"""
-        self.end_time = datetime.now()
-        logger.info("测试会话结束")
-    
-    def add_test_result(self, test_name: str, status: str, duration: float, 
-                       error_message: str = None, screenshots: List[str] = None):
-        """
-        添加测试结果
-        
-        Args:
-            test_name: 测试名称
-            status: 测试状态 (PASSED, FAILED, SKIPPED)
-            duration: 执行时间（秒）
-            error_message: 错误信息
-            screenshots: 截图文件列表
-        """
-        test_result = {
-            'name': test_name,
-            'status': status,
-            'duration': duration,
-            'timestamp': datetime.now().isoformat(),
-            'error_message': error_message,
-            'screenshots': screenshots or []
-        }
-        
-        self.test_results.append(test_result)
-        logger.info(f"添加测试结果: {test_name} - {status}")
-    
-    def generate_html_report(self) -> str:
-        """
-        生成HTML测试报告
-        
-        Returns:
-            报告文件路径
-        """
-        if not self.test_results:
-            logger.warning("没有测试结果，无法生成报告")
-            return None
-        
-        # 计算统计信息
-        stats = self._calculate_statistics()
-        
-        # 生成HTML内容
-        html_content = self._generate_html_content(stats)
-        
-        # 保存报告文件
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        report_filename = f"test_report_{timestamp}.html"
-        report_path = self.report_dir / report_filename
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"HTML报告已生成: {report_path}")
-        return str(report_path)
-    
-    def _calculate_statistics(self) -> Dict[str, Any]:
-        """
-        计算测试统计信息
-        
-        Returns:
-            统计信息字典
-        """
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r['status'] == 'PASSED'])
-        failed_tests = len([r for r in self.test_results if r['status'] == 'FAILED'])
-        skipped_tests = len([r for r in self.test_results if r['status'] == 'SKIPPED'])
-        
-        total_duration = sum(r['duration'] for r in self.test_results)
-        
-        pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        
-        return {
-            'total_tests': total_tests,
-            'passed_tests': passed_tests,
-            'failed_tests': failed_tests,
-            'skipped_tests': skipped_tests,
-            'pass_rate': round(pass_rate, 2),
-            'total_duration': round(total_duration, 2),
-            'start_time': self.start_time.strftime("%Y-%m-%d %H:%M:%S") if self.start_time else "未知",
-            'end_time': self.end_time.strftime("%Y-%m-%d %H:%M:%S") if self.end_time else "未知"
-        }
-    
-    def _generate_html_content(self, stats: Dict[str, Any]) -> str:
-        """
-        生成HTML报告内容
-        
-        Args:
-            stats: 统计信息
-            
-        Returns:
-            HTML内容字符串
-        """
-        title = self.report_config.get('title', '自动化测试报告')
-        description = self.report_config.get('description', '基础验证测试报告')
-        
-        html_template = f"""
-<!DOCTYPE html>
+# 报告页头：统计卡片由页面加载后的脚本根据已写入的测试条目计算，因此未完成的报告也能显示统计
+_PAGE_HEAD = Template("""<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>$title</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.9;
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 30px;
             background-color: #f8f9fa;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             text-align: center;
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #666;
             font-size: 0.9em;
-        }}
-        .passed {{ color: #28a745; }}
-        .failed {{ color: #dc3545; }}
-        .skipped {{ color: #ffc107; }}
-        .total {{ color: #007bff; }}
-        .results {{
+        }
+        .passed { color: #28a745; }
+        .failed { color: #dc3545; }
+        .skipped { color: #ffc107; }
+        .total { color: #007bff; }
+        .results {
             padding: 30px;
-        }}
-        .test-item {{
+        }
+        .test-item {
             border: 1px solid #ddd;
             border-radius: 8px;
             margin-bottom: 20px;
             overflow: hidden;
-        }}
-        .test-header {{
+        }
+        .test-header {
             padding: 15px 20px;
             background-color: #f8f9fa;
             border-bottom: 1px solid #ddd;
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .test-name {{
+        }
+        .test-name {
             font-weight: bold;
             font-size: 1.1em;
-        }}
-        .test-status {{
+        }
+        .test-status {
             padding: 5px 15px;
             border-radius: 20px;
             color: white;
             font-size: 0.9em;
-        }}
-        .status-passed {{ background-color: #28a745; }}
-        .status-failed {{ background-color: #dc3545; }}
-        .status-skipped {{ background-color: #ffc107; }}
-        .test-details {{
+        }
+        .status-passed { background-color: #28a745; }
+        .status-failed { background-color: #dc3545; }
+        .status-skipped { background-color: #ffc107; }
+        .test-details {
             padding: 20px;
-        }}
-        .test-info {{
+        }
+        .test-info {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-bottom: 15px;
-        }}
-        .info-item {{
+        }
+        .info-item {
             display: flex;
             justify-content: space-between;
-        }}
-        .info-label {{
+        }
+        .info-label {
             font-weight: bold;
             color: #666;
-        }}
-        .error-message {{
+        }
+        .error-message {
             background-color: #f8d7da;
             border: 1px solid #f5c6cb;
             color: #721c24;
@@ -254,106 +137,376 @@ class ReportManager:
             margin-top: 15px;
             font-family: monospace;
             white-space: pre-wrap;
-        }}
-        .screenshots {{
+        }
+        .screenshots {
             margin-top: 15px;
-        }}
-        .screenshot-grid {{
+        }
+        .slow-steps {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 10px;
+            font-size: 0.9em;
+        }
+        .slow-steps th, .slow-steps td {
+            border: 1px solid #ddd;
+            padding: 6px 10px;
+            text-align: left;
+        }
+        .slow-steps th {
+            background-color: #f8f9fa;
+        }
+        .screenshot-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
             gap: 15px;
             margin-top: 10px;
-        }}
-        .screenshot-item {{
+        }
+        .screenshot-item {
             border: 1px solid #ddd;
             border-radius: 5px;
             overflow: hidden;
-        }}
-        .screenshot-item img {{
+        }
+        .screenshot-item img {
             width: 100%;
             height: auto;
             display: block;
-        }}
-        .screenshot-caption {{
+        }
+        .screenshot-caption {
             padding: 10px;
             background-color: #f8f9fa;
             font-size: 0.9em;
             color: #666;
-        }}
-        .footer {{
+        }
+        .footer {
             background-color: #f8f9fa;
             padding: 20px;
             text-align: center;
             color: #666;
             border-top: 1px solid #ddd;
-        }}
+        }
     </style>
+    <script>
+        document.addEventListener('DOMContentLoaded', function () {
+            var items = document.querySelectorAll('.test-item');
+            var counts = {passed: 0, failed: 0, skipped: 0};
+            var duration = 0;
+            items.forEach(function (item) {
+                var status = item.getAttribute('data-status');
+                if (status in counts) { counts[status] += 1; }
+                duration += parseFloat(item.getAttribute('data-duration')) || 0;
+            });
+            document.getElementById('stat-total').textContent = items.length;
+            document.getElementById('stat-passed').textContent = counts.passed;
+            document.getElementById('stat-failed').textContent = counts.failed;
+            document.getElementById('stat-skipped').textContent = counts.skipped;
+            document.getElementById('stat-pass-rate').textContent =
+                (items.length ? Math.round(counts.passed / items.length * 10000) / 100 : 0) + '%';
+            document.getElementById('stat-duration').textContent = Math.round(duration * 100) / 100 + 's';
+            if (!document.getElementById('report-complete')) {
+                document.getElementById('report-state').textContent = '测试仍在进行或已中断，以下为已完成的部分结果';
+            }
+        });
+    </script>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{title}</h1>
-            <p>{description}</p>
+            <h1>$title</h1>
+            <p>$description</p>
+            <p id="report-state"></p>
         </div>
-        
+
         <div class="stats">
             <div class="stat-card">
-                <div class="stat-number total">{stats['total_tests']}</div>
+                <div class="stat-number total" id="stat-total">0</div>
                 <div class="stat-label">总测试数</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number passed">{stats['passed_tests']}</div>
+                <div class="stat-number passed" id="stat-passed">0</div>
                 <div class="stat-label">通过</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number failed">{stats['failed_tests']}</div>
+                <div class="stat-number failed" id="stat-failed">0</div>
                 <div class="stat-label">失败</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number skipped">{stats['skipped_tests']}</div>
+                <div class="stat-number skipped" id="stat-skipped">0</div>
                 <div class="stat-label">跳过</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{stats['pass_rate']}%</div>
+                <div class="stat-number" id="stat-pass-rate">0%</div>
                 <div class="stat-label">通过率</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{stats['total_duration']}s</div>
+                <div class="stat-number" id="stat-duration">0s</div>
                 <div class="stat-label">总耗时</div>
             </div>
         </div>
-        
+
         <div class="results">
             <h2>测试结果详情</h2>
-            {self._generate_test_results_html()}
+""")
+
+_TEST_ITEM = Template("""
+            <div class="test-item" data-status="$status_key" data-duration="$duration">
+                <div class="test-header">
+                    <div class="test-name">$name</div>
+                    <div class="test-status status-$status_key">$status</div>
+                </div>
+                <div class="test-details">
+                    <div class="test-info">
+                        <div class="info-item">
+                            <span class="info-label">执行时间:</span>
+                            <span>$duration_text秒</span>
+                        </div>
+                        <div class="info-item">
+                            <span class="info-label">时间戳:</span>
+                            <span>$timestamp</span>
+                        </div>
+                    </div>
+                    $error_html
+                    $slow_steps_html
+                    $screenshots_html
+                </div>
+            </div>
+""")
+
+_PAGE_FOOT = Template("""
         </div>
-        
-        <div class="footer">
-            <p>报告生成时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-            <p>测试开始时间: {stats['start_time']} | 测试结束时间: {stats['end_time']}</p>
+
+        $slowest_steps_html
+
+        <div class="footer" id="report-complete">
+            <p>报告生成时间: $generated_at</p>
+            <p>测试开始时间: $start_time | 测试结束时间: $end_time</p>
         </div>
     </div>
 </body>
 </html>
+""")
+
+
+def _read_journal(journal_path) -> Iterator[Dict[str, Any]]:
+    """逐行读取NDJSON日志"""
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class ReportManager:
+    """测试报告管理器类"""
+
+    def __init__(self, report_dir: str = None):
         """
-        
-        return html_template
-    
-    def _generate_test_results_html(self) -> str:
+        初始化报告管理器
+
+        Args:
+            report_dir: 报告保存目录，None时使用环境变量 REPORT_DIR 或 "reports"
         """
-        生成测试结果HTML
-        
+        if report_dir is None:
+            report_dir = os.environ.get("REPORT_DIR", "reports")
+        self.report_dir = Path(report_dir)
+        self.report_config = config.report_config
+        self._ensure_directory_exists()
+        self.start_time = None
+        self.end_time = None
+        self.journal_path = None
+        self.html_report_path = None
+        self._journal_file = None
+        self._html_file = None
+        self._report_finished = False
+        self._reset_statistics()
+
+    def _ensure_directory_exists(self):
+        """确保报告目录存在"""
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+    def _reset_statistics(self):
+        """重置会话统计（只保留计数和最慢步骤，不保留完整结果）"""
+        self._status_counts = Counter()
+        self._total_duration = 0.0
+        self._slowest_steps = []
+        self._step_sequence = 0
+
+    def start_test_session(self):
+        """开始测试会话（NDJSON日志和HTML报告在写入第一条结果时才创建，没有结果的会话不留下文件）"""
+        self._close_files()
+        self.start_time = datetime.now()
+        self.end_time = None
+        self._report_finished = False
+        self._reset_statistics()
+
+        timestamp = self.start_time.strftime("%Y-%m-%d_%H-%M-%S")
+        self.journal_path = self.report_dir / f"test_report_{timestamp}.ndjson"
+        self.html_report_path = self.report_dir / f"test_report_{timestamp}.html"
+        logger.info("测试会话开始")
+
+    def end_test_session(self):
+        """结束测试会话：关闭NDJSON日志（HTML报告在generate_html_report写入页脚后关闭）"""
+        self.end_time = datetime.now()
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        logger.info("测试会话结束")
+
+    def add_test_result(self, test_name: str, status: str, duration: float,
+                       error_message: str = None, screenshots: List[str] = None,
+                       slow_steps: List[Dict[str, Any]] = None):
+        """
+        添加测试结果（立即写入NDJSON日志和HTML报告）
+
+        Args:
+            test_name: 测试名称
+            status: 测试状态 (PASSED, FAILED, SKIPPED)
+            duration: 执行时间（秒）
+            error_message: 错误信息
+            screenshots: 截图文件列表
+            slow_steps: 耗时最长的页面步骤（来自耗时追踪器）
+        """
+        if self.start_time is None or self._report_finished:
+            self.start_test_session()
+
+        test_result = {
+            'name': test_name,
+            'status': status,
+            'duration': duration,
+            'timestamp': datetime.now().isoformat(),
+            'error_message': error_message,
+            'screenshots': [str(screenshot) for screenshot in screenshots or []],
+            'slow_steps': slow_steps or []
+        }
+
+        self._append_result(test_result)
+        logger.info(f"添加测试结果: {test_name} - {status}")
+
+    def _append_result(self, test_result: Dict[str, Any]):
+        """
+        把一条测试结果写入NDJSON日志和HTML报告，并更新统计
+
+        Args:
+            test_result: 测试结果字典
+        """
+        if self._journal_file is None:
+            # 第一条结果创建日志；结束会话后追加的结果续写到同一日志
+            mode = 'a' if sum(self._status_counts.values()) else 'w'
+            self._journal_file = open(self.journal_path, mode, encoding='utf-8')
+        if self._html_file is None:
+            self._html_file = open(self.html_report_path, 'w', encoding='utf-8')
+            self._html_file.write(_PAGE_HEAD.substitute(
+                title=html.escape(self.report_config.get('title', '自动化测试报告')),
+                description=html.escape(self.report_config.get('description', '基础验证测试报告')),
+            ))
+        self._journal_file.write(json.dumps(test_result, ensure_ascii=False) + "\n")
+        self._journal_file.flush()
+        self._html_file.write(self._render_test_result(test_result))
+        self._html_file.flush()
+
+        self._status_counts[test_result['status']] += 1
+        self._total_duration += test_result['duration']
+        self._keep_slowest_steps(test_result['name'], test_result.get('slow_steps') or [])
+
+    def merge_journals(self, journal_paths: List[Path]) -> int:
+        """
+        把多个NDJSON日志（如各xdist工作进程的输出）合并为一个新会话，
+        之后可用 generate_html_report / generate_json_report 生成合并报告
+
+        Args:
+            journal_paths: 日志文件路径列表
+
+        Returns:
+            合并的测试结果数量
+        """
+        self.start_test_session()
+        merged = 0
+        for journal_path in journal_paths:
+            for test_result in _read_journal(journal_path):
+                self._append_result(test_result)
+                merged += 1
+        self.end_test_session()
+        logger.info(f"已合并 {len(journal_paths)} 个测试日志，共 {merged} 条结果")
+        return merged
+
+    @property
+    def test_results(self) -> List[Dict[str, Any]]:
+        """当前会话的全部测试结果（按需从NDJSON日志读取）"""
+        return list(self.iter_test_results())
+
+    def iter_test_results(self) -> Iterator[Dict[str, Any]]:
+        """
+        逐条读取当前会话的测试结果
+
+        Yields:
+            测试结果字典
+        """
+        if self.journal_path is None or not self.journal_path.exists():
+            return
+        yield from _read_journal(self.journal_path)
+
+    def generate_html_report(self) -> str:
+        """
+        完成HTML测试报告：写入最慢步骤汇总和页脚，并关闭本会话的日志和报告文件
+
+        Returns:
+            报告文件路径
+        """
+        if not sum(self._status_counts.values()):
+            logger.warning("没有测试结果，无法生成报告")
+            return None
+
+        if self._html_file is not None:
+            stats = self._calculate_statistics()
+            self._html_file.write(_PAGE_FOOT.substitute(
+                slowest_steps_html=self._generate_slowest_steps_section(),
+                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                start_time=stats['start_time'],
+                end_time=stats['end_time'],
+            ))
+            self._close_files()
+            self._report_finished = True
+
+        logger.info(f"HTML报告已生成: {self.html_report_path}")
+        return str(self.html_report_path)
+
+    def _calculate_statistics(self) -> Dict[str, Any]:
+        """
+        计算测试统计信息
+
+        Returns:
+            统计信息字典
+        """
+        total_tests = sum(self._status_counts.values())
+        passed_tests = self._status_counts['PASSED']
+        failed_tests = self._status_counts['FAILED']
+        skipped_tests = self._status_counts['SKIPPED']
+
+        pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+
+        return {
+            'total_tests': total_tests,
+            'passed_tests': passed_tests,
+            'failed_tests': failed_tests,
+            'skipped_tests': skipped_tests,
+            'pass_rate': round(pass_rate, 2),
+            'total_duration': round(self._total_duration, 2),
+            'start_time': self.start_time.strftime("%Y-%m-%d %H:%M:%S") if self.start_time else "未知",
+            'end_time': self.end_time.strftime("%Y-%m-%d %H:%M:%S") if self.end_time else "未知"
+        }
+
+    def _render_test_result(self, result: Dict[str, Any]) -> str:
+        """
+        渲染单个测试结果的HTML
+
+        Args:
+            result: 测试结果
+
         Returns:
             测试结果HTML字符串
         """
-        results_html = ""
-        
-        for result in self.test_results:
-            status_class = f"status-{result['status'].lower()}"
-            
-            screenshots_html = ""
-            if result['screenshots']:
-                screenshots_html = f"""
+        screenshots_html = ""
+        if result['screenshots'] and self.report_config.get('include_screenshots', True):
+            screenshots_html = f"""
                 <div class="screenshots">
                     <h4>截图记录</h4>
                     <div class="screenshot-grid">
@@ -361,101 +514,166 @@ class ReportManager:
                     </div>
                 </div>
                 """
-            
-            error_html = ""
-            if result['error_message']:
-                error_html = f"""
+
+        error_html = ""
+        if result['error_message']:
+            error_html = f"""
                 <div class="error-message">
                     <strong>错误信息:</strong><br>
-                    {result['error_message']}
+                    {html.escape(str(result['error_message']))}
                 </div>
                 """
-            
-            results_html += f"""
-            <div class="test-item">
-                <div class="test-header">
-                    <div class="test-name">{result['name']}</div>
-                    <div class="test-status {status_class}">{result['status']}</div>
-                </div>
-                <div class="test-details">
-                    <div class="test-info">
-                        <div class="info-item">
-                            <span class="info-label">执行时间:</span>
-                            <span>{result['duration']:.2f}秒</span>
-                        </div>
-                        <div class="info-item">
-                            <span class="info-label">时间戳:</span>
-                            <span>{result['timestamp']}</span>
-                        </div>
-                    </div>
-                    {error_html}
-                    {screenshots_html}
+
+        slow_steps_html = ""
+        if result.get('slow_steps'):
+            slow_steps_html = f"""
+                <div class="screenshots">
+                    <h4>最慢步骤</h4>
+                    {self._generate_slow_steps_table(result['slow_steps'])}
                 </div>
-            </div>
-            """
-        
-        return results_html
-    
+                """
+
+        return _TEST_ITEM.substitute(
+            status_key=result['status'].lower(),
+            status=html.escape(result['status']),
+            name=html.escape(result['name']),
+            duration=result['duration'],
+            duration_text=f"{result['duration']:.2f}",
+            timestamp=result['timestamp'],
+            error_html=error_html,
+            slow_steps_html=slow_steps_html,
+            screenshots_html=screenshots_html,
+        )
+
+    def _keep_slowest_steps(self, test_name: str, steps: List[Dict[str, Any]]):
+        """
+        只保留全部测试中最慢的N个步骤
+
+        Args:
+            test_name: 测试名称
+            steps: 该测试的步骤耗时列表
+        """
+        top_n = config.trace_config.get('top_n', 10)
+        for step in steps:
+            self._step_sequence += 1
+            entry = (step['duration'], self._step_sequence, dict(step, test=test_name))
+            if len(self._slowest_steps) < top_n:
+                heapq.heappush(self._slowest_steps, entry)
+            else:
+                heapq.heappushpop(self._slowest_steps, entry)
+
+    def _generate_slowest_steps_section(self) -> str:
+        """
+        生成全部测试中最慢步骤的汇总HTML
+
+        Returns:
+            汇总HTML字符串，没有耗时记录时返回空字符串
+        """
+        if not self._slowest_steps:
+            return ""
+
+        top_n = config.trace_config.get('top_n', 10)
+        all_steps = [step for _, _, step in sorted(self._slowest_steps, key=lambda entry: entry[0], reverse=True)]
+        return f"""
+        <div class="results">
+            <h2>最慢步骤 Top {top_n}</h2>
+            {self._generate_slow_steps_table(all_steps, show_test=True)}
+        </div>
+        """
+
+    def _generate_slow_steps_table(self, steps: List[Dict[str, Any]], show_test: bool = False) -> str:
+        """
+        生成步骤耗时表格HTML
+
+        Args:
+            steps: 步骤耗时列表
+            show_test: 是否显示所属测试
+
+        Returns:
+            表格HTML字符串
+        """
+        test_header = "<th>测试</th>" if show_test else ""
+        rows_html = ""
+        for step in steps:
+            test_cell = f"<td>{html.escape(step.get('test', ''))}</td>" if show_test else ""
+            rows_html += f"""
+                <tr>{test_cell}<td>{html.escape(step['name'])}</td><td>{step['duration']:.3f}s</td>
+                <td>{step['commands']}</td><td>{step['command_time']:.3f}s</td><td>{step['sleep_time']:.3f}s</td></tr>"""
+
+        return f"""
+            <table class="slow-steps">
+                <tr>{test_header}<th>步骤</th><th>耗时</th><th>WebDriver命令数</th><th>命令耗时</th><th>sleep耗时</th></tr>
+                {rows_html}
+            </table>
+        """
+
     def _generate_screenshots_html(self, screenshots: List[str]) -> str:
         """
-        生成截图HTML
-        
+        生成截图HTML（按路径引用并延迟加载，不内嵌图片数据）
+
         Args:
             screenshots: 截图文件路径列表
-            
+
         Returns:
             截图HTML字符串
         """
         screenshots_html = ""
-        
+
         for screenshot in screenshots:
-            # 获取相对路径
-            screenshot_path = Path(screenshot)
-            if screenshot_path.is_absolute():
-                try:
-                    screenshot_path = screenshot_path.relative_to(Path.cwd())
-                except ValueError:
-                    screenshot_path = screenshot_path.name
-            
-            caption = screenshot_path.stem.replace('_', ' ')
-            
+            # 转换为相对于报告目录的路径
+            try:
+                screenshot_src = Path(os.path.relpath(screenshot, self.report_dir)).as_posix()
+            except ValueError:
+                screenshot_src = Path(screenshot).as_posix()
+
+            caption = html.escape(Path(screenshot).stem.replace('_', ' '))
+
             screenshots_html += f"""
             <div class="screenshot-item">
-                <img src="{screenshot_path}" alt="{caption}" onclick="window.open(this.src)">
+                <img src="{html.escape(screenshot_src)}" alt="{caption}" loading="lazy" onclick="window.open(this.src)">
                 <div class="screenshot-caption">{caption}</div>
             </div>
             """
-        
+
         return screenshots_html
-    
+
     def generate_json_report(self) -> str:
         """
-        生成JSON格式的测试报告
-        
+        生成JSON格式的测试报告（逐条从NDJSON日志写出）
+
         Returns:
             报告文件路径
         """
-        if not self.test_results:
+        if not sum(self._status_counts.values()):
             logger.warning("没有测试结果，无法生成JSON报告")
             return None
-        
+
         stats = self._calculate_statistics()
-        
-        report_data = {
-            'summary': stats,
-            'test_results': self.test_results
-        }
-        
+
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         report_filename = f"test_report_{timestamp}.json"
         report_path = self.report_dir / report_filename
-        
+
         with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, ensure_ascii=False, indent=2)
-        
+            f.write('{\n  "summary": ')
+            f.write(json.dumps(stats, ensure_ascii=False))
+            f.write(',\n  "test_results": [')
+            for index, result in enumerate(self.iter_test_results()):
+                f.write("," if index else "")
+                f.write("\n    " + json.dumps(result, ensure_ascii=False))
+            f.write("\n  ]\n}\n")
+
         logger.info(f"JSON报告已生成: {report_path}")
         return str(report_path)
 
+    def _close_files(self):
+        """关闭上一个会话的日志和HTML文件"""
+        for handle in (self._journal_file, self._html_file):
+            if handle is not None:
+                handle.close()
+        self._journal_file = None
+        self._html_file = None
+
 
 # 全局报告管理器实例
 report_manager = ReportManager()
@@ -0,0 +1,260 @@
+"""
+重试策略引擎
+按失败原因决定如何重试：元素引用过期时立即重新定位、超时时指数退避（带随机抖动）、
+浏览器会话失效时重建驱动，其他错误按策略的默认动作处理；并统计每个操作的尝试次数和重试耗时
+"""
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+from loguru import logger
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from config.config_manager import config
+
+# 重试动作
+RELOCATE = "relocate"   # 立即重试（调用方重新定位元素）
+BACKOFF = "backoff"     # 指数退避后重试
+RECREATE = "recreate"   # 重建驱动后重试；调用方未提供重建方法时放弃
+GIVE_UP = "give_up"     # 不重试，直接抛出
+
+# WebDriverException中表示浏览器会话已失效的错误信息
+_DEAD_SESSION_PATTERN = re.compile(
+    r"invalid session id|session deleted|no such session|disconnected|not reachable|target window already closed",
+    re.IGNORECASE,
+)
+
+
+class RetryableFailure(Exception):
+    """操作未抛出异常但结果不满足要求时抛出，按指定动作重试"""
+
+    def __init__(self, message: str, action: str = BACKOFF):
+        super().__init__(message)
+        self.action = action
+
+
+@dataclass
+class RetryRule:
+    """异常类型到重试动作的规则"""
+
+    exceptions: Tuple[Type[BaseException], ...]
+    action: str
+    predicate: Optional[Callable[[BaseException], bool]] = None
+
+    def matches(self, error: BaseException) -> bool:
+        """判断规则是否适用于该异常"""
+        if not isinstance(error, self.exceptions):
+            return False
+        return self.predicate is None or self.predicate(error)
+
+
+def is_dead_session(error: BaseException) -> bool:
+    """判断异常是否表示浏览器会话已失效"""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    return isinstance(error, WebDriverException) and bool(_DEAD_SESSION_PATTERN.search(str(error)))
+
+
+# 默认规则（按顺序匹配，第一条匹配的规则生效）
+DEFAULT_RULES = (
+    RetryRule((StaleElementReferenceException,), RELOCATE),
+    RetryRule((WebDriverException,), RECREATE, is_dead_session),
+    RetryRule((TimeoutException,), BACKOFF),
+)
+
+
+class RetryMetrics:
+    """重试统计类（按操作名称汇总）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, operation: str, attempts: int, succeeded: bool, retry_time: float, actions: Counter):
+        """
+        记录一次操作的重试情况
+
+        Args:
+            operation: 操作名称
+            attempts: 尝试次数
+            succeeded: 最终是否成功
+            retry_time: 首次失败之后花费的时间（秒）
+            actions: 各重试动作的次数
+        """
+        with self._lock:
+            stats = self._operations.setdefault(operation, {
+                'calls': 0, 'attempts': 0, 'failures': 0, 'retry_time': 0.0, 'actions': Counter()
+            })
+            stats['calls'] += 1
+            stats['attempts'] += attempts
+            stats['failures'] += 0 if succeeded else 1
+            stats['retry_time'] += retry_time
+            stats['actions'].update(actions)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取统计汇总
+
+        Returns:
+            操作名称 -> {calls, attempts, retries, failures, retry_time, actions}
+        """
+        with self._lock:
+            return {
+                operation: {
+                    'calls': stats['calls'],
+                    'attempts': stats['attempts'],
+                    'retries': stats['attempts'] - stats['calls'],
+                    'failures': stats['failures'],
+                    'retry_time': round(stats['retry_time'], 3),
+                    'actions': dict(stats['actions']),
+                }
+                for operation, stats in self._operations.items()
+            }
+
+    def log_summary(self):
+        """输出发生过重试的操作（按重试耗时从高到低）"""
+        retried = [(name, stats) for name, stats in self.summary().items() if stats['retries']]
+        if not retried:
+            return
+        logger.info("=== 重试统计 ===")
+        for name, stats in sorted(retried, key=lambda item: item[1]['retry_time'], reverse=True):
+            logger.info(f"{name}: 调用{stats['calls']}次, 重试{stats['retries']}次, 失败{stats['failures']}次, "
+                        f"重试耗时{stats['retry_time']:.2f}s, 动作{stats['actions']}")
+
+    def reset(self):
+        """清空统计"""
+        with self._lock:
+            self._operations.clear()
+
+
+class RetryPolicy:
+    """重试策略类"""
+
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None,
+                 multiplier: float = None, jitter: float = None, rules: Sequence[RetryRule] = DEFAULT_RULES,
+                 default_action: str = BACKOFF, metrics: RetryMetrics = None):
+        """
+        初始化重试策略
+
+        Args:
+            max_attempts: 最大尝试次数（含首次），None时使用配置 retry.max_attempts
+            base_delay: 首次退避时间（秒），None时使用配置 retry.base_delay
+            max_delay: 单次退避上限（秒），None时使用配置 retry.max_delay
+            multiplier: 退避倍数，None时使用配置 retry.multiplier
+            jitter: 随机抖动比例（0-1，退避时间在 [delay*(1-jitter), delay] 之间），None时使用配置 retry.jitter
+            rules: 异常分类规则
+            default_action: 没有规则匹配时的动作
+            metrics: 统计对象，None时使用全局统计
+        """
+        retry_config = config.retry_config
+        self.max_attempts = max(1, max_attempts if max_attempts is not None else retry_config.get('max_attempts', 3))
+        self.base_delay = base_delay if base_delay is not None else retry_config.get('base_delay', 1.0)
+        self.max_delay = max_delay if max_delay is not None else retry_config.get('max_delay', 10.0)
+        self.multiplier = multiplier if multiplier is not None else retry_config.get('multiplier', 2.0)
+        self.jitter = jitter if jitter is not None else retry_config.get('jitter', 0.5)
+        self.rules = tuple(rules)
+        self.default_action = default_action
+        self.metrics = metrics or retry_metrics
+
+    def classify(self, error: BaseException) -> str:
+        """
+        根据异常确定重试动作
+
+        Args:
+            error: 异常
+
+        Returns:
+            重试动作
+        """
+        if isinstance(error, RetryableFailure):
+            return error.action
+        for rule in self.rules:
+            if rule.matches(error):
+                return rule.action
+        return self.default_action
+
+    def backoff_delay(self, backoff_count: int) -> float:
+        """
+        计算第N次退避的等待时间
+
+        Args:
+            backoff_count: 本次操作中第几次退避（从1开始）
+
+        Returns:
+            等待时间（秒）
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (backoff_count - 1))
+        return delay * random.uniform(1 - self.jitter, 1)
+
+    def call(self, func: Callable[[], Any], operation: str = None,
+             on_retry: Callable[[int, BaseException, str], None] = None,
+             on_recreate: Callable[[], None] = None) -> Any:
+        """
+        按策略执行操作
+
+        Args:
+            func: 要执行的操作（无参数）
+            operation: 操作名称，用于日志和统计
+            on_retry: 每次重试前的回调（参数: 已失败的尝试序号, 异常, 重试动作），在退避等待之后调用
+            on_recreate: 浏览器会话失效时重建驱动的回调
+
+        Returns:
+            操作返回值
+
+        Raises:
+            最后一次失败的异常
+        """
+        operation = operation or getattr(func, '__name__', 'operation')
+        actions = Counter()
+        backoff_count = 0
+        first_failure_at = None
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                result = func()
+            except Exception as e:
+                if first_failure_at is None:
+                    first_failure_at = time.monotonic()
+                action = self.classify(e)
+                if action == RECREATE and on_recreate is None:
+                    action = GIVE_UP
+                if action == GIVE_UP or attempt >= self.max_attempts:
+                    logger.warning(f"{operation} 第{attempt}次尝试失败，不再重试: {e}")
+                    self._record(operation, attempt, False, first_failure_at, actions)
+                    raise
+
+                actions[action] += 1
+                logger.info(f"{operation} 第{attempt}次尝试失败（{type(e).__name__}），重试动作: {action}")
+                if action == BACKOFF:
+                    backoff_count += 1
+                    delay = self.backoff_delay(backoff_count)
+                    logger.debug(f"{operation} 退避 {delay:.2f}s 后重试")
+                    time.sleep(delay)
+                elif action == RECREATE:
+                    on_recreate()
+                if on_retry is not None:
+                    on_retry(attempt, e, action)
+                continue
+
+            self._record(operation, attempt, True, first_failure_at, actions)
+            return result
+
+    def _record(self, operation: str, attempts: int, succeeded: bool, first_failure_at: Optional[float],
+                actions: Counter):
+        """记录统计"""
+        retry_time = time.monotonic() - first_failure_at if first_failure_at is not None else 0.0
+        self.metrics.record(operation, attempts, succeeded, retry_time, actions)
+
+
+# 全局重试统计实例
+retry_metrics = RetryMetrics()
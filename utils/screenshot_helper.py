@@ -6,17 +6,20 @@ import time
 from datetime import datetime
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
+from utils.screenshot_writer import screenshot_writer
 
 class ScreenshotHelper:
     """截图辅助类"""
     
-    def __init__(self, screenshot_dir: str = "screenshots"):
+    def __init__(self, screenshot_dir: str = None):
         """
         初始化截图辅助类
         
         Args:
-            screenshot_dir: 截图保存目录
+            screenshot_dir: 截图保存目录，None时使用环境变量 SCREENSHOT_DIR 或 "screenshots"
         """
+        if screenshot_dir is None:
+            screenshot_dir = os.environ.get("SCREENSHOT_DIR", "screenshots")
         self.screenshot_dir = screenshot_dir
         self._ensure_screenshot_dir()
     
@@ -49,8 +52,8 @@ class ScreenshotHelper:
             filename = f"{description}_{browser_name}_{timestamp}.png"
             filepath = os.path.join(self.screenshot_dir, filename)
             
-            # 保存截图
-            driver.save_screenshot(filepath)
+            # 保存截图（启用异步写入时由后台线程落盘）
+            screenshot_writer.save(driver, filepath)
             
             logger.info(f"📸 截图已保存: {filepath}")
             return filepath
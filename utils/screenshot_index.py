@@ -0,0 +1,218 @@
+"""
+截图目录索引
+每次运行只扫描一次截图根目录，建立 运行ID(子目录名) -> 目录 -> 步骤名 -> 文件 的索引，
+供Chrome/Edge运行器、BDD报告和总执行器共享；本进程内写入的截图由截图写入器增量登记
+"""
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg'}
+
+# 截图文件名为 <步骤名>_<浏览器>_<时间戳>，建立索引时去掉后两段得到步骤名
+_TIMESTAMP_SUFFIX = re.compile(r"_(?:\d{8}_\d{6}|\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}(?:-\d+)?)$")
+_BROWSER_SUFFIX = re.compile(r"_(?:chrome|edge_ie|edge|firefox|ie|safari|browser|unknown)$", re.IGNORECASE)
+
+
+def screenshot_step_name(filename: str) -> str:
+    """
+    从截图文件名提取步骤名
+
+    Args:
+        filename: 截图文件名或路径
+
+    Returns:
+        步骤名（去掉扩展名、浏览器名和时间戳）
+    """
+    stem = Path(filename).stem
+    return _BROWSER_SUFFIX.sub("", _TIMESTAMP_SUFFIX.sub("", stem))
+
+
+def _add_to_steps(steps: Dict[str, Dict], path: Path, size: int):
+    """登记一张截图：步骤名和完整文件名（不含扩展名）都可作为键，同一步骤保留文件名排序最靠前的一张"""
+    info = {'path': path, 'size': size}
+    for key in (screenshot_step_name(path.name), path.stem):
+        current = steps.get(key)
+        if current is None or path.name < current['path'].name:
+            steps[key] = info
+
+
+def index_screenshot_dir(directory) -> Dict[str, Dict]:
+    """
+    扫描一次截图目录，按步骤名建立索引
+
+    Args:
+        directory: 截图目录
+
+    Returns:
+        步骤名 -> {'path': Path, 'size': int}
+    """
+    steps: Dict[str, Dict] = {}
+    if directory is None or not os.path.isdir(directory):
+        return steps
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_SUFFIXES:
+                _add_to_steps(steps, Path(entry.path), entry.stat().st_size)
+    return steps
+
+
+class ScreenshotIndex:
+    """截图目录索引类"""
+
+    def __init__(self, root=None):
+        """
+        初始化截图索引
+
+        Args:
+            root: 截图根目录，None时使用环境变量 SCREENSHOT_DIR 或 "screenshots"
+        """
+        if root is None:
+            root = os.environ.get("SCREENSHOT_DIR", "screenshots")
+        self.root = Path(root)
+        self._runs: Optional[Dict[str, Dict]] = None
+        self._root_steps: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """重新扫描根目录下的运行目录；修改时间未变的目录保留已建立的步骤索引"""
+        with self._lock:
+            previous = self._runs or {}
+            runs: Dict[str, Dict] = {}
+            if self.root.is_dir():
+                with os.scandir(self.root) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        mtime = entry.stat().st_mtime
+                        old = previous.get(entry.name)
+                        steps = old['steps'] if old and old['mtime'] == mtime else None
+                        runs[entry.name] = {'path': Path(entry.path), 'mtime': mtime, 'steps': steps}
+            self._runs = runs
+            self._root_steps = None
+        logger.debug(f"截图索引已刷新: {self.root}，共 {len(runs)} 个运行目录")
+
+    def runs(self, prefix: str = "") -> List[Path]:
+        """
+        获取运行目录列表（按修改时间从旧到新）
+
+        Args:
+            prefix: 运行ID前缀，如 "chrome_"、"bdd_tests_"
+
+        Returns:
+            目录路径列表
+        """
+        self._ensure_scanned()
+        matched = [run for run_id, run in self._runs.items() if run_id.startswith(prefix)]
+        return [run['path'] for run in sorted(matched, key=lambda run: run['mtime'])]
+
+    def latest_run(self, prefix: str = "") -> Optional[Path]:
+        """
+        获取最新的运行目录
+
+        Args:
+            prefix: 运行ID前缀
+
+        Returns:
+            最新目录路径，不存在时返回None
+        """
+        runs = self.runs(prefix)
+        return runs[-1] if runs else None
+
+    def steps(self, run=None) -> Dict[str, Dict]:
+        """
+        获取运行目录的步骤索引（首次访问时扫描该目录一次）
+
+        Args:
+            run: 运行ID或目录路径，None表示根目录下直接保存的截图
+
+        Returns:
+            步骤名 -> {'path': Path, 'size': int}
+        """
+        self._ensure_scanned()
+        if run is None:
+            if self._root_steps is None:
+                self._root_steps = index_screenshot_dir(self.root)
+            return self._root_steps
+
+        entry = self._runs.get(Path(run).name)
+        if entry is None:
+            return index_screenshot_dir(run)
+        if entry['steps'] is None:
+            entry['steps'] = index_screenshot_dir(entry['path'])
+        return entry['steps']
+
+    def record(self, filepath):
+        """
+        登记本进程新写入的截图，使已建立的索引保持最新
+
+        Args:
+            filepath: 截图文件路径
+        """
+        filepath = Path(filepath)
+        if self._runs is None or filepath.suffix.lower() not in IMAGE_SUFFIXES:
+            return
+        try:
+            relative = filepath.resolve().relative_to(self.root.resolve())
+        except (ValueError, OSError):
+            return
+
+        size = filepath.stat().st_size if filepath.exists() else 0
+        with self._lock:
+            if len(relative.parts) == 1:
+                if self._root_steps is not None:
+                    _add_to_steps(self._root_steps, filepath, size)
+            elif len(relative.parts) == 2:
+                run_id = relative.parts[0]
+                entry = self._runs.setdefault(run_id, {'path': self.root / run_id, 'mtime': 0, 'steps': None})
+                entry['mtime'] = max(entry['mtime'], filepath.stat().st_mtime if filepath.exists() else 0)
+                if entry['steps'] is not None:
+                    _add_to_steps(entry['steps'], filepath, size)
+
+    def _ensure_scanned(self):
+        """首次使用时扫描根目录"""
+        if self._runs is None:
+            self.refresh()
+
+
+_indexes: Dict[str, ScreenshotIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_screenshot_index(root=None) -> ScreenshotIndex:
+    """
+    获取截图根目录对应的共享索引
+
+    Args:
+        root: 截图根目录，None时使用环境变量 SCREENSHOT_DIR 或 "screenshots"
+
+    Returns:
+        截图索引
+    """
+    if root is None:
+        root = os.environ.get("SCREENSHOT_DIR", "screenshots")
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ScreenshotIndex(root)
+            _indexes[key] = index
+        return index
+
+
+def record_screenshot(filepath):
+    """
+    把新写入的截图登记到已创建的索引中
+
+    Args:
+        filepath: 截图文件路径
+    """
+    for index in list(_indexes.values()):
+        try:
+            index.record(filepath)
+        except Exception as e:
+            logger.debug(f"登记截图索引失败: {filepath} - {e}")
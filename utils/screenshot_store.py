@@ -0,0 +1,184 @@
+"""
+内容寻址截图存储
+截图按SHA-256保存为唯一的blob文件，原截图路径以硬链接指向blob（不支持硬链接时复制），
+每个截图目录维护一个manifest.json记录步骤名与blob的对应关系；
+可选的感知哈希去重会让与上一张几乎相同的截图复用同一个blob，磁盘占用只随不同画面数量增长
+"""
+import os
+import io
+import json
+import time
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from loguru import logger
+from config.config_manager import config
+
+
+class ScreenshotStore:
+    """内容寻址截图存储类"""
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, store_dir: str = None, phash_threshold: int = None):
+        """
+        初始化截图存储
+
+        Args:
+            store_dir: blob保存目录，None时使用配置 screenshot.store.dir 或 <截图目录>/store
+            phash_threshold: 感知哈希去重阈值（汉明距离），0表示只合并完全相同的截图
+        """
+        store_config = config.screenshot_config.get('store', {}) or {}
+        self._store_dir = store_dir or store_config.get('dir')
+        self.phash_threshold = (phash_threshold if phash_threshold is not None
+                                else store_config.get('phash_threshold', 0))
+        self._last_frames: Dict[str, Tuple[int, str]] = {}
+        self._manifests: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def store_dir(self) -> Path:
+        """blob目录（未配置时跟随 SCREENSHOT_DIR 环境变量）"""
+        if self._store_dir:
+            return Path(self._store_dir)
+        return Path(os.environ.get("SCREENSHOT_DIR", "screenshots")) / "store"
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用内容寻址存储（环境变量 SCREENSHOT_STORE 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("SCREENSHOT_STORE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool((config.screenshot_config.get('store', {}) or {}).get('enabled', False))
+
+    def put(self, png_bytes: bytes, filepath: str) -> str:
+        """
+        保存截图：写入（或复用）blob，在filepath处建立链接并更新所在目录的manifest
+
+        Args:
+            png_bytes: PNG数据
+            filepath: 截图原本的保存路径
+
+        Returns:
+            blob文件路径
+        """
+        filepath = Path(filepath)
+        run_key = str(filepath.parent.resolve())
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        dhash = self._dhash(png_bytes) if self.phash_threshold > 0 else None
+
+        with self._lock:
+            # 与同一目录的上一张截图比较：完全相同或感知哈希距离在阈值内时复用其blob
+            deduplicated = False
+            last_frame = self._last_frames.get(run_key)
+            if last_frame:
+                last_dhash, last_digest = last_frame
+                if last_digest == digest:
+                    deduplicated = True
+                elif (dhash is not None and last_dhash is not None
+                      and bin(dhash ^ last_dhash).count("1") <= self.phash_threshold):
+                    digest = last_digest
+                    deduplicated = True
+            if not deduplicated:
+                self._last_frames[run_key] = (dhash, digest)
+
+            blob = self.store_dir / digest[:2] / f"{digest}.png"
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                temp_blob = blob.with_name(f"{blob.name}.{threading.get_ident()}.tmp")
+                with open(temp_blob, 'wb') as f:
+                    f.write(png_bytes)
+                os.replace(temp_blob, blob)
+            else:
+                # 硬链接与blob共享inode和修改时间：复用旧blob时更新时间，避免新截图被按保留天数清理
+                os.utime(blob)
+
+            self._link(blob, filepath)
+            self._add_to_manifest(filepath, blob, digest, dhash, deduplicated)
+        return str(blob)
+
+    def prune(self, days: int = 7):
+        """
+        删除不再被任何截图引用且超过保留天数的blob
+
+        Args:
+            days: 保留天数
+        """
+        if not self.store_dir.exists():
+            return
+        cutoff_time = time.time() - days * 24 * 60 * 60
+        for blob in self.store_dir.glob("*/*.png"):
+            try:
+                stat = blob.stat()
+                if stat.st_nlink <= 1 and stat.st_mtime < cutoff_time:
+                    blob.unlink()
+                    logger.info(f"已删除未引用的截图blob: {blob}")
+            except Exception as e:
+                logger.debug(f"清理截图blob失败: {blob} - {e}")
+
+    def _link(self, blob: Path, filepath: Path):
+        """在截图路径处建立指向blob的硬链接，不支持时复制文件"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        if filepath.exists():
+            filepath.unlink()
+        try:
+            os.link(blob, filepath)
+        except OSError:
+            shutil.copyfile(blob, filepath)
+
+    def _add_to_manifest(self, filepath: Path, blob: Path, digest: str, dhash: Optional[int], deduplicated: bool):
+        """更新截图目录下的manifest.json"""
+        manifest_file = filepath.parent / self.MANIFEST_NAME
+        key = str(manifest_file.resolve())
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            manifest = {"frames": [], "distinct": 0}
+            if manifest_file.exists():
+                try:
+                    with open(manifest_file, 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                except Exception:
+                    pass
+            self._manifests[key] = manifest
+
+        try:
+            blob_ref = os.path.relpath(blob, filepath.parent)
+        except ValueError:
+            blob_ref = str(blob)
+        manifest["frames"].append({
+            "step": filepath.stem,
+            "file": filepath.name,
+            "blob": blob_ref.replace(os.sep, "/"),
+            "sha256": digest,
+            "dhash": f"{dhash:016x}" if dhash is not None else None,
+            "deduplicated": deduplicated,
+        })
+        manifest["distinct"] = len({frame["sha256"] for frame in manifest["frames"]})
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _dhash(png_bytes: bytes) -> Optional[int]:
+        """计算64位差值哈希（dHash），Pillow不可用或解码失败时返回None"""
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(png_bytes)).convert("L").resize((9, 8))
+        except Exception:
+            return None
+        pixels = image.tobytes()
+        value = 0
+        for row in range(8):
+            for col in range(8):
+                value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+        return value
+
+
+# 全局截图存储实例
+screenshot_store = ScreenshotStore()
@@ -8,19 +8,23 @@ from pathlib import Path
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
 from config.config_manager import config
+from utils.screenshot_writer import screenshot_writer
+from utils.screenshot_store import screenshot_store
 
 
 class ScreenshotUtils:
     """截图工具类"""
     
-    def __init__(self, screenshot_dir: str = "screenshots", test_session_name: str = None):
+    def __init__(self, screenshot_dir: str = None, test_session_name: str = None):
         """
         初始化截图工具
 
         Args:
-            screenshot_dir: 截图保存目录
+            screenshot_dir: 截图保存目录，None时使用环境变量 SCREENSHOT_DIR 或 "screenshots"
             test_session_name: 测试会话名称，用于创建子文件夹
         """
+        if screenshot_dir is None:
+            screenshot_dir = os.environ.get("SCREENSHOT_DIR", "screenshots")
         self.base_screenshot_dir = Path(screenshot_dir)
         self.screenshot_config = config.screenshot_config
 
@@ -60,8 +64,8 @@ class ScreenshotUtils:
             filename = f"{safe_step_name}_{browser_name}_{timestamp}.png"
             filepath = self.screenshot_dir / filename
             
-            # 截图
-            driver.save_screenshot(str(filepath))
+            # 截图（启用异步写入时由后台线程落盘）
+            screenshot_writer.save(driver, filepath)
             
             logger.info(f"截图已保存: {filepath}")
             return str(filepath)
@@ -167,6 +171,9 @@ class ScreenshotUtils:
                 if file_path.stat().st_mtime < cutoff_time:
                     file_path.unlink()
                     logger.info(f"已删除旧截图: {file_path}")
+            
+            # 清理不再被任何截图引用的blob
+            screenshot_store.prune(days)
                     
         except Exception as e:
             logger.error(f"清理旧截图时出错: {e}")
@@ -0,0 +1,188 @@
+"""
+异步截图写入器
+测试线程只向浏览器获取截图数据，解码、可选的重新压缩和写盘都交给后台线程池完成；
+队列有长度上限，写入跟不上时测试线程会等待（背压），会话结束时调用flush()确保全部落盘
+"""
+import os
+import atexit
+import base64
+import io
+import queue
+import threading
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+from config.config_manager import config
+from utils.screenshot_store import screenshot_store
+from utils.screenshot_index import record_screenshot
+
+
+class AsyncScreenshotWriter:
+    """异步截图写入器类"""
+
+    def __init__(self, workers: int = None, queue_size: int = None, recompress: bool = None):
+        """
+        初始化异步截图写入器
+
+        Args:
+            workers: 写入线程数，None时使用配置 screenshot.writer_threads
+            queue_size: 等待写入的截图数量上限，None时使用配置 screenshot.queue_size
+            recompress: 是否用Pillow重新压缩PNG，None时使用配置 screenshot.recompress
+        """
+        screenshot_config = config.screenshot_config
+        self.workers = workers or screenshot_config.get('writer_threads', 2)
+        self.recompress = recompress if recompress is not None else screenshot_config.get('recompress', False)
+        self._queue = queue.Queue(maxsize=queue_size or screenshot_config.get('queue_size', 16))
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.written = 0
+        self.failed: List[str] = []
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用异步写入（环境变量 SCREENSHOT_ASYNC 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("SCREENSHOT_ASYNC")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.screenshot_config.get('async_write', False))
+
+    def save(self, driver, filepath: str) -> str:
+        """
+        截图并保存，启用异步写入时只在当前线程获取截图数据
+
+        Args:
+            driver: WebDriver实例
+            filepath: 截图保存路径
+
+        Returns:
+            截图文件路径（异步模式下文件在flush()后保证存在）
+        """
+        filepath = str(filepath)
+        if not self.enabled():
+            if screenshot_store.enabled():
+                self._write(driver.get_screenshot_as_base64(), filepath)
+            else:
+                driver.save_screenshot(filepath)
+                record_screenshot(filepath)
+            return filepath
+
+        png_base64 = driver.get_screenshot_as_base64()
+        self._ensure_workers()
+        # 队列已满时阻塞，直到后台线程写完一张
+        self._queue.put((png_base64, filepath))
+        return filepath
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        等待队列中的截图全部写入磁盘
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            是否在超时前全部写完
+        """
+        if not self._threads:
+            return True
+        if timeout is None:
+            self._queue.join()
+            done = True
+        else:
+            # Queue.join不支持超时，使用条件变量等待未完成任务数归零
+            with self._queue.all_tasks_done:
+                done = self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout)
+        if self.failed:
+            logger.warning(f"截图写入失败 {len(self.failed)} 张: {self.failed[:3]}")
+        logger.info(f"异步截图已写入 {self.written} 张")
+        return done
+
+    def shutdown(self):
+        """写完剩余截图并停止后台线程"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        self._queue.join()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout=5)
+
+    def _ensure_workers(self):
+        """按需启动后台写入线程"""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"screenshot-writer-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self):
+        """后台线程：解码、可选重新压缩并写入磁盘"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                png_base64, filepath = item
+                self._write(png_base64, filepath)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, png_base64: str, filepath: str):
+        """写入单张截图"""
+        try:
+            png_bytes = base64.b64decode(png_base64.encode("ascii"))
+            if self.recompress:
+                png_bytes = self._recompress(png_bytes)
+            if screenshot_store.enabled():
+                # 内容寻址存储：相同画面只保存一份blob，截图路径链接到blob
+                screenshot_store.put(png_bytes, filepath)
+            else:
+                Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+                with open(filepath, 'wb') as f:
+                    f.write(png_bytes)
+            record_screenshot(filepath)
+            with self._lock:
+                self.written += 1
+        except Exception as e:
+            logger.error(f"写入截图失败: {filepath} - {e}")
+            with self._lock:
+                self.failed.append(filepath)
+
+    @staticmethod
+    def _recompress(png_bytes: bytes) -> bytes:
+        """使用Pillow优化PNG压缩，Pillow不可用时返回原数据"""
+        try:
+            from PIL import Image
+        except ImportError:
+            return png_bytes
+        output = io.BytesIO()
+        Image.open(io.BytesIO(png_bytes)).save(output, format="PNG", optimize=True)
+        return output.getvalue() if output.tell() < len(png_bytes) else png_bytes
+
+
+# 全局异步截图写入器实例
+screenshot_writer = AsyncScreenshotWriter()
+atexit.register(screenshot_writer.shutdown)
+
+
+def flush_screenshots(timeout: Optional[float] = None) -> bool:
+    """
+    等待所有异步截图写入完成
+
+    Args:
+        timeout: 最长等待时间（秒）
+
+    Returns:
+        是否全部写完
+    """
+    return screenshot_writer.flush(timeout)
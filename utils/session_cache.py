@@ -0,0 +1,263 @@
+"""
+登录会话缓存
+登录一次后将cookie和localStorage/sessionStorage快照保存到磁盘（带过期时间），
+新驱动直接注入快照并打开目标页面，跳过界面登录
+"""
+import os
+import re
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+from loguru import logger
+from config.config_manager import config
+
+
+class SessionCache:
+    """登录会话缓存类"""
+
+    # 读取当前页面存储的脚本
+    _DUMP_STORAGE_SCRIPT = """
+        var dump = function (storage) {
+            var data = {};
+            for (var i = 0; i < storage.length; i++) {
+                var key = storage.key(i);
+                data[key] = storage.getItem(key);
+            }
+            return data;
+        };
+        return [dump(window.localStorage), dump(window.sessionStorage)];
+    """
+
+    # 写入页面存储的脚本（参数: localStorage数据, sessionStorage数据）
+    _RESTORE_STORAGE_SCRIPT = """
+        var fill = function (storage, data) {
+            for (var key in data) { storage.setItem(key, data[key]); }
+        };
+        fill(window.localStorage, arguments[0]);
+        fill(window.sessionStorage, arguments[1]);
+    """
+
+    def __init__(self, cache_dir: str = None, ttl: int = None):
+        """
+        初始化登录会话缓存
+
+        Args:
+            cache_dir: 快照保存目录，None时使用配置 session_cache.dir
+            ttl: 快照有效期（秒），None时使用配置 session_cache.ttl
+        """
+        cache_config = config.session_cache_config
+        self.cache_dir = Path(cache_dir or cache_config.get('dir', '.cache/sessions'))
+        self.ttl = ttl if ttl is not None else cache_config.get('ttl', 1800)
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用登录会话缓存（环境变量 SESSION_CACHE 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("SESSION_CACHE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.session_cache_config.get('enabled', False))
+
+    def save(self, driver, username: str) -> Optional[str]:
+        """
+        保存当前驱动的登录会话快照
+
+        Args:
+            driver: 已登录的WebDriver实例
+            username: 登录账号
+
+        Returns:
+            快照文件路径，保存失败时返回None
+        """
+        try:
+            origin = self._origin(driver.current_url)
+            local_storage, session_storage = driver.execute_script(self._DUMP_STORAGE_SCRIPT)
+            now = time.time()
+            snapshot = {
+                "origin": origin,
+                "username": username,
+                "created": now,
+                "expires": now + self.ttl,
+                "cookies": driver.get_cookies(),
+                "local_storage": local_storage or {},
+                "session_storage": session_storage or {},
+            }
+
+            snapshot_file = self._snapshot_file(origin, username)
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            # 先写临时文件再原子替换，并行进程读取时不会读到写了一半的快照
+            temp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(temp_file, snapshot_file)
+            logger.info(f"登录会话快照已保存: {snapshot_file} (有效期 {self.ttl}s)")
+            return str(snapshot_file)
+        except Exception as e:
+            logger.warning(f"保存登录会话快照失败: {e}")
+            return None
+
+    def load(self, origin: str, username: str) -> Optional[Dict[str, Any]]:
+        """
+        读取未过期的会话快照
+
+        Args:
+            origin: 站点源（scheme://host）
+            username: 登录账号
+
+        Returns:
+            快照数据，不存在或已过期时返回None
+        """
+        snapshot_file = self._snapshot_file(origin, username)
+        if not snapshot_file.exists():
+            return None
+        try:
+            with open(snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            logger.warning(f"读取登录会话快照失败: {e}")
+            return None
+
+        if snapshot.get("expires", 0) <= time.time():
+            logger.info(f"登录会话快照已过期: {snapshot_file}")
+            self.invalidate(origin, username)
+            return None
+        return snapshot
+
+    def restore(self, driver, target_url: str, username: str) -> bool:
+        """
+        将会话快照注入驱动并打开目标页面，打开后校验会话是否仍然有效
+
+        Args:
+            driver: WebDriver实例
+            target_url: 注入后直接打开的页面
+            username: 登录账号
+
+        Returns:
+            会话是否恢复成功（失败时调用方应回退到界面登录）
+        """
+        origin = self._origin(target_url)
+        snapshot = self.load(origin, username)
+        if snapshot is None:
+            return False
+
+        try:
+            if not self._restore_with_cdp(driver, snapshot, target_url):
+                self._restore_with_navigation(driver, snapshot, target_url)
+        except Exception as e:
+            logger.warning(f"注入登录会话失败: {e}")
+            return False
+
+        # 有效性探测：会话被服务端拒绝时会重定向回登录页
+        if "/auth/login" in driver.current_url:
+            logger.info("缓存的登录会话已失效，回退到界面登录")
+            self.invalidate(origin, username)
+            return False
+
+        logger.info(f"已通过缓存会话直接打开: {target_url}")
+        return True
+
+    def invalidate(self, origin: str, username: str):
+        """
+        删除会话快照
+
+        Args:
+            origin: 站点源（scheme://host）
+            username: 登录账号
+        """
+        try:
+            self._snapshot_file(origin, username).unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"删除登录会话快照失败: {e}")
+
+    def _restore_with_cdp(self, driver, snapshot: Dict[str, Any], target_url: str) -> bool:
+        """
+        通过CDP在导航前注入cookie和storage，只需一次页面加载（仅Chromium内核浏览器）
+
+        Returns:
+            是否使用CDP完成注入
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            cookies = [self._cdp_cookie(cookie, snapshot["origin"]) for cookie in snapshot["cookies"]]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": (
+                    f"(function () {{ if (location.origin !== {json.dumps(snapshot['origin'])}) return;"
+                    f" var l = {json.dumps(snapshot['local_storage'])}, s = {json.dumps(snapshot['session_storage'])};"
+                    f" for (var k in l) {{ localStorage.setItem(k, l[k]); }}"
+                    f" for (var k in s) {{ sessionStorage.setItem(k, s[k]); }} }})();"
+                )
+            })
+        except Exception as e:
+            logger.debug(f"CDP注入不可用，改用导航注入: {e}")
+            return False
+
+        try:
+            driver.get(target_url)
+        finally:
+            # 只在首次加载时写入storage，避免覆盖后续页面的修改
+            try:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                       {"identifier": script.get("identifier")})
+            except Exception:
+                pass
+        return True
+
+    def _restore_with_navigation(self, driver, snapshot: Dict[str, Any], target_url: str):
+        """先打开同源页面再写入cookie和storage，最后打开目标页面"""
+        driver.get(snapshot["origin"] + config.session_cache_config.get('bootstrap_path', '/robots.txt'))
+        driver.delete_all_cookies()
+        for cookie in snapshot["cookies"]:
+            cookie = dict(cookie)
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            driver.add_cookie(cookie)
+        driver.execute_script(self._RESTORE_STORAGE_SCRIPT,
+                              snapshot["local_storage"], snapshot["session_storage"])
+        driver.get(target_url)
+
+    @staticmethod
+    def _cdp_cookie(cookie: Dict[str, Any], origin: str) -> Dict[str, Any]:
+        """将WebDriver格式的cookie转换为CDP Network.setCookies格式"""
+        cdp_cookie = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("domain"):
+            cdp_cookie["domain"] = cookie["domain"]
+        else:
+            cdp_cookie["url"] = origin
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            cdp_cookie["sameSite"] = cookie["sameSite"]
+        return cdp_cookie
+
+    def _snapshot_file(self, origin: str, username: str) -> Path:
+        """按站点和账号生成快照文件路径"""
+        name = re.sub(r'[^\w\-.]+', '_', f"{urlparse(origin).netloc}_{username}")
+        return self.cache_dir / f"{name}.json"
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """提取URL的源（scheme://host[:port]）"""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+
+# 全局登录会话缓存实例
+session_cache = SessionCache()
@@ -0,0 +1,163 @@
+"""
+BDD步骤注册表
+场景内共享按驱动缓存的页面对象、按名称分派按钮/标签等页面操作，并让步骤声明截图策略
+（每步截图、仅失败时截图或按比例抽样截图），避免每个步骤都同步截图
+"""
+import os
+import random
+import functools
+from typing import Callable, Dict, Tuple
+from loguru import logger
+from config.config_manager import config
+
+# 截图策略
+ALWAYS = "always"           # 步骤成功和失败时都截图
+ON_FAILURE = "on_failure"   # 仅步骤失败时截图
+SAMPLED = "sampled"         # 步骤成功时按比例抽样截图，失败时截图
+NEVER = "never"             # 不截图
+
+SCREENSHOT_POLICIES = (ALWAYS, ON_FAILURE, SAMPLED, NEVER)
+
+
+class PageRegistry:
+    """场景页面对象注册表：返回当前驱动的页面对象（由BasePage按驱动缓存，驱动归还会话池或关闭时清除）"""
+
+    def __init__(self, context):
+        """
+        初始化页面对象注册表
+
+        Args:
+            context: behave上下文（读取context.driver）
+        """
+        self._context = context
+
+    def get(self, page_class):
+        """
+        获取当前驱动的页面对象
+
+        Args:
+            page_class: 页面类
+
+        Returns:
+            页面对象（同一驱动的同一页面类返回同一实例）
+        """
+        return page_class.for_driver(self._context.driver)
+
+
+class StepRegistry:
+    """步骤注册表类"""
+
+    def __init__(self, sample_rate: float = None):
+        """
+        初始化步骤注册表
+
+        Args:
+            sample_rate: sampled策略的截图比例，None时使用配置 bdd_steps.sample_rate
+        """
+        self.sample_rate = sample_rate if sample_rate is not None else config.bdd_steps_config.get('sample_rate', 0.25)
+        self._actions: Dict[str, Dict[str, Tuple[type, str]]] = {}
+
+    @staticmethod
+    def policy_override() -> str:
+        """
+        获取覆盖所有步骤的截图策略（环境变量 BDD_SCREENSHOT_POLICY 优先于配置文件）
+
+        Returns:
+            截图策略，未设置或无效时返回None
+        """
+        policy = os.environ.get("BDD_SCREENSHOT_POLICY") or config.bdd_steps_config.get('screenshot_policy')
+        if not policy:
+            return None
+        policy = policy.strip().lower()
+        if policy not in SCREENSHOT_POLICIES:
+            logger.warning(f"未知的截图策略: {policy}，使用步骤声明的策略")
+            return None
+        return policy
+
+    def register_action(self, group: str, name: str, page_class: type, method: str):
+        """
+        注册按名称分派的页面操作
+
+        Args:
+            group: 操作分组（如 "tab"、"button"）
+            name: 步骤中的名称（如 "Assign Claim"）
+            page_class: 执行操作的页面类
+            method: 页面方法名
+        """
+        self._actions.setdefault(group, {})[name] = (page_class, method)
+
+    def perform(self, context, group: str, name: str, *args, **kwargs) -> bool:
+        """
+        执行按名称注册的页面操作
+
+        Args:
+            context: behave上下文（使用context.pages获取页面对象）
+            group: 操作分组
+            name: 步骤中的名称
+
+        Returns:
+            是否找到并执行了操作
+        """
+        action = self._actions.get(group, {}).get(name)
+        if action is None:
+            logger.warning(f"未注册的操作: {group}/{name}")
+            return False
+        page_class, method = action
+        getattr(context.pages.get(page_class), method)(*args, **kwargs)
+        return True
+
+    def should_capture(self, policy: str, failed: bool) -> bool:
+        """
+        判断是否需要截图
+
+        Args:
+            policy: 步骤声明的截图策略
+            failed: 步骤是否失败
+
+        Returns:
+            是否截图
+        """
+        policy = self.policy_override() or policy
+        if policy == NEVER:
+            return False
+        if failed or policy == ALWAYS:
+            return True
+        return policy == SAMPLED and random.random() < self.sample_rate
+
+    def screenshot(self, name: str, policy: str = ALWAYS, failure_name: str = None) -> Callable:
+        """
+        步骤截图装饰器：步骤成功时按策略截图，失败时截图后继续抛出
+
+        Args:
+            name: 截图步骤名，可以引用步骤参数（如 "点击_{button_text}"）
+            policy: 截图策略
+            failure_name: 失败截图步骤名，None时使用"<name>失败"
+
+        Returns:
+            装饰器
+        """
+        def decorator(step):
+            @functools.wraps(step)
+            def wrapper(context, *args, **kwargs):
+                step_name = name.format(**kwargs)
+                try:
+                    result = step(context, *args, **kwargs)
+                except Exception:
+                    if self.should_capture(policy, failed=True):
+                        failure_step_name = failure_name.format(**kwargs) if failure_name else f"{step_name}失败"
+                        self._take_screenshot(context, failure_step_name)
+                    raise
+                if self.should_capture(policy, failed=False):
+                    self._take_screenshot(context, step_name)
+                return result
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _take_screenshot(context, step_name: str):
+        """截取当前页面截图"""
+        context.screenshot_utils.take_screenshot(context.driver, step_name, context.browser_name)
+
+
+# 全局步骤注册表实例
+step_registry = StepRegistry()
@@ -0,0 +1,310 @@
+"""
+页面操作耗时追踪器
+记录页面对象方法的嵌套耗时、WebDriver命令次数与延迟、显式sleep时间，
+并按Chrome trace-event格式输出（可在 chrome://tracing 或 Perfetto 中打开）
+"""
+import os
+import re
+import sys
+import json
+import time
+import inspect
+import functools
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from config.config_manager import config
+
+# 原始的time.sleep，追踪期间time.sleep会被替换
+_real_sleep = time.sleep
+
+
+class StepTracer:
+    """页面操作耗时追踪器类"""
+
+    def __init__(self):
+        """初始化追踪器"""
+        self.active = False
+        self.test_name = None
+        self.events: List[Dict[str, Any]] = []
+        self.steps: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = 0.0
+        self._original_sleep = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        判断是否启用耗时追踪（环境变量 STEP_TRACE 优先于配置文件）
+
+        Returns:
+            是否启用
+        """
+        env_value = os.environ.get("STEP_TRACE")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(config.trace_config.get('enabled', False))
+
+    def start(self, test_name: str):
+        """
+        开始追踪一个测试用例
+
+        Args:
+            test_name: 测试名称
+        """
+        if self.active:
+            self.stop()
+        with self._lock:
+            self.events = []
+            self.steps = []
+        self.test_name = test_name
+        self._origin = time.perf_counter()
+        self.active = True
+
+        if config.trace_config.get('record_sleep', True) and self._original_sleep is None:
+            self._original_sleep = time.sleep
+            time.sleep = self._traced_sleep
+        logger.debug(f"开始耗时追踪: {test_name}")
+
+    def stop(self) -> Optional[str]:
+        """
+        结束追踪并写出trace文件
+
+        Returns:
+            trace文件路径，未在追踪或写出失败时返回None
+        """
+        if not self.active:
+            return None
+        self.active = False
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+
+        try:
+            trace_file = self._trace_dir() / f"{self._safe_name(self.test_name)}.trace.json"
+            trace_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                trace = {
+                    "traceEvents": list(self.events),
+                    "displayTimeUnit": "ms",
+                    "metadata": {
+                        "test_name": self.test_name,
+                        "slowest_steps": self.top_steps(),
+                    },
+                }
+            with open(trace_file, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, ensure_ascii=False)
+            logger.info(f"耗时追踪已保存: {trace_file}")
+            return str(trace_file)
+        except Exception as e:
+            logger.error(f"保存耗时追踪失败: {e}")
+            return None
+
+    def span(self, name: str, category: str = "step"):
+        """
+        记录一段嵌套耗时
+
+        Args:
+            name: 步骤名称
+            category: 事件分类
+
+        Returns:
+            上下文管理器
+        """
+        return _Span(self, name, category)
+
+    def record_command(self, command: str, duration: float):
+        """
+        记录一次WebDriver命令
+
+        Args:
+            command: WebDriver命令名称
+            duration: 命令耗时（秒）
+        """
+        for frame in self._stack():
+            frame["commands"] += 1
+            frame["command_time"] += duration
+        self._add_event(command, "webdriver", time.perf_counter() - duration, duration)
+
+    def record_sleep(self, seconds: float):
+        """
+        记录一次显式sleep
+
+        Args:
+            seconds: 实际休眠时间（秒）
+        """
+        for frame in self._stack():
+            frame["sleep_time"] += seconds
+        self._add_event("sleep", "sleep", time.perf_counter() - seconds, seconds)
+
+    def instrument_driver(self, driver):
+        """
+        包装驱动的execute方法，统计每条WebDriver命令（同一驱动只包装一次）
+
+        Args:
+            driver: WebDriver实例
+        """
+        original_execute = getattr(driver, "execute", None)
+        if original_execute is None or getattr(driver, "_step_tracer_instrumented", False):
+            return
+
+        tracer = self
+
+        def execute(driver_command, params=None):
+            if not tracer.active:
+                return original_execute(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                tracer.record_command(driver_command, time.perf_counter() - start)
+
+        try:
+            driver.execute = execute
+            driver._step_tracer_instrumented = True
+        except AttributeError:
+            logger.debug("驱动不支持命令统计，跳过包装")
+
+    def top_steps(self, n: int = None) -> List[Dict[str, Any]]:
+        """
+        获取耗时最长的步骤
+
+        Args:
+            n: 返回数量，None时使用配置 trace.top_n
+
+        Returns:
+            步骤列表（按耗时降序）
+        """
+        if n is None:
+            n = config.trace_config.get('top_n', 10)
+        return sorted(self.steps, key=lambda step: step["duration"], reverse=True)[:n]
+
+    def _traced_sleep(self, seconds):
+        """替换time.sleep，只统计页面代码中的显式sleep（忽略Selenium内部的轮询）"""
+        start = time.perf_counter()
+        _real_sleep(seconds)
+        caller = sys._getframe(1).f_globals.get("__name__", "")
+        if self.active and not caller.startswith("selenium"):
+            self.record_sleep(time.perf_counter() - start)
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        """获取当前线程的步骤栈"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add_event(self, name: str, category: str, start: float, duration: float, args: Dict = None):
+        """添加一条Chrome trace-event完整事件（ph=X）"""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round(duration * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def _trace_dir(self) -> Path:
+        """获取trace文件目录，未配置时使用 <报告目录>/traces"""
+        trace_dir = config.trace_config.get('dir')
+        if not trace_dir:
+            trace_dir = os.path.join(os.environ.get("REPORT_DIR", "reports"), "traces")
+        return Path(trace_dir)
+
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        """将测试名称转换为安全的文件名"""
+        return re.sub(r'[^\w\-.]+', '_', name or "trace").strip('_') or "trace"
+
+
+class _Span:
+    """步骤耗时上下文"""
+
+    def __init__(self, tracer: StepTracer, name: str, category: str):
+        self.tracer = tracer
+        self.frame = {"name": name, "commands": 0, "command_time": 0.0, "sleep_time": 0.0}
+        self.category = category
+
+    def __enter__(self):
+        self.tracer._stack().append(self.frame)
+        self.start = time.perf_counter()
+        return self.frame
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start
+        stack = self.tracer._stack()
+        if stack and stack[-1] is self.frame:
+            stack.pop()
+        if not self.tracer.active:
+            return False
+
+        frame = self.frame
+        args = {
+            "commands": frame["commands"],
+            "command_ms": round(frame["command_time"] * 1000, 1),
+            "sleep_ms": round(frame["sleep_time"] * 1000, 1),
+            "depth": len(stack),
+        }
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+        self.tracer._add_event(frame["name"], self.category, self.start, duration, args)
+        with self.tracer._lock:
+            self.tracer.steps.append({
+                "name": frame["name"],
+                "duration": round(duration, 3),
+                "commands": frame["commands"],
+                "command_time": round(frame["command_time"], 3),
+                "sleep_time": round(frame["sleep_time"], 3),
+                "depth": len(stack),
+            })
+        return False
+
+
+def traced_step(func):
+    """
+    装饰器：追踪激活时记录页面方法的耗时
+
+    Args:
+        func: 页面对象方法
+
+    Returns:
+        包装后的方法
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not step_tracer.active:
+            return func(self, *args, **kwargs)
+        with step_tracer.span(func.__qualname__):
+            return func(self, *args, **kwargs)
+
+    wrapper.__step_traced__ = True
+    return wrapper
+
+
+def instrument_page_class(cls):
+    """
+    为页面类的所有公开方法添加耗时追踪
+
+    Args:
+        cls: 页面类
+
+    Returns:
+        原页面类
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith('_') or not inspect.isfunction(attr) or getattr(attr, "__step_traced__", False):
+            continue
+        setattr(cls, name, traced_step(attr))
+    return cls
+
+
+# 全局耗时追踪器实例
+step_tracer = StepTracer()
@@ -0,0 +1,103 @@
+"""
+pytest-xdist 并行执行支持
+每个xdist工作进程使用独立的截图和报告子目录（<目录>/<工作进程ID>），并默认启用进程级WebDriver会话池，
+使驱动在该工作进程的整个会话内复用；主进程在会话结束时合并各工作进程的NDJSON日志
+"""
+import os
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+
+
+def current_worker() -> Optional[str]:
+    """
+    获取当前xdist工作进程ID
+
+    Returns:
+        工作进程ID（如 "gw0"），非xdist工作进程时返回None
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER") or None
+
+
+def is_xdist_controller(config_obj) -> bool:
+    """
+    判断是否为启用了xdist并行的主进程（主进程不执行用例，只合并各工作进程的报告）
+
+    Args:
+        config_obj: pytest Config对象
+
+    Returns:
+        是否为xdist主进程
+    """
+    return not hasattr(config_obj, "workerinput") and bool(getattr(config_obj.option, "numprocesses", None))
+
+
+def isolate_worker_artifacts():
+    """
+    在xdist工作进程中把 SCREENSHOT_DIR、REPORT_DIR 指向工作进程专属子目录
+
+    必须在截图工具、报告管理器等全局实例创建之前调用；非工作进程中不做任何修改
+    """
+    worker = current_worker()
+    if worker is None:
+        return
+
+    for env_name, default in (("SCREENSHOT_DIR", "screenshots"), ("REPORT_DIR", "reports")):
+        base_dir = Path(os.environ.get(env_name, default))
+        if base_dir.name == worker:
+            continue
+        os.environ[env_name] = str(base_dir / worker)
+
+    # 每个工作进程同一时间只执行一个用例，驱动在进程内复用（显式设置 DRIVER_POOL 时以其为准）
+    os.environ.setdefault("DRIVER_POOL", "true")
+    logger.debug(f"xdist工作进程 {worker} 使用独立目录: "
+                 f"{os.environ['SCREENSHOT_DIR']}, {os.environ['REPORT_DIR']}")
+
+
+def worker_report_journals(report_dir=None, since: float = 0) -> List[Path]:
+    """
+    查找各工作进程写出的NDJSON日志
+
+    Args:
+        report_dir: 主报告目录，None时使用环境变量 REPORT_DIR 或 "reports"
+        since: 只返回修改时间不早于该时间戳的日志（用于排除以前的运行）
+
+    Returns:
+        日志文件路径列表（按工作进程ID和文件名排序）
+    """
+    if report_dir is None:
+        report_dir = os.environ.get("REPORT_DIR", "reports")
+    report_dir = Path(report_dir)
+    if not report_dir.is_dir():
+        return []
+
+    journals = []
+    for worker_dir in sorted(report_dir.glob("gw*")):
+        if not worker_dir.is_dir():
+            continue
+        for journal in sorted(worker_dir.glob("test_report_*.ndjson")):
+            if journal.stat().st_mtime >= since:
+                journals.append(journal)
+    return journals
+
+
+def merge_worker_reports(report_dir=None, since: float = 0):
+    """
+    合并各工作进程的测试日志，在主报告目录生成汇总HTML和JSON报告
+
+    Args:
+        report_dir: 主报告目录，None时使用环境变量 REPORT_DIR 或 "reports"
+        since: 只合并修改时间不早于该时间戳的日志
+
+    Returns:
+        (HTML报告路径, JSON报告路径)，没有可合并的日志时返回 (None, None)
+    """
+    from utils.report_manager import ReportManager
+
+    journals = worker_report_journals(report_dir, since)
+    if not journals:
+        return None, None
+
+    manager = ReportManager(report_dir=report_dir)
+    manager.merge_journals(journals)
+    return manager.generate_html_report(), manager.generate_json_report()